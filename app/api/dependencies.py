@@ -1,7 +1,9 @@
 from functools import lru_cache
+import hashlib
 from secrets import compare_digest
+import time
 
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request, Response
 import psycopg
 
 from app.config import get_settings
@@ -68,3 +70,81 @@ def require_internal_job_token(
     token = authorization.removeprefix("Bearer ").strip()
     if not compare_digest(token, expected):
         raise HTTPException(status_code=403, detail="invalid bearer token")
+
+
+# Bump when read payload shapes change without new data, so clients drop old ETags.
+READ_PAYLOAD_VERSION = "read-v1"
+
+
+def _cache_control_header() -> str:
+    try:
+        max_age = max(int(get_settings().api_cache_control_max_age_sec), 0)
+    except Exception:  # noqa: BLE001
+        max_age = 0
+    return f"public, max-age={max_age}, must-revalidate"
+
+
+def _freshness_bucket_sec() -> int:
+    try:
+        return max(int(get_settings().api_etag_freshness_bucket_sec), 1)
+    except Exception:  # noqa: BLE001
+        return 300
+
+
+def build_read_etag(request: Request, generation: int, *, now: float | None = None) -> str:
+    """Weak ETag over the data generation and a wall-clock bucket.
+
+    Read bodies carry time-relative fields (freshness_hours), so two responses for the same
+    generation are only semantically equal; the bucket bounds how long that drift is reused.
+    """
+    bucket = int((time.time() if now is None else now) // _freshness_bucket_sec())
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(
+        f"{READ_PAYLOAD_VERSION}|{generation}|{bucket}|{request.url.path}|{query}".encode("utf-8")
+    ).hexdigest()
+    return f'W/"g{generation}-{digest[:20]}"'
+
+
+def representation_etag(etag: str, content_coding: str) -> str:
+    """Validator for a content-coded variant of the representation tagged `etag`."""
+    weak = etag.startswith("W/")
+    opaque = _opaque_tag(etag)
+    tagged = f'{opaque[:-1]}-{content_coding}"'
+    return f"W/{tagged}" if weak else tagged
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _if_none_match_tag(header_value: str | None, etag: str) -> str | None:
+    """The client validator matching `etag` or one of its encoded variants, if any."""
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    if not header_value:
+        return None
+    wanted = {_opaque_tag(etag): etag}
+    gzip_etag = representation_etag(etag, "gzip")
+    wanted[_opaque_tag(gzip_etag)] = gzip_etag
+    for token in header_value.split(","):
+        token = token.strip()
+        if token == "*":
+            return etag
+        matched = wanted.get(_opaque_tag(token))
+        if matched is not None:
+            return matched
+    return None
+
+
+def conditional_read(request: Request, response: Response, repo=Depends(get_repository)) -> str | None:
+    """Emit ETag/Cache-Control from the ingest data generation and answer 304 early."""
+    fetch_generation = getattr(repo, "fetch_data_generation", None)
+    if not callable(fetch_generation):
+        return None
+    generation = fetch_generation()
+    etag = build_read_etag(request, generation)
+    headers = {"ETag": etag, "Cache-Control": _cache_control_header()}
+    matched = _if_none_match_tag(request.headers.get("if-none-match"), etag)
+    if matched is not None:
+        raise HTTPException(status_code=304, headers={**headers, "ETag": matched})
+    response.headers.update(headers)
+    return etag
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import gzip
+import time
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.api.dependencies import representation_etag
+from app.config import get_settings
+from app.services.encoded_response_cache import get_encoded_response, set_encoded_response
+
+ENCODED_RESPONSE_GZIP_MIN_BYTES = 1024
+
+
+def _encoded_response_cache_ttl_sec() -> float:
+    try:
+        return max(float(get_settings().api_encoded_response_cache_ttl_sec), 0.0)
+    except Exception:  # noqa: BLE001
+        return 30.0
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for token in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+def _encode(model_cls: type[BaseModel], payload: dict[str, Any]) -> tuple[bytes, bytes | None]:
+    # Validate the assembled dict once and let pydantic-core write JSON directly
+    # (date/datetime included) instead of building per-item models that FastAPI
+    # would dump, re-validate and run through jsonable_encoder again.
+    body = model_cls.model_validate(payload).model_dump_json().encode("utf-8")
+    compressed = gzip.compress(body, compresslevel=5) if len(body) >= ENCODED_RESPONSE_GZIP_MIN_BYTES else None
+    return body, compressed
+
+
+def encoded_json_response(
+    request: Request,
+    response: Response,
+    model_cls: type[BaseModel],
+    build_payload: Callable[[], dict[str, Any]],
+    *,
+    etag: str | None = None,
+) -> Response:
+    """Serialize `build_payload()` through `model_cls` once, reusing the encoded bytes per ETag."""
+    ttl = _encoded_response_cache_ttl_sec() if etag else 0.0
+    now = time.monotonic()
+    cached = get_encoded_response(etag, now=now) if ttl > 0 else None
+    if cached is not None:
+        body, compressed = cached
+    else:
+        body, compressed = _encode(model_cls, build_payload())
+        if ttl > 0:
+            set_encoded_response(etag, body, compressed, now=now, ttl=ttl)
+
+    # Headers set by dependencies (ETag, Cache-Control) live on the injected
+    # response and are not merged into a returned Response, so copy them over.
+    headers = dict(response.headers)
+    headers.pop("content-length", None)
+    headers["Vary"] = "Accept-Encoding"
+    if compressed is not None and _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        if "etag" in headers:
+            # Each content coding is its own representation and needs its own validator.
+            headers["etag"] = representation_etag(headers["etag"], "gzip")
+        return Response(content=compressed, media_type="application/json", headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,34 +1,48 @@
+import hashlib
+import json
 import re
 import unicodedata
-from datetime import date, datetime, timezone
+import zlib
+from datetime import date, datetime, timedelta, timezone
 import logging
 from typing import Literal
 from urllib.parse import unquote_plus
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response
 from pydantic import ValidationError
 
-from app.api.dependencies import get_candidate_data_go_service, get_repository, require_internal_job_token
+from app.api.dependencies import (
+    conditional_read,
+    get_candidate_data_go_service,
+    get_repository,
+    require_internal_job_token,
+)
+from app.api.responses import encoded_json_response
+from app.config import get_settings
 from app.models.schemas import (
     BigMatchPoint,
     CandidateOut,
     DashboardBigMatchesOut,
-    DashboardFilterStatsOut,
     DashboardQualityFreshnessOut,
     DashboardQualityOfficialOut,
     DashboardQualityOut,
     DashboardQualityReviewOut,
     DashboardMapLatestOut,
     DashboardSummaryOut,
+    IngestJobOut,
     IngestPayload,
     JobRunOut,
-    MapLatestPoint,
     MatchupOut,
     OpsFailureDistributionOut,
     OpsCoverageSummaryOut,
     OpsIngestionMetricsOut,
+    OpsMemoCacheOut,
     OpsMetricsSummaryOut,
+    OpsRequestMetricsOut,
     OpsReviewMetricsOut,
+    OpsRouteRequestMetricsOut,
+    OpsSlowQueriesOut,
+    OpsSlowQueryOut,
     ScopeBreakdownOut,
     SourceChannelMixOut,
     OpsWarningRuleOut,
@@ -40,6 +54,8 @@ from app.models.schemas import (
     ReviewQueueIssueCountOut,
     ReviewQueueErrorCountOut,
     RegionElectionOut,
+    RegionElectionsBatchItemOut,
+    RegionElectionsBatchOut,
     RegionOut,
     SourceTraceOut,
     SummaryPoint,
@@ -48,18 +64,36 @@ from app.models.schemas import (
 )
 from app.services.cutoff_policy import (
     SURVEY_END_DATE_CUTOFF,
-    has_article_source,
-    is_article_published_at_allowed,
-    is_survey_end_date_allowed,
+    is_cutoff_eligible_row,
 )
 from app.services.candidate_token_policy import is_noise_candidate_token
+from app.services.ingest_jobs import notify_ingest_job_enqueued
 from app.services.ingest_service import ingest_payload
 from app.services.ingest_input_normalization import normalize_ingest_payload
-from app.services.region_code_normalizer import normalize_region_code_input
+from app.services.matchup_snapshots import matchup_snapshots_enabled, run_matchup_snapshot_rebuild
+from app.services.normalization import percentage_cache_info
+from app.services.region_code_normalizer import normalize_region_code_input, region_code_cache_info
+from app.services.request_metrics import request_metrics_sample_rate, summarize_request_metrics
+from app.services.scenario_parser import scenario_parse_cache_info
+from app.services.slow_query_log import recent_slow_queries, slow_query_threshold_sec
+from app.services.source_selection import (
+    select_summary_representative,
+    summary_reliability_score,
+    summary_source_tier,
+)
+from app.services.summary_selection_cache import (
+    get_cached_summary_selection,
+    set_cached_summary_selection,
+    summary_selection_cache_key,
+)
+from app.services.trend_engine import compute_trend_aggregates
+from app.services.trend_series import refresh_trend_series_for_observations
 
 router = APIRouter(prefix="/api/v1", tags=["v1"])
 logger = logging.getLogger(__name__)
 
+REGION_ELECTIONS_BATCH_MAX_CODES = 300
+
 MATCHUP_ID_ALIASES = {
     "m_2026_seoul_mayor": "20260603|광역자치단체장|11-000",
 }
@@ -98,14 +132,6 @@ MAP_LATEST_NOISE_TOKENS = {
 }
 MAP_LATEST_CANDIDATE_RE = re.compile(r"^[가-힣]{2,4}$")
 MAP_LATEST_LEGACY_TITLE_RE = re.compile(r"\[(?:19|20)\d{2}[^]]*선거[^]]*\]")
-ARTICLE_AGGREGATE_HINTS = ("집계", "aggregate", "평균", "메타", "종합")
-SOURCE_GRADE_SCORE = {
-    "S": 5,
-    "A": 4,
-    "B": 3,
-    "C": 2,
-    "D": 1,
-}
 SUMMARY_SELECTION_POLICY_VERSION = "summary_single_set_v1"
 MAP_LATEST_CANDIDATE_NAME_RE = re.compile(r"^[가-힣]{2,8}$")
 MAP_LATEST_GENERIC_OPTION_EXACT_TOKENS = {
@@ -482,17 +508,6 @@ def _build_selection_trace(row: dict, *, selected_tier: str, source_meta: dict)
     }
 
 
-def _is_cutoff_eligible_row(row: dict) -> bool:
-    if not is_survey_end_date_allowed(row.get("survey_end_date")):
-        return False
-    if not has_article_source(
-        source_channel=row.get("source_channel"),
-        source_channels=row.get("source_channels"),
-    ):
-        return True
-    return is_article_published_at_allowed(row.get("article_published_at"))
-
-
 def _normalize_candidate_token(value: str | None) -> str:
     return re.sub(r"\s+", "", str(value or "").strip())
 
@@ -614,55 +629,6 @@ def _classify_presidential_option(option_name: str) -> str:
     return "election_frame"
 
 
-def _summary_source_tier(row: dict) -> Literal["official", "nesdc", "article_aggregate", "article"]:
-    source_channel = str(row.get("source_channel") or "").strip().lower()
-    source_channels = {str(ch).strip().lower() for ch in (row.get("source_channels") or []) if ch is not None}
-
-    if source_channel == "official" or "official" in source_channels:
-        return "official"
-    if source_channel == "nesdc" or "nesdc" in source_channels:
-        return "nesdc"
-
-    pollster = str(row.get("pollster") or "").strip().lower()
-    if any(hint in pollster for hint in ARTICLE_AGGREGATE_HINTS):
-        return "article_aggregate"
-    return "article"
-
-
-def _summary_source_tier_score(tier: Literal["official", "nesdc", "article_aggregate", "article"]) -> int:
-    return {
-        "official": 4,
-        "nesdc": 3,
-        "article_aggregate": 2,
-        "article": 1,
-    }[tier]
-
-
-def _summary_reliability_score(row: dict) -> int:
-    source_grade = str(row.get("source_grade") or "").strip().upper()
-    if source_grade in SOURCE_GRADE_SCORE:
-        return SOURCE_GRADE_SCORE[source_grade]
-    return 0
-
-
-def _summary_row_sort_key(row: dict) -> tuple[int, float, int]:
-    tier = _summary_source_tier(row)
-    date_value = row.get("survey_end_date")
-    date_score = 0.0
-    if isinstance(date_value, date):
-        date_score = float(date_value.toordinal())
-    return (
-        _summary_source_tier_score(tier),
-        date_score,
-        _summary_reliability_score(row),
-    )
-
-
-def _select_summary_representative(rows: list[dict]) -> tuple[dict, str]:
-    selected = max(rows, key=_summary_row_sort_key)
-    return selected, _summary_source_tier(selected)
-
-
 def _summary_published_or_official_at(row: dict) -> datetime | None:
     return _to_datetime(row.get("official_release_at")) or _to_datetime(row.get("article_published_at"))
 
@@ -672,8 +638,8 @@ def _summary_updated_at(row: dict) -> datetime | None:
 
 
 def _summary_single_set_sort_key(row: dict) -> tuple[int, int, float, float]:
-    tier = _summary_source_tier(row)
-    source_grade_score = _summary_reliability_score(row)
+    tier = summary_source_tier(row)
+    source_grade_score = summary_reliability_score(row)
     published_at = _summary_published_or_official_at(row)
     updated_at = _summary_updated_at(row)
     published_score = published_at.timestamp() if published_at is not None else 0.0
@@ -689,7 +655,7 @@ def _summary_single_set_sort_key(row: dict) -> tuple[int, int, float, float]:
 
 def _select_summary_single_set_representative(rows: list[dict]) -> tuple[dict, str]:
     selected = max(rows, key=_summary_single_set_sort_key)
-    return selected, _summary_source_tier(selected)
+    return selected, summary_source_tier(selected)
 
 
 def _summary_selected_reason(source_meta: dict) -> Literal["official_preferred", "latest_fallback"]:
@@ -725,7 +691,7 @@ def _is_legacy_map_title(title: str | None) -> bool:
 
 
 def _map_latest_drop_reason(row: dict) -> str | None:
-    if not _is_cutoff_eligible_row(row):
+    if not is_cutoff_eligible_row(row):
         return "cutoff_blocked"
 
     option_name = str(row.get("option_name") or "").strip()
@@ -749,16 +715,8 @@ def _map_latest_drop_reason(row: dict) -> str | None:
     return None
 
 
-@router.get("/dashboard/summary", response_model=DashboardSummaryOut)
-def get_dashboard_summary(
-    as_of: date | None = Query(default=None),
-    repo=Depends(get_repository),
-):
-    rows = repo.fetch_dashboard_summary(as_of=as_of)
-    party_support: list[SummaryPoint] = []
-    president_job_approval: list[SummaryPoint] = []
-    election_frame: list[SummaryPoint] = []
-    eligible_rows = [row for row in rows if _is_cutoff_eligible_row(row)]
+def _select_dashboard_summary(rows: list[dict]) -> dict:
+    eligible_rows = [row for row in rows if is_cutoff_eligible_row(row)]
     national_rows = [row for row in eligible_rows if row.get("audience_scope") == "national"]
     grouped: dict[tuple[str, str], list[dict]] = {}
     for row in national_rows:
@@ -777,8 +735,42 @@ def get_dashboard_summary(
             continue
         grouped.setdefault((bucket, option_name), []).append(row)
 
+    selected: list[tuple[str, dict, str]] = []
     for (bucket, _option_name), candidates in sorted(grouped.items(), key=lambda x: (x[0][0], x[0][1])):
         selected_row, selected_tier = _select_summary_single_set_representative(candidates)
+        selected.append((bucket, selected_row, selected_tier))
+    return {
+        "selected": selected,
+        "data_source": _derive_dashboard_data_source(eligible_rows),
+        "scope_breakdown": _build_scope_breakdown(eligible_rows),
+    }
+
+
+@router.get("/dashboard/summary", response_model=DashboardSummaryOut)
+def get_dashboard_summary(
+    as_of: date | None = Query(default=None),
+    repo=Depends(get_repository),
+    _etag=Depends(conditional_read),
+):
+    cache_key = None
+    fetch_generation = getattr(repo, "fetch_data_generation", None)
+    if callable(fetch_generation):
+        cache_key = summary_selection_cache_key(
+            as_of,
+            generation=fetch_generation(),
+            policy_version=SUMMARY_SELECTION_POLICY_VERSION,
+        )
+    selection = get_cached_summary_selection(cache_key) if cache_key is not None else None
+    if selection is None:
+        selection = _select_dashboard_summary(repo.fetch_dashboard_summary(as_of=as_of))
+        if cache_key is not None:
+            set_cached_summary_selection(cache_key, selection)
+
+    # Rendering stays per request: freshness_hours is relative to now.
+    party_support: list[SummaryPoint] = []
+    president_job_approval: list[SummaryPoint] = []
+    election_frame: list[SummaryPoint] = []
+    for bucket, selected_row, selected_tier in selection["selected"]:
         source_meta = _derive_source_meta(selected_row)
         selection_trace = _build_selection_trace(selected_row, selected_tier=selected_tier, source_meta=source_meta)
         point = SummaryPoint(
@@ -819,23 +811,62 @@ def get_dashboard_summary(
     return DashboardSummaryOut(
         as_of=as_of,
         selection_policy_version=SUMMARY_SELECTION_POLICY_VERSION,
-        data_source=_derive_dashboard_data_source(eligible_rows),
+        data_source=selection["data_source"],
         party_support=party_support,
         president_job_approval=president_job_approval,
         election_frame=election_frame,
         presidential_approval=deprecated_presidential_approval,
         presidential_approval_deprecated=True,
-        scope_breakdown=ScopeBreakdownOut(**_build_scope_breakdown(eligible_rows)),
+        scope_breakdown=ScopeBreakdownOut(**selection["scope_breakdown"]),
     )
 
 
+def _trend_point_from_row(row: dict, selected_tier: str | None) -> TrendPoint:
+    source_meta = _derive_source_meta(row)
+    return TrendPoint(
+        survey_end_date=row["survey_end_date"],
+        option_name=row["option_name"],
+        value_mid=row.get("value_mid"),
+        pollster=row.get("pollster"),
+        audience_scope=row.get("audience_scope"),
+        audience_region_code=row.get("audience_region_code"),
+        source_trace=_build_source_trace(
+            row=row,
+            source_meta=source_meta,
+            selected_source_tier=selected_tier,
+            selected_source_channel=row.get("source_channel"),
+        ),
+    )
+
+
+def _select_trend_points(eligible_rows: list[dict]) -> list[TrendPoint]:
+    grouped: dict[tuple[date, str], list[dict]] = {}
+    for row in eligible_rows:
+        survey_end_date = row.get("survey_end_date")
+        option_name = str(row.get("option_name") or "").strip()
+        if not isinstance(survey_end_date, date) or not option_name:
+            continue
+        grouped.setdefault((survey_end_date, option_name), []).append(row)
+
+    points: list[TrendPoint] = []
+    for (survey_end_date, option_name), candidates in sorted(grouped.items(), key=lambda item: (item[0][0], item[0][1])):
+        selected_row, selected_tier = select_summary_representative(candidates)
+        points.append(_trend_point_from_row(dict(selected_row, option_name=option_name), selected_tier))
+    return points
+
+
 @router.get("/trends/{metric}", response_model=TrendsOut)
 def get_trends(
+    request: Request,
+    response: Response,
     metric: Literal["party_support", "president_job_approval", "election_frame"],
     scope: Literal["national", "regional", "local"] = Query(default="national"),
     region_code: str | None = Query(default=None),
     days: int = Query(default=30, ge=1, le=365),
+    aggregate: Literal["raw", "rolling", "weighted", "house_adjusted"] = Query(default="raw"),
+    window_days: int = Query(default=7, ge=1, le=60),
     repo=Depends(get_repository),
+    etag=Depends(conditional_read),
 ):
     resolved_region_code = None
     if scope != "national":
@@ -847,130 +878,169 @@ def get_trends(
         region_normalized = normalize_region_code_input(region_code)
         resolved_region_code = region_normalized.canonical or region_code
 
+    if aggregate != "raw":
+
+        def build_payload() -> dict:
+            # Fetch window_days - 1 extra days so the first requested day has a full window.
+            rows = repo.fetch_trends(
+                metric=metric,
+                scope=scope,
+                region_code=resolved_region_code,
+                days=days + window_days - 1,
+            )
+            eligible_rows = [row for row in rows if is_cutoff_eligible_row(row)]
+            estimates = compute_trend_aggregates(eligible_rows, mode=aggregate, window_days=window_days)
+            first_day = date.today() - timedelta(days=days - 1)
+            points = []
+            for point in _select_trend_points(eligible_rows):
+                if point.survey_end_date < first_day:
+                    continue
+                estimate = estimates.get((point.survey_end_date, point.option_name))
+                if estimate is not None:
+                    point.aggregate_value = estimate.value
+                    point.aggregate_low = estimate.low
+                    point.aggregate_high = estimate.high
+                    point.aggregate_poll_count = estimate.poll_count
+                points.append(point)
+            return {
+                "metric": metric,
+                "scope": scope,
+                "region_code": resolved_region_code,
+                "days": days,
+                "aggregate": aggregate,
+                "window_days": window_days,
+                "points": points,
+                "generated_at": datetime.now(timezone.utc),
+            }
+
+        # Smoothing reads every poll in the window; the encoded result is reused while the read
+        # ETag (data generation + freshness bucket) holds, for up to API_ENCODED_RESPONSE_CACHE_TTL_SEC.
+        return encoded_json_response(request, response, TrendsOut, build_payload, etag=etag)
+
+    fetch_series = getattr(repo, "fetch_trend_series", None)
+    series_rows = None
+    if callable(fetch_series):
+        series_rows = fetch_series(
+            metric=metric,
+            scope=scope,
+            region_code=resolved_region_code,
+            days=days,
+        )
+    if series_rows is not None:
+        # One pre-selected representative per (day, option): skip the grouping pass.
+        return TrendsOut(
+            metric=metric,
+            scope=scope,
+            region_code=resolved_region_code,
+            days=days,
+            points=[_trend_point_from_row(row, row.get("selected_source_tier")) for row in series_rows],
+            generated_at=datetime.now(timezone.utc),
+        )
+
     rows = repo.fetch_trends(
         metric=metric,
         scope=scope,
         region_code=resolved_region_code,
         days=days,
     )
-    eligible_rows = [row for row in rows if _is_cutoff_eligible_row(row)]
-
-    grouped: dict[tuple[date, str], list[dict]] = {}
-    for row in eligible_rows:
-        survey_end_date = row.get("survey_end_date")
-        option_name = str(row.get("option_name") or "").strip()
-        if not isinstance(survey_end_date, date) or not option_name:
-            continue
-        grouped.setdefault((survey_end_date, option_name), []).append(row)
-
-    points: list[TrendPoint] = []
-    for (survey_end_date, option_name), candidates in sorted(grouped.items(), key=lambda item: (item[0][0], item[0][1])):
-        selected_row, selected_tier = _select_summary_representative(candidates)
-        source_meta = _derive_source_meta(selected_row)
-        points.append(
-            TrendPoint(
-                survey_end_date=survey_end_date,
-                option_name=option_name,
-                value_mid=selected_row.get("value_mid"),
-                pollster=selected_row.get("pollster"),
-                audience_scope=selected_row.get("audience_scope"),
-                audience_region_code=selected_row.get("audience_region_code"),
-                source_trace=_build_source_trace(
-                    row=selected_row,
-                    source_meta=source_meta,
-                    selected_source_tier=selected_tier,
-                    selected_source_channel=selected_row.get("source_channel"),
-                ),
-            )
-        )
+    eligible_rows = [row for row in rows if is_cutoff_eligible_row(row)]
 
     return TrendsOut(
         metric=metric,
         scope=scope,
         region_code=resolved_region_code,
         days=days,
-        points=points,
+        points=_select_trend_points(eligible_rows),
         generated_at=datetime.now(timezone.utc),
     )
 
 
 @router.get("/dashboard/map-latest", response_model=DashboardMapLatestOut)
 def get_dashboard_map_latest(
+    request: Request,
+    response: Response,
     as_of: date | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     repo=Depends(get_repository),
+    etag=Depends(conditional_read),
 ):
-    rows = repo.fetch_dashboard_map_latest(as_of=as_of, limit=limit)
-    items = []
-    kept_rows = []
-    reason_counts: dict[str, int] = {}
-    for row in rows:
-        exclusion_reason = _map_latest_exclusion_reason(row)
-        if exclusion_reason is not None:
-            drop_reason = _map_latest_drop_reason(row)
-            if exclusion_reason in {"survey_end_date_before_cutoff", "article_published_at_before_cutoff"}:
-                reason_key = "stale_cycle"
-            elif drop_reason == "cutoff_blocked":
-                reason_key = "stale_cycle"
-            else:
-                reason_key = drop_reason or exclusion_reason
-            reason_counts[reason_key] = reason_counts.get(reason_key, 0) + 1
-            continue
-        kept_rows.append(row)
-
-    logger.info(
-        "dashboard_map_latest_sanity total=%d kept=%d excluded=%d reason_counts=%s",
-        len(rows),
-        len(kept_rows),
-        len(rows) - len(kept_rows),
-        reason_counts,
-    )
+    def build_payload() -> dict:
+        rows = repo.fetch_dashboard_map_latest(as_of=as_of, limit=limit)
+        kept_rows = []
+        reason_counts: dict[str, int] = {}
+        for row in rows:
+            exclusion_reason = _map_latest_exclusion_reason(row)
+            if exclusion_reason is not None:
+                drop_reason = _map_latest_drop_reason(row)
+                if exclusion_reason in {"survey_end_date_before_cutoff", "article_published_at_before_cutoff"}:
+                    reason_key = "stale_cycle"
+                elif drop_reason == "cutoff_blocked":
+                    reason_key = "stale_cycle"
+                else:
+                    reason_key = drop_reason or exclusion_reason
+                reason_counts[reason_key] = reason_counts.get(reason_key, 0) + 1
+                continue
+            kept_rows.append(row)
 
-    for row in kept_rows:
-        selected_tier = _summary_source_tier(row)
-        source_meta = _derive_source_meta(row)
-        title, canonical_title, article_title = _normalize_title_fields(
-            canonical_title=row.get("canonical_title"),
-            article_title=row.get("article_title"),
-            fallback_title=row["title"],
+        logger.info(
+            "dashboard_map_latest_sanity total=%d kept=%d excluded=%d reason_counts=%s",
+            len(rows),
+            len(kept_rows),
+            len(rows) - len(kept_rows),
+            reason_counts,
         )
-        selection_trace = _build_selection_trace(row, selected_tier=selected_tier, source_meta=source_meta)
-        items.append(
-            MapLatestPoint(
-                region_code=row["region_code"],
-                office_type=row["office_type"],
-                title=title,
-                canonical_title=canonical_title,
-                article_title=article_title,
-                value_mid=row.get("value_mid"),
-                survey_end_date=row.get("survey_end_date"),
-                option_name=row.get("option_name"),
-                audience_scope=row.get("audience_scope"),
-                audience_region_code=row.get("audience_region_code"),
-                source_priority=source_meta["source_priority"],
-                selected_source_tier=selected_tier,
-                selected_source_channel=row.get("source_channel"),
-                official_release_at=source_meta["official_release_at"],
-                article_published_at=source_meta["article_published_at"],
-                freshness_hours=source_meta["freshness_hours"],
-                is_official_confirmed=source_meta["is_official_confirmed"],
-                source_channel=row.get("source_channel"),
-                source_channels=row.get("source_channels") or [],
-                source_trace=_build_source_trace(row=row, source_meta=source_meta),
-                selection_trace=selection_trace,
+
+        items = []
+        for row in kept_rows:
+            selected_tier = summary_source_tier(row)
+            source_meta = _derive_source_meta(row)
+            title, canonical_title, article_title = _normalize_title_fields(
+                canonical_title=row.get("canonical_title"),
+                article_title=row.get("article_title"),
+                fallback_title=row["title"],
             )
-        )
-    return DashboardMapLatestOut(
-        as_of=as_of,
-        items=items,
-        scope_breakdown=ScopeBreakdownOut(**_build_scope_breakdown(kept_rows)),
-        filter_stats=DashboardFilterStatsOut(
-            total_count=len(rows),
-            kept_count=len(kept_rows),
-            excluded_count=len(rows) - len(kept_rows),
-            reason_counts=reason_counts,
-        ),
-    )
+            items.append(
+                {
+                    "region_code": row["region_code"],
+                    "office_type": row["office_type"],
+                    "title": title,
+                    "canonical_title": canonical_title,
+                    "article_title": article_title,
+                    "value_mid": row.get("value_mid"),
+                    "survey_end_date": row.get("survey_end_date"),
+                    "option_name": row.get("option_name"),
+                    "audience_scope": row.get("audience_scope"),
+                    "audience_region_code": row.get("audience_region_code"),
+                    "source_priority": source_meta["source_priority"],
+                    "selected_source_tier": selected_tier,
+                    "selected_source_channel": row.get("source_channel"),
+                    "official_release_at": source_meta["official_release_at"],
+                    "article_published_at": source_meta["article_published_at"],
+                    "freshness_hours": source_meta["freshness_hours"],
+                    "is_official_confirmed": source_meta["is_official_confirmed"],
+                    "source_channel": row.get("source_channel"),
+                    "source_channels": row.get("source_channels") or [],
+                    "source_trace": _build_source_trace(row=row, source_meta=source_meta),
+                    "selection_trace": _build_selection_trace(
+                        row, selected_tier=selected_tier, source_meta=source_meta
+                    ),
+                }
+            )
+        return {
+            "as_of": as_of,
+            "items": items,
+            "scope_breakdown": _build_scope_breakdown(kept_rows),
+            "filter_stats": {
+                "total_count": len(rows),
+                "kept_count": len(kept_rows),
+                "excluded_count": len(rows) - len(kept_rows),
+                "reason_counts": reason_counts,
+            },
+        }
+
+    # Up to 500 points with nested traces: skip per-item models and the second
+    # response_model pass, and reuse the encoded body while the ETag holds.
+    return encoded_json_response(request, response, DashboardMapLatestOut, build_payload, etag=etag)
 
 
 @router.get("/dashboard/big-matches", response_model=DashboardBigMatchesOut)
@@ -978,10 +1048,11 @@ def get_dashboard_big_matches(
     as_of: date | None = Query(default=None),
     limit: int = Query(default=3, ge=1, le=20),
     repo=Depends(get_repository),
+    _etag=Depends(conditional_read),
 ):
     rows = repo.fetch_dashboard_big_matches(as_of=as_of, limit=limit)
     items = []
-    eligible_rows = [row for row in rows if _is_cutoff_eligible_row(row)]
+    eligible_rows = [row for row in rows if is_cutoff_eligible_row(row)]
     for row in eligible_rows:
         source_meta = _derive_source_meta(row)
         title, canonical_title, article_title = _normalize_title_fields(
@@ -1075,12 +1146,61 @@ def search_regions(
     return [RegionOut(**row) for row in rows]
 
 
+@router.get("/regions/elections", response_model=RegionElectionsBatchOut)
+def get_region_elections_batch(
+    region_codes: str | None = Query(default=None, description="comma separated region codes"),
+    sido_code: str | None = Query(default=None),
+    topology: Literal["official", "scenario"] = Query(default="official"),
+    version_id: str | None = Query(default=None),
+    repo=Depends(get_repository),
+    _etag=Depends(conditional_read),
+):
+    resolved_codes: list[str] = []
+    for raw_code in (region_codes or "").split(","):
+        raw_code = raw_code.strip()
+        if not raw_code:
+            continue
+        region_normalized = normalize_region_code_input(raw_code)
+        resolved_code = region_normalized.canonical or raw_code
+        if resolved_code not in resolved_codes:
+            resolved_codes.append(resolved_code)
+
+    resolved_sido_code = None
+    if sido_code and sido_code.strip():
+        sido_normalized = normalize_region_code_input(sido_code.strip())
+        resolved_sido_code = sido_normalized.canonical or sido_code.strip()
+
+    if not resolved_codes and not resolved_sido_code:
+        raise HTTPException(status_code=422, detail="region_codes or sido_code is required")
+    if len(resolved_codes) > REGION_ELECTIONS_BATCH_MAX_CODES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"region_codes must not exceed {REGION_ELECTIONS_BATCH_MAX_CODES} codes",
+        )
+
+    rows_by_region = repo.fetch_region_elections_batch(
+        region_codes=resolved_codes,
+        sido_code=resolved_sido_code,
+        topology=topology,
+        version_id=version_id,
+    )
+    items = [
+        RegionElectionsBatchItemOut(
+            region_code=region_code,
+            elections=[RegionElectionOut(**row) for row in rows],
+        )
+        for region_code, rows in rows_by_region.items()
+    ]
+    return RegionElectionsBatchOut(topology=topology, region_count=len(items), items=items)
+
+
 @router.get("/regions/{region_code}/elections", response_model=list[RegionElectionOut])
 def get_region_elections(
     region_code: str,
     topology: Literal["official", "scenario"] = Query(default="official"),
     version_id: str | None = Query(default=None),
     repo=Depends(get_repository),
+    _etag=Depends(conditional_read),
 ):
     region_normalized = normalize_region_code_input(region_code)
     resolved_region_code = region_normalized.canonical or region_code
@@ -1095,12 +1215,21 @@ def get_region_elections(
 
 
 @router.get("/matchups/{matchup_id}", response_model=MatchupOut)
-def get_matchup(matchup_id: str, repo=Depends(get_repository)):
+def get_matchup(
+    matchup_id: str,
+    repo=Depends(get_repository),
+    _etag=Depends(conditional_read),
+):
     resolved_matchup_id = _normalize_matchup_id(matchup_id)
-    matchup = repo.get_matchup(resolved_matchup_id)
+    matchup = None
+    fetch_snapshot = getattr(repo, "fetch_matchup_snapshot", None)
+    if callable(fetch_snapshot) and matchup_snapshots_enabled():
+        matchup = fetch_snapshot(resolved_matchup_id)
+    if matchup is None:
+        matchup = repo.get_matchup(resolved_matchup_id)
     if not matchup:
         raise HTTPException(status_code=404, detail="matchup not found")
-    if not _is_cutoff_eligible_row(matchup):
+    if not is_cutoff_eligible_row(matchup):
         raise HTTPException(status_code=404, detail="matchup not found")
     source_meta = _derive_source_meta(matchup)
     payload = dict(matchup)
@@ -1218,6 +1347,46 @@ def get_ops_metrics_summary(
     )
 
 
+def _memo_cache_out(name: str, info) -> OpsMemoCacheOut:
+    lookups = info.hits + info.misses
+    return OpsMemoCacheOut(
+        name=name,
+        hits=info.hits,
+        misses=info.misses,
+        size=info.currsize,
+        max_size=info.maxsize,
+        hit_rate=round(info.hits / lookups, 4) if lookups else None,
+    )
+
+
+@router.get("/ops/request-metrics", response_model=OpsRequestMetricsOut)
+def get_ops_request_metrics():
+    return OpsRequestMetricsOut(
+        generated_at=datetime.now(timezone.utc),
+        sample_rate=request_metrics_sample_rate(),
+        routes=[OpsRouteRequestMetricsOut(**row) for row in summarize_request_metrics()],
+        memo_caches=[
+            _memo_cache_out("region_code", region_code_cache_info()),
+            _memo_cache_out("percentage", percentage_cache_info()),
+            _memo_cache_out("scenario_parse", scenario_parse_cache_info()),
+        ],
+    )
+
+
+@router.get("/ops/slow-queries", response_model=OpsSlowQueriesOut)
+def get_ops_slow_queries(
+    method: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    _=Depends(require_internal_job_token),
+):
+    threshold_sec = slow_query_threshold_sec()
+    return OpsSlowQueriesOut(
+        generated_at=datetime.now(timezone.utc),
+        threshold_ms=threshold_sec * 1000.0 if threshold_sec is not None else None,
+        items=[OpsSlowQueryOut(**row) for row in recent_slow_queries(method)[:limit]],
+    )
+
+
 @router.get("/ops/coverage/summary", response_model=OpsCoverageSummaryOut)
 def get_ops_coverage_summary(repo=Depends(get_repository)):
     summary = repo.fetch_ops_coverage_summary()
@@ -1267,6 +1436,8 @@ def _apply_review_queue_decision(
     )
     if not row:
         raise HTTPException(status_code=404, detail="review queue item not found")
+    if row.get("entity_type") in {"poll_observation", "ingest_record"}:
+        refresh_trend_series_for_observations(repo, [row.get("entity_id")])
     return ReviewQueueItemOut(**row)
 
 
@@ -1340,14 +1511,52 @@ def get_review_queue_trends(
     )
 
 
-@router.post("/jobs/run-ingest", response_model=JobRunOut)
-async def run_ingest_job(
-    request: Request,
-    _=Depends(require_internal_job_token),
-    repo=Depends(get_repository),
-):
+def _ingest_max_body_bytes() -> int:
+    try:
+        return max(int(get_settings().ingest_max_body_bytes), 1)
+    except Exception:  # noqa: BLE001
+        return 50 * 1024 * 1024
+
+
+async def _read_request_body(request: Request, *, max_bytes: int) -> bytes:
+    """Request body, gunzipped while streaming when Content-Encoding is gzip.
+
+    The limit applies to the decompressed size, so a small compressed body cannot
+    expand past it.
+    """
+    encoding = (request.headers.get("content-encoding") or "identity").strip().lower()
+    if encoding not in {"identity", "gzip"}:
+        raise HTTPException(status_code=415, detail=f"unsupported content-encoding: {encoding}")
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if encoding == "gzip" else None
+    parts: list[bytes] = []
+    size = 0
     try:
-        raw_payload = await request.json()
+        async for chunk in request.stream():
+            if decompressor is not None:
+                # Cap each step's output so one highly compressible chunk cannot blow past the limit in memory.
+                data = decompressor.decompress(chunk, max_bytes - size + 1)
+                while decompressor.unconsumed_tail and len(data) <= max_bytes - size:
+                    data += decompressor.decompress(decompressor.unconsumed_tail, max_bytes - size - len(data) + 1)
+                chunk = data
+            size += len(chunk)
+            if size > max_bytes:
+                raise HTTPException(status_code=413, detail=f"request body exceeds {max_bytes} bytes")
+            parts.append(chunk)
+        if decompressor is not None:
+            tail = decompressor.flush()
+            size += len(tail)
+            if size > max_bytes:
+                raise HTTPException(status_code=413, detail=f"request body exceeds {max_bytes} bytes")
+            parts.append(tail)
+    except zlib.error as exc:
+        raise HTTPException(status_code=400, detail=f"invalid gzip body: {exc}") from exc
+    return b"".join(parts)
+
+
+async def _read_ingest_payload(request: Request) -> IngestPayload:
+    body = await _read_request_body(request, max_bytes=_ingest_max_body_bytes())
+    try:
+        raw_payload = json.loads(body)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(status_code=422, detail=f"invalid json payload: {exc}") from exc
     if not isinstance(raw_payload, dict):
@@ -1355,14 +1564,68 @@ async def run_ingest_job(
 
     normalized_payload = normalize_ingest_payload(raw_payload)
     try:
-        payload = IngestPayload.model_validate(normalized_payload)
+        return IngestPayload.model_validate(normalized_payload)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors()) from exc
 
+
+def _ingest_job_out(job: dict, *, deduplicated: bool = False) -> IngestJobOut:
+    return IngestJobOut(job_id=job["id"], deduplicated=deduplicated, **{k: v for k, v in job.items() if k != "id"})
+
+
+@router.post("/jobs/run-ingest", response_model=JobRunOut)
+async def run_ingest_job(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    _=Depends(require_internal_job_token),
+    repo=Depends(get_repository),
+):
+    payload = await _read_ingest_payload(request)
     result = ingest_payload(payload, repo)
+    if result.touched_matchup_ids and matchup_snapshots_enabled():
+        background_tasks.add_task(run_matchup_snapshot_rebuild, result.touched_matchup_ids, run_id=result.run_id)
     return JobRunOut(
         run_id=result.run_id,
         processed_count=result.processed_count,
         error_count=result.error_count,
+        skipped_count=result.skipped_count,
         status=result.status,
     )
+
+
+@router.post("/jobs/ingest-jobs", response_model=IngestJobOut, status_code=202)
+async def enqueue_ingest_job(
+    request: Request,
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    _=Depends(require_internal_job_token),
+    repo=Depends(get_repository),
+):
+    payload = await _read_ingest_payload(request)
+    payload_json = payload.model_dump(mode="json")
+    payload_hash = hashlib.sha256(
+        json.dumps(payload_json, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    key = (idempotency_key or "").strip() or None
+    job, created = repo.enqueue_ingest_job(
+        payload_json,
+        payload_hash=payload_hash,
+        record_count=len(payload.records),
+        idempotency_key=key,
+    )
+    if job is None:
+        raise HTTPException(status_code=409, detail="idempotency key already used for a different payload")
+    if job["status"] == "queued":
+        notify_ingest_job_enqueued()
+    return _ingest_job_out(job, deduplicated=not created)
+
+
+@router.get("/jobs/ingest-jobs/{job_id}", response_model=IngestJobOut)
+def get_ingest_job(
+    job_id: int,
+    _=Depends(require_internal_job_token),
+    repo=Depends(get_repository),
+):
+    job = repo.fetch_ingest_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="ingest job not found")
+    return _ingest_job_out(job)
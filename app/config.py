@@ -23,6 +23,18 @@ class Settings(BaseSettings):
     data_go_candidate_requests_per_sec: float = 5.0
     data_go_candidate_num_of_rows: int = 300
     api_read_cache_ttl_sec: int = 0
+    matchup_snapshots_enabled: bool = True
+    data_generation_cache_ttl_sec: float = 1.0
+    api_cache_control_max_age_sec: int = 0
+    api_etag_freshness_bucket_sec: int = 300
+    api_encoded_response_cache_ttl_sec: float = 30.0
+    request_metrics_sample_rate: float = 1.0
+    slow_query_threshold_ms: float = 0.0
+    slow_query_explain_enabled: bool = True
+    ingest_job_workers: int = 0
+    ingest_job_poll_interval_sec: float = 2.0
+    ingest_job_stale_after_sec: float = 600.0
+    ingest_max_body_bytes: int = 50 * 1024 * 1024
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
@@ -6,6 +6,7 @@ import psycopg
 from psycopg.rows import dict_row
 
 from app.config import get_settings
+from app.services.request_metrics import InstrumentedCursor
 
 
 class DatabaseConfigurationError(RuntimeError):
@@ -84,7 +85,7 @@ def get_connection():
         raise DatabaseConfigurationError("DATABASE_URL is empty")
 
     try:
-        conn = psycopg.connect(database_url, row_factory=dict_row)
+        conn = psycopg.connect(database_url, row_factory=dict_row, cursor_factory=InstrumentedCursor)
     except psycopg.Error as exc:
         reason = _classify_connection_error(exc)
         message = " ".join(str(exc).split())
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import gzip
 import json
+import math
 import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
+from hashlib import sha256
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import httpx
 
@@ -31,6 +35,7 @@ class AttemptLog:
     finished_at: str | None = None
     duration_seconds: float | None = None
     next_backoff_seconds: float | None = None
+    chunk_id: str | None = None
 
 
 @dataclass
@@ -45,9 +50,10 @@ class IngestRunnerResult:
     failure_type: str | None = None
     cause_code: str | None = None
     failure_reason: str | None = None
+    chunks: list[dict[str, Any]] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        out = {
             "success": self.success,
             "attempts": [asdict(item) for item in self.attempts],
             "run_ids": self.run_ids,
@@ -59,6 +65,9 @@ class IngestRunnerResult:
             "cause_code": self.cause_code,
             "failure_reason": self.failure_reason,
         }
+        if self.chunks is not None:
+            out["chunks"] = self.chunks
+        return out
 
 
 RequestFn = Callable[[str, dict[str, str], dict[str, Any], float], httpx.Response]
@@ -74,6 +83,18 @@ def default_request_fn(
     return httpx.post(url, headers=headers, json=payload, timeout=timeout)
 
 
+def gzip_request_fn(
+    url: str,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: float,
+) -> httpx.Response:
+    """Like default_request_fn, but sends the JSON body gzip-compressed (Content-Encoding: gzip)."""
+    body = gzip.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), compresslevel=6)
+    gzip_headers = {**headers, "Content-Type": "application/json", "Content-Encoding": "gzip"}
+    return httpx.post(url, headers=gzip_headers, content=body, timeout=timeout)
+
+
 def _classify_failure(
     http_status: int | None,
     job_status: str | None,
@@ -480,3 +501,296 @@ def write_runner_report(path: str | Path, result: IngestRunnerResult) -> None:
     report_path = Path(path)
     report_path.parent.mkdir(parents=True, exist_ok=True)
     report_path.write_text(json.dumps(result.to_dict(), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+GetFn = Callable[[str, dict[str, str], float], httpx.Response]
+INGEST_JOB_TERMINAL_STATUSES = {"success", "partial_success", "failed"}
+
+
+def default_get_fn(url: str, headers: dict[str, str], timeout: float) -> httpx.Response:
+    return httpx.get(url, headers=headers, timeout=timeout)
+
+
+def _response_body(response: httpx.Response) -> Any:
+    try:
+        return response.json()
+    except Exception:  # noqa: BLE001
+        return {"detail": response.text[:300] if hasattr(response, "text") else "non-json response"}
+
+
+def run_ingest_job_polling(
+    *,
+    api_base_url: str,
+    token: str,
+    payload: dict[str, Any],
+    idempotency_key: str,
+    max_retries: int = 2,
+    backoff_seconds: float = 1.0,
+    request_timeout: float = 30.0,
+    poll_interval_seconds: float = 5.0,
+    poll_timeout_seconds: float = 1800.0,
+    request_fn: RequestFn = default_request_fn,
+    get_fn: GetFn = default_get_fn,
+    sleep_fn: Callable[[float], None] = time.sleep,
+    event_log_fn: EventLogFn | None = None,
+) -> IngestRunnerResult:
+    """Enqueue the payload as an ingest job and poll it until it finishes.
+
+    Every attempt sends the same Idempotency-Key, so a retry rejoins the existing job
+    (or re-queues it after a failure) instead of ingesting the payload again.
+    """
+    run_started_at = utc_now()
+    run_started_monotonic = time.monotonic()
+    max_attempts = max(1, max_retries + 1)
+    jobs_url = api_base_url.rstrip("/") + "/api/v1/jobs/ingest-jobs"
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": idempotency_key}
+    max_polls = max(1, math.ceil(poll_timeout_seconds / max(poll_interval_seconds, 0.001)))
+    attempts: list[AttemptLog] = []
+    run_ids: list[int] = []
+    _emit_event(event_log_fn, event="run_start", api_base_url=api_base_url, max_attempts=max_attempts, mode="job_polling")
+
+    for attempt in range(1, max_attempts + 1):
+        attempt_started_at = utc_now()
+        attempt_started_monotonic = time.monotonic()
+        http_status: int | None = None
+        job_status: str | None = None
+        error: str | None = None
+        detail: str | None = None
+        try:
+            response = request_fn(jobs_url, headers, payload, request_timeout)
+            http_status = response.status_code
+            body = _response_body(response)
+            detail = _to_error_detail(body)
+            if http_status == 202 and isinstance(body, dict):
+                job_id = body.get("job_id")
+                job_status = body.get("status")
+                polls = 0
+                while job_status not in INGEST_JOB_TERMINAL_STATUSES:
+                    if polls >= max_polls:
+                        error = f"TimeoutError: job {job_id} still {job_status} after {poll_timeout_seconds}s poll timeout"
+                        break
+                    sleep_fn(poll_interval_seconds)
+                    polls += 1
+                    poll = get_fn(f"{jobs_url}/{job_id}", headers, request_timeout)
+                    http_status = poll.status_code
+                    body = _response_body(poll)
+                    if http_status != 200 or not isinstance(body, dict):
+                        detail = _to_error_detail(body)
+                        break
+                    job_status = body.get("status")
+                    _emit_event(
+                        event_log_fn,
+                        event="attempt_waiting",
+                        attempt=attempt,
+                        job_id=job_id,
+                        job_status=job_status,
+                        progress_done=body.get("progress_done"),
+                        record_count=body.get("record_count"),
+                    )
+                if isinstance(body, dict):
+                    detail = body.get("error") or detail
+                    if isinstance(body.get("run_id"), int) and body["run_id"] not in run_ids:
+                        run_ids.append(body["run_id"])
+        except Exception as exc:  # noqa: BLE001
+            error = f"{exc.__class__.__name__}: {exc}"
+
+        failure_class = _classify_failure(http_status, job_status, error)
+        retryable = _is_retryable_failure_class(failure_class)
+        next_backoff_seconds = (
+            _next_backoff_seconds(failure_class, backoff_seconds, attempt)
+            if attempt < max_attempts and retryable
+            else None
+        )
+        attempts.append(
+            AttemptLog(
+                attempt=attempt,
+                http_status=http_status,
+                job_status=job_status,
+                failure_class=failure_class,
+                failure_type=_to_failure_type(failure_class),
+                cause_code=_derive_cause_code(
+                    failure_class=failure_class,
+                    http_status=http_status,
+                    detail=detail,
+                    error=error,
+                ),
+                retryable=retryable,
+                request_timeout_seconds=request_timeout,
+                error=error,
+                detail=detail,
+                started_at=attempt_started_at,
+                finished_at=utc_now(),
+                duration_seconds=round(time.monotonic() - attempt_started_monotonic, 3),
+                next_backoff_seconds=next_backoff_seconds,
+            )
+        )
+        _emit_event(event_log_fn, event="attempt_result", attempt=attempt, job_status=job_status, failure_class=failure_class)
+        if failure_class is None or next_backoff_seconds is None:
+            break
+        sleep_fn(next_backoff_seconds)
+
+    last = attempts[-1]
+    success = last.failure_class is None
+    elapsed_seconds = round(time.monotonic() - run_started_monotonic, 3)
+    _emit_event(event_log_fn, event="run_end", success=success, elapsed_seconds=elapsed_seconds, attempt_count=len(attempts))
+    return IngestRunnerResult(
+        success=success,
+        attempts=attempts,
+        run_ids=run_ids,
+        started_at=run_started_at,
+        finished_at=utc_now(),
+        elapsed_seconds=elapsed_seconds,
+        failure_class=last.failure_class,
+        failure_type=last.failure_type,
+        cause_code=last.cause_code,
+        failure_reason=None if success else _derive_failure_reason(attempts),
+    )
+
+
+@dataclass
+class IngestChunk:
+    chunk_id: str
+    index: int
+    payload: dict[str, Any] = field(repr=False)
+    record_count: int
+    size_bytes: int
+
+
+def split_ingest_payload(
+    payload: dict[str, Any],
+    *,
+    max_chunk_bytes: int = 1_000_000,
+    max_chunk_records: int = 200,
+) -> list[IngestChunk]:
+    """Split records into size-bounded chunks that keep the payload header fields.
+
+    Chunk ids combine the position with a digest of the chunk records, so re-splitting
+    the same payload yields the same ids. A record larger than max_chunk_bytes forms
+    its own chunk.
+    """
+    header = {key: value for key, value in payload.items() if key != "records"}
+    chunks: list[IngestChunk] = []
+    current: list[Any] = []
+    current_size = 0
+
+    def flush() -> None:
+        nonlocal current, current_size
+        if not current:
+            return
+        digest = sha256(json.dumps(current, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+        index = len(chunks)
+        chunks.append(
+            IngestChunk(
+                chunk_id=f"{index:04d}-{digest[:16]}",
+                index=index,
+                payload={**header, "records": current},
+                record_count=len(current),
+                size_bytes=current_size,
+            )
+        )
+        current, current_size = [], 0
+
+    for record in payload.get("records") or []:
+        size = len(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        if current and (current_size + size > max_chunk_bytes or len(current) >= max(max_chunk_records, 1)):
+            flush()
+        current.append(record)
+        current_size += size
+    flush()
+    return chunks
+
+
+def run_chunked_ingest(
+    *,
+    api_base_url: str,
+    token: str,
+    payload: dict[str, Any],
+    max_chunk_bytes: int = 1_000_000,
+    max_chunk_records: int = 200,
+    concurrency: int = 4,
+    acked_chunk_ids: Iterable[str] = (),
+    on_chunk_ack: Callable[[IngestChunk, IngestRunnerResult], None] | None = None,
+    runner_fn: Callable[..., IngestRunnerResult] = run_ingest_with_retry,
+    **runner_kwargs: Any,
+) -> IngestRunnerResult:
+    """Send a payload as independent chunks with bounded concurrency.
+
+    Each chunk is retried on its own by runner_fn, so a timeout only resends that
+    chunk. Chunks listed in acked_chunk_ids (from an earlier run) are not sent again;
+    on_chunk_ack is called as each chunk succeeds so callers can persist progress.
+    """
+    run_started_at = utc_now()
+    run_started_monotonic = time.monotonic()
+    chunks = split_ingest_payload(payload, max_chunk_bytes=max_chunk_bytes, max_chunk_records=max_chunk_records)
+    already_acked = set(acked_chunk_ids)
+    pending = [chunk for chunk in chunks if chunk.chunk_id not in already_acked]
+    results: dict[str, IngestRunnerResult] = {}
+
+    def send(chunk: IngestChunk) -> IngestRunnerResult:
+        return runner_fn(api_base_url=api_base_url, token=token, payload=chunk.payload, **runner_kwargs)
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        futures = {pool.submit(send, chunk): chunk for chunk in pending}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                error = f"{exc.__class__.__name__}: {exc}"
+                result = IngestRunnerResult(
+                    success=False,
+                    attempts=[],
+                    run_ids=[],
+                    finished_at=utc_now(),
+                    failure_class="request_error",
+                    failure_type="request_error",
+                    cause_code="request_error",
+                    failure_reason=f"request_error: {error}",
+                )
+            results[chunk.chunk_id] = result
+            if result.success and on_chunk_ack is not None:
+                on_chunk_ack(chunk, result)
+
+    chunk_rows: list[dict[str, Any]] = []
+    attempts: list[AttemptLog] = []
+    run_ids: list[int] = []
+    first_failure: IngestRunnerResult | None = None
+    for chunk in chunks:
+        result = results.get(chunk.chunk_id)
+        row = {
+            "chunk_id": chunk.chunk_id,
+            "index": chunk.index,
+            "record_count": chunk.record_count,
+            "size_bytes": chunk.size_bytes,
+        }
+        if result is None:
+            chunk_rows.append({**row, "status": "already_acked", "attempt_count": 0, "run_ids": []})
+            continue
+        attempts.extend(replace(item, chunk_id=chunk.chunk_id) for item in result.attempts)
+        run_ids.extend(result.run_ids)
+        if not result.success and first_failure is None:
+            first_failure = result
+        chunk_rows.append(
+            {
+                **row,
+                "status": "acked" if result.success else "failed",
+                "attempt_count": len(result.attempts),
+                "run_ids": result.run_ids,
+                "failure_class": result.failure_class,
+                "failure_reason": result.failure_reason,
+            }
+        )
+
+    return IngestRunnerResult(
+        success=first_failure is None,
+        attempts=attempts,
+        run_ids=run_ids,
+        started_at=run_started_at,
+        finished_at=utc_now(),
+        elapsed_seconds=round(time.monotonic() - run_started_monotonic, 3),
+        failure_class=first_failure.failure_class if first_failure else None,
+        failure_type=first_failure.failure_type if first_failure else None,
+        cause_code=first_failure.cause_code if first_failure else None,
+        failure_reason=first_failure.failure_reason if first_failure else None,
+        chunks=chunk_rows,
+    )
@@ -0,0 +1,36 @@
+import argparse
+import json
+from threading import Thread
+
+from app.db import get_connection
+from app.services.ingest_jobs import ingest_worker_loop, run_next_ingest_job
+from app.services.repository import PostgresRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process queued ingest jobs (POST /jobs/ingest-jobs)")
+    parser.add_argument("--workers", type=int, default=1, help="worker threads polling the queue")
+    parser.add_argument("--once", action="store_true", help="drain the queue once and exit")
+    args = parser.parse_args()
+
+    if args.once:
+        processed = 0
+        with get_connection() as conn:
+            repo = PostgresRepository(conn)
+            while run_next_ingest_job(repo):
+                processed += 1
+        print(json.dumps({"processed_jobs": processed}, ensure_ascii=False, indent=2))
+        return
+
+    workers = [
+        Thread(target=ingest_worker_loop, name=f"ingest-job-worker-{index}", daemon=True)
+        for index in range(max(args.workers, 1))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
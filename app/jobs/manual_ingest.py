@@ -3,18 +3,23 @@ import json
 
 from app.db import get_connection
 from app.models.schemas import IngestPayload
-from app.services.ingest_service import ingest_payload
+from app.services.ingest_service import ingest_payload, plan_ingest_payload
 from app.services.repository import PostgresRepository
 
 
 def main():
     parser = argparse.ArgumentParser(description="Manual ingest runner for MVP")
     parser.add_argument("--input", required=True, help="Path to ingestion payload json file")
+    parser.add_argument("--dry-run", action="store_true", help="plan the writes without a database and print a summary")
     args = parser.parse_args()
 
     payload_data = json.loads(open(args.input, encoding="utf-8").read())
     payload = IngestPayload.model_validate(payload_data)
 
+    if args.dry_run:
+        print(json.dumps(plan_ingest_payload(payload).summary(), ensure_ascii=False, indent=2))
+        return
+
     with get_connection() as conn:
         repo = PostgresRepository(conn)
         result = ingest_payload(payload, repo)
@@ -25,6 +30,7 @@ def main():
                 "run_id": result.run_id,
                 "processed_count": result.processed_count,
                 "error_count": result.error_count,
+                "skipped_count": result.skipped_count,
                 "status": result.status,
             },
             ensure_ascii=False,
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from app.db import get_connection
+from app.services.matchup_snapshots import rebuild_matchup_snapshots
+from app.services.repository import PostgresRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild precomputed matchup detail snapshots")
+    parser.add_argument("--matchup-id", action="append", default=[], help="matchup_id to rebuild (repeatable)")
+    parser.add_argument("--all", action="store_true", help="Rebuild snapshots for every matchup")
+    args = parser.parse_args()
+
+    with get_connection() as conn:
+        repo = PostgresRepository(conn)
+        matchup_ids = repo.fetch_all_matchup_ids() if args.all else list(args.matchup_id)
+        result = rebuild_matchup_snapshots(repo, matchup_ids)
+
+    print(json.dumps(result.as_dict(), ensure_ascii=False, indent=2))
+    if result.failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
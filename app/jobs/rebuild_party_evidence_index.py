@@ -0,0 +1,20 @@
+import argparse
+import json
+
+from app.db import get_connection
+from app.services.repository import PostgresRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recount candidate_party_evidence from candidates, verified poll_options and incumbents"
+    )
+    parser.parse_args()
+
+    with get_connection() as conn:
+        row_count = PostgresRepository(conn).rebuild_candidate_party_evidence()
+    print(json.dumps({"evidence_row_count": row_count}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from app.db import get_connection
+from app.services.repository import PostgresRepository
+from app.services.trend_series import rebuild_trend_series_days
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the pre-aggregated daily trend series")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--all", action="store_true", help="Rebuild every day and mark the series as backfilled")
+    target.add_argument("--run-id", type=int, default=None, help="Rebuild only days touched by one ingestion run")
+    args = parser.parse_args()
+
+    with get_connection() as conn:
+        repo = PostgresRepository(conn)
+        day_keys = repo.fetch_trend_series_day_keys(run_id=None if args.all else args.run_id)
+        result = rebuild_trend_series_days(repo, day_keys)
+        if args.all and not result.failed_days:
+            repo.mark_trend_series_backfilled()
+
+    print(json.dumps(result.as_dict(), ensure_ascii=False, indent=2))
+    if result.failed_days:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 import os
 import logging
+import time
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import psycopg
@@ -9,6 +10,14 @@ import psycopg
 from app.api.routes import router as api_router
 from app.db import DatabaseConfigurationError, DatabaseConnectionError, get_connection
 from app.runtime_db_guard import DB_BOOTSTRAP_STATE, apply_schema_bootstrap, heal_schema_once, is_schema_mismatch_sqlstate
+from app.services.ingest_jobs import start_ingest_job_workers
+from app.services.request_metrics import (
+    finish_request_stats,
+    record_request_metrics,
+    server_timing_header,
+    should_sample_request,
+    start_request_stats,
+)
 
 DEFAULT_CORS_ALLOW_ORIGINS = (
     "https://2026-deploy.vercel.app,"
@@ -37,6 +46,38 @@ app.add_middleware(
 app.include_router(api_router)
 
 
+@app.middleware("http")
+async def request_query_metrics(request: Request, call_next):
+    if not should_sample_request():
+        return await call_next(request)
+
+    stats, token = start_request_stats()
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        finish_request_stats(token)
+    total_sec = time.perf_counter() - started
+
+    route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+    response.headers["Server-Timing"] = server_timing_header(stats, total_sec=total_sec)
+    record_request_metrics(request.method, route, total_sec=total_sec, stats=stats)
+    logger.info(
+        "request_metrics method=%s route=%s status=%s total_ms=%.2f db_ms=%.2f queries=%s rows=%s "
+        "cache_hits=%s cache_misses=%s",
+        request.method,
+        route,
+        response.status_code,
+        total_sec * 1000.0,
+        stats.db_time_sec * 1000.0,
+        stats.query_count,
+        stats.rows_fetched,
+        stats.cache_hits,
+        stats.cache_misses,
+    )
+    return response
+
+
 @app.on_event("startup")
 def startup_schema_bootstrap():
     state = apply_schema_bootstrap()
@@ -49,6 +90,12 @@ def startup_schema_bootstrap():
     )
 
 
+@app.on_event("startup")
+def startup_ingest_job_workers():
+    # Jobs left queued (or stale) by a previous process are picked up without waiting for a new enqueue.
+    start_ingest_job_workers()
+
+
 @app.exception_handler(psycopg.Error)
 def handle_psycopg_error(_, exc: psycopg.Error):  # noqa: ANN001
     detail = "database query failed"
@@ -114,6 +114,10 @@ class TrendPoint(BaseModel):
     audience_scope: Literal["national", "regional", "local"] | None = None
     audience_region_code: str | None = None
     source_trace: SourceTraceOut = Field(default_factory=SourceTraceOut)
+    aggregate_value: float | None = None
+    aggregate_low: float | None = None
+    aggregate_high: float | None = None
+    aggregate_poll_count: int | None = None
 
 
 class TrendsOut(BaseModel):
@@ -121,6 +125,8 @@ class TrendsOut(BaseModel):
     scope: Literal["national", "regional", "local"]
     region_code: str | None = None
     days: int
+    aggregate: Literal["raw", "rolling", "weighted", "house_adjusted"] = "raw"
+    window_days: int | None = None
     points: list[TrendPoint] = Field(default_factory=list)
     generated_at: datetime
 
@@ -248,6 +254,17 @@ class RegionElectionOut(BaseModel):
     status: Literal["조사 데이터 없음", "후보 정보 준비중", "데이터 준비 완료"] = "조사 데이터 없음"
 
 
+class RegionElectionsBatchItemOut(BaseModel):
+    region_code: str
+    elections: list[RegionElectionOut] = Field(default_factory=list)
+
+
+class RegionElectionsBatchOut(BaseModel):
+    topology: Literal["official", "scenario"] = "official"
+    region_count: int = 0
+    items: list[RegionElectionsBatchItemOut] = Field(default_factory=list)
+
+
 class MatchupOptionOut(BaseModel):
     option_name: str
     candidate_id: str | None
@@ -339,9 +356,28 @@ class JobRunOut(BaseModel):
     run_id: int
     processed_count: int
     error_count: int
+    skipped_count: int = 0
     status: str
 
 
+class IngestJobOut(BaseModel):
+    job_id: int
+    status: Literal["queued", "running", "success", "partial_success", "failed"]
+    idempotency_key: str | None = None
+    deduplicated: bool = False
+    record_count: int
+    progress_done: int = 0
+    processed_count: int | None = None
+    error_count: int | None = None
+    skipped_count: int | None = None
+    run_id: int | None = None
+    attempt_count: int = 0
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
 class OpsIngestionMetricsOut(BaseModel):
     total_runs: int
     success_runs: int
@@ -349,6 +385,7 @@ class OpsIngestionMetricsOut(BaseModel):
     failed_runs: int
     total_processed_count: int
     total_error_count: int
+    total_skipped_count: int = 0
     date_inference_failed_count: int = 0
     date_inference_estimated_count: int = 0
     fetch_fail_rate: float
@@ -385,6 +422,54 @@ class OpsMetricsSummaryOut(BaseModel):
     warnings: list[OpsWarningRuleOut]
 
 
+class OpsRouteRequestMetricsOut(BaseModel):
+    method: str
+    route: str
+    sample_count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    db_p50_ms: float
+    db_p95_ms: float
+    db_p99_ms: float
+    queries_mean: float
+    queries_max: int
+    rows_mean: float
+    cache_hit_rate: float | None = None
+
+
+class OpsMemoCacheOut(BaseModel):
+    name: str
+    hits: int
+    misses: int
+    size: int
+    max_size: int | None = None
+    hit_rate: float | None = None
+
+
+class OpsRequestMetricsOut(BaseModel):
+    generated_at: datetime
+    sample_rate: float
+    routes: list[OpsRouteRequestMetricsOut]
+    memo_caches: list[OpsMemoCacheOut] = Field(default_factory=list)
+
+
+class OpsSlowQueryOut(BaseModel):
+    method: str
+    elapsed_ms: float
+    captured_at: datetime
+    query: str
+    params: Any = None
+    plan: Any = None
+    explain_error: str | None = None
+
+
+class OpsSlowQueriesOut(BaseModel):
+    generated_at: datetime
+    threshold_ms: float | None = None
+    items: list[OpsSlowQueryOut]
+
+
 class OpsCoverageSummaryOut(BaseModel):
     generated_at: datetime
     state: str
@@ -87,3 +87,14 @@ def has_article_source(source_channel: str | None, source_channels: list[str] |
     if not channels:
         return True
     return "article" in {x.strip().lower() for x in channels if x}
+
+
+def is_cutoff_eligible_row(row: dict) -> bool:
+    if not is_survey_end_date_allowed(row.get("survey_end_date")):
+        return False
+    if not has_article_source(
+        source_channel=row.get("source_channel"),
+        source_channels=row.get("source_channels"),
+    ):
+        return True
+    return is_article_published_at_allowed(row.get("article_published_at"))
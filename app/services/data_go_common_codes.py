@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 import re
+import sys
 import threading
 import time
 import xml.etree.ElementTree as ET
@@ -10,6 +12,8 @@ from typing import Any
 from urllib.parse import urlencode, urlparse, urlunparse
 from urllib.request import urlopen
 
+from app.services.region_code_normalizer import REGION_CODE_CACHE_SIZE
+
 
 def _append_params(url: str, params: dict[str, str]) -> str:
     parsed = urlparse(url)
@@ -40,16 +44,21 @@ def normalize_region_code(value: Any) -> str | None:
     text = _norm_text(value)
     if not text:
         return None
+    return _normalize_region_code_text(text)
+
 
+# Unlike region_code_normalizer this accepts longer legal-dong codes and keeps legacy prefixes as sent.
+@lru_cache(maxsize=REGION_CODE_CACHE_SIZE)
+def _normalize_region_code_text(text: str) -> str | None:
     if re.fullmatch(r"\d{2}-\d{3}", text):
-        return text
+        return sys.intern(text)
 
     digits = "".join(ch for ch in text if ch.isdigit())
     if len(digits) >= 5:
         digits = digits[:5]
-        return f"{digits[:2]}-{digits[2:]}"
+        return sys.intern(f"{digits[:2]}-{digits[2:]}")
     if len(digits) == 2:
-        return f"{digits}-000"
+        return sys.intern(f"{digits}-000")
     return None
 
 
@@ -1,9 +1,128 @@
 from __future__ import annotations
 
+import re
 from typing import Any
 
 METRO_OFFICE_TYPES: tuple[str, ...] = ("광역자치단체장", "광역의회", "교육감")
 LOCAL_OFFICE_TYPES: tuple[str, ...] = ("기초자치단체장", "기초의회")
+OFFICE_ORDER: tuple[str, ...] = ("광역자치단체장", "광역의회", "교육감", "기초자치단체장", "기초의회", "재보궐")
+OFFICIAL_TOPOLOGY = "official"
+
+_REGION_NAME_SUFFIXES: tuple[str, ...] = ("특별자치도", "특별자치시", "특별시", "광역시", "자치시", "도", "시")
+_COMPACT_REGION_NAMES: dict[str, str] = {
+    "전라남": "전남",
+    "전라북": "전북",
+    "충청남": "충남",
+    "충청북": "충북",
+    "경상남": "경남",
+    "경상북": "경북",
+}
+_SIDO_CODE_RE = re.compile(r"\d{2}-000")
+_CITY_SUFFIXES: tuple[str, ...] = ("특별시", "광역시", "특별자치시", "자치시")
+_PROVINCE_SUFFIXES: tuple[str, ...] = ("도", "특별자치도")
+
+
+def normalize_region_text(value: Any) -> str:
+    if not isinstance(value, str):
+        return ""
+    return value.strip()
+
+
+def strip_region_suffix(name: str) -> str:
+    for suffix in _REGION_NAME_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)] or name
+    return name
+
+
+def compact_region_name(name: str) -> str:
+    return _COMPACT_REGION_NAMES.get(name, name)
+
+
+def is_sido_region_code(region_code: Any) -> bool:
+    return bool(_SIDO_CODE_RE.fullmatch(normalize_region_text(region_code)))
+
+
+def office_sort_key(office_type: str) -> tuple[int, str]:
+    if office_type in OFFICE_ORDER:
+        return OFFICE_ORDER.index(office_type), office_type
+    return len(OFFICE_ORDER), office_type
+
+
+def derive_placeholder_title(region: dict[str, Any], office_type: str) -> str:
+    sido_name = normalize_region_text(region.get("sido_name"))
+    sigungu_name = normalize_region_text(region.get("sigungu_name"))
+    base_sido = strip_region_suffix(sido_name)
+
+    if office_type == "광역자치단체장":
+        if sido_name.endswith(_CITY_SUFFIXES):
+            return f"{base_sido}시장"
+        if sido_name.endswith(_PROVINCE_SUFFIXES):
+            return f"{base_sido}도지사"
+        return f"{base_sido}광역자치단체장"
+
+    if office_type == "광역의회":
+        if sido_name.endswith(_CITY_SUFFIXES):
+            return f"{base_sido}시의회"
+        if sido_name.endswith(_PROVINCE_SUFFIXES):
+            return f"{base_sido}도의회"
+        return f"{base_sido}광역의회"
+
+    if office_type == "교육감":
+        return f"{base_sido}교육감"
+
+    target = sigungu_name if sigungu_name and sigungu_name != "전체" else base_sido
+    if office_type == "기초자치단체장":
+        if target.endswith("구"):
+            return f"{target}청장"
+        if target.endswith("군"):
+            return f"{target}수"
+        if target.endswith("시"):
+            return f"{target}장"
+        return f"{target}기초자치단체장"
+
+    if office_type == "기초의회":
+        return f"{target}의회"
+
+    if office_type == "재보궐":
+        return f"{target}재보궐"
+
+    return f"{target} {office_type}".strip()
+
+
+def apply_official_region_overrides(region: dict[str, Any]) -> dict[str, Any]:
+    region_out = dict(region)
+    code = normalize_region_text(region_out.get("region_code"))
+    if _SIDO_CODE_RE.fullmatch(code):
+        region_out["admin_level"] = "sido"
+        if normalize_region_text(region_out.get("sigungu_name")) in {"", "전체"}:
+            region_out["sigungu_name"] = "전체"
+
+    if code == "29-000":
+        # 운영 회귀 보호: 29-000은 공식 토폴로지에서 세종으로 고정한다.
+        region_out["sido_name"] = "세종특별자치시"
+        region_out["sigungu_name"] = "전체"
+        region_out["admin_level"] = "sido"
+    return region_out
+
+
+def apply_official_title_overrides(region: dict[str, Any], office_type: str, title: str | None) -> str:
+    normalized_title = normalize_region_text(title)
+    code = normalize_region_text(region.get("region_code"))
+
+    # 운영 회귀 보호: 29-000은 세종 라벨이 아닌 타 시도 라벨을 허용하지 않는다.
+    # 레거시/오염 타이틀이 들어오면 코드 기준 placeholder로 강제 복원한다.
+    if code == "29-000" and "세종" not in normalized_title:
+        return derive_placeholder_title(region, office_type)
+
+    if normalized_title:
+        return normalized_title
+    return derive_placeholder_title(region, office_type)
+
+
+def build_official_display_title(region: dict[str, Any], office_type: str, title: str | None) -> str:
+    """Official-topology title as served by the region elections API, precomputed at sync time."""
+    return apply_official_title_overrides(apply_official_region_overrides(region), office_type, title)
 
 
 def default_office_types_for_region(admin_level: str | None) -> tuple[str, ...]:
@@ -44,12 +163,15 @@ def build_election_slots(
 
         for office_type in office_types:
             latest_matchup_id = latest_matchup_by_pair.get((region_code, office_type))
+            title = build_slot_title(region, office_type)
             slots.append(
                 {
                     "region_code": region_code,
                     "office_type": office_type,
                     "slot_matchup_id": build_slot_matchup_id(region_code, office_type),
-                    "title": build_slot_title(region, office_type),
+                    "title": title,
+                    "display_title": build_official_display_title(region, office_type, title),
+                    "topology": OFFICIAL_TOPOLOGY,
                     "source": "code_master",
                     "has_poll_data": bool(latest_matchup_id),
                     "latest_matchup_id": latest_matchup_id,
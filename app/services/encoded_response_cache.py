@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from app.services.request_metrics import record_cache_lookup
+
+ENCODED_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+_ENCODED_RESPONSE_CACHE: dict[str, tuple[float, bytes, bytes | None]] = {}
+_ENCODED_RESPONSE_CACHE_LOCK = Lock()
+
+
+def clear_encoded_response_cache() -> None:
+    with _ENCODED_RESPONSE_CACHE_LOCK:
+        _ENCODED_RESPONSE_CACHE.clear()
+
+
+def get_encoded_response(key: str, *, now: float) -> tuple[bytes, bytes | None] | None:
+    with _ENCODED_RESPONSE_CACHE_LOCK:
+        cached = _ENCODED_RESPONSE_CACHE.get(key)
+    if cached is not None and cached[0] <= now:
+        cached = None
+    record_cache_lookup(cached is not None)
+    return (cached[1], cached[2]) if cached is not None else None
+
+
+def set_encoded_response(key: str, body: bytes, compressed: bytes | None, *, now: float, ttl: float) -> None:
+    with _ENCODED_RESPONSE_CACHE_LOCK:
+        if len(_ENCODED_RESPONSE_CACHE) >= ENCODED_RESPONSE_CACHE_MAX_ENTRIES:
+            expired = [k for k, item in _ENCODED_RESPONSE_CACHE.items() if item[0] <= now]
+            for k in expired or list(_ENCODED_RESPONSE_CACHE)[: ENCODED_RESPONSE_CACHE_MAX_ENTRIES // 4]:
+                _ENCODED_RESPONSE_CACHE.pop(k, None)
+        _ENCODED_RESPONSE_CACHE[key] = (now + ttl, body, compressed)
@@ -191,3 +191,4 @@ def merge_observation_by_priority(existing: dict, incoming: dict) -> dict:
         merged["article_id"] = existing.get("article_id") or incoming.get("article_id")
 
     return merged
+
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+from threading import Event, Lock, Thread
+import time
+from typing import Any
+
+from app.config import get_settings
+from app.db import get_connection
+from app.models.schemas import IngestPayload
+from app.services.ingest_service import IngestResult, ingest_payload
+from app.services.matchup_snapshots import matchup_snapshots_enabled, run_matchup_snapshot_rebuild
+from app.services.repository import PostgresRepository
+
+LOGGER = logging.getLogger(__name__)
+
+INGEST_JOB_TERMINAL_STATUSES = frozenset({"success", "partial_success", "failed"})
+# Progress is written at most this often so heartbeats do not add a write per record.
+INGEST_JOB_PROGRESS_INTERVAL_SEC = 2.0
+
+_WORKERS: list[Thread] = []
+_WORKERS_LOCK = Lock()
+_WAKEUP = Event()
+
+
+def ingest_job_worker_count() -> int:
+    try:
+        return max(int(get_settings().ingest_job_workers), 0)
+    except Exception:  # noqa: BLE001
+        return 0
+
+
+def ingest_job_poll_interval_sec() -> float:
+    try:
+        return max(float(get_settings().ingest_job_poll_interval_sec), 0.1)
+    except Exception:  # noqa: BLE001
+        return 2.0
+
+
+def ingest_job_stale_after_sec() -> float:
+    try:
+        return max(float(get_settings().ingest_job_stale_after_sec), 1.0)
+    except Exception:  # noqa: BLE001
+        return 600.0
+
+
+class IngestJobClaimLost(RuntimeError):
+    """Another worker re-claimed the job after its heartbeat went stale."""
+
+
+def process_ingest_job(repo, job: dict[str, Any]) -> IngestResult | None:
+    """Run one claimed job and record its outcome; ingest failures mark the job failed instead of raising.
+
+    Every job write is conditional on the claim (id + attempt_count), so a worker that lost its
+    claim stops at its next heartbeat and never overwrites the new owner's progress or outcome.
+    """
+    job_id = job["id"]
+    attempt_count = job["attempt_count"]
+    # The claim itself just set heartbeat_at.
+    last_progress = time.monotonic()
+
+    def report_progress(done: int, total: int) -> None:
+        nonlocal last_progress
+        now = time.monotonic()
+        if done < total and now - last_progress < INGEST_JOB_PROGRESS_INTERVAL_SEC:
+            return
+        last_progress = now
+        if not repo.update_ingest_job_progress(job_id, done, attempt_count=attempt_count):
+            raise IngestJobClaimLost(f"ingest job {job_id} attempt {attempt_count} was re-claimed")
+
+    def heartbeat() -> None:
+        # Planning can spend minutes in data.go.kr lookups before the first record is applied.
+        report_progress(0, 1)
+
+    try:
+        payload = IngestPayload.model_validate(job["payload"])
+        result = ingest_payload(payload, repo, progress=report_progress, heartbeat=heartbeat)
+    except IngestJobClaimLost as exc:
+        rollback = getattr(repo, "rollback", None)
+        if callable(rollback):
+            rollback()
+        LOGGER.warning("ingest_job_claim_lost job_id=%s error=%s", job_id, exc)
+        return None
+    except Exception as exc:  # noqa: BLE001
+        rollback = getattr(repo, "rollback", None)
+        if callable(rollback):
+            rollback()
+        LOGGER.warning("ingest_job_failed job_id=%s error=%s", job_id, exc)
+        repo.finish_ingest_job(
+            job_id,
+            status="failed",
+            error=f"{type(exc).__name__}: {exc}",
+            attempt_count=attempt_count,
+        )
+        return None
+
+    finished = repo.finish_ingest_job(
+        job_id,
+        status=result.status,
+        run_id=result.run_id,
+        processed_count=result.processed_count,
+        error_count=result.error_count,
+        skipped_count=result.skipped_count,
+        attempt_count=attempt_count,
+    )
+    if not finished:
+        LOGGER.warning("ingest_job_claim_lost job_id=%s attempt=%s at=finish", job_id, attempt_count)
+    LOGGER.info(
+        "ingest_job_finished job_id=%s run_id=%s status=%s processed=%s skipped=%s errors=%s",
+        job_id,
+        result.run_id,
+        result.status,
+        result.processed_count,
+        result.skipped_count,
+        result.error_count,
+    )
+    return result
+
+
+def run_next_ingest_job(repo) -> bool:
+    """Claim and process the next job; returns False when the queue is empty."""
+    job = repo.claim_next_ingest_job(stale_after_sec=ingest_job_stale_after_sec())
+    if job is None:
+        return False
+    result = process_ingest_job(repo, job)
+    if result is not None and result.touched_matchup_ids and matchup_snapshots_enabled():
+        run_matchup_snapshot_rebuild(result.touched_matchup_ids, run_id=result.run_id)
+    return True
+
+
+def _wait_for_enqueue() -> None:
+    _WAKEUP.wait(ingest_job_poll_interval_sec())
+    _WAKEUP.clear()
+
+
+def ingest_worker_loop(stop: Event | None = None) -> None:
+    """Poll the queue on one connection per worker thread; it is reopened only after an error."""
+    while stop is None or not stop.is_set():
+        try:
+            with get_connection() as conn:
+                repo = PostgresRepository(conn)
+                while stop is None or not stop.is_set():
+                    while run_next_ingest_job(repo):
+                        pass
+                    _wait_for_enqueue()
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("ingest_worker_error error=%s", exc)
+            _wait_for_enqueue()
+
+
+def start_ingest_job_workers() -> None:
+    """Start the in-process worker pool once (INGEST_JOB_WORKERS, off by default).
+
+    Deployments run `python -m app.jobs.ingest_worker` as the consumer; the in-process pool is
+    for single-process setups, and is started at app startup so queued jobs do not wait for an enqueue.
+    """
+    with _WORKERS_LOCK:
+        if _WORKERS:
+            return
+        for index in range(ingest_job_worker_count()):
+            worker = Thread(target=ingest_worker_loop, name=f"ingest-job-worker-{index}", daemon=True)
+            worker.start()
+            _WORKERS.append(worker)
+
+
+def notify_ingest_job_enqueued() -> None:
+    """Wake idle in-process workers, starting the pool if startup did not."""
+    start_ingest_job_workers()
+    _WAKEUP.set()
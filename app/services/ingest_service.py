@@ -1,9 +1,10 @@
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import hashlib
 import json
 import logging
 import re
-from typing import Any
+from typing import Any, Callable
 
 from app.config import get_settings
 from app.models.schemas import IngestPayload, PollOptionInput
@@ -20,18 +21,27 @@ from app.services.data_go_candidate import DataGoCandidateConfig, DataGoCandidat
 from app.services.errors import DuplicateConflictError
 from app.services.fingerprint import build_poll_fingerprint
 from app.services.ingest_input_normalization import normalize_option_type
+from app.services.multi_pattern_matcher import MultiPatternMatcher
 from app.services.normalization import normalize_percentage
-from app.services.region_code_normalizer import normalize_region_code_input
+from app.services.party_evidence_index import (
+    OFFICIAL_PARTY_EVIDENCE_SOURCES,
+    PartyEvidence,
+    PartyEvidenceIndex,
+    get_party_evidence_index,
+    load_party_evidence_index,
+    party_evidence_row,
+)
+from app.services.region_code_normalizer import resolve_region_code
+from app.services.scenario_parser import parse_survey_scenarios, scenario_name_token
+from app.services.trend_series import refresh_trend_series_for_run
 
 PARTY_INFERENCE_REVIEW_THRESHOLD = 0.8
 PARTY_INFERENCE_SOURCE_OFFICIAL_REGISTRY_V3 = "official_registry_v3"
 PARTY_INFERENCE_SOURCE_INCUMBENT_CONTEXT_V3 = "incumbent_context_v3"
-SCENARIO_NAME_RE = re.compile(r"[가-힣]{2,6}")
-SCENARIO_H2H_PAIR_RE = re.compile(
-    r"([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?\s*[-~]\s*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?"
-)
-SCENARIO_MULTI_SINGLE_RE = re.compile(r"다자대결[^가-힣0-9%]*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?")
-SCENARIO_MULTI_ITEM_RE = re.compile(r"([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?")
+PARTY_INFERENCE_SOURCE_ARTICLE_CONTEXT = "article_context"
+# Index evidence that data.go.kr did not confirm stays below the review threshold unless it names an incumbent.
+PARTY_EVIDENCE_UNCONFIRMED_MAX_CONFIDENCE = 0.75
+PARTY_EVIDENCE_INCUMBENT_MAX_CONFIDENCE = 0.85
 DEFAULT_SG_TYPECODES = ("3", "4", "5")
 OFFICE_TYPE_TO_SG_TYPECODES = {
     "광역자치단체장": ("3", "4"),
@@ -142,6 +152,7 @@ SORTED_POPULATION_REGION_ALIASES = sorted(
     key=lambda item: len(item[0]),
     reverse=True,
 )
+POPULATION_REGION_ALIAS_MATCHER = MultiPatternMatcher(alias for alias, _ in SORTED_POPULATION_REGION_ALIASES)
 SURVEY_NAME_OFFICE_RE = re.compile(r"([가-힣]{2,10})(시장|도지사|지사|교육감)")
 
 SCOPE_HARDGUARD_OFFICE_TYPE = "광역자치단체장"
@@ -176,6 +187,8 @@ SCOPE_HARDGUARD_NEEDLES: tuple[tuple[str, str], ...] = (
     ("제주도지사", "50-000"),
     ("제주지사", "50-000"),
 )
+SCOPE_HARDGUARD_REGION_BY_NEEDLE = dict(SCOPE_HARDGUARD_NEEDLES)
+SCOPE_HARDGUARD_MATCHER = MultiPatternMatcher(needle for needle, _ in SCOPE_HARDGUARD_NEEDLES)
 SCOPE_HARDGUARD_SIDO_NAME_BY_CODE = {
     "11-000": "서울특별시",
     "26-000": "부산광역시",
@@ -198,6 +211,9 @@ SCOPE_HARDGUARD_SIDO_NAME_BY_CODE = {
 
 LOGGER = logging.getLogger(__name__)
 
+# Observations per bulk_upsert_poll_observations call during apply.
+INGEST_OBSERVATION_BATCH_SIZE = 100
+
 
 @dataclass
 class IngestResult:
@@ -205,6 +221,8 @@ class IngestResult:
     processed_count: int
     error_count: int
     status: str
+    touched_matchup_ids: list[str] = field(default_factory=list)
+    skipped_count: int = 0
 
 
 @dataclass
@@ -296,16 +314,6 @@ def _apply_survey_name_matchup_correction(
         observation_payload["audience_scope"] = "regional" if region_code.endswith("-000") else "local"
 
 
-def _normalize_region_code(value: Any) -> str | None:
-    if value is None:
-        return None
-    normalized = normalize_region_code_input(str(value))
-    if normalized.canonical:
-        return normalized.canonical
-    raw = str(value).strip()
-    return raw or None
-
-
 def _rebuild_matchup_id(matchup_id: str, office_type: str, region_code: str) -> str:
     return f"{_infer_election_id(matchup_id)}|{office_type}|{region_code}"
 
@@ -318,10 +326,10 @@ def _resolve_scope_hardguard_region_code(*texts: Any) -> tuple[str, str] | None:
     compact = "".join(_compact_text(text) for text in texts if text)
     if not compact:
         return None
-    for needle, region_code in SCOPE_HARDGUARD_NEEDLES:
-        if needle in compact:
-            return region_code, needle
-    return None
+    needle = SCOPE_HARDGUARD_MATCHER.best(compact)
+    if needle is None:
+        return None
+    return SCOPE_HARDGUARD_REGION_BY_NEEDLE[needle], needle
 
 
 def _apply_scope_hardguard(record) -> tuple[bool, str | None]:
@@ -338,7 +346,7 @@ def _apply_scope_hardguard(record) -> tuple[bool, str | None]:
     if record.observation.office_type != SCOPE_HARDGUARD_OFFICE_TYPE:
         record.observation.office_type = SCOPE_HARDGUARD_OFFICE_TYPE
         changed = True
-    if _normalize_region_code(record.observation.region_code) != region_code:
+    if resolve_region_code(record.observation.region_code) != region_code:
         record.observation.region_code = region_code
         changed = True
     rebuilt_matchup_id = _rebuild_matchup_id(
@@ -351,7 +359,7 @@ def _apply_scope_hardguard(record) -> tuple[bool, str | None]:
         changed = True
 
     if record.region is not None:
-        if _normalize_region_code(record.region.region_code) != region_code:
+        if resolve_region_code(record.region.region_code) != region_code:
             record.region.region_code = region_code
             changed = True
         target_sido_name = SCOPE_HARDGUARD_SIDO_NAME_BY_CODE.get(region_code)
@@ -372,7 +380,7 @@ def _apply_scope_hardguard(record) -> tuple[bool, str | None]:
 
 
 def _to_sido_region_code(region_code: str | None) -> str | None:
-    normalized = _normalize_region_code(region_code)
+    normalized = resolve_region_code(region_code)
     if not normalized:
         return None
     if len(normalized) >= 2:
@@ -394,14 +402,12 @@ def _infer_population_region_code(population_text: str, compact_text: str) -> st
 
     explicit_match = POPULATION_CODE_RE.search(population_text)
     if explicit_match:
-        explicit_code = _normalize_region_code(explicit_match.group(0))
+        explicit_code = resolve_region_code(explicit_match.group(0))
         if explicit_code:
             return explicit_code
 
-    for alias, code in SORTED_POPULATION_REGION_ALIASES:
-        if alias in population_text or alias in compact_text:
-            return code
-    return None
+    alias = POPULATION_REGION_ALIAS_MATCHER.best(population_text, compact_text)
+    return POPULATION_REGION_ALIAS_TO_CODE[alias] if alias is not None else None
 
 
 def _infer_scope_from_sampling_population(
@@ -440,8 +446,8 @@ def _infer_scope_from_sampling_population(
 
 def _resolve_observation_scope(observation_payload: dict[str, Any]) -> ScopeInferenceResolution:
     explicit_scope = observation_payload.get("audience_scope")
-    explicit_region_code = _normalize_region_code(observation_payload.get("audience_region_code"))
-    observation_region_code = _normalize_region_code(observation_payload.get("region_code"))
+    explicit_region_code = resolve_region_code(observation_payload.get("audience_region_code"))
+    observation_region_code = resolve_region_code(observation_payload.get("region_code"))
 
     inferred_scope, inferred_region_code, confidence = _infer_scope_from_sampling_population(
         sampling_population_text=observation_payload.get("sampling_population_text")
@@ -490,7 +496,7 @@ def _resolve_observation_scope(observation_payload: dict[str, Any]) -> ScopeInfe
     if final_scope == "regional" and explicit_region_code and inferred_region_code:
         region_conflict = _to_sido_region_code(explicit_region_code) != _to_sido_region_code(inferred_region_code)
     elif final_scope == "local" and explicit_region_code and inferred_region_code:
-        region_conflict = _normalize_region_code(explicit_region_code) != _normalize_region_code(inferred_region_code)
+        region_conflict = resolve_region_code(explicit_region_code) != resolve_region_code(inferred_region_code)
 
     if region_conflict and confidence >= SCOPE_INFERENCE_CONFLICT_THRESHOLD:
         return ScopeInferenceResolution(
@@ -576,6 +582,8 @@ def _apply_party_inference_v3(
     record,
     candidate_party_counter_map: dict[str, Counter[str]],
     service_cache: dict[tuple[str, str | None, str | None, str], DataGoCandidateService | None],
+    party_index: PartyEvidenceIndex | None = None,
+    party_evidence: list[dict[str, Any]] | None = None,
 ) -> None:
     option_type = option_payload.get("option_type")
     if option_type not in {"candidate", "candidate_matchup"}:
@@ -634,6 +642,27 @@ def _apply_party_inference_v3(
             option_payload["needs_manual_review"] = True
         return
 
+    region_code = resolve_region_code(record.observation.region_code)
+    evidence = (
+        party_index.lookup(normalized_name, (region_code, _to_sido_region_code(region_code)))
+        if party_index is not None
+        else None
+    )
+    # Only unanimous official evidence stands in for the data.go.kr lookup.
+    if evidence is not None:
+        top_party, top_count = evidence.top_party()
+        ratio = float(top_count) / float(max(1, evidence.total))
+        top_sources = evidence.party_sources[top_party]
+        if ratio == 1.0 and top_sources & OFFICIAL_PARTY_EVIDENCE_SOURCES:
+            _apply_party_evidence(
+                option_payload,
+                option_name=option_name,
+                evidence=evidence,
+                source=PARTY_INFERENCE_SOURCE_OFFICIAL_REGISTRY_V3,
+                confidence=0.88,
+            )
+            return
+
     for sg_typecode in _office_type_sg_types(record.observation.office_type):
         service = _build_or_get_candidate_service(
             record=record,
@@ -646,6 +675,8 @@ def _apply_party_inference_v3(
         inferred_party = _normalize_party_name(enriched.get("party_name"))
         if not inferred_party:
             continue
+        if party_evidence is not None:
+            party_evidence.append(party_evidence_row(normalized_name, region_code, inferred_party, "data_go"))
 
         confidence = 0.88
         option_payload["party_name"] = inferred_party
@@ -665,6 +696,55 @@ def _apply_party_inference_v3(
             option_payload["needs_manual_review"] = True
         return
 
+    if evidence is None:
+        return
+    if "incumbent" in top_sources:
+        source = PARTY_INFERENCE_SOURCE_INCUMBENT_CONTEXT_V3
+        cap = PARTY_EVIDENCE_INCUMBENT_MAX_CONFIDENCE
+    elif top_sources & OFFICIAL_PARTY_EVIDENCE_SOURCES:
+        # Contested official evidence: still registry-backed, but a reviewer picks the party.
+        source = PARTY_INFERENCE_SOURCE_OFFICIAL_REGISTRY_V3
+        cap = PARTY_EVIDENCE_UNCONFIRMED_MAX_CONFIDENCE
+    else:
+        source = PARTY_INFERENCE_SOURCE_ARTICLE_CONTEXT
+        cap = PARTY_EVIDENCE_UNCONFIRMED_MAX_CONFIDENCE
+    _apply_party_evidence(
+        option_payload,
+        option_name=option_name,
+        evidence=evidence,
+        source=source,
+        confidence=round(max(0.55, min(cap, ratio)), 3),
+    )
+
+
+def _apply_party_evidence(
+    option_payload: dict[str, Any],
+    *,
+    option_name: str,
+    evidence: PartyEvidence,
+    source: str,
+    confidence: float,
+) -> None:
+    top_party, top_count = evidence.top_party()
+    option_payload["party_name"] = top_party
+    option_payload["party_inferred"] = True
+    option_payload["party_inference_source"] = source
+    option_payload["party_inference_confidence"] = confidence
+    option_payload["party_inference_evidence"] = _encode_party_inference_evidence(
+        {
+            "method": "party_inference_v3",
+            "rule": "party_evidence_index",
+            "candidate_name": option_name,
+            "selected_party": top_party,
+            "evidence_region_code": evidence.region_code,
+            "candidate_party_counter": evidence.party_counts,
+            "selected_sources": sorted(evidence.party_sources[top_party]),
+            "support_ratio": round(float(top_count) / float(max(1, evidence.total)), 4),
+        }
+    )
+    if confidence < PARTY_INFERENCE_REVIEW_THRESHOLD:
+        option_payload["needs_manual_review"] = True
+
 
 def _resolve_region_names(record) -> tuple[str | None, str | None]:
     region = getattr(record, "region", None)
@@ -931,14 +1011,6 @@ def _normalize_option(option: PollOptionInput) -> tuple[dict, str | None]:
     return payload, classification_reason
 
 
-def _scenario_name_token(value: Any) -> str:
-    text = str(value or "").strip()
-    if not text:
-        return ""
-    match = SCENARIO_NAME_RE.search(text)
-    return match.group(0) if match else text
-
-
 def _scenario_value(option: dict[str, Any]) -> float:
     value_mid = option.get("value_mid")
     if value_mid is None:
@@ -949,70 +1021,6 @@ def _scenario_value(option: dict[str, Any]) -> float:
         return float("-inf")
 
 
-def _extract_h2h_pairs(survey_name: str) -> list[tuple[str, float, str, float]]:
-    pairs: list[tuple[str, float, str, float]] = []
-    seen: set[tuple[str, float, str, float]] = set()
-    for match in SCENARIO_H2H_PAIR_RE.finditer(survey_name):
-        left_name = _scenario_name_token(match.group(1))
-        right_name = _scenario_name_token(match.group(3))
-        if not left_name or not right_name or left_name == right_name:
-            continue
-        try:
-            left_value = float(match.group(2))
-            right_value = float(match.group(4))
-        except (TypeError, ValueError):
-            continue
-        key = (left_name, left_value, right_name, right_value)
-        if key in seen:
-            continue
-        seen.add(key)
-        pairs.append(key)
-    return pairs
-
-
-def _extract_multi_anchor(survey_name: str) -> tuple[str, float] | None:
-    match = SCENARIO_MULTI_SINGLE_RE.search(survey_name)
-    if not match:
-        return None
-    name = _scenario_name_token(match.group(1))
-    if not name:
-        return None
-    try:
-        value = float(match.group(2))
-    except (TypeError, ValueError):
-        return None
-    return name, value
-
-
-def _extract_multi_candidates(survey_name: str) -> list[tuple[str, float]]:
-    text = str(survey_name or "")
-    if "다자대결" not in text:
-        return []
-
-    start = text.find("다자대결")
-    segment = text[start:]
-    # keep the parsing window short to avoid mixing unrelated survey snippets.
-    for stop_token in (" 양자대결", " 가상대결", " 여론조사", "표본오차", "응답률"):
-        stop_idx = segment.find(stop_token)
-        if stop_idx > 0:
-            segment = segment[:stop_idx]
-            break
-
-    seen_names: set[str] = set()
-    rows: list[tuple[str, float]] = []
-    for match in SCENARIO_MULTI_ITEM_RE.finditer(segment):
-        name = _scenario_name_token(match.group(1))
-        if not name or name in seen_names:
-            continue
-        try:
-            value = float(match.group(2))
-        except (TypeError, ValueError):
-            continue
-        seen_names.add(name)
-        rows.append((name, value))
-    return rows if len(rows) >= 3 else []
-
-
 def _match_candidate_index(
     *,
     options: list[dict[str, Any]],
@@ -1090,7 +1098,7 @@ def _detect_scenario_parse_incomplete(
     for row in options:
         if row.get("option_type") not in {"candidate", "candidate_matchup"}:
             continue
-        name = _scenario_name_token(row.get("option_name"))
+        name = scenario_name_token(row.get("option_name"))
         if name:
             candidate_names.add(name)
     names = sorted(candidate_names)
@@ -1128,7 +1136,7 @@ def _backfill_multi_from_default_candidates(
         title = str(row.get("scenario_title") or "").strip()
         if title:
             multi_title = title
-        name = _scenario_name_token(row.get("option_name"))
+        name = scenario_name_token(row.get("option_name"))
         if name:
             multi_names.add(name)
             row["option_name"] = name
@@ -1140,7 +1148,7 @@ def _backfill_multi_from_default_candidates(
 
     changed = False
     for default_row in default_rows:
-        name = _scenario_name_token(default_row.get("option_name"))
+        name = scenario_name_token(default_row.get("option_name"))
         if not name or name in multi_names:
             continue
         options.append(
@@ -1185,8 +1193,9 @@ def _repair_candidate_matchup_scenarios(
     if len(candidate_indexes) < 3:
         return False
 
-    names_by_index = {i: _scenario_name_token(options[i].get("option_name")) for i in candidate_indexes}
-    multi_candidates = _extract_multi_candidates(text)
+    names_by_index = {i: scenario_name_token(options[i].get("option_name")) for i in candidate_indexes}
+    scenarios = parse_survey_scenarios(text)
+    multi_candidates = scenarios.multi_candidates
     counts: dict[str, int] = {}
     for idx in candidate_indexes:
         name = names_by_index[idx]
@@ -1242,7 +1251,7 @@ def _repair_candidate_matchup_scenarios(
         default_name_to_row: dict[str, dict[str, Any]] = {}
         for idx in default_candidate_indexes:
             row = dict(options[idx])
-            name = names_by_index.get(idx) or _scenario_name_token(row.get("option_name"))
+            name = names_by_index.get(idx) or scenario_name_token(row.get("option_name"))
             if not name:
                 continue
             row["option_name"] = name
@@ -1258,7 +1267,7 @@ def _repair_candidate_matchup_scenarios(
             i for i, row in enumerate(options) if row.get("option_type") == "candidate_matchup"
         ]
         names_after_cleanup = {
-            i: _scenario_name_token(options[i].get("option_name"))
+            i: scenario_name_token(options[i].get("option_name"))
             for i in candidate_indexes_after_cleanup
         }
         for row in options:
@@ -1269,7 +1278,7 @@ def _repair_candidate_matchup_scenarios(
                 continue
             row["scenario_type"] = "multi_candidate"
             row["scenario_title"] = multi_title
-            name = _scenario_name_token(row.get("option_name"))
+            name = scenario_name_token(row.get("option_name"))
             if not name:
                 continue
             row["option_name"] = name
@@ -1339,7 +1348,7 @@ def _repair_candidate_matchup_scenarios(
 
     # Enhanced split: when survey text includes multiple explicit h2h pairs + multi,
     # materialize separate scenario groups (h2h/h2h/multi) even if source options are under default.
-    h2h_pairs = _extract_h2h_pairs(text)
+    h2h_pairs = scenarios.h2h_pairs
     if "다자대결" in text and len(h2h_pairs) >= 2:
         assigned = False
         used_indexes: set[int] = set()
@@ -1456,7 +1465,7 @@ def _repair_candidate_matchup_scenarios(
                 return True
 
         multi_indexes = [i for i in candidate_indexes_all if i not in used_indexes and names_all.get(i)]
-        multi_anchor = _extract_multi_anchor(text)
+        multi_anchor = scenarios.multi_anchor
         if multi_anchor is not None:
             multi_name, multi_value = multi_anchor
             multi_idx = _match_candidate_index(
@@ -1543,354 +1552,741 @@ def _repair_candidate_matchup_scenarios(
     return True
 
 
-def ingest_payload(payload: IngestPayload, repo) -> IngestResult:
-    run_id = repo.create_ingestion_run(payload.run_type, payload.extractor_version, payload.llm_model)
-    processed_count = 0
-    error_count = 0
-    date_inference_failed_count = 0
-    date_inference_estimated_count = 0
-    candidate_service_cache: dict[tuple[str, str | None, str | None, str], DataGoCandidateService | None] = {}
-    candidate_profile_review_marked: set[str] = set()
+@dataclass
+class ReviewItem:
+    entity_type: str
+    entity_id: str
+    issue_type: str
+    review_note: str
+
+
+@dataclass
+class RecordPlan:
+    """Writes and review items planned for one ingest record.
+
+    `rejected` records only write their region (if any) and review items; `error`
+    is set when planning itself raised and the record is counted as failed.
+    """
+
+    observation_key: str
+    record: Any = None
+    review_items: list[ReviewItem] = field(default_factory=list)
+    region: dict[str, Any] | None = None
+    matchup: dict[str, Any] | None = None
+    candidates: list[dict[str, Any]] = field(default_factory=list)
+    article: dict[str, Any] | None = None
+    observation: dict[str, Any] | None = None
+    options: list[dict[str, Any]] = field(default_factory=list)
+    option_classification_reasons: list[str | None] = field(default_factory=list)
+    # Explicit candidate scenarios are merged with the stored default rows at apply
+    # time, so option finalization (inference, verification, reviews) waits for them.
+    needs_default_backfill: bool = False
+    options_finalized: bool = False
+    date_inference_mode: str | None = None
+    date_inference_confidence: Any = None
+    date_inference_uncertain: bool = False
+    # Hash of every row this record writes, stored under the record's own observation_key (not the
+    # row it was fingerprint-merged into); unchanged records are skipped at apply time.
+    content_hash: str | None = None
+    # Evidence this record contributes; its candidate tokens are recounted (and the process index
+    # refreshed) once the record is written.
+    party_evidence: list[dict[str, Any]] = field(default_factory=list)
+    rejected: bool = False
+    error: str | None = None
+
+
+@dataclass
+class IngestPlan:
+    run_type: str
+    extractor_version: str
+    llm_model: str | None
+    payload_hash: str
+    records: list[RecordPlan] = field(default_factory=list)
+    service_cache: dict[tuple[str, str | None, str | None, str], DataGoCandidateService | None] = field(
+        default_factory=dict, repr=False
+    )
+    party_index: PartyEvidenceIndex = field(default_factory=get_party_evidence_index, repr=False)
+
+    def summary(self) -> dict[str, Any]:
+        planned = [row for row in self.records if row.observation is not None and row.error is None]
+        return {
+            "payload_hash": self.payload_hash,
+            "record_count": len(self.records),
+            "planned_count": len(planned),
+            "rejected_count": sum(1 for row in self.records if row.rejected),
+            "hashed_count": sum(1 for row in self.records if row.content_hash),
+            "error_count": sum(1 for row in self.records if row.error is not None),
+            "deferred_option_count": sum(1 for row in planned if not row.options_finalized),
+            "candidate_write_count": sum(len(row.candidates) for row in planned),
+            "option_write_count": sum(len(row.options) for row in planned),
+            "review_item_count": sum(len(row.review_items) for row in self.records),
+        }
 
-    for record in payload.records:
-        try:
-            survey_end_cutoff_reason = survey_end_date_cutoff_reason(record.observation.survey_end_date)
-            if survey_end_cutoff_reason != "PASS":
-                error_count += 1
-                try:
-                    repo.insert_review_queue(
-                        entity_type="ingest_record",
-                        entity_id=record.observation.observation_key,
-                        issue_type="ingestion_error",
-                        review_note=(
-                            "STALE_CYCLE_BLOCK "
-                            f"reason={survey_end_cutoff_reason} "
-                            f"survey_end_date={record.observation.survey_end_date} "
-                            f"cutoff={SURVEY_END_DATE_CUTOFF.isoformat()}"
-                        ),
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-                continue
 
-            article_source = has_article_source(
-                source_channel=record.observation.source_channel,
-                source_channels=record.observation.source_channels,
+def _candidate_context_maps(
+    candidate_rows: list[dict[str, Any]],
+) -> tuple[set[str], dict[str, Counter[str]], dict[str, str], dict[str, str]]:
+    candidate_name_set = {
+        _normalize_candidate_token(candidate.get("name_ko"))
+        for candidate in candidate_rows
+        if _normalize_candidate_token(candidate.get("name_ko"))
+    }
+    candidate_party_counter_map: dict[str, Counter[str]] = {}
+    for candidate in candidate_rows:
+        normalized_name = _normalize_candidate_token(candidate.get("name_ko"))
+        party_name = _normalize_party_name(candidate.get("party_name"))
+        if not normalized_name or not party_name:
+            continue
+        candidate_party_counter_map.setdefault(normalized_name, Counter())[party_name] += 1
+    candidate_party_map = {
+        name: counter.most_common(1)[0][0]
+        for name, counter in candidate_party_counter_map.items()
+        if counter
+    }
+    candidate_id_map = {
+        _normalize_candidate_token(candidate.get("name_ko")): str(candidate.get("candidate_id") or "").strip()
+        for candidate in candidate_rows
+        if _normalize_candidate_token(candidate.get("name_ko")) and str(candidate.get("candidate_id") or "").strip()
+    }
+    return candidate_name_set, candidate_party_counter_map, candidate_party_map, candidate_id_map
+
+
+def record_content_hash(plan: RecordPlan) -> str:
+    """sha256 over the normalized observation, options, candidates, region and article of a planned record."""
+    content = {
+        "observation": plan.observation,
+        "options": plan.options,
+        "candidates": plan.candidates,
+        "region": plan.region,
+        "article": plan.article,
+    }
+    encoded = json.dumps(content, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _record_party_evidence(plan: RecordPlan) -> list[dict[str, Any]]:
+    """Evidence from party names the source stated itself (never from inferred ones)."""
+    region_code = resolve_region_code(plan.record.observation.region_code)
+    rows: list[dict[str, Any]] = []
+    for candidate in plan.candidates:
+        token = _normalize_candidate_token(candidate.get("name_ko"))
+        party_name = _normalize_party_name(candidate.get("party_name"))
+        if token and party_name and not candidate.get("party_inferred"):
+            rows.append(party_evidence_row(token, "", party_name, "registry"))
+    for option in plan.options:
+        if option.get("option_type") not in {"candidate", "candidate_matchup"}:
+            continue
+        if option.get("party_inferred") or option.get("candidate_verified") is False:
+            continue
+        token = _normalize_candidate_token(option.get("option_name"))
+        party_name = _normalize_party_name(option.get("party_name"))
+        if token and party_name:
+            rows.append(party_evidence_row(token, region_code, party_name, "poll_option"))
+    return rows
+
+
+def _finalize_record_options(
+    plan: RecordPlan,
+    service_cache: dict[tuple[str, str | None, str | None, str], DataGoCandidateService | None],
+    party_index: PartyEvidenceIndex | None = None,
+) -> None:
+    record = plan.record
+    candidate_name_set, candidate_party_counter_map, candidate_party_map, candidate_id_map = _candidate_context_maps(
+        plan.candidates
+    )
+
+    scenario_incomplete, scenario_candidate_count, scenario_candidate_names = _detect_scenario_parse_incomplete(
+        survey_name=record.observation.survey_name,
+        article_title=record.article.title,
+        article_raw_text=record.article.raw_text,
+        options=plan.options,
+    )
+    if scenario_incomplete:
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="scenario_parse_incomplete",
+                review_note=(
+                    "SCENARIO_PARSE_INCOMPLETE "
+                    f"candidate_count={scenario_candidate_count} "
+                    f"candidates={','.join(scenario_candidate_names) if scenario_candidate_names else '-'} "
+                    f"matchup_id={record.observation.matchup_id}"
+                ),
             )
-            if article_source:
-                cutoff_reason = published_at_cutoff_reason(record.article.published_at)
-                if cutoff_reason != "PASS":
-                    error_count += 1
-                    parsed_published_at = parse_datetime_like(record.article.published_at)
-                    LOGGER.info(
-                        "collector ingest excluded by article cutoff: reason=old_article_cutoff "
-                        "observation_key=%s published_at=%s policy_reason=%s cutoff=%s",
-                        record.observation.observation_key,
-                        parsed_published_at.isoformat(timespec="seconds") if parsed_published_at else None,
-                        cutoff_reason,
-                        ARTICLE_PUBLISHED_AT_CUTOFF_ISO,
-                    )
-                    try:
-                        repo.insert_review_queue(
-                            entity_type="ingest_record",
-                            entity_id=record.observation.observation_key,
-                            issue_type="ingestion_error",
-                            review_note=(
-                                "ARTICLE_PUBLISHED_AT_CUTOFF_BLOCK "
-                                "reason=old_article_cutoff "
-                                f"policy_reason={cutoff_reason} "
-                                f"published_at={parsed_published_at.isoformat(timespec='seconds') if parsed_published_at else None} "
-                                f"cutoff={ARTICLE_PUBLISHED_AT_CUTOFF_ISO}"
-                            ),
-                        )
-                    except Exception:  # noqa: BLE001
-                        pass
-                    continue
+        )
 
-            hardguard_applied, hardguard_keyword = _apply_scope_hardguard(record)
-            if hardguard_applied:
-                LOGGER.info(
-                    "collector scope hardguard applied: observation_key=%s keyword=%s office_type=%s region_code=%s matchup_id=%s",
-                    record.observation.observation_key,
-                    hardguard_keyword,
-                    record.observation.office_type,
-                    record.observation.region_code,
-                    record.observation.matchup_id,
-                )
+    party_inference_low_confidence: list[tuple[str, float]] = []
+    option_type_manual_review: list[tuple[str, str]] = []
+    candidate_verify_manual_review: list[tuple[str, str]] = []
+    for index, normalized_option in enumerate(plan.options):
+        classification_reason = (
+            plan.option_classification_reasons[index] if index < len(plan.option_classification_reasons) else None
+        )
+        _apply_party_inference_v3(
+            option_payload=normalized_option,
+            record=record,
+            candidate_party_counter_map=candidate_party_counter_map,
+            service_cache=service_cache,
+            party_index=party_index,
+            party_evidence=plan.party_evidence,
+        )
+        candidate_verify_reason = _apply_candidate_verification(
+            option_payload=normalized_option,
+            record=record,
+            candidate_name_set=candidate_name_set,
+            candidate_party_map=candidate_party_map,
+            candidate_id_map=candidate_id_map,
+            service_cache=service_cache,
+        )
+        if classification_reason:
+            option_type_manual_review.append((normalized_option.get("option_name", "unknown"), classification_reason))
+        if candidate_verify_reason:
+            candidate_verify_manual_review.append(
+                (normalized_option.get("option_name", "unknown"), candidate_verify_reason)
+            )
+
+        confidence = normalized_option.get("party_inference_confidence")
+        if not normalized_option.get("party_inferred") or confidence is None:
+            continue
+        try:
+            confidence_value = float(confidence)
+        except (TypeError, ValueError):
+            continue
+        if confidence_value < PARTY_INFERENCE_REVIEW_THRESHOLD:
+            party_inference_low_confidence.append((normalized_option.get("option_name", "unknown"), confidence_value))
+
+    if plan.date_inference_uncertain:
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="extract_error",
+                review_note=(
+                    "date inference uncertainty: "
+                    f"mode={plan.date_inference_mode}, confidence={plan.date_inference_confidence}"
+                ),
+            )
+        )
+    if party_inference_low_confidence:
+        detail = ", ".join(f"{name}:{confidence:.2f}" for name, confidence in party_inference_low_confidence)
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="party_inference_low_confidence",
+                review_note=f"party inference confidence below {PARTY_INFERENCE_REVIEW_THRESHOLD}: {detail}",
+            )
+        )
+    if option_type_manual_review:
+        detail = ", ".join(f"{name}:{reason}" for name, reason in option_type_manual_review)
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="mapping_error",
+                review_note=f"option_type manual review required: {detail}",
+            )
+        )
+    if candidate_verify_manual_review:
+        detail = ", ".join(f"{name}:{reason}" for name, reason in candidate_verify_manual_review)
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="mapping_error",
+                review_note=f"candidate verification manual review required: {detail}",
+            )
+        )
+    plan.party_evidence.extend(_record_party_evidence(plan))
+    plan.options_finalized = True
 
-            if record.region:
-                repo.upsert_region(record.region.model_dump())
 
-            observation_payload = record.observation.model_dump()
-            _apply_survey_name_matchup_correction(
-                observation_payload=observation_payload,
-                article_title=getattr(record.article, "title", None),
+def _plan_record(
+    record,
+    *,
+    service_cache: dict[tuple[str, str | None, str | None, str], DataGoCandidateService | None],
+    candidate_profile_review_marked: set[str],
+    party_index: PartyEvidenceIndex | None = None,
+) -> RecordPlan:
+    plan = RecordPlan(observation_key=record.observation.observation_key, record=record)
+
+    survey_end_cutoff_reason = survey_end_date_cutoff_reason(record.observation.survey_end_date)
+    if survey_end_cutoff_reason != "PASS":
+        plan.rejected = True
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="ingest_record",
+                entity_id=plan.observation_key,
+                issue_type="ingestion_error",
+                review_note=(
+                    "STALE_CYCLE_BLOCK "
+                    f"reason={survey_end_cutoff_reason} "
+                    f"survey_end_date={record.observation.survey_end_date} "
+                    f"cutoff={SURVEY_END_DATE_CUTOFF.isoformat()}"
+                ),
             )
-            scope_resolution = _resolve_observation_scope(observation_payload)
-            if scope_resolution.hard_fail_reason:
-                error_count += 1
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="mapping_error",
-                        review_note=scope_resolution.hard_fail_reason,
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-                continue
+        )
+        return plan
 
-            observation_payload["audience_scope"] = scope_resolution.scope
-            observation_payload["audience_region_code"] = scope_resolution.audience_region_code
-            repo.upsert_matchup(
-                {
-                    "matchup_id": observation_payload["matchup_id"],
-                    "election_id": _infer_election_id(observation_payload["matchup_id"]),
-                    "office_type": observation_payload["office_type"],
-                    "region_code": observation_payload["region_code"],
-                    "title": observation_payload["survey_name"],
-                    "is_active": True,
-                }
+    article_source = has_article_source(
+        source_channel=record.observation.source_channel,
+        source_channels=record.observation.source_channels,
+    )
+    if article_source:
+        cutoff_reason = published_at_cutoff_reason(record.article.published_at)
+        if cutoff_reason != "PASS":
+            parsed_published_at = parse_datetime_like(record.article.published_at)
+            LOGGER.info(
+                "collector ingest excluded by article cutoff: reason=old_article_cutoff "
+                "observation_key=%s published_at=%s policy_reason=%s cutoff=%s",
+                plan.observation_key,
+                parsed_published_at.isoformat(timespec="seconds") if parsed_published_at else None,
+                cutoff_reason,
+                ARTICLE_PUBLISHED_AT_CUTOFF_ISO,
             )
-            if scope_resolution.low_confidence_reason:
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="mapping_error",
-                        review_note=scope_resolution.low_confidence_reason,
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-
-            candidate_rows: list[dict[str, Any]] = []
-            for candidate in record.candidates:
-                candidate_payload = candidate.model_dump()
-                enriched_candidate, profile_review_reason = _enrich_candidate_profile(
-                    candidate_payload=candidate_payload,
-                    record=record,
-                    service_cache=candidate_service_cache,
+            plan.rejected = True
+            plan.review_items.append(
+                ReviewItem(
+                    entity_type="ingest_record",
+                    entity_id=plan.observation_key,
+                    issue_type="ingestion_error",
+                    review_note=(
+                        "ARTICLE_PUBLISHED_AT_CUTOFF_BLOCK "
+                        "reason=old_article_cutoff "
+                        f"policy_reason={cutoff_reason} "
+                        f"published_at={parsed_published_at.isoformat(timespec='seconds') if parsed_published_at else None} "
+                        f"cutoff={ARTICLE_PUBLISHED_AT_CUTOFF_ISO}"
+                    ),
                 )
-                repo.upsert_candidate(enriched_candidate)
-                candidate_rows.append(enriched_candidate)
-                candidate_id = str(enriched_candidate.get("candidate_id") or "").strip()
-                if profile_review_reason and candidate_id and candidate_id not in candidate_profile_review_marked:
-                    try:
-                        repo.insert_review_queue(
-                            entity_type="candidate",
-                            entity_id=candidate_id,
-                            issue_type="mapping_error",
-                            review_note=f"candidate profile manual review required: {profile_review_reason}",
-                        )
-                        candidate_profile_review_marked.add(candidate_id)
-                    except Exception:  # noqa: BLE001
-                        pass
-
-            article_id = repo.upsert_article(record.article.model_dump())
-            if not observation_payload.get("poll_fingerprint"):
-                observation_payload["poll_fingerprint"] = build_poll_fingerprint(observation_payload)
-
-            inference_mode = observation_payload.get("date_inference_mode")
-            inference_confidence = observation_payload.get("date_inference_confidence")
-            inference_uncertain = False
-            if inference_mode == "estimated_timestamp":
-                date_inference_estimated_count += 1
-                inference_uncertain = True
-            if inference_mode in {"strict_fail_blocked", "failed"}:
-                date_inference_failed_count += 1
-                inference_uncertain = True
-            if inference_confidence is not None and float(inference_confidence) < 0.8:
-                inference_uncertain = True
-
-            observation_id = repo.upsert_poll_observation(
-                observation_payload,
-                article_id=article_id,
-                ingestion_run_id=run_id,
             )
+            return plan
+
+    hardguard_applied, hardguard_keyword = _apply_scope_hardguard(record)
+    if hardguard_applied:
+        LOGGER.info(
+            "collector scope hardguard applied: observation_key=%s keyword=%s office_type=%s region_code=%s matchup_id=%s",
+            plan.observation_key,
+            hardguard_keyword,
+            record.observation.office_type,
+            record.observation.region_code,
+            record.observation.matchup_id,
+        )
 
-            candidate_name_set = {
-                _normalize_candidate_token(candidate.get("name_ko"))
-                for candidate in candidate_rows
-                if _normalize_candidate_token(candidate.get("name_ko"))
-            }
-            candidate_party_counter_map: dict[str, Counter[str]] = {}
-            for candidate in candidate_rows:
-                normalized_name = _normalize_candidate_token(candidate.get("name_ko"))
-                party_name = _normalize_party_name(candidate.get("party_name"))
-                if not normalized_name or not party_name:
-                    continue
-                candidate_party_counter_map.setdefault(normalized_name, Counter())[party_name] += 1
-            candidate_party_map = {
-                name: counter.most_common(1)[0][0]
-                for name, counter in candidate_party_counter_map.items()
-                if counter
-            }
-            candidate_id_map = {
-                _normalize_candidate_token(candidate.get("name_ko")): str(candidate.get("candidate_id") or "").strip()
-                for candidate in candidate_rows
-                if _normalize_candidate_token(candidate.get("name_ko")) and str(candidate.get("candidate_id") or "").strip()
-            }
+    if record.region:
+        plan.region = record.region.model_dump()
 
-            party_inference_low_confidence: list[tuple[str, float]] = []
-            option_type_manual_review: list[tuple[str, str]] = []
-            candidate_verify_manual_review: list[tuple[str, str]] = []
-            normalized_options: list[dict[str, Any]] = []
-            classification_reason_by_id: dict[int, str | None] = {}
-            for option in record.options:
-                normalized_option, classification_reason = _normalize_option(option)
-                normalized_options.append(normalized_option)
-                classification_reason_by_id[id(normalized_option)] = classification_reason
-            _repair_candidate_matchup_scenarios(
-                survey_name=record.observation.survey_name,
-                options=normalized_options,
+    observation_payload = record.observation.model_dump()
+    _apply_survey_name_matchup_correction(
+        observation_payload=observation_payload,
+        article_title=getattr(record.article, "title", None),
+    )
+    scope_resolution = _resolve_observation_scope(observation_payload)
+    if scope_resolution.hard_fail_reason:
+        plan.rejected = True
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="mapping_error",
+                review_note=scope_resolution.hard_fail_reason,
             )
-            if _has_explicit_candidate_scenarios(normalized_options):
-                fetch_default = getattr(repo, "fetch_candidate_default_poll_options", None)
-                if callable(fetch_default):
-                    prior_defaults = fetch_default(observation_id) or []
-                    if prior_defaults:
-                        _backfill_multi_from_default_candidates(
-                            options=normalized_options,
-                            default_rows=prior_defaults,
-                        )
-                cleanup_default = getattr(repo, "delete_candidate_default_poll_options", None)
-                if callable(cleanup_default):
-                    cleanup_default(observation_id)
-
-            scenario_incomplete, scenario_candidate_count, scenario_candidate_names = _detect_scenario_parse_incomplete(
-                survey_name=record.observation.survey_name,
-                article_title=record.article.title,
-                article_raw_text=record.article.raw_text,
-                options=normalized_options,
+        )
+        return plan
+
+    observation_payload["audience_scope"] = scope_resolution.scope
+    observation_payload["audience_region_code"] = scope_resolution.audience_region_code
+    plan.matchup = {
+        "matchup_id": observation_payload["matchup_id"],
+        "election_id": _infer_election_id(observation_payload["matchup_id"]),
+        "office_type": observation_payload["office_type"],
+        "region_code": observation_payload["region_code"],
+        "title": observation_payload["survey_name"],
+        "is_active": True,
+    }
+    if scope_resolution.low_confidence_reason:
+        plan.review_items.append(
+            ReviewItem(
+                entity_type="poll_observation",
+                entity_id=plan.observation_key,
+                issue_type="mapping_error",
+                review_note=scope_resolution.low_confidence_reason,
             )
-            if scenario_incomplete:
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="scenario_parse_incomplete",
-                        review_note=(
-                            "SCENARIO_PARSE_INCOMPLETE "
-                            f"candidate_count={scenario_candidate_count} "
-                            f"candidates={','.join(scenario_candidate_names) if scenario_candidate_names else '-'} "
-                            f"matchup_id={record.observation.matchup_id}"
-                        ),
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
+        )
 
-            for normalized_option in normalized_options:
-                classification_reason = classification_reason_by_id.get(id(normalized_option))
-                _apply_party_inference_v3(
-                    option_payload=normalized_option,
-                    record=record,
-                    candidate_party_counter_map=candidate_party_counter_map,
-                    service_cache=candidate_service_cache,
+    for candidate in record.candidates:
+        enriched_candidate, profile_review_reason = _enrich_candidate_profile(
+            candidate_payload=candidate.model_dump(),
+            record=record,
+            service_cache=service_cache,
+        )
+        plan.candidates.append(enriched_candidate)
+        candidate_id = str(enriched_candidate.get("candidate_id") or "").strip()
+        if profile_review_reason and candidate_id and candidate_id not in candidate_profile_review_marked:
+            plan.review_items.append(
+                ReviewItem(
+                    entity_type="candidate",
+                    entity_id=candidate_id,
+                    issue_type="mapping_error",
+                    review_note=f"candidate profile manual review required: {profile_review_reason}",
                 )
-                candidate_verify_reason = _apply_candidate_verification(
-                    option_payload=normalized_option,
+            )
+            candidate_profile_review_marked.add(candidate_id)
+
+    plan.article = record.article.model_dump()
+    if not observation_payload.get("poll_fingerprint"):
+        observation_payload["poll_fingerprint"] = build_poll_fingerprint(observation_payload)
+
+    plan.date_inference_mode = observation_payload.get("date_inference_mode")
+    plan.date_inference_confidence = observation_payload.get("date_inference_confidence")
+    plan.date_inference_uncertain = plan.date_inference_mode in {
+        "estimated_timestamp",
+        "strict_fail_blocked",
+        "failed",
+    } or (plan.date_inference_confidence is not None and float(plan.date_inference_confidence) < 0.8)
+    plan.observation = observation_payload
+
+    for option in record.options:
+        normalized_option, classification_reason = _normalize_option(option)
+        plan.options.append(normalized_option)
+        plan.option_classification_reasons.append(classification_reason)
+    _repair_candidate_matchup_scenarios(
+        survey_name=record.observation.survey_name,
+        options=plan.options,
+    )
+    plan.needs_default_backfill = _has_explicit_candidate_scenarios(plan.options)
+    if not plan.needs_default_backfill:
+        _finalize_record_options(plan, service_cache, party_index)
+    plan.content_hash = record_content_hash(plan)
+    return plan
+
+
+def plan_ingest_payload(payload: IngestPayload, *, heartbeat: Callable[[], None] | None = None) -> IngestPlan:
+    """Turn a payload into per-record writes and review items without touching the DB.
+
+    The payload is copied first, so planning leaves the caller's records unchanged.
+    Candidate registry lookups (data.go.kr) still run here and are cached on the plan; party
+    inference reads whatever the process evidence index holds (see load_party_evidence_index).
+    `heartbeat()` is called after every planned record.
+    """
+    plan = IngestPlan(
+        run_type=payload.run_type,
+        extractor_version=payload.extractor_version,
+        llm_model=payload.llm_model,
+        payload_hash=hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest(),
+    )
+    candidate_profile_review_marked: set[str] = set()
+    for source_record in payload.records:
+        record = source_record.model_copy(deep=True)
+        try:
+            plan.records.append(
+                _plan_record(
+                    record,
+                    service_cache=plan.service_cache,
+                    candidate_profile_review_marked=candidate_profile_review_marked,
+                    party_index=plan.party_index,
+                )
+            )
+        except Exception as exc:  # noqa: BLE001
+            plan.records.append(
+                RecordPlan(
+                    observation_key=record.observation.observation_key,
                     record=record,
-                    candidate_name_set=candidate_name_set,
-                    candidate_party_map=candidate_party_map,
-                    candidate_id_map=candidate_id_map,
-                    service_cache=candidate_service_cache,
+                    review_items=[
+                        ReviewItem(
+                            entity_type="ingest_record",
+                            entity_id=record.observation.observation_key,
+                            issue_type="ingestion_error",
+                            review_note=str(exc),
+                        )
+                    ],
+                    error=str(exc),
                 )
-                repo.upsert_poll_option(observation_id, normalized_option)
-                if classification_reason:
-                    option_type_manual_review.append(
-                        (normalized_option.get("option_name", "unknown"), classification_reason)
-                    )
-                if candidate_verify_reason:
-                    candidate_verify_manual_review.append(
-                        (normalized_option.get("option_name", "unknown"), candidate_verify_reason)
-                    )
+            )
+        if heartbeat is not None:
+            heartbeat()
+    return plan
 
-                confidence = normalized_option.get("party_inference_confidence")
-                if not normalized_option.get("party_inferred") or confidence is None:
-                    continue
-                try:
-                    confidence_value = float(confidence)
-                except (TypeError, ValueError):
-                    continue
-                if confidence_value < PARTY_INFERENCE_REVIEW_THRESHOLD:
-                    party_inference_low_confidence.append(
-                        (normalized_option.get("option_name", "unknown"), confidence_value)
-                    )
 
-            if inference_uncertain:
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="extract_error",
-                        review_note=(
-                            "date inference uncertainty: "
-                            f"mode={inference_mode}, confidence={inference_confidence}"
-                        ),
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-            if party_inference_low_confidence:
-                detail = ", ".join(f"{name}:{confidence:.2f}" for name, confidence in party_inference_low_confidence)
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="party_inference_low_confidence",
-                        review_note=f"party inference confidence below {PARTY_INFERENCE_REVIEW_THRESHOLD}: {detail}",
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-            if option_type_manual_review:
-                detail = ", ".join(f"{name}:{reason}" for name, reason in option_type_manual_review)
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="mapping_error",
-                        review_note=f"option_type manual review required: {detail}",
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
-            if candidate_verify_manual_review:
-                detail = ", ".join(f"{name}:{reason}" for name, reason in candidate_verify_manual_review)
-                try:
-                    repo.insert_review_queue(
-                        entity_type="poll_observation",
-                        entity_id=record.observation.observation_key,
-                        issue_type="mapping_error",
-                        review_note=f"candidate verification manual review required: {detail}",
-                    )
-                except Exception:  # noqa: BLE001
-                    pass
+def _insert_review_items(repo, items: list[ReviewItem]) -> None:
+    for item in items:
+        try:
+            repo.insert_review_queue(
+                entity_type=item.entity_type,
+                entity_id=item.entity_id,
+                issue_type=item.issue_type,
+                review_note=item.review_note,
+            )
+        except Exception:  # noqa: BLE001
+            # Keep batch loop alive even when review_queue insert fails.
+            pass
+
+
+def _apply_record_context(plan: RecordPlan, repo) -> int | None:
+    """Writes that precede the observation; returns the article id, or None without an observation."""
+    if plan.region is not None:
+        repo.upsert_region(plan.region)
+    if plan.observation is None:
+        return None
+    repo.upsert_matchup(plan.matchup)
+    for candidate in plan.candidates:
+        repo.upsert_candidate(candidate)
+    return repo.upsert_article(plan.article)
+
+
+def _apply_record_children(plan: RecordPlan, repo, observation_id: int, *, service_cache, party_index=None) -> None:
+    if plan.needs_default_backfill:
+        fetch_default = getattr(repo, "fetch_candidate_default_poll_options", None)
+        if callable(fetch_default):
+            prior_defaults = fetch_default(observation_id) or []
+            if prior_defaults:
+                _backfill_multi_from_default_candidates(
+                    options=plan.options,
+                    default_rows=prior_defaults,
+                )
+        cleanup_default = getattr(repo, "delete_candidate_default_poll_options", None)
+        if callable(cleanup_default):
+            cleanup_default(observation_id)
+    if not plan.options_finalized:
+        _finalize_record_options(plan, service_cache, party_index)
+
+    for option in plan.options:
+        repo.upsert_poll_option(observation_id, option)
+
+    # The process index only mirrors evidence that was actually persisted.
+    refresh_evidence = getattr(repo, "refresh_candidate_party_evidence", None)
+    if plan.party_evidence and callable(refresh_evidence):
+        stored_evidence = refresh_evidence(plan.party_evidence)
+        if party_index is not None:
+            party_index.replace_candidates(
+                {row["candidate_token"] for row in plan.party_evidence},
+                stored_evidence or [],
+            )
+
+    # Stored only after every write succeeded, so a partial failure is retried next cycle.
+    set_content_hash = getattr(repo, "set_observation_content_hash", None)
+    if plan.content_hash and callable(set_content_hash):
+        set_content_hash(plan.observation_key, observation_id, plan.content_hash)
+
+
+def _apply_record_plan(plan: RecordPlan, repo, *, run_id: int, service_cache, party_index=None) -> None:
+    article_id = _apply_record_context(plan, repo)
+    if plan.observation is None:
+        return
+    observation_id = repo.upsert_poll_observation(
+        plan.observation,
+        article_id=article_id,
+        ingestion_run_id=run_id,
+    )
+    _apply_record_children(plan, repo, observation_id, service_cache=service_cache, party_index=party_index)
+
+
+def _publish_record_writes(repo) -> None:
+    # Records commit one by one, so bump the data generation per record: conditional reads
+    # would otherwise keep answering 304 for mid-run changes until finish_ingestion_run.
+    bump = getattr(repo, "bump_data_generation", None)
+    if callable(bump):
+        bump()
+
+
+@dataclass
+class _ApplyTally:
+    processed_count: int = 0
+    error_count: int = 0
+    date_inference_failed_count: int = 0
+    date_inference_estimated_count: int = 0
+    skipped_count: int = 0
+    touched_matchup_ids: dict[str, None] = field(default_factory=dict)
+
+
+def _record_applied(record_plan: RecordPlan, repo, tally: _ApplyTally) -> None:
+    if record_plan.observation is not None:
+        tally.touched_matchup_ids[record_plan.observation["matchup_id"]] = None
+    _insert_review_items(repo, record_plan.review_items)
+    _publish_record_writes(repo)
+    if record_plan.rejected:
+        tally.error_count += 1
+    else:
+        tally.processed_count += 1
+
+
+def _record_failed(record_plan: RecordPlan, repo, exc: Exception, tally: _ApplyTally) -> None:
+    tally.error_count += 1
+    rollback = getattr(repo, "rollback", None)
+    if callable(rollback):
+        rollback()
+    issue_type = "ingestion_error"
+    if isinstance(exc, DuplicateConflictError):
+        issue_type = "DUPLICATE_CONFLICT"
+    _insert_review_items(
+        repo,
+        [
+            ReviewItem(
+                entity_type="ingest_record",
+                entity_id=record_plan.observation_key,
+                issue_type=issue_type,
+                review_note=str(exc),
+            )
+        ],
+    )
+    _publish_record_writes(repo)
+
+
+def _flush_observation_batch(
+    batch: list[tuple[RecordPlan, int]],
+    repo,
+    *,
+    run_id: int,
+    plan: IngestPlan,
+    tally: _ApplyTally,
+) -> None:
+    """Upsert a batch of observations in one bulk call, then write each record's options.
 
-            processed_count += 1
+    Fingerprint conflicts come back per row and become DUPLICATE_CONFLICT review items; if the
+    bulk call itself fails the batch is retried row by row so one bad row cannot sink the rest.
+    """
+    if not batch:
+        return
+    try:
+        result = repo.bulk_upsert_poll_observations(
+            [record_plan.observation for record_plan, _ in batch],
+            article_ids=[article_id for _, article_id in batch],
+            ingestion_run_id=run_id,
+        )
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("bulk observation upsert failed, retrying per row: run_id=%s error=%s", run_id, exc)
+        rollback = getattr(repo, "rollback", None)
+        if callable(rollback):
+            rollback()
+        result = None
+
+    conflicts = {conflict["index"]: conflict for conflict in (result or {}).get("conflicts", [])}
+    observation_ids = (result or {}).get("observation_ids") or [None] * len(batch)
+    for index, ((record_plan, article_id), observation_id) in enumerate(zip(batch, observation_ids)):
+        try:
+            if index in conflicts:
+                raise DuplicateConflictError(conflicts[index]["error"])
+            if result is None:
+                observation_id = repo.upsert_poll_observation(
+                    record_plan.observation,
+                    article_id=article_id,
+                    ingestion_run_id=run_id,
+                )
+            elif observation_id is None:
+                raise RuntimeError(f"bulk upsert returned no id for observation_key={record_plan.observation_key}")
+            _apply_record_children(
+                record_plan,
+                repo,
+                observation_id,
+                service_cache=plan.service_cache,
+                party_index=plan.party_index,
+            )
         except Exception as exc:  # noqa: BLE001
-            error_count += 1
+            _record_failed(record_plan, repo, exc, tally)
+            continue
+        _record_applied(record_plan, repo, tally)
+    batch.clear()
+
+
+def apply_ingest_plan(
+    plan: IngestPlan,
+    repo,
+    *,
+    progress: Callable[[int, int], None] | None = None,
+) -> IngestResult:
+    """Persist a plan; `progress(done, total)` is called after every record."""
+    run_id = repo.create_ingestion_run(plan.run_type, plan.extractor_version, plan.llm_model)
+    tally = _ApplyTally()
+
+    stored_hashes: dict[str, str] = {}
+    fetch_hashes = getattr(repo, "fetch_observation_content_hashes", None)
+    if callable(fetch_hashes):
+        hashed_keys = [row.observation_key for row in plan.records if row.content_hash and row.error is None]
+        stored_hashes = fetch_hashes(list(dict.fromkeys(hashed_keys))) or {}
+
+    # Observations go through the repository's bulk upsert when it has one.
+    bulk_upsert = callable(getattr(repo, "bulk_upsert_poll_observations", None))
+    batch: list[tuple[RecordPlan, int]] = []
+
+    for done, record_plan in enumerate(plan.records):
+        # Reported at the top of the loop so every `continue` path is covered.
+        if progress is not None and done:
+            progress(done, len(plan.records))
+        if record_plan.content_hash and stored_hashes.get(record_plan.observation_key) == record_plan.content_hash:
+            tally.skipped_count += 1
+            continue
+        if record_plan.error is not None:
+            tally.error_count += 1
             rollback = getattr(repo, "rollback", None)
             if callable(rollback):
                 rollback()
-            issue_type = "ingestion_error"
-            if isinstance(exc, DuplicateConflictError):
-                issue_type = "DUPLICATE_CONFLICT"
-            try:
-                repo.insert_review_queue(
-                    entity_type="ingest_record",
-                    entity_id=record.observation.observation_key,
-                    issue_type=issue_type,
-                    review_note=str(exc),
-                )
-            except Exception:  # noqa: BLE001
-                # Keep batch loop alive even when review_queue insert fails.
-                pass
+            _insert_review_items(repo, record_plan.review_items)
+            _publish_record_writes(repo)
+            continue
+        if record_plan.observation is not None:
+            if record_plan.date_inference_mode == "estimated_timestamp":
+                tally.date_inference_estimated_count += 1
+            if record_plan.date_inference_mode in {"strict_fail_blocked", "failed"}:
+                tally.date_inference_failed_count += 1
+        try:
+            if bulk_upsert and record_plan.observation is not None:
+                batch.append((record_plan, _apply_record_context(record_plan, repo)))
+                if len(batch) >= INGEST_OBSERVATION_BATCH_SIZE:
+                    _flush_observation_batch(batch, repo, run_id=run_id, plan=plan, tally=tally)
+                continue
+            _apply_record_plan(
+                record_plan,
+                repo,
+                run_id=run_id,
+                service_cache=plan.service_cache,
+                party_index=plan.party_index,
+            )
+        except Exception as exc:  # noqa: BLE001
+            _record_failed(record_plan, repo, exc, tally)
+            continue
+        _record_applied(record_plan, repo, tally)
+    _flush_observation_batch(batch, repo, run_id=run_id, plan=plan, tally=tally)
 
-    status = "success" if error_count == 0 else "partial_success"
-    repo.finish_ingestion_run(run_id, status, processed_count, error_count)
+    if progress is not None and plan.records:
+        progress(len(plan.records), len(plan.records))
+
+    # Refresh the daily trend series before finishing the run so the generation bump covers it.
+    refresh_trend_series_for_run(repo, run_id)
+    status = "success" if tally.error_count == 0 else "partial_success"
+    repo.finish_ingestion_run(run_id, status, tally.processed_count, tally.error_count)
     update_counters = getattr(repo, "update_ingestion_policy_counters", None)
     if callable(update_counters):
         update_counters(
             run_id,
-            date_inference_failed_count=date_inference_failed_count,
-            date_inference_estimated_count=date_inference_estimated_count,
+            date_inference_failed_count=tally.date_inference_failed_count,
+            date_inference_estimated_count=tally.date_inference_estimated_count,
         )
-    return IngestResult(run_id=run_id, processed_count=processed_count, error_count=error_count, status=status)
+    update_skipped = getattr(repo, "update_ingestion_skipped_count", None)
+    if tally.skipped_count and callable(update_skipped):
+        update_skipped(run_id, tally.skipped_count)
+    LOGGER.info(
+        "ingest_run_finished run_id=%s processed=%s skipped=%s errors=%s",
+        run_id,
+        tally.processed_count,
+        tally.skipped_count,
+        tally.error_count,
+    )
+    return IngestResult(
+        run_id=run_id,
+        processed_count=tally.processed_count,
+        error_count=tally.error_count,
+        status=status,
+        touched_matchup_ids=list(tally.touched_matchup_ids),
+        skipped_count=tally.skipped_count,
+    )
+
+
+def ingest_payload(
+    payload: IngestPayload,
+    repo,
+    *,
+    progress: Callable[[int, int], None] | None = None,
+    heartbeat: Callable[[], None] | None = None,
+) -> IngestResult:
+    load_party_evidence_index(repo)
+    return apply_ingest_plan(plan_ingest_payload(payload, heartbeat=heartbeat), repo, progress=progress)
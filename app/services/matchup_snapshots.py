@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Iterable
+
+from app.config import get_settings
+from app.db import get_connection
+from app.services.repository import PostgresRepository
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class MatchupSnapshotRebuildResult:
+    rebuilt: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rebuilt_count": len(self.rebuilt),
+            "missing_count": len(self.missing),
+            "failed_count": len(self.failed),
+            "failed": list(self.failed),
+        }
+
+
+def matchup_snapshots_enabled() -> bool:
+    try:
+        return bool(get_settings().matchup_snapshots_enabled)
+    except Exception:  # noqa: BLE001
+        return True
+
+
+def rebuild_matchup_snapshots(
+    repo,
+    matchup_ids: Iterable[str],
+    *,
+    run_id: int | None = None,
+) -> MatchupSnapshotRebuildResult:
+    result = MatchupSnapshotRebuildResult()
+    for matchup_id in dict.fromkeys(str(x).strip() for x in matchup_ids if x):
+        if not matchup_id:
+            continue
+        try:
+            # Read the version before rendering: if the matchup changes in between,
+            # the stored version is older and the read path falls back to live.
+            data_version = repo.fetch_matchup_data_version(matchup_id)
+            payload = repo.get_matchup(matchup_id)
+            if not payload:
+                repo.delete_matchup_snapshot(matchup_id)
+                result.missing.append(matchup_id)
+                continue
+            canonical_matchup_id = str(payload.get("matchup_id") or matchup_id)
+            if canonical_matchup_id != matchup_id:
+                data_version = repo.fetch_matchup_data_version(canonical_matchup_id)
+                payload = repo.get_matchup(canonical_matchup_id) or payload
+            repo.upsert_matchup_snapshot(
+                canonical_matchup_id,
+                payload,
+                data_version=data_version,
+                source_run_id=run_id,
+            )
+            result.rebuilt.append(canonical_matchup_id)
+        except Exception as exc:  # noqa: BLE001
+            rollback = getattr(repo, "rollback", None)
+            if callable(rollback):
+                rollback()
+            LOGGER.warning("matchup snapshot rebuild failed: matchup_id=%s error=%s", matchup_id, exc)
+            result.failed.append(matchup_id)
+    return result
+
+
+def run_matchup_snapshot_rebuild(matchup_ids: Iterable[str], *, run_id: int | None = None) -> dict[str, Any]:
+    """Background entry point: opens its own connection and never raises."""
+    ids = [x for x in matchup_ids if x]
+    if not ids or not matchup_snapshots_enabled():
+        return {"status": "skipped", "rebuilt_count": 0, "missing_count": 0, "failed_count": 0, "failed": []}
+    try:
+        with get_connection() as conn:
+            result = rebuild_matchup_snapshots(PostgresRepository(conn), ids, run_id=run_id)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("matchup snapshot rebuild job failed: run_id=%s error=%s", run_id, exc)
+        return {"status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+    summary = result.as_dict()
+    summary["status"] = "success" if not result.failed else "partial_success"
+    return summary
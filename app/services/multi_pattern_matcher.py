@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+class MultiPatternMatcher:
+    """One compiled alternation over a fixed, priority-ordered dictionary of substrings.
+
+    Patterns keep the order they were given in as their rank (duplicates keep the first rank),
+    so callers that used to loop over a priority-ordered dictionary can pick the best hit
+    without one substring scan per entry.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: list[str] = list(dict.fromkeys(pattern for pattern in patterns if pattern))
+        self._rank = {pattern: rank for rank, pattern in enumerate(self.patterns)}
+        # Alternatives in rank order: at any position the regex engine tries the best pattern first.
+        self._regex = re.compile("|".join(re.escape(pattern) for pattern in self.patterns)) if self.patterns else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def best(self, *texts: str) -> str | None:
+        """The lowest-ranked pattern occurring in any of `texts`.
+
+        Searching again from one past each match start (rather than finditer, which skips past
+        the match end) also sees patterns that overlap a hit, so the result is the same as
+        `next(p for p in patterns if any(p in t for t in texts))`.
+        """
+        if self._regex is None:
+            return None
+        search = self._regex.search
+        best_rank: int | None = None
+        for text in texts:
+            if not text:
+                continue
+            match = search(text)
+            while match is not None:
+                rank = self._rank[match.group()]
+                if best_rank is None or rank < best_rank:
+                    if rank == 0:
+                        return self.patterns[0]
+                    best_rank = rank
+                match = search(text, match.start() + 1)
+        return self.patterns[best_rank] if best_rank is not None else None
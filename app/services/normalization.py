@@ -1,5 +1,6 @@
+from functools import lru_cache
 import re
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 
 class NormalizedValue(NamedTuple):
@@ -9,35 +10,62 @@ class NormalizedValue(NamedTuple):
     is_missing: bool
 
 
-SINGLE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*%?\s*$")
-RANGE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*[~\-]\s*(\d+(?:\.\d+)?)\s*%?\s*$")
-BAND_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*%?\s*대\s*$")
+class NormalizedColumns(NamedTuple):
+    value_min: list[float | None]
+    value_max: list[float | None]
+    value_mid: list[float | None]
+    is_missing: list[bool]
 
 
-def normalize_percentage(raw: str | None) -> NormalizedValue:
-    if raw is None:
-        return NormalizedValue(None, None, None, True)
+# Range ("53~55%"), band ("30%대") or single value ("41.2%") in one pass:
+# "hi" is set for ranges, "band" for bands, neither for a single value.
+PERCENTAGE_RE = re.compile(
+    r"^\s*(?P<lo>\d+(?:\.\d+)?)\s*(?:[~\-]\s*(?P<hi>\d+(?:\.\d+)?)\s*%?|%?\s*(?P<band>대)|%?)\s*$"
+)
+MISSING_TOKENS = frozenset({"언급 없음", "미공개", "N/A", "-"})
+MISSING_VALUE = NormalizedValue(None, None, None, True)
+
 
-    raw = raw.strip()
-    if not raw or raw in {"언급 없음", "미공개", "N/A", "-"}:
-        return NormalizedValue(None, None, None, True)
+@lru_cache(maxsize=4096)
+def _normalize_stripped(raw: str) -> NormalizedValue:
+    if not raw or raw in MISSING_TOKENS:
+        return MISSING_VALUE
 
-    matched = RANGE_RE.match(raw)
-    if matched:
-        lo, hi = float(matched.group(1)), float(matched.group(2))
+    matched = PERCENTAGE_RE.match(raw)
+    if not matched:
+        return MISSING_VALUE
+
+    lo = float(matched.group("lo"))
+    if matched.group("hi") is not None:
+        hi = float(matched.group("hi"))
         lo, hi = min(lo, hi), max(lo, hi)
         return NormalizedValue(lo, hi, (lo + hi) / 2.0, False)
-
-    matched = BAND_RE.match(raw)
-    if matched:
-        base = float(matched.group(1))
-        lo = base
-        hi = base + 9
+    if matched.group("band") is not None:
+        hi = lo + 9
         return NormalizedValue(lo, hi, (lo + hi) / 2.0, False)
+    return NormalizedValue(lo, lo, lo, False)
+
+
+def normalize_percentage(raw: str | None) -> NormalizedValue:
+    if raw is None:
+        return MISSING_VALUE
+    return _normalize_stripped(raw.strip())
+
+
+def percentage_cache_info():
+    return _normalize_stripped.cache_info()
 
-    matched = SINGLE_RE.match(raw)
-    if matched:
-        val = float(matched.group(1))
-        return NormalizedValue(val, val, val, False)
 
-    return NormalizedValue(None, None, None, True)
+def normalize_percentages(raws: Iterable[str | None]) -> NormalizedColumns:
+    """Column-wise normalize_percentage; each distinct raw value is parsed once per batch."""
+    seen: dict[str | None, NormalizedValue] = {}
+    columns = NormalizedColumns([], [], [], [])
+    for raw in raws:
+        value = seen.get(raw)
+        if value is None:
+            value = seen[raw] = normalize_percentage(raw)
+        columns.value_min.append(value.value_min)
+        columns.value_max.append(value.value_max)
+        columns.value_mid.append(value.value_mid)
+        columns.is_missing.append(value.is_missing)
+    return columns
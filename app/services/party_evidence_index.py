@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+import logging
+from threading import Lock
+from typing import Any, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+# registry: candidates table, data_go: data.go.kr lookups made during ingest, poll_option: verified poll_options,
+# incumbent: registry candidates whose job is the region's head-of-government office.
+PARTY_EVIDENCE_SOURCES = ("registry", "data_go", "poll_option", "incumbent")
+OFFICIAL_PARTY_EVIDENCE_SOURCES = frozenset({"registry", "data_go"})
+
+
+@dataclass(frozen=True)
+class PartyEvidence:
+    region_code: str
+    party_counts: dict[str, int]
+    party_sources: dict[str, frozenset[str]]
+
+    @property
+    def total(self) -> int:
+        return sum(self.party_counts.values())
+
+    def top_party(self) -> tuple[str, int]:
+        return Counter(self.party_counts).most_common(1)[0]
+
+
+def party_evidence_row(
+    candidate_token: str,
+    region_code: str | None,
+    party_name: str,
+    source: str,
+    evidence_count: int = 1,
+) -> dict[str, Any]:
+    return {
+        "candidate_token": candidate_token,
+        "region_code": region_code or "",
+        "party_name": party_name,
+        "source": source,
+        "evidence_count": evidence_count,
+    }
+
+
+class PartyEvidenceIndex:
+    """In-memory candidate→party evidence keyed by normalized candidate token, then region code.
+
+    Region "" holds region-agnostic evidence such as the candidates registry.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, dict[str, Counter[str]]]] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> PartyEvidenceIndex:
+        index = cls()
+        index.add_rows(rows)
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(by_region) for by_region in self._entries.values())
+
+    def add_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        with self._lock:
+            self._add_rows(rows)
+
+    def replace_candidates(self, candidate_tokens: Iterable[str], rows: Iterable[dict[str, Any]]) -> None:
+        """Swap everything held for `candidate_tokens` for `rows` (the persisted state after a refresh)."""
+        with self._lock:
+            for token in candidate_tokens:
+                self._entries.pop(token, None)
+            self._add_rows(rows)
+
+    def _add_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            token = str(row.get("candidate_token") or "")
+            party_name = str(row.get("party_name") or "").strip()
+            source = str(row.get("source") or "")
+            if not token or not party_name or source not in PARTY_EVIDENCE_SOURCES:
+                continue
+            by_party = self._entries.setdefault(token, {}).setdefault(str(row.get("region_code") or ""), {})
+            by_party.setdefault(party_name, Counter())[source] += int(row.get("evidence_count") or 1)
+
+    def lookup(self, candidate_token: str, region_codes: Iterable[str | None]) -> PartyEvidence | None:
+        """Evidence for the first region code (most specific first) that has any; "" is always tried last."""
+        if not candidate_token:
+            return None
+        keys = list(dict.fromkeys([*(code or "" for code in region_codes), ""]))
+        with self._lock:
+            by_region = self._entries.get(candidate_token)
+            if not by_region:
+                return None
+            for region_code in keys:
+                by_party = by_region.get(region_code)
+                if not by_party:
+                    continue
+                return PartyEvidence(
+                    region_code=region_code,
+                    party_counts={party: sum(sources.values()) for party, sources in by_party.items()},
+                    party_sources={party: frozenset(sources) for party, sources in by_party.items()},
+                )
+        return None
+
+
+_INDEX = PartyEvidenceIndex()
+_INDEX_LOADED = False
+_INDEX_LOCK = Lock()
+
+
+def get_party_evidence_index() -> PartyEvidenceIndex:
+    return _INDEX
+
+
+def load_party_evidence_index(repo) -> PartyEvidenceIndex:
+    """Load persisted evidence into the process index once; later calls are no-ops."""
+    global _INDEX_LOADED
+    with _INDEX_LOCK:
+        if _INDEX_LOADED:
+            return _INDEX
+        fetch = getattr(repo, "fetch_candidate_party_evidence", None)
+        if not callable(fetch):
+            return _INDEX
+        try:
+            rows = fetch() or []
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("party_evidence_index_load_failed error=%s", exc)
+            rollback = getattr(repo, "rollback", None)
+            if callable(rollback):
+                rollback()
+            return _INDEX
+        _INDEX.add_rows(rows)
+        _INDEX_LOADED = True
+        LOGGER.info("party_evidence_index_loaded rows=%s keys=%s", len(rows), len(_INDEX))
+        return _INDEX
+
+
+def reset_party_evidence_index() -> None:
+    global _INDEX, _INDEX_LOADED
+    with _INDEX_LOCK:
+        _INDEX = PartyEvidenceIndex()
+        _INDEX_LOADED = False
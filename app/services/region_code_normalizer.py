@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
+from functools import lru_cache
+import re
+import sys
+from typing import Any
 
 LEGACY_REGION_PREFIX_MAP = {
     # 강원도(legacy 32) -> 강원특별자치도(42)
@@ -11,6 +14,7 @@ LEGACY_REGION_PREFIX_MAP = {
 _SIMPLE_REGION_CODE_RE = re.compile(r"^\d{2}(?:-\d{3})?$")
 _COMPACT_REGION_CODE_RE = re.compile(r"^\d{5}$")
 _SCENARIO_REGION_CODE_RE = re.compile(r"^\d{2}-\d{2}-\d{3}$")
+REGION_CODE_CACHE_SIZE = 4096
 
 
 @dataclass(frozen=True)
@@ -50,8 +54,8 @@ def _canonicalize_normalized_token(normalized_token: str) -> str | None:
     return None
 
 
-def normalize_region_code_input(raw_value: str | None) -> RegionCodeNormalization:
-    raw = (raw_value or "").strip()
+@lru_cache(maxsize=REGION_CODE_CACHE_SIZE)
+def _normalize_stripped(raw: str) -> RegionCodeNormalization:
     if not raw:
         return RegionCodeNormalization(raw=raw, canonical=None, is_code_like=False, was_aliased=False)
 
@@ -61,4 +65,30 @@ def normalize_region_code_input(raw_value: str | None) -> RegionCodeNormalizatio
         return RegionCodeNormalization(raw=raw, canonical=None, is_code_like=False, was_aliased=False)
 
     was_aliased = normalized_token != canonical
-    return RegionCodeNormalization(raw=raw, canonical=canonical, is_code_like=True, was_aliased=was_aliased)
+    # Interned so the few distinct codes share one string across observations, options and cache keys.
+    return RegionCodeNormalization(
+        raw=raw,
+        canonical=sys.intern(canonical),
+        is_code_like=True,
+        was_aliased=was_aliased,
+    )
+
+
+def normalize_region_code_input(raw_value: str | None) -> RegionCodeNormalization:
+    return _normalize_stripped((raw_value or "").strip())
+
+
+def resolve_region_code(value: Any) -> str | None:
+    """Canonical code for code-like values; other non-empty values are returned stripped."""
+    if value is None:
+        return None
+    raw = str(value).strip()
+    return _normalize_stripped(raw).canonical or raw or None
+
+
+def region_code_cache_info():
+    return _normalize_stripped.cache_info()
+
+
+def clear_region_code_cache() -> None:
+    _normalize_stripped.cache_clear()
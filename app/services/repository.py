@@ -1,15 +1,263 @@
 import copy
 import json
-import re
 import time
-from datetime import date
+from datetime import date, datetime
 from threading import Lock
 from typing import Any
 
+import psycopg
+
 from app.config import get_settings
 from app.services.candidate_token_policy import is_noise_candidate_token
+from app.services.elections_master import (
+    apply_official_region_overrides,
+    apply_official_title_overrides,
+    compact_region_name,
+    derive_placeholder_title,
+    is_sido_region_code,
+    normalize_region_text,
+    office_sort_key,
+    strip_region_suffix,
+)
+from app.services.encoded_response_cache import clear_encoded_response_cache
 from app.services.errors import DuplicateConflictError
 from app.services.fingerprint import merge_observation_by_priority
+from app.services.request_metrics import record_cache_lookup
+from app.services.trend_series import TREND_SERIES_METRICS
+
+_POLL_OBSERVATION_UPSERT_COLUMNS = (
+    "observation_key",
+    "article_id",
+    "survey_name",
+    "pollster",
+    "survey_start_date",
+    "survey_end_date",
+    "confidence_level",
+    "sample_size",
+    "response_rate",
+    "margin_of_error",
+    "sponsor",
+    "method",
+    "region_code",
+    "office_type",
+    "matchup_id",
+    "audience_scope",
+    "audience_region_code",
+    "sampling_population_text",
+    "legal_completeness_score",
+    "legal_filled_count",
+    "legal_required_count",
+    "date_resolution",
+    "date_inference_mode",
+    "date_inference_confidence",
+    "official_release_at",
+    "poll_fingerprint",
+    "source_channel",
+    "source_channels",
+    "verified",
+    "source_grade",
+    "ingestion_run_id",
+)
+_POLL_OBSERVATION_ON_CONFLICT_SQL = """
+ON CONFLICT (observation_key) DO UPDATE
+SET article_id=EXCLUDED.article_id,
+    survey_name=EXCLUDED.survey_name,
+    pollster=EXCLUDED.pollster,
+    survey_start_date=EXCLUDED.survey_start_date,
+    survey_end_date=EXCLUDED.survey_end_date,
+    confidence_level=EXCLUDED.confidence_level,
+    sample_size=EXCLUDED.sample_size,
+    response_rate=EXCLUDED.response_rate,
+    margin_of_error=EXCLUDED.margin_of_error,
+    sponsor=EXCLUDED.sponsor,
+    method=EXCLUDED.method,
+    region_code=EXCLUDED.region_code,
+    office_type=EXCLUDED.office_type,
+    matchup_id=EXCLUDED.matchup_id,
+    audience_scope=EXCLUDED.audience_scope,
+    audience_region_code=EXCLUDED.audience_region_code,
+    sampling_population_text=EXCLUDED.sampling_population_text,
+    legal_completeness_score=EXCLUDED.legal_completeness_score,
+    legal_filled_count=EXCLUDED.legal_filled_count,
+    legal_required_count=EXCLUDED.legal_required_count,
+    date_resolution=EXCLUDED.date_resolution,
+    date_inference_mode=EXCLUDED.date_inference_mode,
+    date_inference_confidence=EXCLUDED.date_inference_confidence,
+    official_release_at=COALESCE(poll_observations.official_release_at, EXCLUDED.official_release_at),
+    poll_fingerprint=COALESCE(poll_observations.poll_fingerprint, EXCLUDED.poll_fingerprint),
+    source_channel=CASE
+        WHEN poll_observations.source_channel = 'nesdc' OR EXCLUDED.source_channel = 'nesdc'
+            THEN 'nesdc'
+        ELSE EXCLUDED.source_channel
+    END,
+    source_channels=CASE
+        WHEN poll_observations.source_channels IS NULL THEN EXCLUDED.source_channels
+        WHEN EXCLUDED.source_channels IS NULL THEN poll_observations.source_channels
+        ELSE ARRAY(
+            SELECT DISTINCT unnest(
+                poll_observations.source_channels || EXCLUDED.source_channels
+            )
+        )
+    END,
+    verified=EXCLUDED.verified,
+    source_grade=EXCLUDED.source_grade,
+    ingestion_run_id=EXCLUDED.ingestion_run_id,
+    updated_at=NOW()
+"""
+_OBSERVATION_TEXT_META_FIELDS = (
+    "pollster",
+    "sponsor",
+    "region_code",
+    "office_type",
+    "matchup_id",
+    "audience_scope",
+    "audience_region_code",
+    "sampling_population_text",
+    "date_resolution",
+    "date_inference_mode",
+    "method",
+)
+_OBSERVATION_VALUE_META_FIELDS = (
+    "survey_start_date",
+    "survey_end_date",
+    "confidence_level",
+    "sample_size",
+    "response_rate",
+    "margin_of_error",
+    "legal_completeness_score",
+    "legal_filled_count",
+    "legal_required_count",
+    "date_inference_confidence",
+    "official_release_at",
+)
+
+
+def _build_fingerprint_merge_sql() -> str:
+    """ON CONFLICT (poll_fingerprint) clause mirroring fingerprint.merge_observation_by_priority."""
+    incoming_wins = (
+        "(lower(COALESCE(EXCLUDED.source_channel, 'article')) = 'nesdc' "
+        "AND lower(COALESCE(poll_observations.source_channel, 'article')) <> 'nesdc')"
+    )
+    assignments = []
+    for field in _OBSERVATION_TEXT_META_FIELDS + _OBSERVATION_VALUE_META_FIELDS:
+        incoming = f"EXCLUDED.{field}"
+        existing = f"poll_observations.{field}"
+        if field in _OBSERVATION_TEXT_META_FIELDS:
+            incoming, existing = f"NULLIF({incoming}, '')", f"NULLIF({existing}, '')"
+        assignments.append(
+            f"{field}=CASE WHEN {incoming_wins} THEN COALESCE({incoming}, {existing}) "
+            f"ELSE COALESCE({existing}, {incoming}) END"
+        )
+
+    channels = (
+        "(COALESCE(poll_observations.source_channels, ARRAY[]::text[]) "
+        "|| COALESCE(EXCLUDED.source_channels, ARRAY[]::text[]) "
+        "|| ARRAY[lower(COALESCE(poll_observations.source_channel, 'article')), "
+        "lower(COALESCE(EXCLUDED.source_channel, 'article'))])"
+    )
+    article_context = (
+        "(lower(COALESCE(EXCLUDED.source_channel, 'article')) = 'article' "
+        "AND NULLIF(EXCLUDED.survey_name, '') IS NOT NULL)"
+    )
+    fill_empty_name = (
+        "(NULLIF(poll_observations.survey_name, '') IS NULL AND NULLIF(EXCLUDED.survey_name, '') IS NOT NULL)"
+    )
+
+    def grade_score(expr: str) -> str:
+        return (
+            f"CASE upper(btrim({expr})) WHEN 'A' THEN 4 WHEN 'B' THEN 3 WHEN 'C' THEN 2 WHEN 'D' THEN 1 ELSE -1 END"
+        )
+
+    assignments += [
+        f"source_channels=ARRAY_REMOVE(ARRAY["
+        f"CASE WHEN 'article' = ANY{channels} THEN 'article' END, "
+        f"CASE WHEN 'nesdc' = ANY{channels} THEN 'nesdc' END], NULL)",
+        f"source_channel=CASE WHEN 'nesdc' = ANY{channels} THEN 'nesdc' ELSE 'article' END",
+        "verified=poll_observations.verified OR COALESCE(EXCLUDED.verified, FALSE)",
+        "source_grade=CASE "
+        "WHEN NULLIF(btrim(EXCLUDED.source_grade), '') IS NULL THEN poll_observations.source_grade "
+        "WHEN NULLIF(btrim(poll_observations.source_grade), '') IS NULL THEN upper(btrim(EXCLUDED.source_grade)) "
+        f"WHEN {grade_score('poll_observations.source_grade')} > {grade_score('EXCLUDED.source_grade')} "
+        "THEN poll_observations.source_grade "
+        "ELSE upper(btrim(EXCLUDED.source_grade)) END",
+        "ingestion_run_id=COALESCE(EXCLUDED.ingestion_run_id, poll_observations.ingestion_run_id)",
+        f"survey_name=CASE WHEN {article_context} OR {fill_empty_name} THEN EXCLUDED.survey_name "
+        "ELSE COALESCE(NULLIF(poll_observations.survey_name, ''), EXCLUDED.survey_name) END",
+        f"article_id=CASE WHEN {article_context} THEN COALESCE(EXCLUDED.article_id, poll_observations.article_id) "
+        f"WHEN {fill_empty_name} THEN poll_observations.article_id "
+        "ELSE COALESCE(poll_observations.article_id, EXCLUDED.article_id) END",
+        "updated_at=NOW()",
+    ]
+
+    # Core-field disagreement leaves the row untouched and RETURNING empty -> DUPLICATE_CONFLICT.
+    core_checks = [
+        "(NULLIF(poll_observations.region_code, '') IS NULL OR NULLIF(EXCLUDED.region_code, '') IS NULL "
+        "OR upper(regexp_replace(poll_observations.region_code, '\\s+', '', 'g')) "
+        "= upper(regexp_replace(EXCLUDED.region_code, '\\s+', '', 'g')))",
+        "(NULLIF(poll_observations.office_type, '') IS NULL OR NULLIF(EXCLUDED.office_type, '') IS NULL "
+        "OR lower(btrim(regexp_replace(poll_observations.office_type, '\\s+', ' ', 'g'))) "
+        "= lower(btrim(regexp_replace(EXCLUDED.office_type, '\\s+', ' ', 'g'))))",
+    ]
+    for field in ("survey_start_date", "survey_end_date", "sample_size"):
+        core_checks.append(
+            f"(poll_observations.{field} IS NULL OR EXCLUDED.{field} IS NULL "
+            f"OR poll_observations.{field} = EXCLUDED.{field})"
+        )
+
+    return (
+        "ON CONFLICT (poll_fingerprint) WHERE poll_fingerprint IS NOT NULL DO UPDATE\nSET "
+        + ",\n    ".join(assignments)
+        + "\nWHERE "
+        + "\n  AND ".join(core_checks)
+    )
+
+
+_POLL_OBSERVATION_FINGERPRINT_MERGE_SQL = _build_fingerprint_merge_sql()
+# Rows per multi-row INSERT; 31 columns keeps each statement well under the 65535 bind limit.
+POLL_OBSERVATION_BULK_CHUNK_SIZE = 500
+
+# registry and poll_option evidence counts, derived from candidates and verified poll_options.
+# {candidate_filter}/{option_filter} narrow the recount to some candidate tokens (see the expression indexes).
+_PARTY_EVIDENCE_RECOUNT_SQL = """
+INSERT INTO candidate_party_evidence (
+    candidate_token, region_code, party_name, source, evidence_count
+)
+SELECT
+    lower(regexp_replace(c.name_ko, '[[:space:]]+', '', 'g')),
+    '',
+    btrim(c.party_name),
+    'registry',
+    COUNT(*)
+FROM candidates c
+WHERE c.party_inferred = FALSE
+  AND COALESCE(btrim(c.name_ko), '') <> ''
+  AND COALESCE(btrim(c.party_name), '') <> ''
+  {candidate_filter}
+GROUP BY 1, 3
+UNION ALL
+SELECT
+    lower(regexp_replace(po.option_name, '[[:space:]]+', '', 'g')),
+    COALESCE(o.region_code, ''),
+    btrim(po.party_name),
+    'poll_option',
+    COUNT(*)
+FROM poll_options po
+JOIN poll_observations o ON o.id = po.observation_id
+WHERE po.option_type IN ('candidate', 'candidate_matchup')
+  AND po.party_inferred = FALSE
+  AND po.candidate_verified = TRUE
+  AND COALESCE(btrim(po.option_name), '') <> ''
+  AND COALESCE(btrim(po.party_name), '') <> ''
+  {option_filter}
+GROUP BY 1, 2, 3
+"""
+
+# ingest_jobs columns returned to callers; the payload is only read when a worker claims the job.
+_INGEST_JOB_COLUMNS = (
+    "id, idempotency_key, status, payload_hash, record_count, progress_done, processed_count, error_count, "
+    "skipped_count, run_id, attempt_count, error, created_at, started_at, heartbeat_at, finished_at"
+)
+
 
 def _is_noise_candidate_option(option_name: str | None, candidate_id: str | None) -> bool:
     _ = candidate_id
@@ -50,9 +298,21 @@ _API_READ_CACHE: dict[str, tuple[float, Any]] = {}
 _API_READ_CACHE_LOCK = Lock()
 
 
+_DATA_GENERATION_CACHE: dict[str, tuple[float, int]] = {}
+
+
 def clear_api_read_cache() -> None:
     with _API_READ_CACHE_LOCK:
         _API_READ_CACHE.clear()
+        _DATA_GENERATION_CACHE.clear()
+
+
+def _data_generation_cache_ttl_sec() -> float:
+    try:
+        ttl = float(get_settings().data_generation_cache_ttl_sec)
+    except Exception:  # noqa: BLE001
+        return 1.0
+    return max(ttl, 0.0)
 
 
 def _api_read_cache_ttl_sec() -> float:
@@ -70,13 +330,11 @@ def _api_read_cache_get(cache_key: str) -> Any | None:
     now = time.monotonic()
     with _API_READ_CACHE_LOCK:
         item = _API_READ_CACHE.get(cache_key)
-        if item is None:
-            return None
-        expire_at, payload = item
-        if expire_at <= now:
+        if item is not None and item[0] <= now:
             _API_READ_CACHE.pop(cache_key, None)
-            return None
-        return copy.deepcopy(payload)
+            item = None
+    record_cache_lookup(item is not None)
+    return copy.deepcopy(item[1]) if item is not None else None
 
 
 def _api_read_cache_set(cache_key: str, payload: Any) -> None:
@@ -97,6 +355,201 @@ def _api_read_cache_key(*parts: object) -> str:
     return "|".join(normalized)
 
 
+def _with_matchup_version_bump(insert_sql: str) -> str:
+    """Wrap a poll_observations INSERT ... RETURNING id, observation_key, matchup_id,
+    poll_fingerprint so the same statement bumps matchups.data_version for the written rows.
+
+    Every CTE reads the pre-statement snapshot, so the poll_observations join still sees the
+    matchup an observation belonged to before it was moved and both snapshots go stale.
+    """
+    return f"""
+        WITH written AS (
+            {insert_sql}
+        ),
+        bumped_matchups AS (
+            UPDATE matchups
+            SET data_version = data_version + 1
+            WHERE matchup_id IN (SELECT matchup_id FROM written)
+               OR matchup_id IN (
+                    SELECT o.matchup_id
+                    FROM poll_observations o
+                    JOIN written w ON w.observation_key = o.observation_key
+               )
+        )
+        SELECT id, observation_key, poll_fingerprint FROM written
+    """
+
+
+def _json_list(value: Any) -> list:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def _coerce_iso_date(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _infer_region_election_id(matchup_rows: list[dict], poll_meta_rows: list[dict]) -> str:
+    for row in matchup_rows:
+        matchup_id = row.get("matchup_id")
+        if isinstance(matchup_id, str) and "|" in matchup_id:
+            return matchup_id.split("|", 1)[0]
+    for row in poll_meta_rows:
+        matchup_id = row.get("latest_matchup_id")
+        if isinstance(matchup_id, str) and "|" in matchup_id:
+            return matchup_id.split("|", 1)[0]
+    return "20260603"
+
+
+def _region_election_status_label(has_poll_data: bool, has_candidate_data: bool) -> str:
+    if not has_poll_data:
+        return "조사 데이터 없음"
+    if not has_candidate_data:
+        return "후보 정보 준비중"
+    return "데이터 준비 완료"
+
+
+def _assemble_region_election_slots(
+    region: dict,
+    *,
+    fallback_region_code: str,
+    election_rows: list[dict],
+    matchup_rows: list[dict],
+    poll_meta_rows: list[dict],
+    topology_mode: str,
+    topology_version_id: str,
+) -> list[dict]:
+    election_by_office: dict[str, dict] = {}
+    for row in election_rows:
+        office_type = row.get("office_type")
+        if not isinstance(office_type, str):
+            continue
+        election_by_office[office_type] = row
+
+    resolved_region_code = region.get("region_code") or fallback_region_code
+    matchup_by_office: dict[str, dict] = {}
+    for row in matchup_rows:
+        office_type = row.get("office_type")
+        if not isinstance(office_type, str):
+            continue
+        matchup_by_office.setdefault(office_type, row)
+
+    poll_meta_by_office = {
+        row["office_type"]: row
+        for row in poll_meta_rows
+        if isinstance(row.get("office_type"), str)
+    }
+
+    is_master_empty = len(election_by_office) == 0
+
+    if election_by_office:
+        slots = sorted(election_by_office.keys(), key=office_sort_key)
+    else:
+        resolved_region_code = normalize_region_text(region.get("region_code"))
+        if not is_sido_region_code(resolved_region_code) and normalize_region_text(region.get("admin_level")) in {
+            "sigungu",
+            "local",
+        }:
+            slots = ["기초자치단체장", "기초의회"]
+        else:
+            slots = ["광역자치단체장", "광역의회", "교육감"]
+
+        if "재보궐" in matchup_by_office or "재보궐" in poll_meta_by_office:
+            slots.append("재보궐")
+
+    extra_offices = sorted(
+        (set(election_by_office.keys()) | set(matchup_by_office.keys()) | set(poll_meta_by_office.keys())) - set(slots),
+        key=office_sort_key,
+    )
+    slots.extend(extra_offices)
+
+    election_id = _infer_region_election_id(matchup_rows, poll_meta_rows)
+    result: list[dict] = []
+    for office_type in slots:
+        poll_meta = poll_meta_by_office.get(office_type, {})
+        election_row = election_by_office.get(office_type)
+        has_poll_data = bool(poll_meta.get("has_poll_data", False))
+        if not has_poll_data and election_row is not None:
+            has_poll_data = bool(election_row.get("has_poll_data", False))
+        has_candidate_data = bool(poll_meta.get("has_candidate_data", False))
+        latest_survey_end_date = poll_meta.get("latest_survey_end_date")
+        latest_matchup_id = poll_meta.get("latest_matchup_id")
+        if latest_matchup_id is None and election_row is not None:
+            latest_matchup_id = election_row.get("latest_matchup_id")
+
+        matchup_row = matchup_by_office.get(office_type)
+        display_title = None
+        if election_row:
+            slot_matchup_id = election_row.get("slot_matchup_id")
+            matchup_id = latest_matchup_id or (matchup_row.get("matchup_id") if matchup_row else None) or slot_matchup_id
+            matchup_id = matchup_id or f"{election_id}|{office_type}|{resolved_region_code}"
+            title = (
+                election_row.get("title")
+                or (matchup_row.get("title") if matchup_row else None)
+                or derive_placeholder_title(region, office_type)
+            )
+            display_title = election_row.get("display_title")
+            is_active = bool(election_row.get("is_active", True))
+            is_placeholder = not has_poll_data
+            is_fallback = False
+            source = normalize_region_text(election_row.get("source")) or "master"
+        elif matchup_row:
+            matchup_id = matchup_row["matchup_id"]
+            title = matchup_row["title"]
+            is_active = bool(matchup_row.get("is_active", True))
+            is_placeholder = False
+            is_fallback = is_master_empty
+            source = "generated" if is_master_empty else "matchups"
+        else:
+            matchup_id = latest_matchup_id or f"{election_id}|{office_type}|{resolved_region_code}"
+            title = derive_placeholder_title(region, office_type)
+            is_active = True
+            is_placeholder = True
+            is_fallback = True
+            source = "generated"
+
+        if topology_mode == "official":
+            # elections.display_title is precomputed by the master sync with the same overrides.
+            title = display_title or apply_official_title_overrides(region, office_type, title)
+
+        result.append(
+            {
+                "matchup_id": matchup_id,
+                "region_code": resolved_region_code,
+                "office_type": office_type,
+                "title": title,
+                "is_active": is_active,
+                "is_placeholder": is_placeholder,
+                "is_fallback": is_fallback,
+                "source": source,
+                "has_poll_data": has_poll_data,
+                "has_candidate_data": has_candidate_data,
+                "latest_survey_end_date": latest_survey_end_date,
+                "latest_matchup_id": latest_matchup_id,
+                "status": _region_election_status_label(has_poll_data=has_poll_data, has_candidate_data=has_candidate_data),
+                "topology": topology_mode,
+                "topology_version_id": topology_version_id,
+            }
+        )
+
+    return result
+
+
 class PostgresRepository:
     def __init__(self, conn):
         self.conn = conn
@@ -106,6 +559,7 @@ class PostgresRepository:
 
     def _invalidate_api_read_cache(self) -> None:
         clear_api_read_cache()
+        clear_encoded_response_cache()
 
     def create_ingestion_run(self, run_type: str, extractor_version: str, llm_model: str | None) -> int:
         with self.conn.cursor() as cur:
@@ -132,9 +586,46 @@ class PostgresRepository:
                 """,
                 (status, processed_count, error_count, run_id),
             )
+            self._bump_data_generation(cur)
+        self.conn.commit()
+        self._invalidate_api_read_cache()
+
+    @staticmethod
+    def _bump_data_generation(cur) -> None:
+        cur.execute(
+            """
+            INSERT INTO data_generation (id, generation, updated_at)
+            VALUES (1, 1, NOW())
+            ON CONFLICT (id) DO UPDATE
+            SET generation = data_generation.generation + 1,
+                updated_at = NOW()
+            """
+        )
+
+    def bump_data_generation(self) -> None:
+        with self.conn.cursor() as cur:
+            self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
 
+    def fetch_data_generation(self) -> int:
+        ttl = _data_generation_cache_ttl_sec()
+        now = time.monotonic()
+        if ttl > 0:
+            with _API_READ_CACHE_LOCK:
+                item = _DATA_GENERATION_CACHE.get("generation")
+            if item is not None and item[0] > now:
+                return item[1]
+
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT generation FROM data_generation WHERE id = 1")
+            row = cur.fetchone() or {}
+        generation = int(row.get("generation") or 0)
+        if ttl > 0:
+            with _API_READ_CACHE_LOCK:
+                _DATA_GENERATION_CACHE["generation"] = (now + ttl, generation)
+        return generation
+
     def update_ingestion_policy_counters(
         self,
         run_id: int,
@@ -155,6 +646,320 @@ class PostgresRepository:
         self.conn.commit()
         self._invalidate_api_read_cache()
 
+    def update_ingestion_skipped_count(self, run_id: int, skipped_count: int) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingestion_runs SET skipped_count=%s WHERE id=%s",
+                (skipped_count, run_id),
+            )
+        self.conn.commit()
+        self._invalidate_api_read_cache()
+
+    def fetch_observation_content_hashes(self, record_keys: list[str]) -> dict[str, str]:
+        if not record_keys:
+            return {}
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT record_key, content_hash
+                FROM ingest_record_hashes
+                WHERE record_key = ANY(%s)
+                """,
+                (list(record_keys),),
+            )
+            rows = cur.fetchall()
+        return {row["record_key"]: row["content_hash"] for row in rows}
+
+    def set_observation_content_hash(self, record_key: str, observation_id: int, content_hash: str) -> None:
+        # Not served by any read API, so the read cache stays valid.
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO ingest_record_hashes (record_key, observation_id, content_hash)
+                VALUES (%s, %s, %s)
+                ON CONFLICT (record_key) DO UPDATE
+                SET observation_id=EXCLUDED.observation_id,
+                    content_hash=EXCLUDED.content_hash,
+                    updated_at=NOW()
+                """,
+                (record_key, observation_id, content_hash),
+            )
+        self.conn.commit()
+
+    def fetch_candidate_party_evidence(self) -> list[dict]:
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT candidate_token, region_code, party_name, source, evidence_count
+                FROM candidate_party_evidence
+                """
+            )
+            return cur.fetchall()
+
+    def refresh_candidate_party_evidence(self, rows: list[dict]) -> list[dict]:
+        """Re-derive evidence for the candidate tokens in `rows` and return every stored row for them.
+
+        registry and poll_option counts are recounted exactly as rebuild_candidate_party_evidence
+        does, so applying the same record twice leaves them unchanged; a data_go row records one
+        lookup result and keeps its count.
+        """
+        # Not served by any read API, so the read cache stays valid.
+        tokens = sorted({str(row["candidate_token"]) for row in rows if row.get("candidate_token")})
+        if not tokens:
+            return []
+        data_go_rows = [row for row in rows if row.get("source") == "data_go"]
+        with self.conn.cursor() as cur:
+            if data_go_rows:
+                cur.executemany(
+                    """
+                    INSERT INTO candidate_party_evidence (
+                        candidate_token, region_code, party_name, source, evidence_count
+                    )
+                    VALUES (
+                        %(candidate_token)s, %(region_code)s, %(party_name)s, %(source)s, %(evidence_count)s
+                    )
+                    ON CONFLICT (candidate_token, region_code, party_name, source) DO UPDATE
+                    SET updated_at = NOW()
+                    """,
+                    data_go_rows,
+                )
+            cur.execute(
+                """
+                DELETE FROM candidate_party_evidence
+                WHERE source IN ('registry', 'poll_option')
+                  AND candidate_token = ANY(%(tokens)s)
+                """,
+                {"tokens": tokens},
+            )
+            cur.execute(
+                _PARTY_EVIDENCE_RECOUNT_SQL.format(
+                    candidate_filter="AND lower(regexp_replace(c.name_ko, '[[:space:]]+', '', 'g')) = ANY(%(tokens)s)",
+                    option_filter="AND lower(regexp_replace(po.option_name, '[[:space:]]+', '', 'g')) = ANY(%(tokens)s)",
+                ),
+                {"tokens": tokens},
+            )
+            cur.execute(
+                """
+                SELECT candidate_token, region_code, party_name, source, evidence_count
+                FROM candidate_party_evidence
+                WHERE candidate_token = ANY(%(tokens)s)
+                """,
+                {"tokens": tokens},
+            )
+            stored = cur.fetchall()
+        self.conn.commit()
+        return stored
+
+    def rebuild_candidate_party_evidence(self) -> int:
+        """Recount registry, poll_option and incumbent evidence from candidates, verified poll_options and regions.
+
+        data_go rows have no table to be recomputed from, so they are kept.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM candidate_party_evidence WHERE source IN ('registry', 'poll_option', 'incumbent')")
+            cur.execute(_PARTY_EVIDENCE_RECOUNT_SQL.format(candidate_filter="", option_filter=""))
+            cur.execute("SELECT region_code, sido_name, sigungu_name FROM regions")
+            regions = cur.fetchall()
+            cur.execute(
+                """
+                SELECT name_ko, party_name, job
+                FROM candidates
+                WHERE party_inferred = FALSE
+                  AND COALESCE(btrim(name_ko), '') <> ''
+                  AND COALESCE(btrim(party_name), '') <> ''
+                  AND COALESCE(btrim(job), '') <> ''
+                """
+            )
+            incumbent_rows = self._incumbent_party_evidence_rows(cur.fetchall(), regions)
+            if incumbent_rows:
+                cur.executemany(
+                    """
+                    INSERT INTO candidate_party_evidence (
+                        candidate_token, region_code, party_name, source, evidence_count
+                    )
+                    VALUES (
+                        %(candidate_token)s, %(region_code)s, %(party_name)s, %(source)s, %(evidence_count)s
+                    )
+                    """,
+                    incumbent_rows,
+                )
+            cur.execute("SELECT COUNT(*) AS row_count FROM candidate_party_evidence")
+            row = cur.fetchone()
+        self.conn.commit()
+        return int(row["row_count"]) if row else 0
+
+    @staticmethod
+    def _incumbent_party_evidence_rows(candidates: list[dict], regions: list[dict]) -> list[dict]:
+        """Candidates whose job is a region's head-of-government title (서울시장, 성동구청장, ...).
+
+        Sigungu titles shared by several sido (중구청장) also need the sido name in the job.
+        """
+        titles: dict[str, list[tuple[str, str]]] = {}
+        for region in regions:
+            sido_name = str(region.get("sido_name") or "").strip()
+            sigungu_name = str(region.get("sigungu_name") or "").strip()
+            base_sido = PostgresRepository._strip_region_suffix(sido_name)
+            if sigungu_name and sigungu_name != "전체":
+                names = [PostgresRepository._derive_matchup_title_from_region(region, "기초자치단체장", "")]
+            else:
+                names = [PostgresRepository._derive_matchup_title_from_region(region, "광역자치단체장", "")]
+                if sido_name:
+                    names.append(f"{sido_name}장" if sido_name.endswith("시") else f"{sido_name}지사")
+            for name in names:
+                title = "".join(name.split())
+                if title:
+                    titles.setdefault(title, []).append((str(region["region_code"]), base_sido))
+
+        counts: dict[tuple[str, str, str], int] = {}
+        for candidate in candidates:
+            token = "".join(str(candidate.get("name_ko") or "").split()).lower()
+            party_name = str(candidate.get("party_name") or "").strip()
+            job = "".join(str(candidate.get("job") or "").split())
+            if not token or not party_name or not job:
+                continue
+            for title, holders in titles.items():
+                if title not in job:
+                    continue
+                for region_code, base_sido in holders:
+                    if len(holders) > 1 and base_sido not in job:
+                        continue
+                    key = (token, region_code, party_name)
+                    counts[key] = counts.get(key, 0) + 1
+        return [
+            {
+                "candidate_token": token,
+                "region_code": region_code,
+                "party_name": party_name,
+                "source": "incumbent",
+                "evidence_count": count,
+            }
+            for (token, region_code, party_name), count in sorted(counts.items())
+        ]
+
+    def enqueue_ingest_job(
+        self,
+        payload: dict,
+        *,
+        payload_hash: str,
+        record_count: int,
+        idempotency_key: str | None = None,
+    ) -> tuple[dict | None, bool]:
+        """Insert a queued job, or return the job already holding idempotency_key.
+
+        A failed job with the same key is queued again. Returns (None, False) when
+        the key belongs to a different payload.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"""
+                INSERT INTO ingest_jobs (idempotency_key, payload, payload_hash, record_count)
+                VALUES (%s, %s::jsonb, %s, %s)
+                ON CONFLICT (idempotency_key) WHERE idempotency_key IS NOT NULL DO UPDATE
+                SET status = CASE WHEN ingest_jobs.status = 'failed' THEN 'queued' ELSE ingest_jobs.status END,
+                    error = CASE WHEN ingest_jobs.status = 'failed' THEN NULL ELSE ingest_jobs.error END,
+                    updated_at = NOW()
+                WHERE ingest_jobs.payload_hash = EXCLUDED.payload_hash
+                RETURNING {_INGEST_JOB_COLUMNS}, (xmax = 0) AS created
+                """,
+                (
+                    idempotency_key,
+                    json.dumps(payload, ensure_ascii=False, default=_json_default),
+                    payload_hash,
+                    record_count,
+                ),
+            )
+            row = cur.fetchone()
+        self.conn.commit()
+        if row is None:
+            return None, False
+        job = dict(row)
+        return job, bool(job.pop("created"))
+
+    def fetch_ingest_job(self, job_id: int) -> dict | None:
+        with self.conn.cursor() as cur:
+            cur.execute(f"SELECT {_INGEST_JOB_COLUMNS} FROM ingest_jobs WHERE id = %s", (job_id,))
+            row = cur.fetchone()
+        return dict(row) if row else None
+
+    def claim_next_ingest_job(self, *, stale_after_sec: float) -> dict | None:
+        """Mark the oldest queued job (or a running job with a stale heartbeat) running and return it with its payload."""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE ingest_jobs
+                SET status = 'running',
+                    attempt_count = attempt_count + 1,
+                    progress_done = 0,
+                    error = NULL,
+                    started_at = NOW(),
+                    heartbeat_at = NOW(),
+                    updated_at = NOW()
+                WHERE id = (
+                    SELECT id
+                    FROM ingest_jobs
+                    WHERE status = 'queued'
+                       OR (status = 'running' AND heartbeat_at < NOW() - (%s * INTERVAL '1 second'))
+                    ORDER BY id
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT 1
+                )
+                RETURNING {_INGEST_JOB_COLUMNS}, payload
+                """,
+                (stale_after_sec,),
+            )
+            row = cur.fetchone()
+        self.conn.commit()
+        return dict(row) if row else None
+
+    def update_ingest_job_progress(self, job_id: int, progress_done: int, *, attempt_count: int) -> bool:
+        """Heartbeat a claimed job; False when another worker has since re-claimed it."""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE ingest_jobs
+                SET progress_done = %s, heartbeat_at = NOW(), updated_at = NOW()
+                WHERE id = %s AND attempt_count = %s AND status = 'running'
+                """,
+                (progress_done, job_id, attempt_count),
+            )
+            updated = cur.rowcount == 1
+        self.conn.commit()
+        return updated
+
+    def finish_ingest_job(
+        self,
+        job_id: int,
+        *,
+        status: str,
+        run_id: int | None = None,
+        processed_count: int | None = None,
+        error_count: int | None = None,
+        skipped_count: int | None = None,
+        error: str | None = None,
+        attempt_count: int,
+    ) -> bool:
+        """Record the outcome of the claim identified by attempt_count; False when the claim was lost."""
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE ingest_jobs
+                SET status = %s,
+                    run_id = %s,
+                    processed_count = %s,
+                    error_count = %s,
+                    skipped_count = %s,
+                    progress_done = CASE WHEN %s = 'failed' THEN progress_done ELSE record_count END,
+                    error = %s,
+                    finished_at = NOW(),
+                    updated_at = NOW()
+                WHERE id = %s AND attempt_count = %s AND status = 'running'
+                """,
+                (status, run_id, processed_count, error_count, skipped_count, status, error, job_id, attempt_count),
+            )
+            updated = cur.rowcount == 1
+        self.conn.commit()
+        return updated
+
     def upsert_region(self, region: dict) -> None:
         with self.conn.cursor() as cur:
             cur.execute(
@@ -170,6 +975,7 @@ class PostgresRepository:
                 """,
                 region,
             )
+            self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
 
@@ -237,6 +1043,7 @@ class PostgresRepository:
                 """,
                 payload,
             )
+            self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
 
@@ -309,92 +1116,132 @@ class PostgresRepository:
 
     def upsert_poll_observation(self, observation: dict, article_id: int, ingestion_run_id: int) -> int:
         payload = self._prepare_observation_payload(observation, article_id, ingestion_run_id)
+        if payload["poll_fingerprint"]:
+            try:
+                observation_id = self._insert_poll_observation(payload, _POLL_OBSERVATION_FINGERPRINT_MERGE_SQL)
+            except psycopg.errors.UniqueViolation:
+                # observation_key already belongs to a row with another fingerprint.
+                self.conn.rollback()
+                return self._upsert_poll_observation_by_key(payload)
+            if observation_id is None:
+                raise DuplicateConflictError(
+                    f"DUPLICATE_CONFLICT core fields mismatch for poll_fingerprint={payload['poll_fingerprint']}"
+                )
+            self.conn.commit()
+            self._invalidate_api_read_cache()
+            return observation_id
+        return self._upsert_poll_observation_by_key(payload)
+
+    def _upsert_poll_observation_by_key(self, payload: dict) -> int:
         if payload["poll_fingerprint"]:
             existing = self._find_observation_by_fingerprint(payload["poll_fingerprint"])
             if existing:
                 payload = merge_observation_by_priority(existing=existing, incoming=payload)
                 if not payload.get("observation_key"):
                     raise DuplicateConflictError("DUPLICATE_CONFLICT missing observation_key after merge")
+        observation_id = self._insert_poll_observation(payload, _POLL_OBSERVATION_ON_CONFLICT_SQL)
+        self.conn.commit()
+        self._invalidate_api_read_cache()
+        return observation_id
 
+    def _insert_poll_observation(self, payload: dict, on_conflict_sql: str) -> int | None:
+        placeholders = ", ".join(f"%({column})s" for column in _POLL_OBSERVATION_UPSERT_COLUMNS)
         with self.conn.cursor() as cur:
             cur.execute(
-                """
-                INSERT INTO poll_observations (
-                    observation_key, article_id, survey_name, pollster,
-                    survey_start_date, survey_end_date, confidence_level, sample_size,
-                    response_rate, margin_of_error, sponsor, method, region_code,
-                    office_type, matchup_id, audience_scope, audience_region_code,
-                    sampling_population_text, legal_completeness_score,
-                    legal_filled_count, legal_required_count, date_resolution,
-                    date_inference_mode, date_inference_confidence, official_release_at,
-                    poll_fingerprint, source_channel, source_channels,
-                    verified, source_grade,
-                    ingestion_run_id
-                )
-                VALUES (
-                    %(observation_key)s, %(article_id)s, %(survey_name)s, %(pollster)s,
-                    %(survey_start_date)s, %(survey_end_date)s, %(confidence_level)s, %(sample_size)s,
-                    %(response_rate)s, %(margin_of_error)s, %(sponsor)s, %(method)s, %(region_code)s,
-                    %(office_type)s, %(matchup_id)s, %(audience_scope)s, %(audience_region_code)s,
-                    %(sampling_population_text)s, %(legal_completeness_score)s,
-                    %(legal_filled_count)s, %(legal_required_count)s, %(date_resolution)s,
-                    %(date_inference_mode)s, %(date_inference_confidence)s, %(official_release_at)s,
-                    %(poll_fingerprint)s, %(source_channel)s, %(source_channels)s,
-                    %(verified)s, %(source_grade)s,
-                    %(ingestion_run_id)s
-                )
-                ON CONFLICT (observation_key) DO UPDATE
-                SET article_id=EXCLUDED.article_id,
-                    survey_name=EXCLUDED.survey_name,
-                    pollster=EXCLUDED.pollster,
-                    survey_start_date=EXCLUDED.survey_start_date,
-                    survey_end_date=EXCLUDED.survey_end_date,
-                    confidence_level=EXCLUDED.confidence_level,
-                    sample_size=EXCLUDED.sample_size,
-                    response_rate=EXCLUDED.response_rate,
-                    margin_of_error=EXCLUDED.margin_of_error,
-                    sponsor=EXCLUDED.sponsor,
-                    method=EXCLUDED.method,
-                    region_code=EXCLUDED.region_code,
-                    office_type=EXCLUDED.office_type,
-                    matchup_id=EXCLUDED.matchup_id,
-                    audience_scope=EXCLUDED.audience_scope,
-                    audience_region_code=EXCLUDED.audience_region_code,
-                    sampling_population_text=EXCLUDED.sampling_population_text,
-                    legal_completeness_score=EXCLUDED.legal_completeness_score,
-                    legal_filled_count=EXCLUDED.legal_filled_count,
-                    legal_required_count=EXCLUDED.legal_required_count,
-                    date_resolution=EXCLUDED.date_resolution,
-                    date_inference_mode=EXCLUDED.date_inference_mode,
-                    date_inference_confidence=EXCLUDED.date_inference_confidence,
-                    official_release_at=COALESCE(poll_observations.official_release_at, EXCLUDED.official_release_at),
-                    poll_fingerprint=COALESCE(poll_observations.poll_fingerprint, EXCLUDED.poll_fingerprint),
-                    source_channel=CASE
-                        WHEN poll_observations.source_channel = 'nesdc' OR EXCLUDED.source_channel = 'nesdc'
-                            THEN 'nesdc'
-                        ELSE EXCLUDED.source_channel
-                    END,
-                    source_channels=CASE
-                        WHEN poll_observations.source_channels IS NULL THEN EXCLUDED.source_channels
-                        WHEN EXCLUDED.source_channels IS NULL THEN poll_observations.source_channels
-                        ELSE ARRAY(
-                            SELECT DISTINCT unnest(
-                                poll_observations.source_channels || EXCLUDED.source_channels
-                            )
-                        )
-                    END,
-                    verified=EXCLUDED.verified,
-                    source_grade=EXCLUDED.source_grade,
-                    ingestion_run_id=EXCLUDED.ingestion_run_id,
-                    updated_at=NOW()
-                RETURNING id
-                """,
+                _with_matchup_version_bump(
+                    f"""
+                    INSERT INTO poll_observations ({", ".join(_POLL_OBSERVATION_UPSERT_COLUMNS)})
+                    VALUES ({placeholders})
+                    {on_conflict_sql}
+                    RETURNING id, observation_key, matchup_id, poll_fingerprint
+                    """
+                ),
                 payload,
             )
-            observation_id = cur.fetchone()["id"]
+            row = cur.fetchone()
+        return row["id"] if row else None
+
+    def bulk_upsert_poll_observations(
+        self,
+        observations: list[dict],
+        *,
+        article_ids: list[int],
+        ingestion_run_id: int,
+    ) -> dict[str, Any]:
+        """Upsert a batch with multi-row INSERTs using upsert_poll_observation's conflict clauses.
+
+        Fingerprinted rows merge in SQL via ON CONFLICT (poll_fingerprint); rows without one
+        upsert by observation_key. A statement may not touch a row twice, so a row whose
+        fingerprint or observation_key already appeared earlier in the batch goes into the next
+        wave and merges into what the earlier one wrote.
+
+        Core-field mismatches are skipped and reported as {index, observation_key, error} so the
+        caller can file DUPLICATE_CONFLICT review items; observation_ids is aligned with the
+        input and holds None for those rows.
+        """
+        payloads = [
+            self._prepare_observation_payload(observation, article_id, ingestion_run_id)
+            for observation, article_id in zip(observations, article_ids, strict=True)
+        ]
+        waves: list[list[int]] = []
+        last_wave: dict[tuple[str, str], int] = {}
+        for index, payload in enumerate(payloads):
+            claims = [("key", payload["observation_key"])]
+            if payload["poll_fingerprint"]:
+                claims.append(("fingerprint", payload["poll_fingerprint"]))
+            wave = max((last_wave.get(claim, -1) for claim in claims), default=-1) + 1
+            for claim in claims:
+                last_wave[claim] = wave
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append(index)
+
+        observation_ids: list[int | None] = [None] * len(payloads)
+        conflicts: list[dict[str, Any]] = []
+        row_placeholder = "(" + ", ".join(["%s"] * len(_POLL_OBSERVATION_UPSERT_COLUMNS)) + ")"
+        with self.conn.cursor() as cur:
+            for wave in waves:
+                fingerprinted = [index for index in wave if payloads[index]["poll_fingerprint"]]
+                by_key = [index for index in wave if not payloads[index]["poll_fingerprint"]]
+                for indexes, on_conflict_sql, returned_by in (
+                    (fingerprinted, _POLL_OBSERVATION_FINGERPRINT_MERGE_SQL, "poll_fingerprint"),
+                    (by_key, _POLL_OBSERVATION_ON_CONFLICT_SQL, "observation_key"),
+                ):
+                    for start in range(0, len(indexes), POLL_OBSERVATION_BULK_CHUNK_SIZE):
+                        chunk = indexes[start : start + POLL_OBSERVATION_BULK_CHUNK_SIZE]
+                        params = [payloads[i].get(column) for i in chunk for column in _POLL_OBSERVATION_UPSERT_COLUMNS]
+                        cur.execute(
+                            _with_matchup_version_bump(
+                                f"""
+                                INSERT INTO poll_observations ({", ".join(_POLL_OBSERVATION_UPSERT_COLUMNS)})
+                                VALUES {", ".join([row_placeholder] * len(chunk))}
+                                {on_conflict_sql}
+                                RETURNING id, observation_key, matchup_id, poll_fingerprint
+                                """
+                            ),
+                            params,
+                        )
+                        ids = {row[returned_by]: row["id"] for row in cur.fetchall() or []}
+                        for index in chunk:
+                            observation_ids[index] = ids.get(payloads[index][returned_by])
+                            if observation_ids[index] is None:
+                                conflicts.append(
+                                    {
+                                        "index": index,
+                                        "observation_key": payloads[index]["observation_key"],
+                                        "error": "DUPLICATE_CONFLICT core fields mismatch for "
+                                        f"poll_fingerprint={payloads[index]['poll_fingerprint']}",
+                                    }
+                                )
         self.conn.commit()
         self._invalidate_api_read_cache()
-        return observation_id
+
+        conflicts.sort(key=lambda conflict: conflict["index"])
+        return {
+            "observation_ids": observation_ids,
+            "conflicts": conflicts,
+            "written_count": len(payloads) - len(conflicts),
+        }
 
     def upsert_matchup(self, matchup: dict) -> None:
         with self.conn.cursor() as cur:
@@ -411,10 +1258,12 @@ class PostgresRepository:
                     region_code=EXCLUDED.region_code,
                     title=EXCLUDED.title,
                     is_active=EXCLUDED.is_active,
+                    data_version=matchups.data_version + 1,
                     updated_at=NOW()
                 """,
                 matchup,
             )
+            self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
 
@@ -706,6 +1555,8 @@ class PostgresRepository:
                 po.value_mid,
                 o.pollster,
                 o.survey_end_date,
+                o.sample_size,
+                o.margin_of_error,
                 o.source_grade,
                 o.audience_scope,
                 o.audience_region_code,
@@ -736,6 +1587,205 @@ class PostgresRepository:
         _api_read_cache_set(cache_key, rows)
         return rows
 
+    def fetch_trend_series(
+        self,
+        *,
+        metric: str,
+        scope: str,
+        region_code: str | None,
+        days: int,
+    ) -> list[dict] | None:
+        """Range-scan the daily representative series; None until the series has been backfilled."""
+        region_key = (region_code or "") if scope in {"regional", "local"} else ""
+        cache_key = _api_read_cache_key("trend_series", metric, scope, region_key or "none", days)
+        cached = _api_read_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT backfilled_at FROM trend_series_state WHERE id = 1")
+            state = cur.fetchone() or {}
+            if state.get("backfilled_at") is None:
+                return None
+            cur.execute(
+                """
+                SELECT
+                    option_name,
+                    value_mid,
+                    pollster,
+                    survey_end_date,
+                    source_grade,
+                    audience_scope,
+                    audience_region_code,
+                    observation_updated_at,
+                    official_release_at,
+                    article_published_at,
+                    source_channel,
+                    COALESCE(source_channels, ARRAY[]::text[]) AS source_channels,
+                    selected_source_tier
+                FROM trend_daily_points
+                WHERE metric = %s
+                  AND audience_scope = %s
+                  AND region_key = %s
+                  AND survey_end_date >= CURRENT_DATE - (%s::int - 1)
+                ORDER BY survey_end_date ASC, option_name
+                """,
+                (metric, scope, region_key, days),
+            )
+            rows = [dict(row) for row in (cur.fetchall() or [])]
+
+        _api_read_cache_set(cache_key, rows)
+        return rows
+
+    def fetch_trend_series_day_keys(
+        self,
+        *,
+        run_id: int | None = None,
+        observation_keys: list[str] | None = None,
+    ) -> list[dict]:
+        """Day keys to rebuild: every day for a full rebuild, otherwise the days of the run's
+        (or the given) observations plus the stored days their points were on before the write."""
+        params: list[object] = []
+        observation_filter = ""
+        stored_days = """
+                UNION
+                SELECT audience_scope, region_key, survey_end_date
+                FROM trend_daily_points
+        """
+        if run_id is not None or observation_keys is not None:
+            if run_id is not None:
+                condition, value = "o.ingestion_run_id = %s", run_id
+            else:
+                condition, value = "o.observation_key = ANY(%s)", list(observation_keys)
+            observation_filter = f"AND {condition}"
+            # Points still reference the observation on its previous day; revisiting that day
+            # clears it when survey_end_date, scope or region moved.
+            stored_days = f"""
+                UNION
+                SELECT tp.audience_scope, tp.region_key, tp.survey_end_date
+                FROM trend_daily_points tp
+                JOIN poll_observations o ON o.id = tp.observation_id
+                WHERE {condition}
+            """
+            params = [value, value]
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT DISTINCT
+                    o.audience_scope,
+                    CASE
+                        WHEN o.audience_scope IN ('regional', 'local')
+                            THEN COALESCE(o.audience_region_code, o.region_code, '')
+                        ELSE ''
+                    END AS region_key,
+                    o.survey_end_date
+                FROM poll_observations o
+                WHERE o.audience_scope IS NOT NULL
+                  AND o.survey_end_date IS NOT NULL
+                  {observation_filter}
+                {stored_days}
+                ORDER BY 3, 1, 2
+                """,
+                params,
+            )
+            return [dict(row) for row in (cur.fetchall() or [])]
+
+    def fetch_trend_series_day_rows(self, *, scope: str, region_key: str, survey_end_date: date) -> list[dict]:
+        params: list[object] = [list(TREND_SERIES_METRICS), scope, survey_end_date]
+        region_filter = ""
+        if scope in {"regional", "local"}:
+            region_filter = "AND COALESCE(o.audience_region_code, o.region_code) = %s"
+            params.append(region_key)
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    po.option_type AS metric,
+                    po.option_name,
+                    po.value_mid,
+                    o.id AS observation_id,
+                    o.pollster,
+                    o.survey_end_date,
+                    o.source_grade,
+                    o.audience_scope,
+                    o.audience_region_code,
+                    o.updated_at AS observation_updated_at,
+                    o.official_release_at,
+                    a.published_at AS article_published_at,
+                    o.source_channel,
+                    COALESCE(
+                        o.source_channels,
+                        CASE WHEN o.source_channel IS NULL THEN ARRAY[]::text[] ELSE ARRAY[o.source_channel] END
+                    ) AS source_channels
+                FROM poll_options po
+                JOIN poll_observations o ON o.id = po.observation_id
+                LEFT JOIN articles a ON a.id = o.article_id
+                WHERE po.option_type = ANY(%s)
+                  AND o.verified = TRUE
+                  AND o.audience_scope = %s
+                  AND o.survey_end_date = %s
+                  {region_filter}
+                ORDER BY po.option_type, po.option_name, o.id DESC
+                """,
+                params,
+            )
+            return [dict(row) for row in (cur.fetchall() or [])]
+
+    def replace_trend_series_day(
+        self,
+        *,
+        scope: str,
+        region_key: str,
+        survey_end_date: date,
+        points: list[dict],
+    ) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM trend_daily_points
+                WHERE audience_scope = %s
+                  AND region_key = %s
+                  AND survey_end_date = %s
+                """,
+                (scope, region_key, survey_end_date),
+            )
+            if points:
+                cur.executemany(
+                    """
+                    INSERT INTO trend_daily_points (
+                        metric, audience_scope, region_key, survey_end_date, option_name,
+                        value_mid, pollster, source_grade, audience_region_code, observation_id,
+                        observation_updated_at, official_release_at, article_published_at,
+                        source_channel, source_channels, selected_source_tier, built_at
+                    )
+                    VALUES (
+                        %(metric)s, %(audience_scope)s, %(region_key)s, %(survey_end_date)s, %(option_name)s,
+                        %(value_mid)s, %(pollster)s, %(source_grade)s, %(audience_region_code)s, %(observation_id)s,
+                        %(observation_updated_at)s, %(official_release_at)s, %(article_published_at)s,
+                        %(source_channel)s, %(source_channels)s, %(selected_source_tier)s, NOW()
+                    )
+                    """,
+                    [{**point, "audience_scope": scope, "region_key": region_key} for point in points],
+                )
+            self._bump_data_generation(cur)
+        self.conn.commit()
+        self._invalidate_api_read_cache()
+
+    def mark_trend_series_backfilled(self) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO trend_series_state (id, backfilled_at, updated_at)
+                VALUES (1, NOW(), NOW())
+                ON CONFLICT (id) DO UPDATE
+                SET backfilled_at = EXCLUDED.backfilled_at,
+                    updated_at = NOW()
+                """
+            )
+            self._bump_data_generation(cur)
+        self.conn.commit()
+        self._invalidate_api_read_cache()
+
     def fetch_dashboard_map_latest(self, as_of: date | None, limit: int = 100):
         cache_key = _api_read_cache_key("dashboard_map_latest", as_of or "none", limit)
         cached = _api_read_cache_get(cache_key)
@@ -1241,148 +2291,6 @@ class PostgresRepository:
         topology: str = "official",
         version_id: str | None = None,
     ):
-        def normalize_text(value: str | None) -> str:
-            if not isinstance(value, str):
-                return ""
-            return value.strip()
-
-        def strip_region_suffix(name: str) -> str:
-            for suffix in ("특별자치도", "특별자치시", "특별시", "광역시", "자치시", "도", "시"):
-                if name.endswith(suffix):
-                    return name[: -len(suffix)] or name
-            return name
-
-        def compact_region_name(name: str) -> str:
-            replacements = {
-                "전라남": "전남",
-                "전라북": "전북",
-                "충청남": "충남",
-                "충청북": "충북",
-                "경상남": "경남",
-                "경상북": "경북",
-            }
-            return replacements.get(name, name)
-
-        def derive_placeholder_title(region: dict, office_type: str) -> str:
-            sido_name = normalize_text(region.get("sido_name"))
-            sigungu_name = normalize_text(region.get("sigungu_name"))
-            base_sido = strip_region_suffix(sido_name)
-
-            if office_type == "광역자치단체장":
-                if sido_name.endswith(("특별시", "광역시", "특별자치시", "자치시")):
-                    return f"{base_sido}시장"
-                if sido_name.endswith(("도", "특별자치도")):
-                    return f"{base_sido}도지사"
-                return f"{base_sido}광역자치단체장"
-
-            if office_type == "광역의회":
-                if sido_name.endswith(("특별시", "광역시", "특별자치시", "자치시")):
-                    return f"{base_sido}시의회"
-                if sido_name.endswith(("도", "특별자치도")):
-                    return f"{base_sido}도의회"
-                return f"{base_sido}광역의회"
-
-            if office_type == "교육감":
-                return f"{base_sido}교육감"
-
-            target = sigungu_name if sigungu_name and sigungu_name != "전체" else base_sido
-            if office_type == "기초자치단체장":
-                if target.endswith("구"):
-                    return f"{target}청장"
-                if target.endswith("군"):
-                    return f"{target}수"
-                if target.endswith("시"):
-                    return f"{target}장"
-                return f"{target}기초자치단체장"
-
-            if office_type == "기초의회":
-                return f"{target}의회"
-
-            if office_type == "재보궐":
-                return f"{target}재보궐"
-
-            return f"{target} {office_type}".strip()
-
-        def infer_election_id(matchup_rows: list[dict], poll_meta_rows: list[dict]) -> str:
-            for row in matchup_rows:
-                matchup_id = row.get("matchup_id")
-                if isinstance(matchup_id, str) and "|" in matchup_id:
-                    return matchup_id.split("|", 1)[0]
-            for row in poll_meta_rows:
-                matchup_id = row.get("latest_matchup_id")
-                if isinstance(matchup_id, str) and "|" in matchup_id:
-                    return matchup_id.split("|", 1)[0]
-            return "20260603"
-
-        def status_label(has_poll_data: bool, has_candidate_data: bool) -> str:
-            if not has_poll_data:
-                return "조사 데이터 없음"
-            if not has_candidate_data:
-                return "후보 정보 준비중"
-            return "데이터 준비 완료"
-
-        def build_scenario_parent_region(
-            parent_region_code: str,
-            topology_version_id: str,
-            cur,
-        ) -> dict | None:
-            cur.execute(
-                """
-                SELECT r.sido_name, r.sigungu_name
-                FROM region_topology_edges e
-                JOIN regions r ON r.region_code = e.child_region_code
-                WHERE e.version_id = %s
-                  AND e.parent_region_code = %s
-                ORDER BY e.child_region_code
-                """,
-                (topology_version_id, parent_region_code),
-            )
-            children = cur.fetchall() or []
-            if not children:
-                return None
-
-            bases: list[str] = []
-            for child in children:
-                name = compact_region_name(strip_region_suffix(normalize_text(child.get("sido_name"))))
-                if name and name not in bases:
-                    bases.append(name)
-            label = "·".join(bases) if bases else parent_region_code
-            return {
-                "region_code": parent_region_code,
-                "sido_name": f"{label} 통합특별시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-
-        def apply_official_region_overrides(region: dict) -> dict:
-            region_out = dict(region)
-            code = normalize_text(region_out.get("region_code"))
-            if re.fullmatch(r"\d{2}-000", code):
-                region_out["admin_level"] = "sido"
-                if normalize_text(region_out.get("sigungu_name")) in {"", "전체"}:
-                    region_out["sigungu_name"] = "전체"
-
-            if code == "29-000":
-                # 운영 회귀 보호: 29-000은 공식 토폴로지에서 세종으로 고정한다.
-                region_out["sido_name"] = "세종특별자치시"
-                region_out["sigungu_name"] = "전체"
-                region_out["admin_level"] = "sido"
-            return region_out
-
-        def apply_official_title_overrides(region: dict, office_type: str, title: str | None) -> str:
-            normalized_title = normalize_text(title)
-            code = normalize_text(region.get("region_code"))
-
-            # 운영 회귀 보호: 29-000은 세종 라벨이 아닌 타 시도 라벨을 허용하지 않는다.
-            # 레거시/오염 타이틀이 들어오면 코드 기준 placeholder로 강제 복원한다.
-            if code == "29-000" and "세종" not in normalized_title:
-                return derive_placeholder_title(region, office_type)
-
-            if normalized_title:
-                return normalized_title
-            return derive_placeholder_title(region, office_type)
-
-        office_order = ["광역자치단체장", "광역의회", "교육감", "기초자치단체장", "기초의회", "재보궐"]
         topology_mode = "scenario" if topology == "scenario" else "official"
 
         with self.conn.cursor() as cur:
@@ -1450,7 +2358,7 @@ class PostgresRepository:
             )
             region = cur.fetchone()
             if not region and topology_mode == "scenario" and effective_region_code != region_code:
-                region = build_scenario_parent_region(effective_region_code, topology_version_id, cur)
+                region = self._build_scenario_parent_region(effective_region_code, topology_version_id, cur)
             if not region:
                 return []
             if topology_mode == "official":
@@ -1463,6 +2371,7 @@ class PostgresRepository:
                     office_type,
                     slot_matchup_id,
                     title,
+                    display_title,
                     source,
                     has_poll_data,
                     latest_matchup_id,
@@ -1520,123 +2429,217 @@ class PostgresRepository:
             )
             poll_meta_rows = cur.fetchall() or []
 
-        election_by_office: dict[str, dict] = {}
-        for row in election_rows:
-            office_type = row.get("office_type")
-            if not isinstance(office_type, str):
-                continue
-            election_by_office[office_type] = row
+        return _assemble_region_election_slots(
+            region,
+            fallback_region_code=effective_region_code,
+            election_rows=election_rows,
+            matchup_rows=matchup_rows,
+            poll_meta_rows=poll_meta_rows,
+            topology_mode=topology_mode,
+            topology_version_id=topology_version_id,
+        )
 
-        resolved_region_code = region.get("region_code") or effective_region_code
-        matchup_by_office: dict[str, dict] = {}
-        for row in matchup_rows:
-            office_type = row.get("office_type")
-            if not isinstance(office_type, str):
-                continue
-            matchup_by_office.setdefault(office_type, row)
+    @staticmethod
+    def _build_scenario_parent_region(parent_region_code: str, topology_version_id: str, cur) -> dict | None:
+        cur.execute(
+            """
+            SELECT r.sido_name, r.sigungu_name
+            FROM region_topology_edges e
+            JOIN regions r ON r.region_code = e.child_region_code
+            WHERE e.version_id = %s
+              AND e.parent_region_code = %s
+            ORDER BY e.child_region_code
+            """,
+            (topology_version_id, parent_region_code),
+        )
+        children = cur.fetchall() or []
+        if not children:
+            return None
 
-        poll_meta_by_office = {
-            row["office_type"]: row
-            for row in poll_meta_rows
-            if isinstance(row.get("office_type"), str)
+        bases: list[str] = []
+        for child in children:
+            name = compact_region_name(strip_region_suffix(normalize_region_text(child.get("sido_name"))))
+            if name and name not in bases:
+                bases.append(name)
+        label = "·".join(bases) if bases else parent_region_code
+        return {
+            "region_code": parent_region_code,
+            "sido_name": f"{label} 통합특별시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
         }
 
-        is_master_empty = len(election_by_office) == 0
-
-        if election_by_office:
-            slots = sorted(
-                election_by_office.keys(),
-                key=lambda office: (
-                    office_order.index(office) if office in office_order else len(office_order),
-                    office,
-                ),
-            )
-        else:
-            resolved_region_code = normalize_text(region.get("region_code"))
-            is_sido_code = bool(re.fullmatch(r"\d{2}-000", resolved_region_code))
-            if not is_sido_code and normalize_text(region.get("admin_level")) in {"sigungu", "local"}:
-                slots = ["기초자치단체장", "기초의회"]
-            else:
-                slots = ["광역자치단체장", "광역의회", "교육감"]
+    def fetch_region_elections_batch(
+        self,
+        region_codes: list[str] | None = None,
+        sido_code: str | None = None,
+        topology: str = "official",
+        version_id: str | None = None,
+    ) -> dict[str, list[dict]]:
+        requested_codes = list(dict.fromkeys(code for code in (region_codes or []) if code))
+        sido_like = f"{sido_code[:2]}-%" if sido_code else None
+        topology_mode = "scenario" if topology == "scenario" else "official"
 
-            if "재보궐" in matchup_by_office or "재보궐" in poll_meta_by_office:
-                slots.append("재보궐")
+        if topology_mode == "scenario":
+            # Scenario topology re-parents regions per version; keep the per-region path for it.
+            codes = list(requested_codes)
+            if sido_like:
+                with self.conn.cursor() as cur:
+                    cur.execute(
+                        """
+                        SELECT region_code
+                        FROM regions
+                        WHERE region_code LIKE %s
+                        ORDER BY region_code
+                        """,
+                        (sido_like,),
+                    )
+                    for row in cur.fetchall() or []:
+                        if row["region_code"] not in codes:
+                            codes.append(row["region_code"])
+            return {
+                code: self.fetch_region_elections(code, topology=topology_mode, version_id=version_id)
+                for code in codes
+            }
 
-        extra_offices = sorted(
-            (set(election_by_office.keys()) | set(matchup_by_office.keys()) | set(poll_meta_by_office.keys())) - set(slots),
-            key=lambda office: (
-                office_order.index(office) if office in office_order else len(office_order),
-                office,
-            ),
+        cache_key = _api_read_cache_key(
+            "region_elections_batch",
+            ",".join(sorted(requested_codes)),
+            sido_like or "none",
+            version_id or "none",
         )
-        slots.extend(extra_offices)
-
-        election_id = infer_election_id(matchup_rows, poll_meta_rows)
-        result: list[dict] = []
-        for office_type in slots:
-            poll_meta = poll_meta_by_office.get(office_type, {})
-            election_row = election_by_office.get(office_type)
-            has_poll_data = bool(poll_meta.get("has_poll_data", False))
-            if not has_poll_data and election_row is not None:
-                has_poll_data = bool(election_row.get("has_poll_data", False))
-            has_candidate_data = bool(poll_meta.get("has_candidate_data", False))
-            latest_survey_end_date = poll_meta.get("latest_survey_end_date")
-            latest_matchup_id = poll_meta.get("latest_matchup_id")
-            if latest_matchup_id is None and election_row is not None:
-                latest_matchup_id = election_row.get("latest_matchup_id")
-
-            matchup_row = matchup_by_office.get(office_type)
-            if election_row:
-                slot_matchup_id = election_row.get("slot_matchup_id")
-                matchup_id = latest_matchup_id or (matchup_row.get("matchup_id") if matchup_row else None) or slot_matchup_id
-                matchup_id = matchup_id or f"{election_id}|{office_type}|{resolved_region_code}"
-                title = (
-                    election_row.get("title")
-                    or (matchup_row.get("title") if matchup_row else None)
-                    or derive_placeholder_title(region, office_type)
-                )
-                is_active = bool(election_row.get("is_active", True))
-                is_placeholder = not has_poll_data
-                is_fallback = False
-                source = normalize_text(election_row.get("source")) or "master"
-            elif matchup_row:
-                matchup_id = matchup_row["matchup_id"]
-                title = matchup_row["title"]
-                is_active = bool(matchup_row.get("is_active", True))
-                is_placeholder = False
-                is_fallback = is_master_empty
-                source = "generated" if is_master_empty else "matchups"
-            else:
-                matchup_id = latest_matchup_id or f"{election_id}|{office_type}|{resolved_region_code}"
-                title = derive_placeholder_title(region, office_type)
-                is_active = True
-                is_placeholder = True
-                is_fallback = True
-                source = "generated"
+        cached = _api_read_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
-            if topology_mode == "official":
-                title = apply_official_title_overrides(region, office_type, title)
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                WITH target_regions AS (
+                    SELECT region_code, sido_name, sigungu_name, admin_level
+                    FROM regions
+                    WHERE region_code = ANY(%(region_codes)s::text[])
+                       OR (%(sido_like)s::text IS NOT NULL AND region_code LIKE %(sido_like)s::text)
+                ),
+                topology_version AS (
+                    SELECT version_id
+                    FROM region_topology_versions
+                    WHERE mode = 'official'
+                      AND (%(version_id)s::text IS NULL OR version_id = %(version_id)s::text)
+                    ORDER BY
+                        CASE status
+                            WHEN 'effective' THEN 0
+                            WHEN 'announced' THEN 1
+                            ELSE 2
+                        END,
+                        effective_from DESC NULLS LAST,
+                        version_id DESC
+                    LIMIT 1
+                ),
+                poll_ranked AS (
+                    SELECT
+                        o.id,
+                        o.region_code,
+                        o.office_type,
+                        o.matchup_id,
+                        o.survey_end_date,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY o.region_code, o.office_type
+                            ORDER BY o.survey_end_date DESC NULLS LAST, o.id DESC
+                        ) AS rn
+                    FROM poll_observations o
+                    JOIN target_regions tr ON tr.region_code = o.region_code
+                )
+                SELECT
+                    tr.region_code,
+                    tr.sido_name,
+                    tr.sigungu_name,
+                    tr.admin_level,
+                    (SELECT version_id FROM topology_version) AS topology_version_id,
+                    COALESCE((
+                        SELECT json_agg(
+                            json_build_object(
+                                'region_code', e.region_code,
+                                'office_type', e.office_type,
+                                'slot_matchup_id', e.slot_matchup_id,
+                                'title', e.title,
+                                'display_title', e.display_title,
+                                'source', e.source,
+                                'has_poll_data', e.has_poll_data,
+                                'latest_matchup_id', e.latest_matchup_id,
+                                'is_active', e.is_active
+                            )
+                            ORDER BY e.has_poll_data DESC, e.office_type, e.title
+                        )
+                        FROM elections e
+                        WHERE e.region_code = tr.region_code
+                    ), '[]'::json) AS election_rows,
+                    COALESCE((
+                        SELECT json_agg(
+                            json_build_object(
+                                'matchup_id', m.matchup_id,
+                                'region_code', m.region_code,
+                                'office_type', m.office_type,
+                                'title', m.title,
+                                'is_active', m.is_active
+                            )
+                            ORDER BY m.is_active DESC, m.updated_at DESC, m.matchup_id DESC
+                        )
+                        FROM matchups m
+                        WHERE m.region_code = tr.region_code
+                    ), '[]'::json) AS matchup_rows,
+                    COALESCE((
+                        SELECT json_agg(
+                            json_build_object(
+                                'office_type', pr.office_type,
+                                'has_poll_data', TRUE,
+                                'latest_survey_end_date', pr.survey_end_date::date,
+                                'latest_matchup_id', pr.matchup_id,
+                                'has_candidate_data', EXISTS (
+                                    SELECT 1
+                                    FROM poll_options po
+                                    WHERE po.observation_id = pr.id
+                                      AND po.option_type = 'candidate_matchup'
+                                      AND COALESCE(po.candidate_verified, TRUE) = TRUE
+                                )
+                            )
+                        )
+                        FROM poll_ranked pr
+                        WHERE pr.region_code = tr.region_code
+                          AND pr.rn = 1
+                    ), '[]'::json) AS poll_meta_rows
+                FROM target_regions tr
+                ORDER BY tr.region_code
+                """,
+                {"region_codes": requested_codes, "sido_like": sido_like, "version_id": version_id},
+            )
+            rows = cur.fetchall() or []
 
-            result.append(
+        result: dict[str, list[dict]] = {code: [] for code in requested_codes}
+        for row in rows:
+            region_code = row["region_code"]
+            region = apply_official_region_overrides(
                 {
-                    "matchup_id": matchup_id,
-                    "region_code": resolved_region_code,
-                    "office_type": office_type,
-                    "title": title,
-                    "is_active": is_active,
-                    "is_placeholder": is_placeholder,
-                    "is_fallback": is_fallback,
-                    "source": source,
-                    "has_poll_data": has_poll_data,
-                    "has_candidate_data": has_candidate_data,
-                    "latest_survey_end_date": latest_survey_end_date,
-                    "latest_matchup_id": latest_matchup_id,
-                    "status": status_label(has_poll_data=has_poll_data, has_candidate_data=has_candidate_data),
-                    "topology": topology_mode,
-                    "topology_version_id": topology_version_id,
+                    "region_code": region_code,
+                    "sido_name": row.get("sido_name"),
+                    "sigungu_name": row.get("sigungu_name"),
+                    "admin_level": row.get("admin_level"),
                 }
             )
+            poll_meta_rows = [dict(item) for item in _json_list(row.get("poll_meta_rows"))]
+            for item in poll_meta_rows:
+                item["latest_survey_end_date"] = _coerce_iso_date(item.get("latest_survey_end_date"))
+            result[region_code] = _assemble_region_election_slots(
+                region,
+                fallback_region_code=region_code,
+                election_rows=_json_list(row.get("election_rows")),
+                matchup_rows=_json_list(row.get("matchup_rows")),
+                poll_meta_rows=poll_meta_rows,
+                topology_mode="official",
+                topology_version_id=row.get("topology_version_id") or "official-v1",
+            )
 
+        _api_read_cache_set(cache_key, result)
         return result
 
     def upsert_election_slot(self, election_slot: dict) -> None:
@@ -1647,21 +2650,25 @@ class PostgresRepository:
         payload.setdefault("is_active", True)
         payload.setdefault("slot_matchup_id", f"master|{payload['office_type']}|{payload['region_code']}")
         payload.setdefault("title", payload["office_type"])
+        payload.setdefault("display_title", None)
+        payload.setdefault("topology", "official")
 
         with self.conn.cursor() as cur:
             cur.execute(
                 """
                 INSERT INTO elections (
-                    region_code, office_type, slot_matchup_id, title,
+                    region_code, office_type, slot_matchup_id, title, display_title, topology,
                     source, has_poll_data, latest_matchup_id, is_active
                 )
                 VALUES (
-                    %(region_code)s, %(office_type)s, %(slot_matchup_id)s, %(title)s,
+                    %(region_code)s, %(office_type)s, %(slot_matchup_id)s, %(title)s, %(display_title)s, %(topology)s,
                     %(source)s, %(has_poll_data)s, %(latest_matchup_id)s, %(is_active)s
                 )
                 ON CONFLICT (region_code, office_type) DO UPDATE
                 SET slot_matchup_id=EXCLUDED.slot_matchup_id,
                     title=EXCLUDED.title,
+                    display_title=EXCLUDED.display_title,
+                    topology=EXCLUDED.topology,
                     source=EXCLUDED.source,
                     has_poll_data=EXCLUDED.has_poll_data,
                     latest_matchup_id=EXCLUDED.latest_matchup_id,
@@ -1670,6 +2677,7 @@ class PostgresRepository:
                 """,
                 payload,
             )
+            self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
 
@@ -1725,46 +2733,63 @@ class PostgresRepository:
             rows = cur.fetchall() or []
         return {(str(row["region_code"]), str(row["office_type"])) for row in rows}
 
-    def _find_matchup_meta(self, matchup_id: str) -> dict | None:
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT matchup_id, region_code, office_type, title, is_active
-                FROM matchups
-                WHERE matchup_id = %s
-                """,
-                (matchup_id,),
-            )
-            row = cur.fetchone()
-            if row:
-                return row
+    _MATCHUP_DETAIL_META_KEYS = ("matchup_id", "region_code", "office_type", "title", "is_active")
+    _MATCHUP_DETAIL_REGION_KEYS = ("region_code", "sido_name", "sigungu_name", "admin_level")
 
-            parts = [x.strip() for x in matchup_id.split("|")]
-            if len(parts) != 3:
-                return None
-            _, office_type, region_code = parts
-            cur.execute(
-                """
-                SELECT matchup_id, region_code, office_type, title, is_active
-                FROM matchups
-                WHERE office_type = %s
-                  AND region_code = %s
-                ORDER BY is_active DESC, updated_at DESC, matchup_id DESC
-                LIMIT 1
-                """,
-                (office_type, region_code),
-            )
-            return cur.fetchone()
-
-    def _fetch_recent_matchup_observations(self, matchup_id: str, *, limit: int = 5) -> list[dict]:
+    def _fetch_matchup_detail_rows(self, matchup_id: str, *, limit: int = 5) -> list[dict]:
+        parts = [x.strip() for x in matchup_id.split("|")]
+        office_type, region_code = (parts[1], parts[2]) if len(parts) == 3 else (None, None)
         with self.conn.cursor() as cur:
             cur.execute(
                 """
+                WITH matchup_meta AS (
+                    SELECT matchup_id, region_code, office_type, title, is_active
+                    FROM (
+                        SELECT m.matchup_id, m.region_code, m.office_type, m.title, m.is_active, 0 AS match_rank
+                        FROM matchups m
+                        WHERE m.matchup_id = %(matchup_id)s
+                        UNION ALL
+                        (
+                            SELECT m.matchup_id, m.region_code, m.office_type, m.title, m.is_active, 1 AS match_rank
+                            FROM matchups m
+                            WHERE m.office_type = %(office_type)s
+                              AND m.region_code = %(region_code)s
+                            ORDER BY m.is_active DESC, m.updated_at DESC, m.matchup_id DESC
+                            LIMIT 1
+                        )
+                    ) candidates
+                    ORDER BY match_rank
+                    LIMIT 1
+                ),
+                recent_observations AS (
+                    SELECT o.*
+                    FROM poll_observations o
+                    JOIN matchup_meta mm ON mm.matchup_id = o.matchup_id
+                    ORDER BY o.survey_end_date DESC NULLS LAST, o.id DESC
+                    LIMIT %(limit)s
+                ),
+                open_reviews AS (
+                    SELECT DISTINCT rq.entity_id
+                    FROM review_queue rq
+                    JOIN recent_observations ro ON ro.observation_key = rq.entity_id
+                    WHERE rq.entity_type IN ('poll_observation', 'ingest_record')
+                      AND rq.status IN ('pending', 'in_progress')
+                )
                 SELECT
+                    mm.matchup_id AS meta_matchup_id,
+                    mm.region_code AS meta_region_code,
+                    mm.office_type AS meta_office_type,
+                    mm.title AS meta_title,
+                    mm.is_active AS meta_is_active,
+                    r.region_code AS title_region_region_code,
+                    r.sido_name AS title_region_sido_name,
+                    r.sigungu_name AS title_region_sigungu_name,
+                    r.admin_level AS title_region_admin_level,
+                    (o.id IS NOT NULL) AS has_observation,
                     o.matchup_id,
                     o.region_code,
                     o.office_type,
-                    COALESCE(m.title, o.matchup_id) AS title,
+                    COALESCE(mm.title, o.matchup_id) AS title,
                     o.observation_key,
                     o.pollster,
                     o.survey_start_date,
@@ -1791,22 +2816,18 @@ class PostgresRepository:
                         WHEN COALESCE('nesdc' = ANY(o.source_channels), FALSE) THEN TRUE
                         ELSE FALSE
                     END AS nesdc_enriched,
-                    EXISTS (
-                        SELECT 1
-                        FROM review_queue rq
-                        WHERE rq.entity_type IN ('poll_observation', 'ingest_record')
-                          AND rq.entity_id = o.observation_key
-                          AND rq.status IN ('pending', 'in_progress')
-                    ) AS needs_manual_review,
+                    (orv.entity_id IS NOT NULL) AS needs_manual_review,
                     o.poll_fingerprint,
                     o.source_channel,
                     o.source_channels,
                     o.verified,
                     o.id AS observation_id,
                     COALESCE(opts.options, '[]'::json) AS options
-                FROM poll_observations o
-                LEFT JOIN matchups m ON m.matchup_id = o.matchup_id
+                FROM matchup_meta mm
+                LEFT JOIN regions r ON r.region_code = mm.region_code
+                LEFT JOIN recent_observations o ON TRUE
                 LEFT JOIN articles a ON a.id = o.article_id
+                LEFT JOIN open_reviews orv ON orv.entity_id = o.observation_key
                 LEFT JOIN LATERAL (
                     SELECT
                         json_agg(
@@ -1873,21 +2894,41 @@ class PostgresRepository:
                     WHERE po.observation_id = o.id
                       AND COALESCE(po.candidate_verified, TRUE) = TRUE
                 ) opts ON TRUE
-                WHERE o.matchup_id = %s
                 ORDER BY o.survey_end_date DESC NULLS LAST, o.id DESC
-                LIMIT %s
                 """,
-                (matchup_id, max(int(limit), 1)),
-            )
-            rows: list[dict] = []
-            if hasattr(cur, "fetchall"):
-                rows = cur.fetchall() or []
-            # Test doubles may stub fetchone-only behavior.
-            if not rows and hasattr(cur, "fetchone"):
-                single = cur.fetchone()
-                if single:
-                    rows = [single]
-            return rows
+                {
+                    "matchup_id": matchup_id,
+                    "office_type": office_type,
+                    "region_code": region_code,
+                    "limit": max(int(limit), 1),
+                },
+            )
+            return cur.fetchall() or []
+
+    @classmethod
+    def _split_matchup_detail_rows(cls, rows: list[dict]) -> tuple[dict | None, dict | None, list[dict]]:
+        if not rows:
+            return None, None, []
+        head = rows[0]
+        meta = {key: head.get(f"meta_{key}") for key in cls._MATCHUP_DETAIL_META_KEYS}
+        if not meta["matchup_id"]:
+            return None, None, []
+        region = None
+        if head.get("title_region_region_code"):
+            region = {key: head.get(f"title_region_{key}") for key in cls._MATCHUP_DETAIL_REGION_KEYS}
+
+        observations: list[dict] = []
+        for row in rows:
+            if not row.get("has_observation"):
+                continue
+            observations.append(
+                {
+                    key: value
+                    for key, value in row.items()
+                    if key != "has_observation" and not key.startswith(("meta_", "title_region_"))
+                }
+            )
+        return meta, region, observations
 
     @staticmethod
     def _normalize_options(options_payload, *, include_stats: bool = False) -> list[dict] | tuple[list[dict], dict]:
@@ -2327,7 +3368,9 @@ class PostgresRepository:
         if cached is not None:
             return cached
 
-        matchup_meta = self._find_matchup_meta(matchup_id)
+        matchup_meta, region_for_title, observations = self._split_matchup_detail_rows(
+            self._fetch_matchup_detail_rows(matchup_id, limit=5)
+        )
         if not matchup_meta:
             return None
 
@@ -2339,13 +3382,11 @@ class PostgresRepository:
                 _api_read_cache_set(cache_key, canonical_cached)
                 return canonical_cached
 
-        region_for_title = self._fetch_region_for_matchup_title(matchup_meta.get("region_code"))
         canonical_title = self._derive_matchup_title_from_region(
             region_for_title,
             matchup_meta.get("office_type"),
             str(matchup_meta.get("title") or "").strip() or canonical_matchup_id,
         )
-        observations = self._fetch_recent_matchup_observations(canonical_matchup_id, limit=5)
         if not observations:
             result = {
                 "matchup_id": canonical_matchup_id,
@@ -2459,6 +3500,83 @@ class PostgresRepository:
             _api_read_cache_set(cache_key, result)
         return result
 
+    def fetch_matchup_snapshot(self, matchup_id: str) -> dict | None:
+        # The read cache is consulted first; a snapshot is only served while its data_version
+        # matches the matchup's, anything stale falls back to the live get_matchup path.
+        cache_key = _api_read_cache_key("matchup", matchup_id)
+        cached = _api_read_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT s.payload
+                FROM matchup_snapshots s
+                JOIN matchups m ON m.matchup_id = s.matchup_id
+                WHERE s.matchup_id = %s
+                  AND s.data_version = m.data_version
+                """,
+                (matchup_id,),
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        payload = row.get("payload")
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        if not isinstance(payload, dict):
+            return None
+        for key in ("survey_start_date", "survey_end_date"):
+            payload[key] = _coerce_iso_date(payload.get(key))
+        _api_read_cache_set(cache_key, payload)
+        return payload
+
+    def fetch_matchup_data_version(self, matchup_id: str) -> int:
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT data_version FROM matchups WHERE matchup_id = %s", (matchup_id,))
+            row = cur.fetchone() or {}
+        return int(row.get("data_version") or 0)
+
+    def upsert_matchup_snapshot(
+        self,
+        matchup_id: str,
+        payload: dict,
+        *,
+        data_version: int,
+        source_run_id: int | None = None,
+    ) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO matchup_snapshots (matchup_id, payload, data_version, source_run_id, built_at)
+                VALUES (%s, %s::jsonb, %s, %s, NOW())
+                ON CONFLICT (matchup_id) DO UPDATE
+                SET payload=EXCLUDED.payload,
+                    data_version=EXCLUDED.data_version,
+                    source_run_id=EXCLUDED.source_run_id,
+                    built_at=NOW()
+                """,
+                (
+                    matchup_id,
+                    json.dumps(payload, ensure_ascii=False, default=_json_default),
+                    data_version,
+                    source_run_id,
+                ),
+            )
+        self.conn.commit()
+
+    def delete_matchup_snapshot(self, matchup_id: str) -> None:
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM matchup_snapshots WHERE matchup_id = %s", (matchup_id,))
+        self.conn.commit()
+
+    def fetch_all_matchup_ids(self) -> list[str]:
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT matchup_id FROM matchups ORDER BY matchup_id")
+            rows = cur.fetchall() or []
+        return [row["matchup_id"] for row in rows]
+
     def get_candidate(self, candidate_id: str):
         with self.conn.cursor() as cur:
             cur.execute(
@@ -2499,6 +3617,7 @@ class PostgresRepository:
                     COUNT(*) FILTER (WHERE status = 'failed')::int AS failed_runs,
                     COALESCE(SUM(processed_count), 0)::int AS total_processed_count,
                     COALESCE(SUM(error_count), 0)::int AS total_error_count,
+                    COALESCE(SUM(skipped_count), 0)::int AS total_skipped_count,
                     COALESCE(SUM(date_inference_failed_count), 0)::int AS date_inference_failed_count,
                     COALESCE(SUM(date_inference_estimated_count), 0)::int AS date_inference_estimated_count
                 FROM ingestion_runs
@@ -2520,6 +3639,7 @@ class PostgresRepository:
             "failed_runs": row.get("failed_runs", 0) or 0,
             "total_processed_count": processed,
             "total_error_count": errors,
+            "total_skipped_count": row.get("total_skipped_count", 0) or 0,
             "date_inference_failed_count": row.get("date_inference_failed_count", 0) or 0,
             "date_inference_estimated_count": row.get("date_inference_estimated_count", 0) or 0,
             "fetch_fail_rate": round(fetch_fail_rate, 4),
@@ -2691,6 +3811,19 @@ class PostgresRepository:
                 (status, assigned_to, review_note, item_id),
             )
             row = cur.fetchone()
+            if row and row.get("entity_type") in {"poll_observation", "ingest_record"}:
+                # Review status feeds needs_manual_review in matchup detail payloads.
+                cur.execute(
+                    """
+                    DELETE FROM matchup_snapshots s
+                    USING poll_observations o
+                    WHERE o.observation_key = %s
+                      AND s.matchup_id = o.matchup_id
+                    """,
+                    (row.get("entity_id"),),
+                )
+            if row:
+                self._bump_data_generation(cur)
         self.conn.commit()
         self._invalidate_api_read_cache()
         return row
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+import math
+import random
+from threading import Lock
+import time
+from typing import Any
+
+import psycopg
+
+from app.config import get_settings
+from app.services.slow_query_log import capture_slow_query, slow_query_threshold_sec
+
+REQUEST_METRICS_MAX_SAMPLES_PER_ROUTE = 1000
+
+
+@dataclass
+class RequestQueryStats:
+    query_count: int = 0
+    db_time_sec: float = 0.0
+    rows_fetched: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+_CURRENT_REQUEST_STATS: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+_ROUTE_SAMPLES: dict[tuple[str, str], deque[tuple[float, float, int, int, int, int]]] = {}
+_ROUTE_SAMPLES_LOCK = Lock()
+
+
+def request_metrics_sample_rate() -> float:
+    try:
+        rate = float(get_settings().request_metrics_sample_rate)
+    except Exception:  # noqa: BLE001
+        return 1.0
+    return min(max(rate, 0.0), 1.0)
+
+
+def should_sample_request() -> bool:
+    rate = request_metrics_sample_rate()
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+def start_request_stats() -> tuple[RequestQueryStats, Token]:
+    # Threadpool-run dependencies and endpoints see a copied context, so they
+    # share this object and their increments land on the same request.
+    stats = RequestQueryStats()
+    return stats, _CURRENT_REQUEST_STATS.set(stats)
+
+
+def finish_request_stats(token: Token) -> None:
+    _CURRENT_REQUEST_STATS.reset(token)
+
+
+def current_request_stats() -> RequestQueryStats | None:
+    return _CURRENT_REQUEST_STATS.get()
+
+
+def record_cache_lookup(hit: bool) -> None:
+    stats = _CURRENT_REQUEST_STATS.get()
+    if stats is None:
+        return
+    if hit:
+        stats.cache_hits += 1
+    else:
+        stats.cache_misses += 1
+
+
+class InstrumentedCursor(psycopg.Cursor):
+    """Cursor that adds statement count, DB time and fetched rows to the sampled request, if any.
+
+    With slow-query capture on, statements over the threshold are also recorded with their plan.
+    """
+
+    def execute(self, query, params=None, **kwargs):  # noqa: ANN001
+        stats = _CURRENT_REQUEST_STATS.get()
+        slow_threshold = slow_query_threshold_sec()
+        if stats is None and slow_threshold is None:
+            return super().execute(query, params, **kwargs)
+        started = time.perf_counter()
+        try:
+            result = super().execute(query, params, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            if stats is not None:
+                stats.query_count += 1
+                stats.db_time_sec += elapsed
+        if slow_threshold is not None and elapsed >= slow_threshold:
+            capture_slow_query(self.connection, query, params, elapsed_sec=elapsed)
+        return result
+
+    def executemany(self, query, params_seq, **kwargs):  # noqa: ANN001
+        stats = _CURRENT_REQUEST_STATS.get()
+        if stats is None:
+            return super().executemany(query, params_seq, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, params_seq, **kwargs)
+        finally:
+            stats.query_count += 1
+            stats.db_time_sec += time.perf_counter() - started
+
+    def fetchone(self):
+        row = super().fetchone()
+        stats = _CURRENT_REQUEST_STATS.get()
+        if stats is not None and row is not None:
+            stats.rows_fetched += 1
+        return row
+
+    def fetchmany(self, size: int = 0):
+        rows = super().fetchmany(size)
+        stats = _CURRENT_REQUEST_STATS.get()
+        if stats is not None:
+            stats.rows_fetched += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        stats = _CURRENT_REQUEST_STATS.get()
+        if stats is not None:
+            stats.rows_fetched += len(rows)
+        return rows
+
+
+def server_timing_header(stats: RequestQueryStats, *, total_sec: float) -> str:
+    return ", ".join(
+        [
+            f'db;dur={stats.db_time_sec * 1000.0:.2f};desc="queries={stats.query_count} rows={stats.rows_fetched}"',
+            f'cache;desc="hits={stats.cache_hits} misses={stats.cache_misses}"',
+            f"total;dur={total_sec * 1000.0:.2f}",
+        ]
+    )
+
+
+def record_request_metrics(method: str, route: str, *, total_sec: float, stats: RequestQueryStats) -> None:
+    sample = (
+        total_sec,
+        stats.db_time_sec,
+        stats.query_count,
+        stats.rows_fetched,
+        stats.cache_hits,
+        stats.cache_misses,
+    )
+    with _ROUTE_SAMPLES_LOCK:
+        samples = _ROUTE_SAMPLES.get((method, route))
+        if samples is None:
+            samples = _ROUTE_SAMPLES[(method, route)] = deque(maxlen=REQUEST_METRICS_MAX_SAMPLES_PER_ROUTE)
+        samples.append(sample)
+
+
+def clear_request_metrics() -> None:
+    with _ROUTE_SAMPLES_LOCK:
+        _ROUTE_SAMPLES.clear()
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list; 0.0 when empty."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _percentile_ms(sorted_values: list[float], pct: float) -> float:
+    return round(percentile(sorted_values, pct) * 1000.0, 3)
+
+
+def summarize_request_metrics() -> list[dict[str, Any]]:
+    """Per-route percentiles over the most recent sampled requests."""
+    with _ROUTE_SAMPLES_LOCK:
+        snapshot = {key: list(samples) for key, samples in _ROUTE_SAMPLES.items()}
+
+    out: list[dict[str, Any]] = []
+    for (method, route), samples in sorted(snapshot.items(), key=lambda item: (item[0][1], item[0][0])):
+        total = sorted(sample[0] for sample in samples)
+        db = sorted(sample[1] for sample in samples)
+        queries = [sample[2] for sample in samples]
+        hits = sum(sample[4] for sample in samples)
+        lookups = hits + sum(sample[5] for sample in samples)
+        out.append(
+            {
+                "method": method,
+                "route": route,
+                "sample_count": len(samples),
+                "p50_ms": _percentile_ms(total, 50),
+                "p95_ms": _percentile_ms(total, 95),
+                "p99_ms": _percentile_ms(total, 99),
+                "db_p50_ms": _percentile_ms(db, 50),
+                "db_p95_ms": _percentile_ms(db, 95),
+                "db_p99_ms": _percentile_ms(db, 99),
+                "queries_mean": round(sum(queries) / len(queries), 2),
+                "queries_max": max(queries),
+                "rows_mean": round(sum(sample[3] for sample in samples) / len(samples), 2),
+                "cache_hit_rate": round(hits / lookups, 4) if lookups else None,
+            }
+        )
+    return out
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+SCENARIO_NAME_RE = re.compile(r"[가-힣]{2,6}")
+SCENARIO_H2H_PAIR_RE = re.compile(
+    r"([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?\s*[-~]\s*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?"
+)
+SCENARIO_MULTI_SINGLE_RE = re.compile(r"다자대결[^가-힣0-9%]*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?")
+SCENARIO_MULTI_ITEM_RE = re.compile(r"([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?")
+# keep the multi-candidate parsing window short to avoid mixing unrelated survey snippets.
+SCENARIO_MULTI_STOP_TOKENS = (" 양자대결", " 가상대결", " 여론조사", "표본오차", "응답률")
+SCENARIO_PARSE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class ScenarioParse:
+    h2h_pairs: tuple[tuple[str, float, str, float], ...]
+    multi_anchor: tuple[str, float] | None
+    multi_candidates: tuple[tuple[str, float], ...]
+
+
+def scenario_name_token(value: object) -> str:
+    text = str(value or "").strip()
+    if not text:
+        return ""
+    match = SCENARIO_NAME_RE.search(text)
+    return match.group(0) if match else text
+
+
+def _h2h_pairs(text: str) -> tuple[tuple[str, float, str, float], ...]:
+    pairs: list[tuple[str, float, str, float]] = []
+    seen: set[tuple[str, float, str, float]] = set()
+    for match in SCENARIO_H2H_PAIR_RE.finditer(text):
+        left_name = scenario_name_token(match.group(1))
+        right_name = scenario_name_token(match.group(3))
+        if not left_name or not right_name or left_name == right_name:
+            continue
+        try:
+            left_value = float(match.group(2))
+            right_value = float(match.group(4))
+        except (TypeError, ValueError):
+            continue
+        key = (left_name, left_value, right_name, right_value)
+        if key in seen:
+            continue
+        seen.add(key)
+        pairs.append(key)
+    return tuple(pairs)
+
+
+def _multi_anchor(text: str) -> tuple[str, float] | None:
+    match = SCENARIO_MULTI_SINGLE_RE.search(text)
+    if not match:
+        return None
+    name = scenario_name_token(match.group(1))
+    if not name:
+        return None
+    try:
+        value = float(match.group(2))
+    except (TypeError, ValueError):
+        return None
+    return name, value
+
+
+def _multi_candidates(text: str) -> tuple[tuple[str, float], ...]:
+    start = text.find("다자대결")
+    if start < 0:
+        return ()
+    segment = text[start:]
+    for stop_token in SCENARIO_MULTI_STOP_TOKENS:
+        stop_idx = segment.find(stop_token)
+        if stop_idx > 0:
+            segment = segment[:stop_idx]
+            break
+
+    seen_names: set[str] = set()
+    rows: list[tuple[str, float]] = []
+    for match in SCENARIO_MULTI_ITEM_RE.finditer(segment):
+        name = scenario_name_token(match.group(1))
+        if not name or name in seen_names:
+            continue
+        try:
+            value = float(match.group(2))
+        except (TypeError, ValueError):
+            continue
+        seen_names.add(name)
+        rows.append((name, value))
+    return tuple(rows) if len(rows) >= 3 else ()
+
+
+@lru_cache(maxsize=SCENARIO_PARSE_CACHE_SIZE)
+def _parse_normalized(text: str) -> ScenarioParse:
+    return ScenarioParse(
+        h2h_pairs=_h2h_pairs(text),
+        multi_anchor=_multi_anchor(text),
+        multi_candidates=_multi_candidates(text),
+    )
+
+
+def parse_survey_scenarios(survey_name: str | None) -> ScenarioParse:
+    """Parse h2h pairs, the multi-candidate anchor and the multi-candidate list from survey text.
+
+    Results are memoized per survey text; a payload usually repeats one survey name across
+    many options and records.
+    """
+    return _parse_normalized(str(survey_name or "").strip())
+
+
+def scenario_parse_cache_info():
+    return _parse_normalized.cache_info()
+
+
+def clear_scenario_parse_cache() -> None:
+    _parse_normalized.cache_clear()
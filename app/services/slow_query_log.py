@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+import logging
+import sys
+from threading import Lock
+from typing import Any, Iterator
+
+import psycopg
+
+from app.config import get_settings
+
+LOGGER = logging.getLogger(__name__)
+
+SLOW_QUERY_LOG_MAX_ENTRIES = 200
+SLOW_QUERY_PARAM_MAX_CHARS = 200
+REPOSITORY_MODULE = "app.services.repository"
+
+_SLOW_QUERIES: deque[dict[str, Any]] = deque(maxlen=SLOW_QUERY_LOG_MAX_ENTRIES)
+_SLOW_QUERIES_LOCK = Lock()
+# Set by capture_query_plans(): every statement is recorded with a plan, regardless of threshold.
+_PLAN_CAPTURE: ContextVar[list[dict[str, Any]] | None] = ContextVar("query_plan_capture", default=None)
+
+
+def slow_query_threshold_sec() -> float | None:
+    """Capture threshold in seconds, or None while capture is off (the default)."""
+    if _PLAN_CAPTURE.get() is not None:
+        return 0.0
+    try:
+        threshold_ms = float(get_settings().slow_query_threshold_ms)
+    except Exception:  # noqa: BLE001
+        return None
+    return threshold_ms / 1000.0 if threshold_ms > 0 else None
+
+
+def _explain_enabled() -> bool:
+    if _PLAN_CAPTURE.get() is not None:
+        return True
+    try:
+        return bool(get_settings().slow_query_explain_enabled)
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def repository_method_name() -> str:
+    """Outermost PostgresRepository method on the current stack (the public entry point)."""
+    frame = sys._getframe(1)
+    name = None
+    while frame is not None:
+        if frame.f_globals.get("__name__") == REPOSITORY_MODULE and "self" in frame.f_locals:
+            name = frame.f_code.co_name
+        frame = frame.f_back
+    return name or "unknown"
+
+
+def is_read_query(query: str) -> bool:
+    head = query.lstrip().split(None, 1)[0].upper() if query.strip() else ""
+    return head in {"SELECT", "WITH"}
+
+
+def explain_query(conn, query: str, params: Any, *, analyze: bool = False) -> tuple[Any | None, str | None]:
+    """EXPLAIN a read query inside a savepoint so a failure cannot abort the caller.
+
+    analyze=True re-executes the statement; only the offline plan capture asks for it.
+    """
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    try:
+        with conn.transaction():
+            # A plain psycopg.Cursor keeps EXPLAIN itself out of the instrumented counts.
+            with psycopg.Cursor(conn) as cur:
+                cur.execute(f"EXPLAIN ({options}) " + query, params)
+                row = cur.fetchone()
+    except psycopg.Error as exc:
+        return None, f"{exc.__class__.__name__}: {exc}"
+    if row is None:
+        return None, None
+    value = next(iter(row.values())) if isinstance(row, dict) else row[0]
+    return value, None
+
+
+def _short_params(params: Any) -> Any:
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: _short_value(value) for key, value in params.items()}
+    if isinstance(params, (list, tuple)):
+        return [_short_value(value) for value in params]
+    return _short_value(params)
+
+
+def _short_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    text = str(value)
+    return text if len(text) <= SLOW_QUERY_PARAM_MAX_CHARS else text[: SLOW_QUERY_PARAM_MAX_CHARS - 3] + "..."
+
+
+def capture_slow_query(conn, query: Any, params: Any, *, elapsed_sec: float) -> None:
+    query_text = query if isinstance(query, str) else str(query)
+    method = repository_method_name()
+    plan = explain_error = None
+    captured = _PLAN_CAPTURE.get()
+    if _explain_enabled() and is_read_query(query_text):
+        # A slow request must not pay for running its slow query a second time.
+        plan, explain_error = explain_query(conn, query_text, params, analyze=captured is not None)
+
+    entry = {
+        "method": method,
+        "elapsed_ms": round(elapsed_sec * 1000.0, 3),
+        "captured_at": datetime.now(timezone.utc),
+        "query": " ".join(query_text.split()),
+        "params": _short_params(params),
+        "plan": plan,
+        "explain_error": explain_error,
+    }
+    if captured is not None:
+        captured.append(entry)
+        return
+    with _SLOW_QUERIES_LOCK:
+        _SLOW_QUERIES.append(entry)
+    LOGGER.warning("slow_query method=%s elapsed_ms=%.2f explained=%s", method, entry["elapsed_ms"], plan is not None)
+
+
+def recent_slow_queries(method: str | None = None) -> list[dict[str, Any]]:
+    with _SLOW_QUERIES_LOCK:
+        rows = list(_SLOW_QUERIES)
+    if method:
+        rows = [row for row in rows if row["method"] == method]
+    return list(reversed(rows))
+
+
+def clear_slow_queries() -> None:
+    with _SLOW_QUERIES_LOCK:
+        _SLOW_QUERIES.clear()
+
+
+@contextmanager
+def capture_query_plans() -> Iterator[list[dict[str, Any]]]:
+    """Record every instrumented statement with its EXPLAIN plan into the yielded list."""
+    captured: list[dict[str, Any]] = []
+    token = _PLAN_CAPTURE.set(captured)
+    try:
+        yield captured
+    finally:
+        _PLAN_CAPTURE.reset(token)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal
+
+ARTICLE_AGGREGATE_HINTS = ("집계", "aggregate", "평균", "메타", "종합")
+SOURCE_GRADE_SCORE = {
+    "S": 5,
+    "A": 4,
+    "B": 3,
+    "C": 2,
+    "D": 1,
+}
+
+
+def summary_source_tier(row: dict) -> Literal["official", "nesdc", "article_aggregate", "article"]:
+    source_channel = str(row.get("source_channel") or "").strip().lower()
+    source_channels = {str(ch).strip().lower() for ch in (row.get("source_channels") or []) if ch is not None}
+
+    if source_channel == "official" or "official" in source_channels:
+        return "official"
+    if source_channel == "nesdc" or "nesdc" in source_channels:
+        return "nesdc"
+
+    pollster = str(row.get("pollster") or "").strip().lower()
+    if any(hint in pollster for hint in ARTICLE_AGGREGATE_HINTS):
+        return "article_aggregate"
+    return "article"
+
+
+def summary_source_tier_score(tier: Literal["official", "nesdc", "article_aggregate", "article"]) -> int:
+    return {
+        "official": 4,
+        "nesdc": 3,
+        "article_aggregate": 2,
+        "article": 1,
+    }[tier]
+
+
+def summary_reliability_score(row: dict) -> int:
+    source_grade = str(row.get("source_grade") or "").strip().upper()
+    if source_grade in SOURCE_GRADE_SCORE:
+        return SOURCE_GRADE_SCORE[source_grade]
+    return 0
+
+
+def summary_row_sort_key(row: dict) -> tuple[int, float, int]:
+    tier = summary_source_tier(row)
+    date_value = row.get("survey_end_date")
+    date_score = 0.0
+    if isinstance(date_value, date):
+        date_score = float(date_value.toordinal())
+    return (
+        summary_source_tier_score(tier),
+        date_score,
+        summary_reliability_score(row),
+    )
+
+
+def select_summary_representative(rows: list[dict]) -> tuple[dict, str]:
+    selected = max(rows, key=summary_row_sort_key)
+    return selected, summary_source_tier(selected)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date, datetime
+from threading import Lock
+from typing import Any, Hashable
+
+from app.services.cutoff_policy import KST
+from app.services.request_metrics import record_cache_lookup
+
+SUMMARY_SELECTION_CACHE_MAX_ENTRIES = 512
+
+_SUMMARY_SELECTION_CACHE: OrderedDict[Hashable, Any] = OrderedDict()
+_SUMMARY_SELECTION_CACHE_LOCK = Lock()
+
+
+def clear_summary_selection_cache() -> None:
+    with _SUMMARY_SELECTION_CACHE_LOCK:
+        _SUMMARY_SELECTION_CACHE.clear()
+
+
+def summary_selection_cache_key(
+    as_of: date | None,
+    *,
+    generation: int,
+    policy_version: str,
+    today: date | None = None,
+) -> tuple:
+    """Past `as_of` dates are treated as immutable and keyed without the data generation."""
+    today = today or datetime.now(KST).date()
+    if as_of is not None and as_of < today:
+        return ("historical", as_of.isoformat(), policy_version)
+    return ("current", as_of.isoformat() if as_of else "latest", generation, policy_version)
+
+
+def get_cached_summary_selection(key: Hashable) -> Any | None:
+    with _SUMMARY_SELECTION_CACHE_LOCK:
+        value = _SUMMARY_SELECTION_CACHE.get(key)
+        if value is not None:
+            _SUMMARY_SELECTION_CACHE.move_to_end(key)
+    record_cache_lookup(value is not None)
+    return value
+
+
+def set_cached_summary_selection(key: Hashable, value: Any) -> None:
+    with _SUMMARY_SELECTION_CACHE_LOCK:
+        if key[0] == "current":
+            # A newer generation supersedes every older "current" entry.
+            for stale in [k for k in _SUMMARY_SELECTION_CACHE if k[0] == "current" and k[1] == key[1]]:
+                del _SUMMARY_SELECTION_CACHE[stale]
+        _SUMMARY_SELECTION_CACHE[key] = value
+        _SUMMARY_SELECTION_CACHE.move_to_end(key)
+        while len(_SUMMARY_SELECTION_CACHE) > SUMMARY_SELECTION_CACHE_MAX_ENTRIES:
+            _SUMMARY_SELECTION_CACHE.popitem(last=False)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+import math
+from typing import Iterable
+
+TREND_AGGREGATE_MODES = ("raw", "rolling", "weighted", "house_adjusted")
+DEFAULT_EFFECTIVE_SAMPLE_SIZE = 500.0
+# Respondents-worth of prior pulling sparsely observed pollsters' house effects toward zero.
+HOUSE_EFFECT_PRIOR_WEIGHT = 2000.0
+Z_95 = 1.96
+
+
+@dataclass(frozen=True)
+class TrendSample:
+    survey_end_date: date
+    value: float
+    weight: float
+    pollster: str
+
+
+@dataclass(frozen=True)
+class TrendEstimate:
+    value: float
+    low: float
+    high: float
+    poll_count: int
+
+
+def effective_sample_size(row: dict) -> float:
+    """Sample size, else the size implied by a 95% margin of error, else a flat default."""
+    try:
+        sample_size = float(row.get("sample_size") or 0)
+    except (TypeError, ValueError):
+        sample_size = 0.0
+    if sample_size > 0:
+        return sample_size
+    try:
+        margin = float(row.get("margin_of_error") or 0)
+    except (TypeError, ValueError):
+        margin = 0.0
+    if margin > 0:
+        return (Z_95**2 * 0.25) / (margin / 100.0) ** 2
+    return DEFAULT_EFFECTIVE_SAMPLE_SIZE
+
+
+def build_trend_samples(rows: Iterable[dict]) -> dict[str, list[TrendSample]]:
+    """Group eligible observation rows by option name, sorted by survey date."""
+    samples: dict[str, list[TrendSample]] = {}
+    for row in rows:
+        survey_end_date = row.get("survey_end_date")
+        option_name = str(row.get("option_name") or "").strip()
+        value = row.get("value_mid")
+        if not isinstance(survey_end_date, date) or not option_name or value is None:
+            continue
+        samples.setdefault(option_name, []).append(
+            TrendSample(
+                survey_end_date=survey_end_date,
+                value=float(value),
+                weight=effective_sample_size(row),
+                pollster=str(row.get("pollster") or "").strip(),
+            )
+        )
+    for option_samples in samples.values():
+        option_samples.sort(key=lambda sample: sample.survey_end_date)
+    return samples
+
+
+class _RunningMoments:
+    """Weighted mean and sum of squared deviations with West's incremental updates.
+
+    Removal is the exact inverse of addition, so a sliding window never subtracts large
+    raw power sums from each other; the state is reset whenever the window empties.
+    """
+
+    __slots__ = ("count", "weight", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.weight = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float, weight: float) -> None:
+        self.count += 1
+        self.weight += weight
+        delta = value - self.mean
+        self.mean += delta * weight / self.weight
+        self.m2 += weight * delta * (value - self.mean)
+
+    def remove(self, value: float, weight: float) -> None:
+        self.count -= 1
+        remaining = self.weight - weight
+        if self.count <= 0 or remaining <= 0:
+            self.__init__()
+            return
+        delta = value - self.mean
+        self.mean -= delta * weight / remaining
+        self.m2 = max(self.m2 - weight * delta * (value - self.mean), 0.0)
+        self.weight = remaining
+
+
+def _window_estimates(
+    samples: list[TrendSample],
+    *,
+    window_days: int,
+    weighted: bool,
+    offsets: dict[str, float] | None = None,
+) -> dict[date, TrendEstimate]:
+    """Trailing-window estimate at each observed date in one pass over the sorted samples."""
+    estimates: dict[date, TrendEstimate] = {}
+    moments = _RunningMoments()
+    tail = 0
+    head = 0
+    total = len(samples)
+
+    def point(sample: TrendSample) -> tuple[float, float]:
+        value = sample.value - (offsets or {}).get(sample.pollster, 0.0)
+        return value, (sample.weight if weighted else 1.0)
+
+    while head < total:
+        current_date = samples[head].survey_end_date
+        while head < total and samples[head].survey_end_date == current_date:
+            moments.add(*point(samples[head]))
+            head += 1
+        window_start = current_date - timedelta(days=window_days - 1)
+        while samples[tail].survey_end_date < window_start:
+            moments.remove(*point(samples[tail]))
+            tail += 1
+
+        mean = moments.mean
+        count = moments.count
+        if weighted:
+            # Binomial sampling error over the pooled effective sample.
+            share = min(max(mean / 100.0, 0.0), 1.0)
+            stderr = 100.0 * math.sqrt(share * (1.0 - share) / moments.weight)
+        elif count > 1:
+            variance = moments.m2 / (count - 1)
+            stderr = math.sqrt(variance / count)
+        else:
+            stderr = 0.0
+        estimates[current_date] = TrendEstimate(
+            value=round(mean, 2),
+            low=round(mean - Z_95 * stderr, 2),
+            high=round(mean + Z_95 * stderr, 2),
+            poll_count=count,
+        )
+    return estimates
+
+
+def _house_effects(samples: list[TrendSample], baseline: dict[date, TrendEstimate]) -> dict[str, float]:
+    residual_sum: dict[str, float] = {}
+    weight_sum: dict[str, float] = {}
+    for sample in samples:
+        if not sample.pollster:
+            continue
+        residual = sample.value - baseline[sample.survey_end_date].value
+        residual_sum[sample.pollster] = residual_sum.get(sample.pollster, 0.0) + sample.weight * residual
+        weight_sum[sample.pollster] = weight_sum.get(sample.pollster, 0.0) + sample.weight
+    effects = {
+        pollster: residual_sum[pollster] / (weight_sum[pollster] + HOUSE_EFFECT_PRIOR_WEIGHT)
+        for pollster in residual_sum
+    }
+    # Center so the adjustment removes relative lean without shifting the overall level.
+    total_weight = sum(weight_sum.values())
+    if total_weight > 0:
+        center = sum(effects[p] * weight_sum[p] for p in effects) / total_weight
+        effects = {pollster: effect - center for pollster, effect in effects.items()}
+    return effects
+
+
+def compute_trend_aggregates(
+    rows: Iterable[dict],
+    *,
+    mode: str,
+    window_days: int,
+) -> dict[tuple[date, str], TrendEstimate]:
+    """Smoothed estimate per (survey_end_date, option_name) for a non-raw aggregate mode."""
+    if mode not in TREND_AGGREGATE_MODES or mode == "raw":
+        raise ValueError(f"unsupported trend aggregate mode: {mode}")
+    window_days = max(int(window_days), 1)
+
+    out: dict[tuple[date, str], TrendEstimate] = {}
+    for option_name, samples in build_trend_samples(rows).items():
+        if mode == "rolling":
+            estimates = _window_estimates(samples, window_days=window_days, weighted=False)
+        else:
+            estimates = _window_estimates(samples, window_days=window_days, weighted=True)
+            if mode == "house_adjusted":
+                effects = _house_effects(samples, estimates)
+                estimates = _window_estimates(samples, window_days=window_days, weighted=True, offsets=effects)
+        for survey_end_date, estimate in estimates.items():
+            out[(survey_end_date, option_name)] = estimate
+    return out
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import Any, Iterable
+
+from app.services.cutoff_policy import is_cutoff_eligible_row
+from app.services.source_selection import select_summary_representative
+
+LOGGER = logging.getLogger(__name__)
+
+TREND_SERIES_METRICS = ("party_support", "president_job_approval", "election_frame")
+TREND_SERIES_POINT_FIELDS = (
+    "metric",
+    "survey_end_date",
+    "option_name",
+    "value_mid",
+    "pollster",
+    "source_grade",
+    "audience_region_code",
+    "observation_id",
+    "observation_updated_at",
+    "official_release_at",
+    "article_published_at",
+    "source_channel",
+    "source_channels",
+)
+
+
+@dataclass
+class TrendSeriesRebuildResult:
+    rebuilt_days: int = 0
+    point_count: int = 0
+    failed_days: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rebuilt_days": self.rebuilt_days,
+            "point_count": self.point_count,
+            "failed_days": self.failed_days,
+        }
+
+
+def select_trend_series_points(rows: list[dict]) -> list[dict]:
+    """Pick one representative per (metric, option_name) the same way `/trends/{metric}` does."""
+    grouped: dict[tuple[str, str], list[dict]] = {}
+    for row in rows:
+        if not is_cutoff_eligible_row(row):
+            continue
+        option_name = str(row.get("option_name") or "").strip()
+        if not option_name or row.get("survey_end_date") is None:
+            continue
+        grouped.setdefault((str(row.get("metric")), option_name), []).append(row)
+
+    points: list[dict] = []
+    for (metric, option_name), candidates in sorted(grouped.items()):
+        selected_row, selected_tier = select_summary_representative(candidates)
+        point = {field: selected_row.get(field) for field in TREND_SERIES_POINT_FIELDS}
+        point["metric"] = metric
+        point["option_name"] = option_name
+        point["source_channels"] = list(selected_row.get("source_channels") or [])
+        point["selected_source_tier"] = selected_tier
+        points.append(point)
+    return points
+
+
+def rebuild_trend_series_days(repo, day_keys: Iterable[dict]) -> TrendSeriesRebuildResult:
+    result = TrendSeriesRebuildResult()
+    seen: set[tuple[str, str, Any]] = set()
+    for key in day_keys:
+        scope = key.get("audience_scope")
+        survey_end_date = key.get("survey_end_date")
+        region_key = key.get("region_key") or ""
+        if not scope or survey_end_date is None or (scope, region_key, survey_end_date) in seen:
+            continue
+        seen.add((scope, region_key, survey_end_date))
+        try:
+            rows = repo.fetch_trend_series_day_rows(
+                scope=scope,
+                region_key=region_key,
+                survey_end_date=survey_end_date,
+            )
+            points = select_trend_series_points(rows)
+            repo.replace_trend_series_day(
+                scope=scope,
+                region_key=region_key,
+                survey_end_date=survey_end_date,
+                points=points,
+            )
+        except Exception as exc:  # noqa: BLE001
+            rollback = getattr(repo, "rollback", None)
+            if callable(rollback):
+                rollback()
+            LOGGER.warning(
+                "trend series rebuild failed: scope=%s region_key=%s date=%s error=%s",
+                scope,
+                region_key,
+                survey_end_date,
+                exc,
+            )
+            result.failed_days += 1
+            continue
+        result.rebuilt_days += 1
+        result.point_count += len(points)
+    return result
+
+
+def refresh_trend_series_for_run(repo, run_id: int) -> TrendSeriesRebuildResult | None:
+    """Rebuild the days touched by one ingest run; no-op for repositories without the series."""
+    fetch_day_keys = getattr(repo, "fetch_trend_series_day_keys", None)
+    if not callable(fetch_day_keys):
+        return None
+    try:
+        day_keys = fetch_day_keys(run_id=run_id)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("trend series day key lookup failed: run_id=%s error=%s", run_id, exc)
+        return None
+    return rebuild_trend_series_days(repo, day_keys)
+
+
+def refresh_trend_series_for_observations(repo, observation_keys: Iterable[str]) -> TrendSeriesRebuildResult | None:
+    """Rebuild the days of individual observations, e.g. after a review decision."""
+    keys = list(dict.fromkeys(str(x) for x in observation_keys if x))
+    fetch_day_keys = getattr(repo, "fetch_trend_series_day_keys", None)
+    if not keys or not callable(fetch_day_keys):
+        return None
+    try:
+        day_keys = fetch_day_keys(observation_keys=keys)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.warning("trend series day key lookup failed: observation_keys=%s error=%s", keys, exc)
+        rollback = getattr(repo, "rollback", None)
+        if callable(rollback):
+            rollback()
+        return None
+    return rebuild_trend_series_days(repo, day_keys)
@@ -209,7 +209,8 @@ CREATE TABLE IF NOT EXISTS ingestion_runs (
 
 ALTER TABLE ingestion_runs
     ADD COLUMN IF NOT EXISTS date_inference_failed_count INT NOT NULL DEFAULT 0,
-    ADD COLUMN IF NOT EXISTS date_inference_estimated_count INT NOT NULL DEFAULT 0;
+    ADD COLUMN IF NOT EXISTS date_inference_estimated_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS skipped_count INT NOT NULL DEFAULT 0;
 
 CREATE TABLE IF NOT EXISTS poll_observations (
     id BIGSERIAL PRIMARY KEY,
@@ -344,7 +345,9 @@ ALTER TABLE elections
     ADD COLUMN IF NOT EXISTS source TEXT NOT NULL DEFAULT 'code_master',
     ADD COLUMN IF NOT EXISTS has_poll_data BOOLEAN NOT NULL DEFAULT FALSE,
     ADD COLUMN IF NOT EXISTS latest_matchup_id TEXT NULL,
-    ADD COLUMN IF NOT EXISTS is_active BOOLEAN NOT NULL DEFAULT TRUE;
+    ADD COLUMN IF NOT EXISTS is_active BOOLEAN NOT NULL DEFAULT TRUE,
+    ADD COLUMN IF NOT EXISTS display_title TEXT NULL,
+    ADD COLUMN IF NOT EXISTS topology TEXT NOT NULL DEFAULT 'official';
 
 UPDATE elections
 SET slot_matchup_id = COALESCE(slot_matchup_id, 'master|' || office_type || '|' || region_code),
@@ -366,6 +369,105 @@ BEGIN
 END;
 $$;
 
+CREATE TABLE IF NOT EXISTS data_generation (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    generation BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO data_generation (id, generation)
+VALUES (1, 0)
+ON CONFLICT (id) DO NOTHING;
+
+-- matchups.data_version is bumped by every write to the matchup or its observations;
+-- a snapshot is served only while its data_version still matches.
+ALTER TABLE matchups
+    ADD COLUMN IF NOT EXISTS data_version BIGINT NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS matchup_snapshots (
+    matchup_id TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    data_version BIGINT NOT NULL DEFAULT 0,
+    source_run_id BIGINT NULL,
+    built_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    idempotency_key TEXT NULL,
+    status TEXT NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'success', 'partial_success', 'failed')),
+    payload JSONB NOT NULL,
+    payload_hash TEXT NOT NULL,
+    record_count INT NOT NULL DEFAULT 0,
+    progress_done INT NOT NULL DEFAULT 0,
+    processed_count INT NULL,
+    error_count INT NULL,
+    skipped_count INT NULL,
+    run_id BIGINT NULL REFERENCES ingestion_runs(id),
+    attempt_count INT NOT NULL DEFAULT 0,
+    error TEXT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMPTZ NULL,
+    heartbeat_at TIMESTAMPTZ NULL,
+    finished_at TIMESTAMPTZ NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ingest_jobs_idempotency_key
+    ON ingest_jobs (idempotency_key)
+    WHERE idempotency_key IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_claim
+    ON ingest_jobs (status, id)
+    WHERE status IN ('queued', 'running');
+
+-- Content hash per ingested source record, keyed by the record's own observation_key: a record
+-- fingerprint-merged into another source's row still finds its hash, and the sources of one poll
+-- keep separate hashes.
+CREATE TABLE IF NOT EXISTS ingest_record_hashes (
+    record_key TEXT PRIMARY KEY,
+    observation_id BIGINT NOT NULL REFERENCES poll_observations(id) ON DELETE CASCADE,
+    content_hash TEXT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS candidate_party_evidence (
+    candidate_token TEXT NOT NULL,
+    region_code TEXT NOT NULL DEFAULT '',
+    party_name TEXT NOT NULL,
+    source TEXT NOT NULL CHECK (source IN ('registry', 'data_go', 'poll_option', 'incumbent')),
+    evidence_count INT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (candidate_token, region_code, party_name, source)
+);
+
+CREATE TABLE IF NOT EXISTS trend_daily_points (
+    metric TEXT NOT NULL,
+    audience_scope TEXT NOT NULL,
+    region_key TEXT NOT NULL DEFAULT '',
+    survey_end_date DATE NOT NULL,
+    option_name TEXT NOT NULL,
+    value_mid FLOAT NULL,
+    pollster TEXT NULL,
+    source_grade TEXT NULL,
+    audience_region_code TEXT NULL,
+    observation_id BIGINT NULL,
+    observation_updated_at TIMESTAMPTZ NULL,
+    official_release_at TIMESTAMPTZ NULL,
+    article_published_at TIMESTAMPTZ NULL,
+    source_channel TEXT NULL,
+    source_channels TEXT[] NULL,
+    selected_source_tier TEXT NOT NULL,
+    built_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (metric, audience_scope, region_key, survey_end_date, option_name)
+);
+
+CREATE TABLE IF NOT EXISTS trend_series_state (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    backfilled_at TIMESTAMPTZ NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
 CREATE TABLE IF NOT EXISTS poll_options (
     id BIGSERIAL PRIMARY KEY,
     observation_id BIGINT NOT NULL REFERENCES poll_observations(id) ON DELETE CASCADE,
@@ -511,6 +613,7 @@ CREATE TABLE IF NOT EXISTS review_queue (
 );
 
 CREATE INDEX IF NOT EXISTS idx_regions_search ON regions (sido_name, sigungu_name);
+CREATE INDEX IF NOT EXISTS idx_regions_code_prefix ON regions (region_code text_pattern_ops);
 CREATE INDEX IF NOT EXISTS idx_poll_observations_date ON poll_observations (survey_end_date DESC);
 CREATE INDEX IF NOT EXISTS idx_poll_observations_matchup ON poll_observations (matchup_id);
 CREATE INDEX IF NOT EXISTS idx_poll_observations_matchup_latest
@@ -522,7 +625,90 @@ CREATE INDEX IF NOT EXISTS idx_poll_observations_verified_date
 CREATE INDEX IF NOT EXISTS idx_poll_observations_verified_region_office_date
     ON poll_observations (region_code, office_type, survey_end_date DESC, id DESC)
     WHERE verified = TRUE;
-CREATE INDEX IF NOT EXISTS idx_poll_observations_fingerprint ON poll_observations (poll_fingerprint);
+-- Collapse fingerprint duplicates once, then enforce one observation per fingerprint.
+-- Survivor per fingerprint: a nesdc row if any, else the oldest id. Losers' options move to the
+-- survivor unless the survivor already has the same (option_type, option_name, scenario_key).
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_indexes
+        WHERE indexname = 'uq_poll_observations_fingerprint'
+    ) THEN
+        CREATE TEMP TABLE poll_fingerprint_dedup ON COMMIT DROP AS
+        SELECT id, keep_id
+        FROM (
+            SELECT
+                id,
+                first_value(id) OVER (
+                    PARTITION BY poll_fingerprint
+                    ORDER BY (COALESCE(source_channel, 'article') = 'nesdc') DESC, id ASC
+                ) AS keep_id
+            FROM poll_observations
+            WHERE poll_fingerprint IS NOT NULL
+        ) ranked
+        WHERE id <> keep_id;
+
+        UPDATE poll_observations keep
+        SET source_channels = ARRAY_REMOVE(
+                ARRAY[
+                    CASE WHEN merged.has_article THEN 'article' END,
+                    CASE WHEN merged.has_nesdc THEN 'nesdc' END
+                ],
+                NULL
+            ),
+            source_channel = CASE WHEN merged.has_nesdc THEN 'nesdc' ELSE 'article' END,
+            verified = merged.any_verified,
+            updated_at = NOW()
+        FROM (
+            SELECT
+                d.keep_id,
+                bool_or(
+                    'article' = ANY(COALESCE(o.source_channels, ARRAY[COALESCE(o.source_channel, 'article')]))
+                ) AS has_article,
+                bool_or(
+                    'nesdc' = ANY(COALESCE(o.source_channels, ARRAY[COALESCE(o.source_channel, 'article')]))
+                ) AS has_nesdc,
+                bool_or(o.verified) AS any_verified
+            FROM poll_fingerprint_dedup d
+            JOIN poll_observations o ON o.id IN (d.id, d.keep_id)
+            GROUP BY d.keep_id
+        ) merged
+        WHERE keep.id = merged.keep_id;
+
+        UPDATE poll_options po
+        SET observation_id = moved.keep_id
+        FROM (
+            SELECT DISTINCT ON (d.keep_id, loser.option_type, loser.option_name, loser.scenario_key)
+                loser.id,
+                d.keep_id
+            FROM poll_options loser
+            JOIN poll_fingerprint_dedup d ON d.id = loser.observation_id
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM poll_options existing
+                WHERE existing.observation_id = d.keep_id
+                  AND existing.option_type = loser.option_type
+                  AND existing.option_name = loser.option_name
+                  AND existing.scenario_key = loser.scenario_key
+            )
+            ORDER BY d.keep_id, loser.option_type, loser.option_name, loser.scenario_key, loser.id DESC
+        ) moved
+        WHERE po.id = moved.id;
+
+        DELETE FROM poll_observations o
+        USING poll_fingerprint_dedup d
+        WHERE o.id = d.id;
+
+        CREATE UNIQUE INDEX uq_poll_observations_fingerprint
+            ON poll_observations (poll_fingerprint)
+            WHERE poll_fingerprint IS NOT NULL;
+    END IF;
+    DROP INDEX IF EXISTS idx_poll_observations_fingerprint;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_poll_observations_ingestion_run ON poll_observations (ingestion_run_id);
 CREATE INDEX IF NOT EXISTS idx_poll_observations_source_channels ON poll_observations USING GIN (source_channels);
 CREATE INDEX IF NOT EXISTS idx_candidates_source_channels ON candidates USING GIN (source_channels);
 CREATE INDEX IF NOT EXISTS idx_elections_region_active ON elections (region_code, is_active, office_type);
@@ -536,6 +722,12 @@ CREATE INDEX IF NOT EXISTS idx_poll_options_summary_type_observation
 CREATE INDEX IF NOT EXISTS idx_poll_options_candidate_matchup_observation_value
     ON poll_options (observation_id, value_mid DESC, option_name)
     WHERE option_type = 'candidate_matchup' AND value_mid IS NOT NULL;
+-- Per-token party evidence recounts at ingest (refresh_candidate_party_evidence).
+CREATE INDEX IF NOT EXISTS idx_poll_options_candidate_token
+    ON poll_options ((lower(regexp_replace(option_name, '[[:space:]]+', '', 'g'))))
+    WHERE option_type IN ('candidate', 'candidate_matchup');
+CREATE INDEX IF NOT EXISTS idx_candidates_name_token
+    ON candidates ((lower(regexp_replace(name_ko, '[[:space:]]+', '', 'g'))));
 CREATE INDEX IF NOT EXISTS idx_review_queue_status ON review_queue (status, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_review_queue_entity_status
     ON review_queue (entity_type, entity_id, status);
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+import json
+import random
+import re
+import statistics
+import sys
+from threading import Lock
+import time
+from pathlib import Path
+from typing import Any, Callable
+from urllib import request as urllib_request
+from urllib.error import HTTPError, URLError
+from urllib.parse import quote
+
+import psycopg
+from psycopg.rows import dict_row
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.request_metrics import percentile  # noqa: E402
+from src.pipeline.standards import COMMON_CODE_REGIONS  # noqa: E402
+
+SCENARIO = "api_read_load_v1"
+ELECTION_PREFIX = "20260603"
+SURNAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오")
+GIVEN_NAMES = ("민준", "서연", "도윤", "하은", "시우", "지유", "주원", "수아", "예준", "지호", "하준", "서윤")
+PARTIES = ("더불어민주당", "국민의힘", "조국혁신당", "개혁신당")
+POLLSTERS = ("한국갤럽", "리얼미터", "NBS", "엠브레인퍼블릭", "KSOI", "한국리서치", "코리아리서치")
+NATIONAL_OPTIONS = (
+    ("party_support", "더불어민주당"),
+    ("party_support", "국민의힘"),
+    ("president_job_approval", "대통령 직무 긍정평가"),
+    ("president_job_approval", "대통령 직무 부정평가"),
+    ("election_frame", "국정안정론"),
+    ("election_frame", "국정견제론"),
+)
+REVIEW_ISSUE_TYPES = ("extract_error", "mapping_error", "classify_error", "duplicate_conflict")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Seed a synthetic dataset and load-test the public read API")
+    parser.add_argument("--target", choices=["local", "remote"], default="local")
+    parser.add_argument(
+        "--isolated-db",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Seed a temporary database and drop it afterwards (default: true)",
+    )
+    parser.add_argument("--skip-seed", action="store_true", help="reuse an already seeded database")
+    parser.add_argument("--observations", type=int, default=20000)
+    parser.add_argument("--review-items", type=int, default=20000)
+    parser.add_argument("--seed-batch-size", type=int, default=250)
+    parser.add_argument("--seed", type=int, default=20260603)
+    parser.add_argument("--api-base", default=None, help="drive a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="requests per endpoint")
+    parser.add_argument("--report", default="data/api_load_benchmark_report.json")
+    return parser.parse_args()
+
+
+def _candidate_names(region_code: str, count: int) -> list[str]:
+    offset = sum(ord(ch) for ch in region_code)
+    return [
+        SURNAMES[(offset + index) % len(SURNAMES)] + GIVEN_NAMES[(offset * 7 + index * 5) % len(GIVEN_NAMES)]
+        for index in range(count)
+    ]
+
+
+def _office_type(admin_level: str) -> str:
+    return "광역자치단체장" if admin_level == "sido" else "기초자치단체장"
+
+
+def build_seed_records(*, observations: int, seed: int, today: date | None = None) -> list[dict[str, Any]]:
+    """Deterministic ingest records spread over every COMMON_CODE_REGIONS entry.
+
+    Every tenth observation is a national party/approval/frame poll; the rest are local
+    candidate matchups. Survey dates cover the trailing 60 days so trends and cutoffs see data.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    regions = list(COMMON_CODE_REGIONS.values())
+    records: list[dict[str, Any]] = []
+    for index in range(observations):
+        region = regions[index % len(regions)]
+        end_date = today - timedelta(days=1 + rng.randrange(60))
+        pollster = POLLSTERS[rng.randrange(len(POLLSTERS))]
+        office_type = _office_type(region.admin_level)
+        matchup_id = f"{ELECTION_PREFIX}|{office_type}|{region.region_code}"
+        national = index % 10 == 0
+        observation = {
+            "observation_key": f"bench-obs-{index}",
+            "survey_name": f"{pollster} 정기조사 {end_date.isoformat()}",
+            "pollster": pollster,
+            "survey_start_date": (end_date - timedelta(days=2)).isoformat(),
+            "survey_end_date": end_date.isoformat(),
+            "sample_size": 500 + rng.randrange(1500),
+            "response_rate": round(5 + rng.random() * 15, 1),
+            "margin_of_error": round(2.5 + rng.random() * 2, 1),
+            "region_code": region.region_code,
+            "office_type": office_type,
+            "matchup_id": matchup_id,
+            "audience_scope": "national" if national else "regional",
+            "source_channel": "nesdc" if index % 3 == 0 else "article",
+            "verified": index % 4 != 0,
+            "source_grade": "ABCD"[rng.randrange(4)],
+        }
+        if national:
+            candidates: list[dict[str, Any]] = []
+            options = [
+                {"option_type": option_type, "option_name": name, "value_raw": f"{20 + rng.randrange(40)}%"}
+                for option_type, name in NATIONAL_OPTIONS
+            ]
+        else:
+            names = _candidate_names(region.region_code, 3)
+            candidates = [
+                {
+                    "candidate_id": f"bench-cand-{region.region_code}-{slot}",
+                    "name_ko": name,
+                    "party_name": PARTIES[slot % len(PARTIES)],
+                }
+                for slot, name in enumerate(names)
+            ]
+            options = [
+                {"option_type": "candidate_matchup", "option_name": name, "value_raw": f"{15 + rng.randrange(35)}%"}
+                for name in names
+            ]
+        records.append(
+            {
+                "article": {
+                    "url": f"https://bench.example.com/poll/{index}",
+                    "title": f"[여론조사] {region.sido_name} {region.sigungu_name} {office_type} 가상대결",
+                    "publisher": "벤치뉴스",
+                    "published_at": f"{end_date.isoformat()}T09:00:00+09:00",
+                    "raw_text": f"{pollster} 조사 표본 {observation['sample_size']}명",
+                    "raw_hash": f"bench-hash-{index}",
+                },
+                "region": {
+                    "region_code": region.region_code,
+                    "sido_name": region.sido_name,
+                    "sigungu_name": region.sigungu_name,
+                    "admin_level": region.admin_level,
+                    "parent_region_code": region.parent_region_code,
+                },
+                "candidates": candidates,
+                "observation": observation,
+                "options": options,
+            }
+        )
+    return records
+
+
+def build_endpoint_plan(records: list[dict[str, Any]]) -> list[tuple[str, Callable[[int], str]]]:
+    """(endpoint name, request-index -> path) for the public read endpoints under test."""
+    regions = sorted({record["region"]["region_code"] for record in records})
+    matchups = sorted({record["observation"]["matchup_id"] for record in records})
+    queries = sorted({record["region"]["sido_name"][:2] for record in records})
+    metrics = ("party_support", "president_job_approval", "election_frame")
+    prefix = "/api/v1"
+    return [
+        ("dashboard_summary", lambda i: f"{prefix}/dashboard/summary"),
+        ("dashboard_map_latest", lambda i: f"{prefix}/dashboard/map-latest"),
+        ("dashboard_big_matches", lambda i: f"{prefix}/dashboard/big-matches"),
+        ("regions_search", lambda i: f"{prefix}/regions/search?q={quote(queries[i % len(queries)])}"),
+        ("region_elections", lambda i: f"{prefix}/regions/{regions[i % len(regions)]}/elections"),
+        ("matchup", lambda i: f"{prefix}/matchups/{quote(matchups[i % len(matchups)], safe='')}"),
+        ("trends", lambda i: f"{prefix}/trends/{metrics[i % len(metrics)]}?days=30"),
+    ]
+
+
+def summarize_samples(samples: list[dict[str, Any]], *, elapsed_sec: float) -> dict[str, Any]:
+    """Latency percentiles plus query and cache stats for one endpoint's samples.
+
+    A request that issued no SQL at all was answered from an in-process cache, so
+    cache_hit_rate is the share of zero-query requests when query counts are known.
+    """
+    latencies = sorted(sample["latency_ms"] for sample in samples)
+    counted = [sample["query_count"] for sample in samples if sample.get("query_count") is not None]
+    status_counts: dict[str, int] = {}
+    for sample in samples:
+        key = str(sample["status"])
+        status_counts[key] = status_counts.get(key, 0) + 1
+    return {
+        "requests": len(samples),
+        "status_counts": status_counts,
+        "throughput_rps": round(len(samples) / elapsed_sec, 2) if elapsed_sec else None,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+        "queries_per_request": round(statistics.fmean(counted), 2) if counted else None,
+        "max_queries_per_request": max(counted) if counted else None,
+        "cache_hit_rate": round(sum(1 for count in counted if count == 0) / len(counted), 4) if counted else None,
+    }
+
+
+class _CountingCursor(psycopg.Cursor):
+    def execute(self, query, params=None, **kwargs):  # noqa: ANN001
+        self.connection.bench_query_count = getattr(self.connection, "bench_query_count", 0) + 1
+        return super().execute(query, params, **kwargs)
+
+
+class InProcessDriver:
+    """Runs the FastAPI app in-process with a repository whose cursor counts statements."""
+
+    def __init__(self, database_url: str):
+        from fastapi import Request
+        from fastapi.testclient import TestClient
+
+        from app.api.dependencies import get_repository
+        from app.main import app
+        from app.services.repository import PostgresRepository
+
+        self._counts: dict[str, int] = {}
+        self._lock = Lock()
+
+        def counting_repository(request: Request):
+            conn = psycopg.connect(database_url, row_factory=dict_row, cursor_factory=_CountingCursor)
+            try:
+                yield PostgresRepository(conn)
+            finally:
+                with self._lock:
+                    self._counts[request.headers.get("x-bench-request-id", "")] = getattr(
+                        conn, "bench_query_count", 0
+                    )
+                conn.close()
+
+        app.dependency_overrides[get_repository] = counting_repository
+        self._app = app
+        self._dependency = get_repository
+        self._client = TestClient(app)
+
+    def get(self, path: str, request_id: str) -> tuple[int, int | None]:
+        response = self._client.get(path, headers={"x-bench-request-id": request_id})
+        with self._lock:
+            query_count = self._counts.pop(request_id, 0)
+        return response.status_code, query_count
+
+    def close(self) -> None:
+        self._app.dependency_overrides.pop(self._dependency, None)
+        self._client.close()
+
+
+def _server_timing_query_count(header: str | None) -> int | None:
+    match = re.search(r"queries=(\d+)", header or "")
+    return int(match.group(1)) if match else None
+
+
+class HttpDriver:
+    """Drives a running server; query counts come from its Server-Timing header when sampled."""
+
+    def __init__(self, api_base: str, *, timeout: float = 30.0):
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+
+    def get(self, path: str, request_id: str) -> tuple[int, int | None]:
+        req = urllib_request.Request(self.api_base + path, headers={"x-bench-request-id": request_id})
+        try:
+            with urllib_request.urlopen(req, timeout=self.timeout) as response:
+                response.read()
+                return response.status, _server_timing_query_count(response.headers.get("Server-Timing"))
+        except HTTPError as exc:
+            return exc.code, _server_timing_query_count(exc.headers.get("Server-Timing"))
+        except URLError:
+            return 0, None
+
+    def close(self) -> None:
+        return None
+
+
+def drive_endpoint(driver, name: str, path_for: Callable[[int], str], *, requests: int, concurrency: int) -> dict:
+    def one(index: int) -> dict[str, Any]:
+        started = time.perf_counter()
+        status, query_count = driver.get(path_for(index), f"{name}-{index}")
+        return {
+            "status": status,
+            "latency_ms": (time.perf_counter() - started) * 1000.0,
+            "query_count": query_count,
+        }
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        samples = list(pool.map(one, range(requests)))
+    return summarize_samples(samples, elapsed_sec=time.perf_counter() - started)
+
+
+def seed_database(database_url: str, records: list[dict[str, Any]], *, review_items: int, batch_size: int) -> dict:
+    from app.models.schemas import IngestPayload
+    from app.services.ingest_service import ingest_payload
+    from app.services.repository import PostgresRepository
+    from app.services.trend_series import rebuild_trend_series_days
+
+    started = time.perf_counter()
+    processed = errors = 0
+    with psycopg.connect(database_url, row_factory=dict_row) as conn:
+        repo = PostgresRepository(conn)
+        for start in range(0, len(records), batch_size):
+            payload = IngestPayload.model_validate(
+                {"run_type": "benchmark_seed", "extractor_version": "bench-v1", "records": records[start : start + batch_size]}
+            )
+            result = ingest_payload(payload, repo)
+            processed += result.processed_count
+            errors += result.error_count
+
+        regions = list(COMMON_CODE_REGIONS)
+        for index in range(review_items):
+            repo.insert_review_queue(
+                entity_type="ingest_record",
+                entity_id=f"bench-review-{regions[index % len(regions)]}-{index}",
+                issue_type=REVIEW_ISSUE_TYPES[index % len(REVIEW_ISSUE_TYPES)],
+                review_note=f"benchmark seed {index}",
+            )
+
+        trend_result = rebuild_trend_series_days(repo, repo.fetch_trend_series_day_keys())
+        if not trend_result.failed_days:
+            repo.mark_trend_series_backfilled()
+
+    return {
+        "elapsed_sec": round(time.perf_counter() - started, 2),
+        "processed_count": processed,
+        "error_count": errors,
+        "review_items": review_items,
+        "trend_series_backfilled": not trend_result.failed_days,
+    }
+
+
+def main() -> int:
+    from app.services.encoded_response_cache import clear_encoded_response_cache
+    from app.services.repository import clear_api_read_cache
+    from app.services.summary_selection_cache import clear_summary_selection_cache
+    from scripts.init_db import run_schema
+    from scripts.qa.run_db_equivalence import (
+        create_isolated_remote_db,
+        drop_isolated_remote_db,
+        ensure_runtime_env,
+        redact_dsn,
+        resolve_database_url,
+    )
+
+    args = parse_args()
+    db_url = resolve_database_url(args.target)
+    working_db_url = db_url
+    isolated_db_name: str | None = None
+    if args.isolated_db and not args.skip_seed:
+        working_db_url, isolated_db_name = create_isolated_remote_db(db_url)
+    ensure_runtime_env(working_db_url)
+
+    records = build_seed_records(observations=args.observations, seed=args.seed)
+    report: dict[str, Any] = {
+        "scenario": SCENARIO,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database_url": redact_dsn(working_db_url),
+        "inputs": {
+            "regions": len(COMMON_CODE_REGIONS),
+            "observations": args.observations,
+            "review_items": args.review_items,
+            "seed": args.seed,
+            "driver": "http" if args.api_base else "in_process",
+            "concurrency": args.concurrency,
+            "requests_per_endpoint": args.requests,
+        },
+        "status": "running",
+    }
+    driver = None
+    try:
+        if not args.skip_seed:
+            run_schema(ROOT / "db" / "schema.sql")
+            report["seed"] = seed_database(
+                working_db_url,
+                records,
+                review_items=args.review_items,
+                batch_size=args.seed_batch_size,
+            )
+
+        driver = HttpDriver(args.api_base) if args.api_base else InProcessDriver(working_db_url)
+        endpoints: dict[str, Any] = {}
+        for name, path_for in build_endpoint_plan(records):
+            clear_api_read_cache()
+            clear_encoded_response_cache()
+            clear_summary_selection_cache()
+            endpoints[name] = drive_endpoint(
+                driver,
+                name,
+                path_for,
+                requests=args.requests,
+                concurrency=args.concurrency,
+            )
+        report["endpoints"] = endpoints
+        report["status"] = "ok"
+    except Exception as exc:  # noqa: BLE001
+        report["status"] = "failed"
+        report["error"] = f"{exc.__class__.__name__}: {exc}"
+    finally:
+        if driver is not None:
+            driver.close()
+        if isolated_db_name:
+            drop_isolated_remote_db(db_url, isolated_db_name)
+
+    path = Path(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(report.get("endpoints") or report, ensure_ascii=False, indent=2))
+    return 0 if report["status"] == "ok" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+from hashlib import sha256
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.request_metrics import percentile
+from src.pipeline.collector import CollectorOutput, PollCollector
+from src.pipeline.contracts import Article, stable_id
+from src.pipeline.ingest_adapter import collector_output_to_ingest_payload
+
+SCENARIO = "collector_recorded_corpus_v1"
+STAGES = ("classify", "pre_extract_gate", "extract", "ingest_payload")
+DEFAULT_CORPUS_GLOB = "data/collector_*.json"
+DEFAULT_BASELINE = "data/collector_benchmark_baseline.json"
+# Metrics compared against the baseline and the direction that counts as a regression.
+HIGHER_IS_BETTER = {"articles_per_sec": True, "p50_ms": False, "p99_ms": False}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay recorded collector articles and measure throughput")
+    parser.add_argument("--corpus-glob", default=DEFAULT_CORPUS_GLOB, help="packs with articles[] or records[].article")
+    parser.add_argument("--limit", type=int, default=0, help="cap corpus size (0 = all)")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown before failing")
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--report", default="data/collector_benchmark_report.json")
+    return parser.parse_args()
+
+
+def _resolve(path: str) -> Path:
+    """Relative report/baseline paths are anchored at the repo root, like the corpus glob."""
+    resolved = Path(path)
+    return resolved if resolved.is_absolute() else ROOT / resolved
+
+
+def _article_from_row(row: dict) -> Article | None:
+    raw_text = row.get("raw_text")
+    url = row.get("url")
+    if not isinstance(raw_text, str) or not raw_text.strip() or not url:
+        return None
+    raw_hash = row.get("raw_hash") or sha256(raw_text.encode("utf-8")).hexdigest()
+    return Article(
+        id=row.get("id") or stable_id("art", url, raw_hash),
+        url=url,
+        title=row.get("title") or "",
+        publisher=row.get("publisher") or "",
+        published_at=row.get("published_at"),
+        snippet=row.get("snippet") or raw_text[:220],
+        collected_at=row.get("collected_at") or "2026-01-01T00:00:00+00:00",
+        raw_hash=raw_hash,
+        raw_text=raw_text,
+    )
+
+
+def load_corpus(paths: list[Path], *, limit: int = 0) -> list[Article]:
+    """Unique articles (by raw_hash) from recorded collector packs, in file order."""
+    articles: list[Article] = []
+    seen: set[str] = set()
+    for path in paths:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(doc, dict):
+            continue
+        rows = list(doc.get("articles") or [])
+        rows += [record.get("article") or {} for record in doc.get("records") or [] if isinstance(record, dict)]
+        for row in rows:
+            article = _article_from_row(row) if isinstance(row, dict) else None
+            if article is None or article.raw_hash in seen:
+                continue
+            seen.add(article.raw_hash)
+            articles.append(article)
+            if limit and len(articles) >= limit:
+                return articles
+    return articles
+
+
+def corpus_digest(articles: list[Article]) -> str:
+    return sha256("\n".join(article.raw_hash for article in articles).encode("utf-8")).hexdigest()[:16]
+
+
+def replay_article(collector: PollCollector, article: Article, stage_sec: dict[str, float]) -> int:
+    """Run one article through the collector stages like PollCollector.run; returns ingest record count."""
+    started = time.perf_counter()
+    label, _confidence = collector.classify(article.raw_text)
+    stage_sec["classify"] += time.perf_counter() - started
+    if label != "POLL_REPORT":
+        return 0
+
+    started = time.perf_counter()
+    gate_passed, _reason = collector.pre_extract_gate(article)
+    stage_sec["pre_extract_gate"] += time.perf_counter() - started
+    if not gate_passed:
+        return 0
+
+    started = time.perf_counter()
+    observations, options, errors = collector.extract(article)
+    stage_sec["extract"] += time.perf_counter() - started
+
+    started = time.perf_counter()
+    output = CollectorOutput(
+        articles=[article],
+        poll_observations=observations,
+        poll_options=options,
+        review_queue=errors,
+    )
+    payload = collector_output_to_ingest_payload(output)
+    stage_sec["ingest_payload"] += time.perf_counter() - started
+    return len(payload["records"])
+
+
+def _peak_memory_kib(collector: PollCollector, articles: list[Article]) -> float:
+    # Separate pass so tracemalloc overhead does not distort the timings.
+    scratch = {stage: 0.0 for stage in STAGES}
+    tracemalloc.start()
+    try:
+        for article in articles:
+            replay_article(collector, article, scratch)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024.0, 1)
+
+
+def run_benchmark(articles: list[Article], *, iterations: int, warmup: int) -> dict[str, Any]:
+    collector = PollCollector()
+    for _ in range(max(warmup, 0)):
+        scratch = {stage: 0.0 for stage in STAGES}
+        for article in articles:
+            replay_article(collector, article, scratch)
+
+    latencies: list[float] = []
+    stage_sec = {stage: 0.0 for stage in STAGES}
+    record_count = 0
+    started = time.perf_counter()
+    for _ in range(max(iterations, 1)):
+        record_count = 0
+        for article in articles:
+            article_started = time.perf_counter()
+            record_count += replay_article(collector, article, stage_sec)
+            latencies.append(time.perf_counter() - article_started)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    processed = len(latencies)
+    return {
+        "article_count": len(articles),
+        "iterations": max(iterations, 1),
+        "ingest_record_count": record_count,
+        "elapsed_sec": round(elapsed, 4),
+        "articles_per_sec": round(processed / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000.0, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000.0, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000.0, 3) if latencies else 0.0,
+        "peak_memory_kib": _peak_memory_kib(collector, articles),
+        "stage_sec": {stage: round(value, 4) for stage, value in stage_sec.items()},
+        "stage_share": {
+            stage: round(value / sum(stage_sec.values()), 4) if sum(stage_sec.values()) else 0.0
+            for stage, value in stage_sec.items()
+        },
+    }
+
+
+def compare_with_baseline(results: dict[str, Any], baseline: dict[str, Any] | None, *, threshold: float) -> dict:
+    if not baseline:
+        return {"status": "no_baseline", "regressions": []}
+    if baseline.get("corpus_digest") != results.get("corpus_digest"):
+        return {"status": "corpus_mismatch", "regressions": []}
+
+    regressions = []
+    for metric, higher_is_better in HIGHER_IS_BETTER.items():
+        current = results.get(metric)
+        previous = (baseline.get("results") or {}).get(metric)
+        if not current or not previous:
+            continue
+        change = (current - previous) / previous
+        if (higher_is_better and change < -threshold) or (not higher_is_better and change > threshold):
+            regressions.append(
+                {"metric": metric, "baseline": previous, "current": current, "change": round(change, 4)}
+            )
+    return {"status": "regression" if regressions else "ok", "threshold": threshold, "regressions": regressions}
+
+
+def main() -> int:
+    args = parse_args()
+    paths = sorted(ROOT.glob(args.corpus_glob))
+    articles = load_corpus(paths, limit=args.limit)
+    if not articles:
+        print(f"no articles found for {args.corpus_glob}")
+        return 1
+
+    results = run_benchmark(articles, iterations=args.iterations, warmup=args.warmup)
+    results["corpus_digest"] = corpus_digest(articles)
+
+    baseline_path = _resolve(args.baseline)
+    baseline = None
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    comparison = compare_with_baseline(results, baseline, threshold=args.threshold)
+
+    report = {
+        "scenario": SCENARIO,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "inputs": {
+            "corpus_glob": args.corpus_glob,
+            "corpus_files": [str(path.relative_to(ROOT)) for path in paths],
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+        },
+        "corpus_digest": results["corpus_digest"],
+        "results": results,
+        "baseline_comparison": comparison,
+    }
+    path = _resolve(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.write_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print(json.dumps({"results": results, "baseline_comparison": comparison}, ensure_ascii=False, indent=2))
+    return 1 if comparison["status"] == "regression" else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.errors import DuplicateConflictError
+from app.services.fingerprint import build_poll_fingerprint, merge_observation_by_priority
+from app.services.repository import PostgresRepository
+
+SCENARIO = "article_nesdc_mixed_ingest_v1"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark per-row vs bulk poll fingerprint merge")
+    parser.add_argument("--polls", type=int, default=2000, help="distinct polls (each seen via article and nesdc)")
+    parser.add_argument("--reingest-rounds", type=int, default=2)
+    parser.add_argument("--conflict-every", type=int, default=50, help="every Nth nesdc row disagrees on office_type")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--roundtrip-ms", type=float, default=0.5, help="simulated latency per statement")
+    parser.add_argument("--report", default="data/fingerprint_merge_benchmark_report.json")
+    return parser.parse_args()
+
+
+def build_observations(*, polls: int, conflict_every: int) -> list[dict]:
+    """Article rows first, then the overlapping NESDC registrations, like a backfill."""
+    base_day = date(2026, 2, 1)
+    articles: list[dict] = []
+    nesdc: list[dict] = []
+    for index in range(polls):
+        end_date = base_day + timedelta(days=index % 28)
+        core = {
+            "pollster": f"조사기관{index % 40}",
+            "sponsor": f"의뢰처{index % 17}",
+            "survey_start_date": (end_date - timedelta(days=2)).isoformat(),
+            "survey_end_date": end_date.isoformat(),
+            "region_code": f"{11 + index % 17}-000",
+            "sample_size": 800 + index,
+            "method": "전화면접",
+            "office_type": "광역자치단체장",
+            "matchup_id": f"20260603|광역자치단체장|{11 + index % 17}-000",
+        }
+        fingerprint = build_poll_fingerprint(core)
+        articles.append(
+            {
+                **core,
+                "observation_key": f"article-{index}",
+                "survey_name": f"기사 기반 조사 {index}",
+                "margin_of_error": 3.1,
+                "poll_fingerprint": fingerprint,
+                "source_channel": "article",
+                "verified": False,
+                "source_grade": "C",
+            }
+        )
+        nesdc_row = {
+            **core,
+            "observation_key": f"nesdc-{index}",
+            "survey_name": f"NESDC 등록 {index}",
+            "confidence_level": 95.0,
+            "response_rate": 10.5,
+            "poll_fingerprint": fingerprint,
+            "source_channel": "nesdc",
+            "verified": True,
+            "source_grade": "A",
+        }
+        if conflict_every and index % conflict_every == 0:
+            nesdc_row["office_type"] = "기초자치단체장"
+        nesdc.append(nesdc_row)
+    return articles + nesdc
+
+
+class _BenchCursor:
+    def __init__(self, conn: "_BenchConn"):
+        self.conn = conn
+        self._rows: list[dict] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query: str, params: Any = None) -> None:
+        self.conn.statement_count += 1
+        if self.conn.roundtrip_sec:
+            time.sleep(self.conn.roundtrip_sec)
+        if "FROM poll_observations" in query and "poll_fingerprint = %s" in query:
+            row = self.conn.by_fingerprint.get(params[0])
+            self._rows = [dict(row)] if row else []
+        elif "INSERT INTO poll_observations" in query:
+            column_list = query.split("INSERT INTO poll_observations (", 1)[1].split(")", 1)[0]
+            columns = [column.strip() for column in column_list.split(",")]
+            if isinstance(params, dict):
+                payloads = [{column: params.get(column) for column in columns}]
+            else:
+                width = len(columns)
+                payloads = [dict(zip(columns, params[i : i + width])) for i in range(0, len(params), width)]
+            if "ON CONFLICT (poll_fingerprint)" in query:
+                rows = [self.conn.upsert_by_fingerprint(payload) for payload in payloads]
+                self._rows = [row for row in rows if row is not None]
+            else:
+                self._rows = [self.conn.upsert(payload) for payload in payloads]
+        else:
+            self._rows = []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _BenchConn:
+    """In-memory stand-in that counts statements.
+
+    observation_key ON CONFLICT is modelled as replace; the poll_fingerprint arbiter applies
+    the same priority merge as the SQL clause and returns no row on a core-field mismatch.
+    """
+
+    def __init__(self, *, roundtrip_ms: float):
+        self.roundtrip_sec = max(roundtrip_ms, 0.0) / 1000.0
+        self.statement_count = 0
+        self.by_key: dict[str, dict] = {}
+        self.by_fingerprint: dict[str, dict] = {}
+        self._next_id = 1
+
+    def upsert(self, payload: dict) -> dict:
+        key = payload["observation_key"]
+        current = self.by_key.get(key)
+        row = dict(payload, id=current["id"] if current else self._next_id)
+        if current is None:
+            self._next_id += 1
+        self.by_key[key] = row
+        if row.get("poll_fingerprint"):
+            self.by_fingerprint[row["poll_fingerprint"]] = row
+        return {"id": row["id"], "observation_key": key, "poll_fingerprint": row.get("poll_fingerprint")}
+
+    def upsert_by_fingerprint(self, payload: dict) -> dict | None:
+        existing = self.by_fingerprint.get(payload["poll_fingerprint"])
+        if existing is None:
+            return self.upsert(payload)
+        try:
+            merged = merge_observation_by_priority(existing=existing, incoming=payload)
+        except DuplicateConflictError:
+            return None
+        return self.upsert(merged)
+
+    def cursor(self):
+        return _BenchCursor(self)
+
+    def commit(self):
+        return None
+
+    def rollback(self):
+        return None
+
+
+def _run_per_row(observations: list[dict], *, rounds: int, roundtrip_ms: float) -> dict[str, Any]:
+    conn = _BenchConn(roundtrip_ms=roundtrip_ms)
+    repo = PostgresRepository(conn)
+    conflicts = 0
+    started = time.perf_counter()
+    for run_id in range(1, rounds + 1):
+        for observation in observations:
+            try:
+                repo.upsert_poll_observation(observation, article_id=1, ingestion_run_id=run_id)
+            except DuplicateConflictError:
+                conflicts += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsed_sec": round(elapsed, 4),
+        "statement_count": conn.statement_count,
+        "observation_count": len(conn.by_key),
+        "duplicate_conflict_count": conflicts,
+    }
+
+
+def _run_bulk(
+    observations: list[dict],
+    *,
+    rounds: int,
+    batch_size: int,
+    roundtrip_ms: float,
+) -> dict[str, Any]:
+    conn = _BenchConn(roundtrip_ms=roundtrip_ms)
+    repo = PostgresRepository(conn)
+    conflicts = 0
+    started = time.perf_counter()
+    for run_id in range(1, rounds + 1):
+        for start in range(0, len(observations), batch_size):
+            batch = observations[start : start + batch_size]
+            result = repo.bulk_upsert_poll_observations(
+                batch,
+                article_ids=[1] * len(batch),
+                ingestion_run_id=run_id,
+            )
+            conflicts += len(result["conflicts"])
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsed_sec": round(elapsed, 4),
+        "statement_count": conn.statement_count,
+        "observation_count": len(conn.by_key),
+        "duplicate_conflict_count": conflicts,
+    }
+
+
+def run_benchmark(
+    *,
+    polls: int,
+    reingest_rounds: int,
+    conflict_every: int,
+    batch_size: int,
+    roundtrip_ms: float,
+) -> dict[str, Any]:
+    observations = build_observations(polls=polls, conflict_every=conflict_every)
+    per_row = _run_per_row(
+        observations,
+        rounds=reingest_rounds,
+        roundtrip_ms=roundtrip_ms,
+    )
+    bulk = _run_bulk(
+        observations,
+        rounds=reingest_rounds,
+        batch_size=batch_size,
+        roundtrip_ms=roundtrip_ms,
+    )
+    speedup = per_row["elapsed_sec"] / bulk["elapsed_sec"] if bulk["elapsed_sec"] else None
+    return {
+        "scenario": SCENARIO,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "inputs": {
+            "source_channels": ["article", "nesdc"],
+            "polls": polls,
+            "observations_per_round": len(observations),
+            "reingest_rounds": reingest_rounds,
+            "conflict_every": conflict_every,
+            "batch_size": batch_size,
+            "roundtrip_ms": roundtrip_ms,
+        },
+        "results": {
+            "per_row": per_row,
+            "bulk": bulk,
+            "speedup": round(speedup, 2) if speedup else None,
+            "observation_count_matches": per_row["observation_count"] == bulk["observation_count"],
+            "duplicate_increase": bulk["observation_count"] - polls,
+        },
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    report = run_benchmark(
+        polls=args.polls,
+        reingest_rounds=args.reingest_rounds,
+        conflict_every=args.conflict_every,
+        batch_size=args.batch_size,
+        roundtrip_ms=args.roundtrip_ms,
+    )
+    path = Path(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(json.dumps(report["results"], ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
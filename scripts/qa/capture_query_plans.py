@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from datetime import date, datetime, timezone
+import difflib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SCENARIO = "repository_read_query_plans_v1"
+DEFAULT_BASELINE = "data/query_plan_baselines.json"
+# Large tables where a new sequential scan is treated as a plan regression.
+WATCHED_RELATIONS = ("poll_observations", "poll_options", "review_queue", "articles", "candidates")
+
+# Repository read methods exercised against the seeded DB: (method name, kwargs builder).
+READ_METHOD_CALLS: list[tuple[str, Callable[[dict[str, Any]], dict[str, Any]]]] = [
+    ("fetch_dashboard_summary", lambda ctx: {"as_of": None}),
+    ("fetch_dashboard_map_latest", lambda ctx: {"as_of": None, "limit": 100}),
+    ("fetch_dashboard_big_matches", lambda ctx: {"as_of": None, "limit": 3}),
+    ("fetch_dashboard_quality", lambda ctx: {}),
+    ("fetch_trends", lambda ctx: {"metric": "party_support", "scope": "national", "region_code": None, "days": 30}),
+    ("fetch_trend_series", lambda ctx: {"metric": "party_support", "scope": "national", "region_code": None, "days": 30}),
+    ("search_regions", lambda ctx: {"query": ctx["region_query"], "limit": 20}),
+    ("search_regions_by_code", lambda ctx: {"region_code": ctx["region_code"], "limit": 20}),
+    ("fetch_region_elections", lambda ctx: {"region_code": ctx["region_code"]}),
+    ("fetch_region_elections_batch", lambda ctx: {"sido_code": ctx["sido_code"]}),
+    ("get_matchup", lambda ctx: {"matchup_id": ctx["matchup_id"]}),
+    ("fetch_matchup_snapshot", lambda ctx: {"matchup_id": ctx["matchup_id"]}),
+    ("get_candidate", lambda ctx: {"candidate_id": ctx["candidate_id"]}),
+    ("fetch_incumbent_candidates", lambda ctx: {"region_code": ctx["region_code"], "office_type": ctx["office_type"]}),
+    ("fetch_ops_ingestion_metrics", lambda ctx: {"window_hours": 24}),
+    ("fetch_ops_review_metrics", lambda ctx: {"window_hours": 24}),
+    ("fetch_ops_failure_distribution", lambda ctx: {"window_hours": 24}),
+    ("fetch_ops_coverage_summary", lambda ctx: {}),
+    ("fetch_review_queue_items", lambda ctx: {"status": "pending", "limit": 50}),
+    ("fetch_review_queue_stats", lambda ctx: {"window_hours": 24}),
+    ("fetch_review_queue_trends", lambda ctx: {"window_hours": 24}),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Capture EXPLAIN plans for repository reads and diff against baselines")
+    parser.add_argument("--target", choices=["local", "remote"], default="local")
+    parser.add_argument("--isolated-db", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--observations", type=int, default=5000)
+    parser.add_argument("--review-items", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=20260603)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--report", default="data/query_plan_report.json")
+    return parser.parse_args()
+
+
+def plan_shape(plan: Any) -> list[str]:
+    """Indented node outline (node type, relation, index, join) with costs and timings dropped."""
+    root = plan[0] if isinstance(plan, list) and plan else plan
+    if isinstance(root, dict) and "Plan" in root:
+        root = root["Plan"]
+    lines: list[str] = []
+
+    def walk(node: dict, depth: int) -> None:
+        label = str(node.get("Node Type") or "?")
+        if node.get("Join Type"):
+            label = f"{node['Join Type']} {label}"
+        if node.get("Index Name"):
+            label += f" using {node['Index Name']}"
+        if node.get("Relation Name"):
+            label += f" on {node['Relation Name']}"
+        lines.append("  " * depth + label)
+        for child in node.get("Plans") or []:
+            walk(child, depth + 1)
+
+    if isinstance(root, dict):
+        walk(root, 0)
+    return lines
+
+
+def seq_scans(shape: list[str]) -> set[str]:
+    return {
+        relation
+        for line in shape
+        for relation in WATCHED_RELATIONS
+        if line.strip().startswith("Seq Scan") and line.strip().endswith(f" on {relation}")
+    }
+
+
+def group_plans(captured: list[dict[str, Any]]) -> dict[str, list[list[str]]]:
+    plans: dict[str, list[list[str]]] = {}
+    for entry in captured:
+        if entry.get("plan") is None:
+            continue
+        plans.setdefault(entry["method"], []).append(plan_shape(entry["plan"]))
+    return plans
+
+
+def diff_plans(baseline: dict[str, list[list[str]]], current: dict[str, list[list[str]]]) -> dict[str, dict]:
+    """Per-method status: ok / changed / new / missing, with a unified diff and new watched seq scans."""
+    out: dict[str, dict] = {}
+    for method in sorted(set(baseline) | set(current)):
+        if method not in baseline:
+            out[method] = {"status": "new", "diff": [], "new_seq_scans": []}
+            continue
+        if method not in current:
+            out[method] = {"status": "missing", "diff": [], "new_seq_scans": []}
+            continue
+        before = [line for shape in baseline[method] for line in shape + ["--"]]
+        after = [line for shape in current[method] for line in shape + ["--"]]
+        diff = list(difflib.unified_diff(before, after, "baseline", "current", lineterm="", n=1))
+        new_scans = set().union(*(seq_scans(s) for s in current[method])) - set().union(
+            *(seq_scans(s) for s in baseline[method])
+        )
+        out[method] = {
+            "status": "changed" if diff else "ok",
+            "diff": diff,
+            "new_seq_scans": sorted(new_scans),
+        }
+    return out
+
+
+def _call_context(records: list[dict[str, Any]]) -> dict[str, Any]:
+    local = next(record for record in records if record["candidates"])
+    region_code = local["region"]["region_code"]
+    return {
+        "region_code": region_code,
+        "sido_code": f"{region_code[:2]}-000",
+        "region_query": local["region"]["sido_name"][:2],
+        "matchup_id": local["observation"]["matchup_id"],
+        "office_type": local["observation"]["office_type"],
+        "candidate_id": local["candidates"][0]["candidate_id"],
+    }
+
+
+def capture_repository_plans(database_url: str, context: dict[str, Any]) -> tuple[dict[str, list[list[str]]], dict]:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    from app.services.repository import PostgresRepository, clear_api_read_cache
+    from app.services.request_metrics import InstrumentedCursor
+    from app.services.slow_query_log import capture_query_plans
+
+    errors: dict[str, str] = {}
+    captured_all: list[dict[str, Any]] = []
+    with psycopg.connect(database_url, row_factory=dict_row, cursor_factory=InstrumentedCursor) as conn:
+        repo = PostgresRepository(conn)
+        for method, build_kwargs in READ_METHOD_CALLS:
+            clear_api_read_cache()
+            with capture_query_plans() as captured:
+                try:
+                    getattr(repo, method)(**build_kwargs(context))
+                except Exception as exc:  # noqa: BLE001
+                    conn.rollback()
+                    errors[method] = f"{exc.__class__.__name__}: {exc}"
+            captured_all.extend(captured)
+    return group_plans(captured_all), errors
+
+
+def main() -> int:
+    from scripts.init_db import run_schema
+    from scripts.qa.benchmark_api_load import build_seed_records, seed_database
+    from scripts.qa.run_db_equivalence import (
+        create_isolated_remote_db,
+        drop_isolated_remote_db,
+        ensure_runtime_env,
+        redact_dsn,
+        resolve_database_url,
+    )
+
+    args = parse_args()
+    db_url = resolve_database_url(args.target)
+    working_db_url, isolated_db_name = db_url, None
+    if args.isolated_db and not args.skip_seed:
+        working_db_url, isolated_db_name = create_isolated_remote_db(db_url)
+    ensure_runtime_env(working_db_url)
+
+    # Fixed anchor date keeps the seeded distribution, and so the plans, reproducible.
+    records = build_seed_records(observations=args.observations, seed=args.seed, today=date(2026, 3, 1))
+    try:
+        if not args.skip_seed:
+            run_schema(ROOT / "db" / "schema.sql")
+            seed_database(working_db_url, records, review_items=args.review_items, batch_size=250)
+        plans, errors = capture_repository_plans(working_db_url, _call_context(records))
+    finally:
+        if isolated_db_name:
+            drop_isolated_remote_db(db_url, isolated_db_name)
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("plans") or {}
+    comparison = diff_plans(baseline, plans) if baseline is not None else {}
+    regressions = sorted(method for method, row in comparison.items() if row["new_seq_scans"])
+
+    report = {
+        "scenario": SCENARIO,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "database_url": redact_dsn(working_db_url),
+        "inputs": {"observations": args.observations, "review_items": args.review_items, "seed": args.seed},
+        "method_errors": errors,
+        "baseline": str(baseline_path) if baseline is not None else None,
+        "changed_methods": sorted(method for method, row in comparison.items() if row["status"] != "ok"),
+        "seq_scan_regressions": regressions,
+        "comparison": comparison,
+        "plans": plans,
+    }
+    path = Path(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.write_baseline:
+        baseline_doc = {"scenario": SCENARIO, "generated_at": report["generated_at"], "plans": plans}
+        baseline_path.write_text(json.dumps(baseline_doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    print(
+        json.dumps(
+            {key: report[key] for key in ("method_errors", "changed_methods", "seq_scan_regressions")},
+            ensure_ascii=False,
+            indent=2,
+        )
+    )
+    return 1 if errors or regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
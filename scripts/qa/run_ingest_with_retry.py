@@ -6,16 +6,26 @@ import json
 import os
 import re
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from hashlib import sha256
 from pathlib import Path
+from types import SimpleNamespace
 
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app.jobs.ingest_runner import run_ingest_with_retry, write_runner_report
+from app.jobs.ingest_runner import (
+    default_request_fn,
+    gzip_request_fn,
+    run_chunked_ingest,
+    run_ingest_job_polling,
+    run_ingest_with_retry,
+    split_ingest_payload,
+    write_runner_report,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,6 +44,16 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--dead-letter-dir", default="data/dead_letter")
     parser.add_argument("--disable-dead-letter", action="store_true")
     parser.add_argument("--allow-partial-success", action="store_true")
+    parser.add_argument("--async-job", action="store_true", help="enqueue via /jobs/ingest-jobs and poll the job")
+    parser.add_argument("--idempotency-key", default=None, help="defaults to the payload digest")
+    parser.add_argument("--poll-interval-seconds", type=float, default=5.0)
+    parser.add_argument("--poll-timeout-seconds", type=float, default=1800.0)
+    parser.add_argument("--chunked", action="store_true", help="send size-bounded chunks, retrying only failed chunks")
+    parser.add_argument("--max-chunk-bytes", type=int, default=1_000_000)
+    parser.add_argument("--max-chunk-records", type=int, default=200)
+    parser.add_argument("--chunk-concurrency", type=int, default=4)
+    parser.add_argument("--ack-state", default=None, help="chunk ack file; acked chunks are skipped on rerun")
+    parser.add_argument("--gzip", action="store_true", help="send request bodies with Content-Encoding: gzip")
     return parser.parse_args()
 
 
@@ -59,10 +79,13 @@ def write_dead_letter_record(
     payload: dict,
     result,
     report_path: str,
+    chunk_id: str | None = None,
 ) -> Path:
     out_dir = Path(dead_letter_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     failure_fragment = _safe_filename_fragment(result.failure_type or result.failure_class)
+    if chunk_id:
+        failure_fragment = f"{failure_fragment}_chunk_{_safe_filename_fragment(chunk_id)}"
     output_path = out_dir / f"ingest_dead_letter_{_utc_timestamp_compact()}_{failure_fragment}.json"
     record = {
         "created_at": datetime.now(timezone.utc).isoformat(),
@@ -75,10 +98,61 @@ def write_dead_letter_record(
         "payload": payload,
         "status": "pending",
     }
+    if chunk_id:
+        record["chunk_id"] = chunk_id
     output_path.write_text(json.dumps(record, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
     return output_path
 
 
+def load_acked_chunk_ids(path: str | Path | None) -> set[str]:
+    if not path or not Path(path).exists():
+        return set()
+    state = json.loads(Path(path).read_text(encoding="utf-8"))
+    return set(state.get("acked_chunk_ids") or [])
+
+
+def save_acked_chunk_ids(path: str | Path, acked: set[str]) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    state = {"updated_at": datetime.now(timezone.utc).isoformat(), "acked_chunk_ids": sorted(acked)}
+    target.write_text(json.dumps(state, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def write_chunk_dead_letters(
+    *,
+    dead_letter_dir: str | Path,
+    source_input_path: str,
+    payload: dict,
+    result,
+    report_path: str,
+    max_chunk_bytes: int,
+    max_chunk_records: int,
+) -> list[Path]:
+    """One dead letter per failed chunk, each holding only that chunk's payload."""
+    failed = {row["chunk_id"] for row in result.chunks or [] if row["status"] == "failed"}
+    paths = []
+    for chunk in split_ingest_payload(payload, max_chunk_bytes=max_chunk_bytes, max_chunk_records=max_chunk_records):
+        if chunk.chunk_id not in failed:
+            continue
+        chunk_row = next(row for row in result.chunks if row["chunk_id"] == chunk.chunk_id)
+        chunk_result = SimpleNamespace(
+            failure_class=chunk_row.get("failure_class"),
+            failure_type=chunk_row.get("failure_class"),
+            failure_reason=chunk_row.get("failure_reason"),
+        )
+        paths.append(
+            write_dead_letter_record(
+                dead_letter_dir=dead_letter_dir,
+                source_input_path=source_input_path,
+                payload=chunk.payload,
+                result=chunk_result,
+                report_path=report_path,
+                chunk_id=chunk.chunk_id,
+            )
+        )
+    return paths
+
+
 def is_effective_success(result, *, allow_partial_success: bool) -> bool:
     if result.success:
         return True
@@ -232,18 +306,62 @@ def main() -> int:
         flush=True,
     )
 
-    result = run_ingest_with_retry(
-        api_base_url=args.api_base,
-        token=token,
-        payload=payload,
-        max_retries=args.max_retries,
-        backoff_seconds=args.backoff_seconds,
-        request_timeout=args.timeout,
-        timeout_scale_on_timeout=args.timeout_scale_on_timeout,
-        timeout_max=args.timeout_max,
-        heartbeat_interval_seconds=args.heartbeat_interval_seconds,
-        event_log_fn=_emit_heartbeat,
-    )
+    request_fn = gzip_request_fn if args.gzip else default_request_fn
+    if args.chunked:
+        acked = load_acked_chunk_ids(args.ack_state)
+        ack_lock = threading.Lock()
+
+        def _on_chunk_ack(chunk, _result) -> None:
+            if not args.ack_state:
+                return
+            with ack_lock:
+                acked.add(chunk.chunk_id)
+                save_acked_chunk_ids(args.ack_state, acked)
+
+        result = run_chunked_ingest(
+            api_base_url=args.api_base,
+            token=token,
+            payload=payload,
+            max_chunk_bytes=args.max_chunk_bytes,
+            max_chunk_records=args.max_chunk_records,
+            concurrency=args.chunk_concurrency,
+            acked_chunk_ids=acked,
+            on_chunk_ack=_on_chunk_ack,
+            max_retries=args.max_retries,
+            request_fn=request_fn,
+            backoff_seconds=args.backoff_seconds,
+            request_timeout=args.timeout,
+            timeout_scale_on_timeout=args.timeout_scale_on_timeout,
+            timeout_max=args.timeout_max,
+            heartbeat_interval_seconds=0,
+        )
+    elif args.async_job:
+        result = run_ingest_job_polling(
+            api_base_url=args.api_base,
+            token=token,
+            payload=payload,
+            idempotency_key=args.idempotency_key or f"ingest-{_payload_digest(payload)}",
+            max_retries=args.max_retries,
+            request_fn=request_fn,
+            backoff_seconds=args.backoff_seconds,
+            poll_interval_seconds=args.poll_interval_seconds,
+            poll_timeout_seconds=args.poll_timeout_seconds,
+            event_log_fn=_emit_heartbeat,
+        )
+    else:
+        result = run_ingest_with_retry(
+            api_base_url=args.api_base,
+            token=token,
+            payload=payload,
+            max_retries=args.max_retries,
+            request_fn=request_fn,
+            backoff_seconds=args.backoff_seconds,
+            request_timeout=args.timeout,
+            timeout_scale_on_timeout=args.timeout_scale_on_timeout,
+            timeout_max=args.timeout_max,
+            heartbeat_interval_seconds=args.heartbeat_interval_seconds,
+            event_log_fn=_emit_heartbeat,
+        )
     write_runner_report(args.report, result)
     success = is_effective_success(result, allow_partial_success=args.allow_partial_success)
     output = {
@@ -271,7 +389,20 @@ def main() -> int:
 
     dead_letter_path: str | None = None
     artifact_path: str | None = None
-    if not success and not args.disable_dead_letter:
+    if not success and not args.disable_dead_letter and result.chunks is not None:
+        chunk_dead_letters = write_chunk_dead_letters(
+            dead_letter_dir=args.dead_letter_dir,
+            source_input_path=args.input,
+            payload=payload,
+            result=result,
+            report_path=args.report,
+            max_chunk_bytes=args.max_chunk_bytes,
+            max_chunk_records=args.max_chunk_records,
+        )
+        output["chunk_dead_letter_paths"] = [str(path) for path in chunk_dead_letters]
+        dead_letter_path = str(chunk_dead_letters[0]) if chunk_dead_letters else None
+        output["dead_letter_path"] = dead_letter_path
+    elif not success and not args.disable_dead_letter:
         dead_letter_path = write_dead_letter_record(
             dead_letter_dir=args.dead_letter_dir,
             source_input_path=args.input,
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from hashlib import sha256
+import json
+import os
+import socket
+import subprocess
+import sys
+from threading import Lock
+import time
+from pathlib import Path
+from typing import Any, Callable
+from urllib import request as urllib_request
+from urllib.error import URLError
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+SUITE = "qa_parallel_gate"
+LOG_TAIL_LINES = 40
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run independent QA gate checks concurrently")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--with-db", action="store_true", help="seed one DB and run DB/live-server checks against it")
+    parser.add_argument("--input", default="data/sample_ingest.json", help="ingest payload shared by DB checks")
+    parser.add_argument("--only", default="", help="comma-separated check names to run (dependencies included)")
+    parser.add_argument("--cache-dir", default="data/.qa_gate_cache")
+    parser.add_argument("--check-timeout", type=float, default=900.0)
+    parser.add_argument("--report", default="data/qa_parallel_gate_report.json")
+    return parser.parse_args()
+
+
+@dataclass
+class CheckOutcome:
+    status: str  # pass | fail | skipped
+    detail: str = ""
+    artifacts: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class GateCheck:
+    name: str
+    run: Callable[["GateContext"], CheckOutcome]
+    requires: tuple[str, ...] = ()
+    needs_db: bool = False
+
+
+class GateContext:
+    """State shared by every check: options, environment and a keyed artifact cache.
+
+    Artifacts are built once under a per-key lock; builders that produce files
+    write them under cache_dir keyed by the content hash of their inputs, so a
+    re-run with unchanged inputs reuses them.
+    """
+
+    def __init__(self, *, root: Path, cache_dir: Path, input_path: Path, timeout: float, env: dict[str, str]):
+        self.root = root
+        self.cache_dir = cache_dir
+        self.input_path = input_path
+        self.timeout = timeout
+        self.env = env
+        self._artifacts: dict[str, Any] = {}
+        self._locks: dict[str, Lock] = {}
+        self._locks_guard = Lock()
+        self.cache_hits: dict[str, int] = {}
+
+    def artifact(self, key: str, builder: Callable[[], Any]) -> Any:
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, Lock())
+        with lock:
+            if key in self._artifacts:
+                self.cache_hits[key] = self.cache_hits.get(key, 0) + 1
+                return self._artifacts[key]
+            value = builder()
+            self._artifacts[key] = value
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._locks_guard:
+            self._artifacts[key] = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._artifacts.get(key, default)
+
+    def run_command(self, command: list[str], *, extra_env: dict[str, str] | None = None) -> CheckOutcome:
+        env = {**self.env, **(extra_env or {})}
+        try:
+            completed = subprocess.run(
+                command,
+                cwd=self.root,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except FileNotFoundError as exc:
+            return CheckOutcome("fail", f"command not found: {exc.filename}")
+        except subprocess.TimeoutExpired:
+            return CheckOutcome("fail", f"timed out after {self.timeout:.0f}s")
+        output = (completed.stdout or "") + (completed.stderr or "")
+        tail = "\n".join(output.strip().splitlines()[-LOG_TAIL_LINES:])
+        return CheckOutcome("pass" if completed.returncode == 0 else "fail", tail)
+
+
+def normalized_payload_path(ctx: GateContext) -> Path:
+    """Normalized copy of --input, cached on disk by input content hash."""
+
+    def build() -> Path:
+        from app.services.ingest_input_normalization import normalize_ingest_payload
+
+        raw = ctx.input_path.read_bytes()
+        target = ctx.cache_dir / f"normalized_{sha256(raw).hexdigest()[:16]}.json"
+        if not target.exists():
+            payload = normalize_ingest_payload(json.loads(raw.decode("utf-8")))
+            ctx.cache_dir.mkdir(parents=True, exist_ok=True)
+            target.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        return target
+
+    return ctx.artifact("normalized_payload", build)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_health(api_base: str, *, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib_request.urlopen(f"{api_base}/health", timeout=2) as response:
+                if response.status == 200:
+                    return True
+        except (URLError, OSError):
+            time.sleep(0.3)
+    return False
+
+
+def check_pytest(ctx: GateContext) -> CheckOutcome:
+    return ctx.run_command([sys.executable, "-m", "pytest", "-q"])
+
+
+def check_api_contract_suite(ctx: GateContext) -> CheckOutcome:
+    report = ctx.cache_dir / "qa_api_contract_report.json"
+    outcome = ctx.run_command(["bash", "scripts/qa/run_api_contract_suite.sh", "--report", str(report)])
+    outcome.artifacts["report"] = str(report)
+    return outcome
+
+
+def check_workflow_yaml(ctx: GateContext) -> CheckOutcome:
+    return ctx.run_command(["bash", "scripts/qa/validate_workflow_yaml.sh"])
+
+
+def check_normalized_payload(ctx: GateContext) -> CheckOutcome:
+    path = normalized_payload_path(ctx)
+    records = len(json.loads(path.read_text(encoding="utf-8")).get("records") or [])
+    return CheckOutcome("pass", f"{records} records", {"path": str(path)})
+
+
+def check_seed_db(ctx: GateContext) -> CheckOutcome:
+    import psycopg
+    from psycopg.rows import dict_row
+
+    from app.db import run_schema
+    from app.models.schemas import IngestPayload
+    from app.services.ingest_service import ingest_payload
+    from app.services.repository import PostgresRepository
+
+    run_schema(ctx.root / "db" / "schema.sql")
+    payload = IngestPayload.model_validate(json.loads(normalized_payload_path(ctx).read_text(encoding="utf-8")))
+    with psycopg.connect(ctx.env["DATABASE_URL"], row_factory=dict_row) as conn:
+        result = ingest_payload(payload, PostgresRepository(conn))
+    status = "pass" if result.error_count == 0 else "fail"
+    return CheckOutcome(status, f"processed={result.processed_count} errors={result.error_count}")
+
+
+def check_app_server(ctx: GateContext) -> CheckOutcome:
+    port = _free_port()
+    api_base = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ctx.root,
+        env=ctx.env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    ctx.put("app_server_process", process)
+    if not _wait_for_health(api_base, timeout=30.0):
+        return CheckOutcome("fail", f"server on {api_base} did not become healthy")
+    ctx.put("api_base", api_base)
+    return CheckOutcome("pass", api_base, {"api_base": api_base})
+
+
+def check_db_equivalence(ctx: GateContext) -> CheckOutcome:
+    report = ctx.cache_dir / "qa_local_db_report.json"
+    outcome = ctx.run_command(
+        [
+            sys.executable,
+            "scripts/qa/run_db_equivalence.py",
+            "--target",
+            "local",
+            "--input",
+            str(normalized_payload_path(ctx)),
+            "--report",
+            str(report),
+        ],
+        extra_env={"LOCAL_DATABASE_URL": ctx.env["DATABASE_URL"]},
+    )
+    outcome.artifacts["report"] = str(report)
+    return outcome
+
+
+def check_smoke_public_api(ctx: GateContext) -> CheckOutcome:
+    return ctx.run_command(
+        [
+            "bash",
+            "scripts/qa/smoke_public_api.sh",
+            "--api-base",
+            ctx.get("api_base"),
+            "--web-origin",
+            "http://127.0.0.1:3000",
+            "--out-dir",
+            str(ctx.cache_dir / "public_api_smoke"),
+        ]
+    )
+
+
+DEFAULT_CHECKS: list[GateCheck] = [
+    GateCheck("pytest", check_pytest),
+    GateCheck("api_contract_suite", check_api_contract_suite),
+    GateCheck("workflow_yaml", check_workflow_yaml),
+    GateCheck("normalized_payload", check_normalized_payload),
+    GateCheck("seed_db", check_seed_db, requires=("normalized_payload",), needs_db=True),
+    # db_equivalence re-ingests into the shared database, so it runs after seeding and before the server reads it.
+    GateCheck("db_equivalence", check_db_equivalence, requires=("seed_db",), needs_db=True),
+    GateCheck("app_server", check_app_server, requires=("seed_db", "db_equivalence"), needs_db=True),
+    GateCheck("smoke_public_api", check_smoke_public_api, requires=("app_server",), needs_db=True),
+]
+
+
+def select_checks(checks: list[GateCheck], only: set[str]) -> list[GateCheck]:
+    """Named checks plus everything they transitively require, in declaration order."""
+    if not only:
+        return list(checks)
+    by_name = {check.name: check for check in checks}
+    wanted: set[str] = set()
+    stack = [name for name in only if name in by_name]
+    while stack:
+        name = stack.pop()
+        if name in wanted:
+            continue
+        wanted.add(name)
+        stack.extend(by_name[name].requires)
+    return [check for check in checks if check.name in wanted]
+
+
+def run_gate(checks: list[GateCheck], ctx: GateContext, *, workers: int, with_db: bool) -> dict[str, Any]:
+    """Run checks on a bounded pool as soon as their requirements have passed."""
+    started = time.perf_counter()
+    results: dict[str, dict[str, Any]] = {}
+    pending = list(checks)
+    running: dict[Future, tuple[GateCheck, float]] = {}
+
+    def finish(check: GateCheck, outcome: CheckOutcome, began: float | None) -> None:
+        now = time.perf_counter()
+        results[check.name] = {
+            "status": outcome.status,
+            "detail": outcome.detail,
+            "artifacts": outcome.artifacts,
+            "requires": list(check.requires),
+            "started_offset_sec": round(began - started, 3) if began is not None else None,
+            "duration_sec": round(now - began, 3) if began is not None else 0.0,
+        }
+
+    def guarded(check: GateCheck) -> CheckOutcome:
+        try:
+            return check.run(ctx)
+        except Exception as exc:  # noqa: BLE001
+            return CheckOutcome("fail", f"{exc.__class__.__name__}: {exc}")
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        while pending or running:
+            for check in list(pending):
+                if check.needs_db and not with_db:
+                    pending.remove(check)
+                    finish(check, CheckOutcome("skipped", "requires --with-db"), None)
+                    continue
+                required = [results.get(name, {}).get("status") for name in check.requires]
+                if any(status in {"fail", "skipped"} for status in required):
+                    pending.remove(check)
+                    finish(check, CheckOutcome("skipped", "requirement did not pass"), None)
+                elif all(status == "pass" for status in required):
+                    pending.remove(check)
+                    running[pool.submit(guarded, check)] = (check, time.perf_counter())
+            if not running:
+                # Remaining checks wait on names that are not part of this run.
+                for check in pending:
+                    finish(check, CheckOutcome("skipped", "requirement not scheduled"), None)
+                break
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                check, began = running.pop(future)
+                finish(check, future.result(), began)
+
+    wall = time.perf_counter() - started
+    serial = sum(row["duration_sec"] for row in results.values())
+    failed = sorted(name for name, row in results.items() if row["status"] == "fail")
+    return {
+        "checks": {check.name: results[check.name] for check in checks},
+        "summary": {
+            "overall_status": "FAIL" if failed else "PASS",
+            "failed_checks": failed,
+            "passed": sum(1 for row in results.values() if row["status"] == "pass"),
+            "skipped": sum(1 for row in results.values() if row["status"] == "skipped"),
+            "wall_sec": round(wall, 3),
+            "serial_sec": round(serial, 3),
+            "parallel_speedup": round(serial / wall, 2) if wall > 0 else None,
+            "artifact_cache_hits": dict(ctx.cache_hits),
+        },
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    env = dict(os.environ)
+    env.setdefault("PYTHONPATH", str(ROOT))
+    if args.with_db:
+        from scripts.qa.run_db_equivalence import ensure_runtime_env, resolve_database_url
+
+        ensure_runtime_env(resolve_database_url("local"))
+        env = {**dict(os.environ), "PYTHONPATH": env["PYTHONPATH"]}
+
+    ctx = GateContext(
+        root=ROOT,
+        cache_dir=ROOT / args.cache_dir,
+        input_path=ROOT / args.input,
+        timeout=args.check_timeout,
+        env=env,
+    )
+    only = {name.strip() for name in args.only.split(",") if name.strip()}
+    try:
+        outcome = run_gate(select_checks(DEFAULT_CHECKS, only), ctx, workers=args.workers, with_db=args.with_db)
+    finally:
+        process = ctx.get("app_server_process")
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+    report = {
+        "suite": SUITE,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "inputs": {"workers": args.workers, "with_db": args.with_db, "input": args.input, "only": sorted(only)},
+        **outcome,
+    }
+    path = Path(args.report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    for name, row in report["checks"].items():
+        print(f"[{row['status'].upper()}] {name} {row['duration_sec']:.2f}s")
+    print(json.dumps(report["summary"], ensure_ascii=False, indent=2))
+    return 0 if report["summary"]["overall_status"] == "PASS" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
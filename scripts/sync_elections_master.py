@@ -71,6 +71,9 @@ def run_elections_master_sync(*, dry_run: bool = False, report_path: str = "data
                 for slot in slots:
                     repo.upsert_election_slot(slot)
                     upserted += 1
+                bump_generation = getattr(repo, "bump_data_generation", None)
+                if upserted and callable(bump_generation):
+                    bump_generation()
 
         missing_default_slot_pairs = _count_missing_default_pairs(regions, slots)
         no_poll_slots = sum(1 for slot in slots if not slot.get("has_poll_data"))
@@ -15,6 +15,9 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 import xml.etree.ElementTree as ET
 
+from app.services.multi_pattern_matcher import MultiPatternMatcher
+from app.services.scenario_parser import parse_survey_scenarios, scenario_name_token
+
 from .contracts import (
     Article,
     PollObservation,
@@ -83,6 +86,17 @@ class PollCollector:
     _POLLSTER_RE = re.compile(
         "(" + "|".join(re.escape(token) for token in sorted(_POLLSTER_TOKENS, key=len, reverse=True)) + ")"
     )
+    _REGION_OFFICE_MATCHER = MultiPatternMatcher(needle for needle, _, _ in REGION_OFFICE_DIRECT_PATTERNS)
+    _REGION_OFFICE_BY_NEEDLE = {
+        needle: (region_code, office_type)
+        for needle, region_code, office_type in reversed(REGION_OFFICE_DIRECT_PATTERNS)
+    }
+    # Longest alias first, limited to aliases whose code is a known common-code region.
+    _REGION_ALIAS_MATCHER = MultiPatternMatcher(
+        alias
+        for alias in sorted(REGION_ALIASES.keys(), key=len, reverse=True)
+        if REGION_ALIASES[alias] in COMMON_CODE_REGIONS
+    )
     _SURVEY_PERIOD_YMD_RANGE_RE = re.compile(
         r"(20\d{2})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?\s*(?:~|∼|-|부터)\s*"
         r"(?:(20\d{2})\s*[.\-/년]\s*)?(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?(?:까지)?"
@@ -167,12 +181,6 @@ class PollCollector:
     _RELATIVE_N_MONTHS_AGO_RE = re.compile(r"(\d{1,2})개월전")
     _RELATIVE_LAST_N_DAYS_RE = re.compile(r"지난(\d{1,2})일")
     _RELATIVE_LAST_MONTH_RE = re.compile(r"지난달")
-    _SCENARIO_NAME_RE = re.compile(r"[가-힣]{2,6}")
-    _SCENARIO_H2H_PAIR_RE = re.compile(
-        r"([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?\s*[-~]\s*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?"
-    )
-    _SCENARIO_MULTI_SINGLE_RE = re.compile(r"다자대결[^가-힣0-9%]*([가-힣]{2,6})\s*([0-9]{1,2}(?:\.[0-9]+)?)\s*%?")
-
     def __init__(
         self,
         election_id: str = "2026_local",
@@ -727,11 +735,12 @@ class PollCollector:
             if not options[idx].scenario_key:
                 options[idx].scenario_key = "default"
 
-        h2h_pairs = self._extract_h2h_pairs(text)
+        scenarios = parse_survey_scenarios(text)
+        h2h_pairs = scenarios.h2h_pairs
         if len(h2h_pairs) < 2:
             return False
 
-        names_by_index = {idx: self._scenario_name_token(options[idx].option_name) for idx in candidate_indexes}
+        names_by_index = {idx: scenario_name_token(options[idx].option_name) for idx in candidate_indexes}
         candidate_indexes_all = list(candidate_indexes)
         names_all = dict(names_by_index)
         used_indexes: set[int] = set()
@@ -807,7 +816,7 @@ class PollCollector:
             assigned = True
 
         multi_indexes = [idx for idx in candidate_indexes_all if idx not in used_indexes and names_all.get(idx)]
-        multi_anchor = self._extract_multi_anchor(text)
+        multi_anchor = scenarios.multi_anchor
         if multi_anchor is not None:
             multi_name, multi_value = multi_anchor
             multi_idx = self._match_candidate_index(
@@ -851,46 +860,6 @@ class PollCollector:
             self._refresh_option_identity(option=row, observation=observation)
         return True
 
-    def _extract_h2h_pairs(self, text: str) -> list[tuple[str, float, str, float]]:
-        pairs: list[tuple[str, float, str, float]] = []
-        seen: set[tuple[str, float, str, float]] = set()
-        for match in self._SCENARIO_H2H_PAIR_RE.finditer(text):
-            left_name = self._scenario_name_token(match.group(1))
-            right_name = self._scenario_name_token(match.group(3))
-            if not left_name or not right_name or left_name == right_name:
-                continue
-            try:
-                left_value = float(match.group(2))
-                right_value = float(match.group(4))
-            except (TypeError, ValueError):
-                continue
-            key = (left_name, left_value, right_name, right_value)
-            if key in seen:
-                continue
-            seen.add(key)
-            pairs.append(key)
-        return pairs
-
-    def _extract_multi_anchor(self, text: str) -> tuple[str, float] | None:
-        match = self._SCENARIO_MULTI_SINGLE_RE.search(text)
-        if not match:
-            return None
-        name = self._scenario_name_token(match.group(1))
-        if not name:
-            return None
-        try:
-            value = float(match.group(2))
-        except (TypeError, ValueError):
-            return None
-        return name, value
-
-    def _scenario_name_token(self, value: str | None) -> str:
-        text = str(value or "").strip()
-        if not text:
-            return ""
-        match = self._SCENARIO_NAME_RE.search(text)
-        return match.group(0) if match else text
-
     def _scenario_value(self, option: PollOption) -> float:
         if option.value_mid is None:
             return float("-inf")
@@ -1242,9 +1211,9 @@ class PollCollector:
         return tokens[0] if tokens else None
 
     def _extract_region_office(self, text: str) -> tuple[str, str] | None:
-        for needle, region_code, office_type in REGION_OFFICE_DIRECT_PATTERNS:
-            if needle in text:
-                return region_code, office_type
+        direct_needle = self._REGION_OFFICE_MATCHER.best(text)
+        if direct_needle is not None:
+            return self._REGION_OFFICE_BY_NEEDLE[direct_needle]
 
         region_code = self._extract_region_code(text)
         if region_code is None:
@@ -1280,12 +1249,8 @@ class PollCollector:
         return None
 
     def _extract_region_code(self, text: str) -> str | None:
-        for alias in sorted(REGION_ALIASES.keys(), key=len, reverse=True):
-            if alias in text:
-                code = REGION_ALIASES[alias]
-                if code in COMMON_CODE_REGIONS:
-                    return code
-        return None
+        alias = self._REGION_ALIAS_MATCHER.best(text)
+        return REGION_ALIASES[alias] if alias is not None else None
 
     @classmethod
     def _parse_anchor_date(cls, value: str | None) -> date | None:
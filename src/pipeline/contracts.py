@@ -3,9 +3,9 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from hashlib import sha1
-from typing import Any
+from typing import Any, Iterable
 
-from app.services.normalization import NormalizedValue, normalize_percentage
+from app.services.normalization import NormalizedColumns, NormalizedValue, normalize_percentage, normalize_percentages
 
 from .standards import ISSUE_TAXONOMY, OFFICE_TYPE_STANDARD
 
@@ -288,6 +288,10 @@ def normalize_value(raw: str | None) -> NormalizedValue:
     return normalize_percentage(raw)
 
 
+def normalize_values(raws: Iterable[str | None]) -> NormalizedColumns:
+    return normalize_percentages(raws)
+
+
 def new_review_queue_item(
     *,
     entity_type: str,
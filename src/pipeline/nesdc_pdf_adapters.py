@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import re
 from typing import Any
 
-from .contracts import normalize_value
+from .contracts import normalize_value, normalize_values
 
 TOP10_POLLSTERS: tuple[str, ...] = (
     "(주)엠브레인퍼블릭",
@@ -124,23 +124,20 @@ class NesdcPdfAdapterEngine:
         )
 
     def _normalize_items(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            value_raw = row.get("value_raw")
-            norm = normalize_value(value_raw)
-            out.append(
-                {
-                    "question": row.get("question"),
-                    "option": row.get("option"),
-                    "value_raw": value_raw,
-                    "value_min": norm.value_min,
-                    "value_max": norm.value_max,
-                    "value_mid": norm.value_mid,
-                    "is_missing": norm.is_missing,
-                    "provenance": row.get("provenance") or {},
-                }
-            )
-        return out
+        columns = normalize_values(row.get("value_raw") for row in rows)
+        return [
+            {
+                "question": row.get("question"),
+                "option": row.get("option"),
+                "value_raw": row.get("value_raw"),
+                "value_min": columns.value_min[idx],
+                "value_max": columns.value_max[idx],
+                "value_mid": columns.value_mid[idx],
+                "is_missing": columns.is_missing[idx],
+                "provenance": row.get("provenance") or {},
+            }
+            for idx, row in enumerate(rows)
+        ]
 
     @classmethod
     def _collect_text(cls, row: dict[str, Any], *, keys: tuple[str, ...]) -> str:
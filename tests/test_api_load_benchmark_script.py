@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.models.schemas import IngestPayload
+from scripts.qa.benchmark_api_load import (
+    build_endpoint_plan,
+    build_seed_records,
+    drive_endpoint,
+    summarize_samples,
+)
+from src.pipeline.standards import COMMON_CODE_REGIONS
+
+
+def test_seed_records_cover_every_region_and_validate_as_ingest_payload():
+    records = build_seed_records(observations=len(COMMON_CODE_REGIONS) * 2, seed=7, today=date(2026, 3, 1))
+
+    IngestPayload.model_validate({"records": records})
+    assert {record["region"]["region_code"] for record in records} == set(COMMON_CODE_REGIONS)
+    national = [record for record in records if record["observation"]["audience_scope"] == "national"]
+    assert len(national) == len(records) // 10
+    assert {option["option_type"] for option in national[0]["options"]} == {
+        "party_support",
+        "president_job_approval",
+        "election_frame",
+    }
+    assert all(record["observation"]["survey_end_date"] < "2026-03-01" for record in records)
+    assert records == build_seed_records(observations=len(records), seed=7, today=date(2026, 3, 1))
+
+
+def test_endpoint_plan_targets_public_read_routes():
+    plan = dict(build_endpoint_plan(build_seed_records(observations=20, seed=1, today=date(2026, 3, 1))))
+
+    assert set(plan) == {
+        "dashboard_summary",
+        "dashboard_map_latest",
+        "dashboard_big_matches",
+        "regions_search",
+        "region_elections",
+        "matchup",
+        "trends",
+    }
+    assert plan["matchup"](0).startswith("/api/v1/matchups/20260603%7C")
+    assert plan["trends"](1) == "/api/v1/trends/president_job_approval?days=30"
+
+
+def test_summarize_samples_reports_percentiles_queries_and_cache_hits():
+    samples = [{"status": 200, "latency_ms": float(ms), "query_count": 0 if ms % 2 else 3} for ms in range(1, 101)]
+
+    summary = summarize_samples(samples, elapsed_sec=2.0)
+
+    assert summary["p50_ms"] == 50.0
+    assert summary["p95_ms"] == 95.0
+    assert summary["p99_ms"] == 99.0
+    assert summary["throughput_rps"] == 50.0
+    assert summary["queries_per_request"] == 1.5
+    assert summary["cache_hit_rate"] == 0.5
+    assert summary["status_counts"] == {"200": 100}
+
+
+def test_drive_endpoint_runs_requested_count_through_driver():
+    class _Driver:
+        def __init__(self):
+            self.paths = []
+
+        def get(self, path, request_id):
+            self.paths.append(path)
+            return 200, None
+
+    driver = _Driver()
+    summary = drive_endpoint(driver, "x", lambda i: f"/p/{i}", requests=5, concurrency=2)
+
+    assert sorted(driver.paths) == [f"/p/{i}" for i in range(5)]
+    assert summary["requests"] == 5
+    assert summary["queries_per_request"] is None
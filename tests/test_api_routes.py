@@ -1,4 +1,6 @@
-from datetime import date
+from datetime import date, datetime, timedelta, timezone
+import gzip
+import json
 import unicodedata
 
 import pytest
@@ -7,6 +9,10 @@ from fastapi.testclient import TestClient
 from app.api.dependencies import get_candidate_data_go_service, get_repository
 from app.config import get_settings
 from app.main import app
+from app.services.encoded_response_cache import clear_encoded_response_cache
+from app.services.request_metrics import clear_request_metrics
+from app.services.summary_selection_cache import clear_summary_selection_cache
+from app.services.trend_series import select_trend_series_points
 
 
 class FakeApiRepo:
@@ -274,6 +280,15 @@ class FakeApiRepo:
             }
         ]
 
+    def fetch_region_elections_batch(self, region_codes=None, sido_code=None, topology="official", version_id=None):
+        codes = list(region_codes or [])
+        if sido_code and sido_code not in codes:
+            codes.append(sido_code)
+        return {
+            code: self.fetch_region_elections(code, topology=topology, version_id=version_id)
+            for code in codes
+        }
+
     def get_matchup(self, matchup_id):
         if matchup_id == "missing":
             return None
@@ -1405,6 +1420,75 @@ def test_trends_contract_and_representative_trace():
     app.dependency_overrides.clear()
 
 
+def test_trends_served_from_daily_series_match_live_selection():
+    live_client = TestClient(app)
+    app.dependency_overrides[get_repository] = override_repo
+    live = live_client.get("/api/v1/trends/party_support", params={"scope": "national", "days": 30}).json()
+
+    class SeriesRepo(FakeApiRepo):
+        def fetch_trend_series(self, metric, scope, region_code, days):
+            rows = [dict(row, metric=metric) for row in FakeApiRepo.fetch_trends(self, metric, scope, region_code, days)]
+            points = select_trend_series_points(rows)
+            return [dict(point, audience_scope=scope) for point in points if point["metric"] == metric]
+
+        def fetch_trends(self, metric, scope, region_code, days):  # noqa: ARG002
+            raise AssertionError("live trend query should not run when the series is available")
+
+    def override_series_repo():
+        yield SeriesRepo()
+
+    app.dependency_overrides[get_repository] = override_series_repo
+    series = TestClient(app).get("/api/v1/trends/party_support", params={"scope": "national", "days": 30}).json()
+
+    for body in (live, series):
+        for point in body["points"]:
+            point["source_trace"].pop("freshness_hours")
+    assert series["points"] == live["points"]
+    assert len(series["points"]) == 2
+
+    app.dependency_overrides.clear()
+
+
+def test_trends_aggregate_mode_adds_smoothed_values_and_trims_warmup_days():
+    today = date.today()
+
+    class AggregateRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.requested_days = None
+
+        def fetch_trends(self, metric, scope, region_code, days):  # noqa: ARG002
+            self.requested_days = days
+            base = FakeApiRepo.fetch_trends(self, "party_support", "national", None, 30)[1]
+            return [
+                dict(base, survey_end_date=today - timedelta(days=offset), value_mid=value, sample_size=1000)
+                for offset, value in ((3, 30.0), (1, 34.0), (0, 38.0))
+            ]
+
+    repo = AggregateRepo()
+
+    def override_aggregate_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_aggregate_repo
+    client = TestClient(app)
+
+    res = client.get(
+        "/api/v1/trends/party_support",
+        params={"scope": "national", "days": 2, "aggregate": "rolling", "window_days": 3},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert repo.requested_days == 4
+    assert body["aggregate"] == "rolling"
+    assert body["window_days"] == 3
+    assert [point["value_mid"] for point in body["points"]] == [34.0, 38.0]
+    assert [point["aggregate_value"] for point in body["points"]] == [32.0, 36.0]
+    assert body["points"][1]["aggregate_poll_count"] == 2
+
+    app.dependency_overrides.clear()
+
+
 def test_trends_regional_scope_requires_region_code():
     app.dependency_overrides[get_repository] = override_repo
     app.dependency_overrides[get_candidate_data_go_service] = override_candidate_data_go_service
@@ -1616,6 +1700,48 @@ def test_region_elections_normalizes_region_code_aliases():
     app.dependency_overrides.clear()
 
 
+def test_region_elections_batch_returns_items_per_region_in_one_call():
+    class CaptureBatchRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.batch_calls = []
+
+        def fetch_region_elections_batch(self, region_codes=None, sido_code=None, topology="official", version_id=None):
+            self.batch_calls.append((list(region_codes or []), sido_code, topology, version_id))
+            return super().fetch_region_elections_batch(
+                region_codes=region_codes,
+                sido_code=sido_code,
+                topology=topology,
+                version_id=version_id,
+            )
+
+    repo = CaptureBatchRepo()
+
+    def override_capture_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_capture_repo
+    client = TestClient(app)
+
+    response = client.get("/api/v1/regions/elections?region_codes=11-000,KR-32,11-000")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["topology"] == "official"
+    assert body["region_count"] == 2
+    assert [item["region_code"] for item in body["items"]] == ["11-000", "42-000"]
+    assert body["items"][1]["elections"][0]["region_code"] == "42-000"
+    assert repo.batch_calls == [(["11-000", "42-000"], None, "official", None)]
+
+    sido_response = client.get("/api/v1/regions/elections?sido_code=26-000")
+    assert sido_response.status_code == 200
+    assert repo.batch_calls[-1] == ([], "26-000", "official", None)
+
+    missing = client.get("/api/v1/regions/elections")
+    assert missing.status_code == 422
+
+    app.dependency_overrides.clear()
+
+
 def test_matchup_normalizes_region_code_aliases_in_matchup_id():
     app.dependency_overrides[get_repository] = override_repo
     app.dependency_overrides[get_candidate_data_go_service] = override_candidate_data_go_service
@@ -2115,6 +2241,44 @@ def test_review_decision_endpoints_require_token_and_update_status(monkeypatch:
     get_settings.cache_clear()
 
 
+def test_review_decision_refreshes_trend_series_days_of_the_observation(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
+    monkeypatch.setenv("DATA_GO_KR_KEY", "test-data-go-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setenv("INTERNAL_JOB_TOKEN", "dev-internal-token")
+    get_settings.cache_clear()
+
+    class TrendSeriesRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.day_key_requests = []
+
+        def fetch_trend_series_day_keys(self, *, run_id=None, observation_keys=None):
+            self.day_key_requests.append(observation_keys)
+            return []
+
+    repo = TrendSeriesRepo()
+
+    def override_trend_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_trend_repo
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/v1/review/101/approve",
+        json={},
+        headers={"Authorization": "Bearer dev-internal-token"},
+    )
+
+    assert response.status_code == 200
+    assert repo.day_key_requests == [["obs-1"]]
+
+    app.dependency_overrides.clear()
+    get_settings.cache_clear()
+
+
 def test_run_ingest_requires_bearer_token(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
@@ -2176,6 +2340,418 @@ def test_run_ingest_requires_bearer_token(monkeypatch: pytest.MonkeyPatch):
     get_settings.cache_clear()
 
 
+def test_run_ingest_schedules_snapshot_rebuild_for_touched_matchups(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
+    monkeypatch.setenv("DATA_GO_KR_KEY", "test-data-go-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setenv("INTERNAL_JOB_TOKEN", "dev-internal-token")
+    get_settings.cache_clear()
+
+    scheduled = []
+    monkeypatch.setattr(
+        "app.api.routes.run_matchup_snapshot_rebuild",
+        lambda matchup_ids, run_id=None: scheduled.append((list(matchup_ids), run_id)),
+    )
+
+    app.dependency_overrides[get_repository] = override_repo
+    app.dependency_overrides[get_candidate_data_go_service] = override_candidate_data_go_service
+    client = TestClient(app)
+
+    payload = {
+        "run_type": "manual",
+        "extractor_version": "manual-v1",
+        "records": [
+            {
+                "article": {"url": "https://example.com/snapshot", "title": "t", "publisher": "p"},
+                "region": {
+                    "region_code": "11-000",
+                    "sido_name": "서울특별시",
+                    "sigungu_name": "전체",
+                    "admin_level": "sido",
+                },
+                "observation": {
+                    "observation_key": "obs-snapshot",
+                    "survey_name": "survey",
+                    "pollster": "MBC",
+                    "region_code": "11-000",
+                    "office_type": "광역자치단체장",
+                    "matchup_id": "20260603|광역자치단체장|11-000",
+                },
+                "options": [
+                    {"option_type": "presidential_approval", "option_name": "국정안정론", "value_raw": "53~55%"}
+                ],
+            }
+        ],
+    }
+
+    ok = client.post(
+        "/api/v1/jobs/run-ingest",
+        json=payload,
+        headers={"Authorization": "Bearer dev-internal-token"},
+    )
+    assert ok.status_code == 200
+    assert scheduled == [(["20260603|광역자치단체장|11-000"], ok.json()["run_id"])]
+
+    app.dependency_overrides.clear()
+    get_settings.cache_clear()
+
+
+def test_run_ingest_accepts_gzip_body_and_limits_decompressed_size(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
+    monkeypatch.setenv("DATA_GO_KR_KEY", "test-data-go-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setenv("INTERNAL_JOB_TOKEN", "dev-internal-token")
+    monkeypatch.setenv("INGEST_MAX_BODY_BYTES", "4096")
+    get_settings.cache_clear()
+    monkeypatch.setattr("app.api.routes.run_matchup_snapshot_rebuild", lambda matchup_ids, run_id=None: None)
+
+    app.dependency_overrides[get_repository] = override_repo
+    app.dependency_overrides[get_candidate_data_go_service] = override_candidate_data_go_service
+    client = TestClient(app)
+
+    record = {
+        "article": {"url": "https://example.com/gzip", "title": "t", "publisher": "p"},
+        "observation": {
+            "observation_key": "obs-gzip",
+            "survey_name": "survey",
+            "pollster": "MBC",
+            "region_code": "11-000",
+            "office_type": "광역자치단체장",
+            "matchup_id": "20260603|광역자치단체장|11-000",
+        },
+        "options": [{"option_type": "party_support", "option_name": "더불어민주당", "value_raw": "40%"}],
+    }
+    payload = {"run_type": "manual", "extractor_version": "manual-v1", "records": [record]}
+    headers = {
+        "Authorization": "Bearer dev-internal-token",
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }
+
+    def gzip_body(body: dict) -> bytes:
+        return gzip.compress(json.dumps(body, ensure_ascii=False).encode("utf-8"))
+
+    ok = client.post("/api/v1/jobs/run-ingest", content=gzip_body(payload), headers=headers)
+    assert ok.status_code == 200
+    assert ok.json()["processed_count"] == 1
+
+    # 100 copies compress to well under the limit but expand far past it.
+    oversized = client.post(
+        "/api/v1/jobs/run-ingest",
+        content=gzip_body({**payload, "records": [record] * 100}),
+        headers=headers,
+    )
+    assert oversized.status_code == 413
+
+    corrupt = client.post("/api/v1/jobs/run-ingest", content=b"not gzip", headers=headers)
+    assert corrupt.status_code == 400
+
+    unsupported = client.post(
+        "/api/v1/jobs/run-ingest",
+        content=b"{}",
+        headers={**headers, "Content-Encoding": "zstd"},
+    )
+    assert unsupported.status_code == 415
+
+    app.dependency_overrides.clear()
+    get_settings.cache_clear()
+
+
+def test_ingest_jobs_enqueue_is_idempotent_and_pollable(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
+    monkeypatch.setenv("DATA_GO_KR_KEY", "test-data-go-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setenv("INTERNAL_JOB_TOKEN", "dev-internal-token")
+    get_settings.cache_clear()
+
+    notified = []
+    monkeypatch.setattr("app.api.routes.notify_ingest_job_enqueued", lambda: notified.append(True))
+
+    class JobQueueRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.jobs = {}
+
+        def enqueue_ingest_job(self, payload, *, payload_hash, record_count, idempotency_key=None):
+            for job in self.jobs.values():
+                if idempotency_key and job["idempotency_key"] == idempotency_key:
+                    if job["payload_hash"] != payload_hash:
+                        return None, False
+                    return job, False
+            job = {
+                "id": len(self.jobs) + 1,
+                "idempotency_key": idempotency_key,
+                "status": "queued",
+                "payload_hash": payload_hash,
+                "record_count": record_count,
+                "progress_done": 0,
+                "attempt_count": 0,
+                "created_at": datetime(2026, 3, 1, tzinfo=timezone.utc),
+            }
+            self.jobs[job["id"]] = job
+            return job, True
+
+        def fetch_ingest_job(self, job_id):
+            return self.jobs.get(job_id)
+
+    repo = JobQueueRepo()
+
+    def override_job_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_job_repo
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer dev-internal-token", "Idempotency-Key": "cycle-1"}
+    payload = {
+        "run_type": "manual",
+        "extractor_version": "manual-v1",
+        "records": [
+            {
+                "article": {"url": "https://example.com/job", "title": "t", "publisher": "p"},
+                "observation": {
+                    "observation_key": "obs-job",
+                    "survey_name": "survey",
+                    "pollster": "MBC",
+                    "region_code": "11-000",
+                    "office_type": "광역자치단체장",
+                    "matchup_id": "20260603|광역자치단체장|11-000",
+                },
+                "options": [{"option_type": "party_support", "option_name": "더불어민주당", "value_raw": "40%"}],
+            }
+        ],
+    }
+
+    assert client.post("/api/v1/jobs/ingest-jobs", json=payload).status_code == 401
+    first = client.post("/api/v1/jobs/ingest-jobs", json=payload, headers=headers)
+    again = client.post("/api/v1/jobs/ingest-jobs", json=payload, headers=headers)
+    assert first.status_code == 202
+    assert first.json()["status"] == "queued"
+    assert first.json()["record_count"] == 1
+    assert first.json()["deduplicated"] is False
+    assert again.json()["job_id"] == first.json()["job_id"]
+    assert again.json()["deduplicated"] is True
+    assert len(repo.jobs) == 1
+    assert len(notified) == 2
+
+    payload["records"][0]["options"][0]["value_raw"] = "41%"
+    conflict = client.post("/api/v1/jobs/ingest-jobs", json=payload, headers=headers)
+    assert conflict.status_code == 409
+
+    repo.jobs[1].update(status="success", run_id=12, processed_count=1, progress_done=1)
+    polled = client.get("/api/v1/jobs/ingest-jobs/1", headers={"Authorization": "Bearer dev-internal-token"})
+    assert polled.status_code == 200
+    assert polled.json()["status"] == "success"
+    assert polled.json()["run_id"] == 12
+    missing = client.get("/api/v1/jobs/ingest-jobs/99", headers={"Authorization": "Bearer dev-internal-token"})
+    assert missing.status_code == 404
+
+    app.dependency_overrides.clear()
+    get_settings.cache_clear()
+
+
+def test_matchup_serves_snapshot_before_live_path():
+    class SnapshotRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.live_calls = 0
+
+        def fetch_matchup_snapshot(self, matchup_id):
+            if matchup_id != "20260603|광역자치단체장|11-000":
+                return None
+            payload = FakeApiRepo.get_matchup(self, matchup_id)
+            payload["pollster"] = "스냅샷리서치"
+            payload["survey_end_date"] = "2026-02-18"
+            return payload
+
+        def get_matchup(self, matchup_id):
+            self.live_calls += 1
+            return super().get_matchup(matchup_id)
+
+    repo = SnapshotRepo()
+
+    def override_snapshot_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_snapshot_repo
+    client = TestClient(app)
+
+    snapshot = client.get("/api/v1/matchups/20260603|광역자치단체장|11-000")
+    assert snapshot.status_code == 200
+    assert snapshot.json()["pollster"] == "스냅샷리서치"
+    assert snapshot.json()["survey_end_date"] == "2026-02-18"
+    assert repo.live_calls == 0
+
+    live = client.get("/api/v1/matchups/20260603|광역자치단체장|26-000")
+    assert live.status_code == 200
+    assert live.json()["pollster"] == "KBS"
+    assert repo.live_calls == 1
+
+    app.dependency_overrides.clear()
+
+
+def test_public_reads_emit_generation_etag_and_answer_not_modified():
+    clear_summary_selection_cache()
+
+    class GenerationRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.generation = 7
+            self.summary_calls = 0
+
+        def fetch_data_generation(self):
+            return self.generation
+
+        def fetch_dashboard_summary(self, as_of):
+            self.summary_calls += 1
+            return super().fetch_dashboard_summary(as_of)
+
+    repo = GenerationRepo()
+
+    def override_generation_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_generation_repo
+    client = TestClient(app)
+
+    first = client.get("/api/v1/dashboard/summary")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"g7-')
+    assert "must-revalidate" in first.headers["cache-control"]
+    assert repo.summary_calls == 1
+
+    other_query = client.get("/api/v1/dashboard/summary?as_of=2026-02-18")
+    assert other_query.headers["etag"] != etag
+
+    cached = client.get("/api/v1/dashboard/summary", headers={"If-None-Match": etag.removeprefix("W/")})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert repo.summary_calls == 2
+
+    repo.generation = 8
+    refreshed = client.get("/api/v1/dashboard/summary", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"].startswith('W/"g8-')
+    assert repo.summary_calls == 3
+
+    app.dependency_overrides.clear()
+
+
+def test_read_etag_rolls_over_with_freshness_bucket(monkeypatch: pytest.MonkeyPatch):
+    from starlette.requests import Request
+
+    from app.api.dependencies import build_read_etag
+
+    monkeypatch.setenv("API_ETAG_FRESHNESS_BUCKET_SEC", "300")
+    get_settings.cache_clear()
+    request = Request({"type": "http", "method": "GET", "path": "/api/v1/dashboard/summary", "query_string": b"", "headers": []})
+
+    first = build_read_etag(request, 3, now=600.0)
+    assert build_read_etag(request, 3, now=899.0) == first
+    assert build_read_etag(request, 3, now=900.0) != first
+    assert build_read_etag(request, 4, now=600.0) != first
+    get_settings.cache_clear()
+
+
+def test_dashboard_summary_selection_cached_per_generation_and_historical_as_of():
+    clear_summary_selection_cache()
+
+    class GenerationRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.generation = 1
+            self.summary_as_of: list = []
+
+        def fetch_data_generation(self):
+            return self.generation
+
+        def fetch_dashboard_summary(self, as_of):
+            self.summary_as_of.append(as_of)
+            return super().fetch_dashboard_summary(as_of)
+
+    repo = GenerationRepo()
+
+    def override_generation_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_generation_repo
+    client = TestClient(app)
+
+    first = client.get("/api/v1/dashboard/summary")
+    second = client.get("/api/v1/dashboard/summary")
+    assert first.status_code == second.status_code == 200
+    assert first.json()["party_support"] == second.json()["party_support"]
+    client.get("/api/v1/dashboard/summary?as_of=2026-02-18")
+    assert repo.summary_as_of == [None, date(2026, 2, 18)]
+
+    repo.generation = 2
+    client.get("/api/v1/dashboard/summary")
+    client.get("/api/v1/dashboard/summary?as_of=2026-02-18")
+    assert repo.summary_as_of == [None, date(2026, 2, 18), None]
+
+    app.dependency_overrides.clear()
+    clear_summary_selection_cache()
+
+
+def test_map_latest_reuses_encoded_body_per_generation_and_gzips():
+    clear_encoded_response_cache()
+
+    class GenerationMapRepo(FakeApiRepo):
+        def __init__(self):
+            super().__init__()
+            self.generation = 11
+            self.map_calls = 0
+
+        def fetch_data_generation(self):
+            return self.generation
+
+        def fetch_dashboard_map_latest(self, as_of, limit=100):
+            self.map_calls += 1
+            rows = super().fetch_dashboard_map_latest(as_of, limit=limit)
+            return [dict(rows[0], title=f"{rows[0]['title']} {'가' * 600}")] + rows[1:]
+
+    repo = GenerationMapRepo()
+
+    def override_generation_repo():
+        yield repo
+
+    app.dependency_overrides[get_repository] = override_generation_repo
+    client = TestClient(app)
+
+    plain = client.get("/api/v1/dashboard/map-latest", headers={"Accept-Encoding": "identity"})
+    assert plain.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"].startswith('W/"g11-')
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert repo.map_calls == 1
+
+    compressed = client.get("/api/v1/dashboard/map-latest", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.json() == plain.json()
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert compressed.headers["etag"].endswith('-gzip"')
+    assert repo.map_calls == 1
+
+    revalidated = client.get(
+        "/api/v1/dashboard/map-latest",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == compressed.headers["etag"]
+
+    repo.generation = 12
+    refreshed = client.get("/api/v1/dashboard/map-latest")
+    assert refreshed.headers["etag"].startswith('W/"g12-')
+    assert repo.map_calls == 2
+
+    app.dependency_overrides.clear()
+    clear_encoded_response_cache()
+
+
 def test_run_ingest_normalizes_candidate_payload_before_validation(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
@@ -2535,3 +3111,55 @@ def test_candidate_endpoint_handles_profile_missing_contract_with_nulls():
     assert body["profile_provenance"]["birth_date"] == "ingest"
 
     app.dependency_overrides.clear()
+
+
+def test_sampled_requests_emit_server_timing_and_aggregate_per_route():
+    clear_request_metrics()
+    clear_encoded_response_cache()
+
+    class GenerationRepo(FakeApiRepo):
+        def fetch_data_generation(self):
+            return 3
+
+    app.dependency_overrides[get_repository] = lambda: GenerationRepo()
+    client = TestClient(app)
+
+    first = client.get("/api/v1/dashboard/map-latest")
+    second = client.get("/api/v1/dashboard/map-latest")
+    assert first.status_code == second.status_code == 200
+    assert first.headers["server-timing"].startswith('db;dur=')
+    assert 'cache;desc="hits=0 misses=1"' in first.headers["server-timing"]
+    assert 'cache;desc="hits=1 misses=0"' in second.headers["server-timing"]
+
+    metrics = client.get("/api/v1/ops/request-metrics")
+    assert metrics.status_code == 200
+    body = metrics.json()
+    assert body["sample_rate"] == 1.0
+    route = next(row for row in body["routes"] if row["route"] == "/api/v1/dashboard/map-latest")
+    assert route["method"] == "GET"
+    assert route["sample_count"] == 2
+    assert route["p99_ms"] >= route["p50_ms"] > 0
+    assert route["cache_hit_rate"] == 0.5
+    caches = {row["name"]: row for row in body["memo_caches"]}
+    assert set(caches) == {"region_code", "percentage", "scenario_parse"}
+    assert caches["region_code"]["max_size"] > 0
+
+    app.dependency_overrides.clear()
+    clear_request_metrics()
+
+
+def test_slow_queries_endpoint_requires_internal_token(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-service-role")
+    monkeypatch.setenv("DATA_GO_KR_KEY", "test-data-go-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+    monkeypatch.setenv("INTERNAL_JOB_TOKEN", "dev-internal-token")
+    get_settings.cache_clear()
+    client = TestClient(app)
+
+    assert client.get("/api/v1/ops/slow-queries").status_code == 401
+    res = client.get("/api/v1/ops/slow-queries", headers={"Authorization": "Bearer dev-internal-token"})
+    assert res.status_code == 200
+    assert res.json()["items"] == []
+
+    get_settings.cache_clear()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+from scripts.qa.benchmark_collector import STAGES, compare_with_baseline, corpus_digest, load_corpus, run_benchmark
+
+ARTICLE_TEXT = (
+    "[여론조사] 서울시장 가상대결 김민준 41% vs 이서연 37%. 조사기관 한국갤럽, 표본 1,000명, "
+    "응답률 12.3%, 오차범위 ±3.1%p. 조사기간 2026년 2월 10~11일."
+)
+
+
+def _write_pack(path, payload):
+    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_load_corpus_reads_articles_and_records_and_dedups_by_hash(tmp_path):
+    article = {"url": "https://example.com/a", "title": "서울시장 여론조사", "raw_text": ARTICLE_TEXT, "raw_hash": "h1"}
+    first = _write_pack(tmp_path / "collector_a.json", {"articles": [article]})
+    second = _write_pack(
+        tmp_path / "collector_b.json",
+        {"records": [{"article": article}, {"article": {**article, "url": "https://example.com/b", "raw_hash": "h2"}}]},
+    )
+
+    articles = load_corpus([first, second])
+
+    assert [a.raw_hash for a in articles] == ["h1", "h2"]
+    assert corpus_digest(articles) != corpus_digest(articles[:1])
+
+
+def test_run_benchmark_reports_latency_memory_and_stage_times(tmp_path):
+    pack = _write_pack(
+        tmp_path / "collector_a.json",
+        {"articles": [{"url": "https://example.com/a", "title": "서울시장 여론조사", "raw_text": ARTICLE_TEXT}]},
+    )
+
+    results = run_benchmark(load_corpus([pack]), iterations=2, warmup=0)
+
+    assert results["article_count"] == 1
+    assert results["iterations"] == 2
+    assert results["articles_per_sec"] > 0
+    assert results["p99_ms"] >= results["p50_ms"] > 0
+    assert results["peak_memory_kib"] > 0
+    assert set(results["stage_sec"]) == set(STAGES)
+
+
+def test_compare_with_baseline_flags_slowdowns_beyond_threshold():
+    baseline = {"corpus_digest": "d1", "results": {"articles_per_sec": 100.0, "p50_ms": 1.0, "p99_ms": 10.0}}
+
+    ok = compare_with_baseline(
+        {"corpus_digest": "d1", "articles_per_sec": 90.0, "p50_ms": 1.1, "p99_ms": 11.0}, baseline, threshold=0.2
+    )
+    slow = compare_with_baseline(
+        {"corpus_digest": "d1", "articles_per_sec": 70.0, "p50_ms": 1.0, "p99_ms": 15.0}, baseline, threshold=0.2
+    )
+
+    assert ok["status"] == "ok"
+    assert slow["status"] == "regression"
+    assert [row["metric"] for row in slow["regressions"]] == ["articles_per_sec", "p99_ms"]
+    assert compare_with_baseline({"corpus_digest": "d2"}, baseline, threshold=0.2)["status"] == "corpus_mismatch"
+    assert compare_with_baseline({"corpus_digest": "d1"}, None, threshold=0.2)["status"] == "no_baseline"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from app.services.elections_master import (
     build_election_slots,
+    build_official_display_title,
     default_office_types_for_region,
 )
 
@@ -48,3 +49,30 @@ def test_build_election_slots_adds_default_and_byelection_slots() -> None:
     metro_row = next(row for row in slots if row["region_code"] == "32-000" and row["office_type"] == "광역자치단체장")
     assert metro_row["has_poll_data"] is True
     assert metro_row["latest_matchup_id"] == "20260603|광역자치단체장|32-000"
+
+
+def test_build_official_display_title_applies_sejong_override() -> None:
+    gwangju_row = {
+        "region_code": "29-000",
+        "sido_name": "광주광역시",
+        "sigungu_name": "전체",
+        "admin_level": "sido",
+    }
+    gangwon_row = {
+        "region_code": "32-000",
+        "sido_name": "강원특별자치도",
+        "sigungu_name": "전체",
+        "admin_level": "sido",
+    }
+
+    assert build_official_display_title(gwangju_row, "광역자치단체장", "광주광역시 광역자치단체장") == "세종시장"
+    assert build_official_display_title(gangwon_row, "교육감", "강원특별자치도 교육감") == "강원특별자치도 교육감"
+    assert build_official_display_title(gangwon_row, "교육감", None) == "강원교육감"
+
+    slots = build_election_slots(
+        regions=[gwangju_row],
+        latest_matchup_by_pair={},
+        observed_byelection_pairs=set(),
+    )
+    assert [slot["display_title"] for slot in slots] == ["세종시장", "세종시의회", "세종교육감"]
+    assert all(slot["topology"] == "official" for slot in slots)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from app.services.repository import PostgresRepository
+from scripts.qa.benchmark_fingerprint_merge import _BenchConn, build_observations, run_benchmark
+
+
+def test_bulk_upsert_merges_repeated_fingerprints_in_sql_waves():
+    observations = build_observations(polls=4, conflict_every=3)
+    conn = _BenchConn(roundtrip_ms=0)
+    repo = PostgresRepository(conn)
+
+    result = repo.bulk_upsert_poll_observations(observations, article_ids=[7] * len(observations), ingestion_run_id=1)
+
+    # Article rows in one INSERT, the NESDC rows sharing their fingerprints in a second.
+    assert conn.statement_count == 2
+    assert result["written_count"] == 6
+    assert [c["observation_key"] for c in result["conflicts"]] == ["nesdc-0", "nesdc-3"]
+    ids = result["observation_ids"]
+    assert ids[4] is None and ids[7] is None
+    assert ids[5] == ids[1] and ids[6] == ids[2]
+    merged = conn.by_key["article-1"]
+    assert merged["source_channel"] == "nesdc"
+    assert merged["source_channels"] == ["article", "nesdc"]
+    assert merged["verified"] is True
+    assert "nesdc-1" not in conn.by_key
+
+
+def test_bulk_upsert_uses_key_conflict_for_rows_without_fingerprint():
+    conn = _BenchConn(roundtrip_ms=0)
+    repo = PostgresRepository(conn)
+    observations = [
+        {"observation_key": "obs-a", "survey_name": "first", "pollster": "A"},
+        {"observation_key": "obs-a", "survey_name": "second", "pollster": "A"},
+    ]
+
+    result = repo.bulk_upsert_poll_observations(observations, article_ids=[7, 7], ingestion_run_id=1)
+
+    assert conn.statement_count == 2
+    assert result["conflicts"] == []
+    assert result["observation_ids"][0] == result["observation_ids"][1]
+    assert conn.by_key["obs-a"]["survey_name"] == "second"
+
+
+def test_benchmark_reports_matching_counts_for_both_paths():
+    report = run_benchmark(polls=20, reingest_rounds=2, conflict_every=5, batch_size=8, roundtrip_ms=0)
+
+    results = report["results"]
+    assert report["scenario"] == "article_nesdc_mixed_ingest_v1"
+    assert results["observation_count_matches"] is True
+    assert results["duplicate_increase"] == 0
+    assert results["per_row"]["duplicate_conflict_count"] == results["bulk"]["duplicate_conflict_count"] == 8
+    assert results["bulk"]["statement_count"] < results["per_row"]["statement_count"]
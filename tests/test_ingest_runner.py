@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import gzip
+import json
 
-from app.jobs.ingest_runner import run_ingest_with_retry
+import app.jobs.ingest_runner as ingest_runner_module
+from app.jobs.ingest_runner import (
+    gzip_request_fn,
+    run_chunked_ingest,
+    run_ingest_job_polling,
+    run_ingest_with_retry,
+    split_ingest_payload,
+)
 
 
 @dataclass
@@ -187,3 +196,136 @@ def test_ingest_runner_classifies_db_schema_detail() -> None:
     assert result.failure_class == "http_5xx"
     assert result.cause_code == "db_schema_mismatch"
     assert result.attempts[0].cause_code == "db_schema_mismatch"
+
+
+def test_ingest_job_polling_retries_with_same_idempotency_key_and_polls_to_success():
+    posts: list[str] = []
+    polls = iter(
+        [
+            DummyResponse(status_code=200, body={"job_id": 7, "status": "running", "progress_done": 3}),
+            DummyResponse(status_code=200, body={"job_id": 7, "status": "success", "run_id": 41}),
+        ]
+    )
+
+    def request_fn(url, headers, payload, timeout):  # noqa: ARG001
+        posts.append(headers["Idempotency-Key"])
+        if len(posts) == 1:
+            return DummyResponse(status_code=503, body={"detail": "database connection failed (network_error): x"})
+        return DummyResponse(status_code=202, body={"job_id": 7, "status": "queued"})
+
+    def get_fn(url, headers, timeout):  # noqa: ARG001
+        assert url.endswith("/api/v1/jobs/ingest-jobs/7")
+        return next(polls)
+
+    result = run_ingest_job_polling(
+        api_base_url="http://127.0.0.1:8100",
+        token="token",
+        payload={"records": []},
+        idempotency_key="ingest-abc",
+        request_fn=request_fn,
+        get_fn=get_fn,
+        sleep_fn=lambda _: None,
+    )
+
+    assert result.success is True
+    assert posts == ["ingest-abc", "ingest-abc"]
+    assert result.run_ids == [41]
+    assert [item.failure_class for item in result.attempts] == ["http_5xx", None]
+
+
+def test_ingest_job_polling_times_out_when_job_never_finishes():
+    def request_fn(url, headers, payload, timeout):  # noqa: ARG001
+        return DummyResponse(status_code=202, body={"job_id": 3, "status": "queued"})
+
+    def get_fn(url, headers, timeout):  # noqa: ARG001
+        return DummyResponse(status_code=200, body={"job_id": 3, "status": "running"})
+
+    result = run_ingest_job_polling(
+        api_base_url="http://127.0.0.1:8100",
+        token="token",
+        payload={"records": []},
+        idempotency_key="ingest-abc",
+        max_retries=0,
+        poll_interval_seconds=1.0,
+        poll_timeout_seconds=3.0,
+        request_fn=request_fn,
+        get_fn=get_fn,
+        sleep_fn=lambda _: None,
+    )
+
+    assert result.success is False
+    assert result.failure_class == "timeout"
+    assert result.attempts[0].job_status == "running"
+
+
+def _chunk_payload(count: int) -> dict:
+    return {
+        "run_type": "collector",
+        "extractor_version": "v1",
+        "records": [{"observation": {"observation_key": f"obs-{i}"}, "note": "x" * 50} for i in range(count)],
+    }
+
+
+def test_split_ingest_payload_bounds_chunks_and_keeps_stable_ids():
+    payload = _chunk_payload(7)
+
+    chunks = split_ingest_payload(payload, max_chunk_bytes=10_000, max_chunk_records=3)
+    again = split_ingest_payload(payload, max_chunk_bytes=10_000, max_chunk_records=3)
+    by_size = split_ingest_payload(payload, max_chunk_bytes=200, max_chunk_records=100)
+
+    assert [chunk.record_count for chunk in chunks] == [3, 3, 1]
+    assert [chunk.chunk_id for chunk in chunks] == [chunk.chunk_id for chunk in again]
+    assert chunks[0].payload["run_type"] == "collector"
+    assert all(chunk.size_bytes <= 200 for chunk in by_size)
+    assert sum(chunk.record_count for chunk in by_size) == 7
+
+
+def test_chunked_ingest_resends_only_failed_chunks_and_skips_acked():
+    payload = _chunk_payload(6)
+    chunks = split_ingest_payload(payload, max_chunk_bytes=10_000, max_chunk_records=2)
+    sent: list[str] = []
+    acked: list[str] = []
+
+    def request_fn(url, headers, chunk_payload, timeout):  # noqa: ARG001
+        key = chunk_payload["records"][0]["observation"]["observation_key"]
+        sent.append(key)
+        if key == "obs-4" and sent.count(key) == 1:
+            return DummyResponse(status_code=503, body={"detail": "upstream"})
+        return DummyResponse(status_code=200, body={"run_id": len(sent), "status": "success"})
+
+    result = run_chunked_ingest(
+        api_base_url="http://127.0.0.1:8100",
+        token="token",
+        payload=payload,
+        max_chunk_records=2,
+        concurrency=2,
+        acked_chunk_ids={chunks[0].chunk_id},
+        on_chunk_ack=lambda chunk, _result: acked.append(chunk.chunk_id),
+        max_retries=1,
+        request_fn=request_fn,
+        sleep_fn=lambda _: None,
+        heartbeat_interval_seconds=0,
+    )
+
+    assert result.success is True
+    assert sorted(sent) == ["obs-2", "obs-4", "obs-4"]
+    assert sorted(acked) == sorted(chunk.chunk_id for chunk in chunks[1:])
+    assert [row["status"] for row in result.chunks] == ["already_acked", "acked", "acked"]
+    assert {item.chunk_id for item in result.attempts} == {chunks[1].chunk_id, chunks[2].chunk_id}
+
+
+def test_gzip_request_fn_sends_compressed_json(monkeypatch):
+    captured = {}
+
+    def fake_post(url, *, headers, content, timeout):
+        captured.update(url=url, headers=headers, content=content, timeout=timeout)
+        return DummyResponse(200, {"status": "success"})
+
+    monkeypatch.setattr(ingest_runner_module.httpx, "post", fake_post)
+    payload = {"run_type": "manual", "records": [{"observation": {"survey_name": "여론조사"}}]}
+
+    gzip_request_fn("http://api/jobs", {"Authorization": "Bearer t"}, payload, 5.0)
+
+    assert captured["headers"]["Content-Encoding"] == "gzip"
+    assert captured["headers"]["Authorization"] == "Bearer t"
+    assert json.loads(gzip.decompress(captured["content"])) == payload
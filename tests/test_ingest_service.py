@@ -5,6 +5,7 @@ from app.models.schemas import IngestPayload
 from app.services.errors import DuplicateConflictError
 import app.services.ingest_service as ingest_service_module
 from app.services.ingest_service import ingest_payload
+from app.services.party_evidence_index import get_party_evidence_index, reset_party_evidence_index
 
 
 class FakeRepo:
@@ -195,6 +196,28 @@ def test_ingest_error_pushes_review_queue():
     assert repo.review[0][2] == "ingestion_error"
 
 
+def test_each_applied_record_bumps_data_generation_before_the_run_finishes():
+    class GenerationRepo(FakeRepo):
+        def __init__(self):
+            super().__init__()
+            self.bumps_before_finish = []
+            self.generation = 0
+
+        def bump_data_generation(self):
+            self.generation += 1
+
+        def finish_ingestion_run(self, run_id, status, processed_count, error_count):
+            self.bumps_before_finish.append(self.generation)
+            super().finish_ingestion_run(run_id, status, processed_count, error_count)
+
+    repo = GenerationRepo()
+    payload = IngestPayload.model_validate(deepcopy(PAYLOAD))
+
+    ingest_payload(payload, repo)
+
+    assert repo.bumps_before_finish == [len(payload.records)]
+
+
 def test_scope_inference_from_population_text_sets_regional_scope_and_region_code():
     repo = FakeRepo()
     payload_data = deepcopy(PAYLOAD)
@@ -288,6 +311,74 @@ def test_duplicate_conflict_routes_to_specific_review_issue_type():
     assert repo.review[0][2] == "DUPLICATE_CONFLICT"
 
 
+class BulkRepo(FakeRepo):
+    def __init__(self, *, conflict_keys=(), bulk_error=None):
+        super().__init__()
+        self.conflict_keys = set(conflict_keys)
+        self.bulk_error = bulk_error
+        self.bulk_calls = []
+        self.row_upserts = 0
+        self.rollbacks = 0
+
+    def bulk_upsert_poll_observations(self, observations, *, article_ids, ingestion_run_id):
+        self.bulk_calls.append([o["observation_key"] for o in observations])
+        if self.bulk_error is not None:
+            raise self.bulk_error
+        ids, conflicts = [], []
+        for index, observation in enumerate(observations):
+            key = observation["observation_key"]
+            if key in self.conflict_keys:
+                ids.append(None)
+                conflicts.append({"index": index, "observation_key": key, "error": "DUPLICATE_CONFLICT core fields mismatch"})
+                continue
+            self.observations[key] = observation
+            ids.append(len(self.observations))
+        return {"observation_ids": ids, "conflicts": conflicts, "written_count": len(ids) - len(conflicts)}
+
+    def upsert_poll_observation(self, observation, article_id, ingestion_run_id):
+        self.row_upserts += 1
+        return super().upsert_poll_observation(observation, article_id, ingestion_run_id)
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _two_record_payload():
+    raw = deepcopy(PAYLOAD)
+    second = deepcopy(raw["records"][0])
+    second["article"]["url"] = "https://example.com/2"
+    second["observation"]["observation_key"] = "obs-2"
+    second["observation"]["pollster"] = "KBS"
+    raw["records"].append(second)
+    return IngestPayload.model_validate(raw)
+
+
+def test_apply_batches_observations_through_bulk_upsert_and_files_conflicts():
+    repo = BulkRepo(conflict_keys={"obs-2"})
+
+    result = ingest_payload(_two_record_payload(), repo)
+
+    assert repo.bulk_calls == [["obs-1", "obs-2"]]
+    assert repo.row_upserts == 0
+    assert result.processed_count == 1
+    assert result.error_count == 1
+    assert set(repo.observations) == {"obs-1"}
+    assert [(entity_id, issue) for _, entity_id, issue, _ in repo.review] == [("obs-2", "DUPLICATE_CONFLICT")]
+    assert {row[0] for row in repo.options} == {1}
+
+
+def test_apply_retries_per_row_when_bulk_upsert_fails():
+    repo = BulkRepo(bulk_error=RuntimeError("statement timeout"))
+
+    result = ingest_payload(_two_record_payload(), repo)
+
+    assert repo.bulk_calls == [["obs-1", "obs-2"]]
+    assert repo.rollbacks == 1
+    assert repo.row_upserts == 2
+    assert result.processed_count == 2
+    assert result.error_count == 0
+
+
 def test_uncertain_date_inference_routes_review_and_updates_run_counters():
     repo = FakeRepo()
     payload_data = deepcopy(PAYLOAD)
@@ -518,6 +609,101 @@ def test_candidate_particle_noise_token_routes_manual_review_mapping_error():
     assert any(row[2] == "mapping_error" and "CANDIDATE_TOKEN_NOISE" in row[3] for row in repo.review)
 
 
+def test_party_inference_v3_short_circuits_only_on_official_evidence(monkeypatch):
+    enrich_calls = []
+
+    class _FakeVerifier:
+        def enrich_candidate(self, candidate):  # noqa: ANN001
+            enrich_calls.append(candidate["name_ko"])
+            return candidate
+
+        def verify_candidate(self, *, candidate_name, party_name=None):  # noqa: ARG002
+            return (True, 0.97)
+
+    monkeypatch.setattr(ingest_service_module, "_build_candidate_service", lambda *, record, sg_typecode: _FakeVerifier())
+
+    class EvidenceRepo(FakeRepo):
+        def __init__(self):
+            super().__init__()
+            self.evidence = [
+                {
+                    "candidate_token": "오세훈",
+                    "region_code": "",
+                    "party_name": "국민의힘",
+                    "source": "registry",
+                    "evidence_count": 1,
+                },
+                {
+                    "candidate_token": "나경원",
+                    "region_code": "11-000",
+                    "party_name": "국민의힘",
+                    "source": "incumbent",
+                    "evidence_count": 1,
+                },
+            ]
+
+        def fetch_candidate_party_evidence(self):
+            return list(self.evidence)
+
+        def refresh_candidate_party_evidence(self, rows):
+            # Counts are re-derived, never accumulated: re-applying a record replaces its rows.
+            def key(row):
+                return (row["candidate_token"], row["region_code"], row["party_name"], row["source"])
+
+            stored = {key(row): row for row in self.evidence}
+            for row in rows:
+                stored[key(row)] = dict(row)
+            self.evidence = list(stored.values())
+            tokens = {row["candidate_token"] for row in rows}
+            return [row for row in self.evidence if row["candidate_token"] in tokens]
+
+    reset_party_evidence_index()
+    repo = EvidenceRepo()
+    payload_data = deepcopy(PAYLOAD)
+    payload_data["records"][0]["options"] = [
+        {"option_type": "candidate_matchup", "option_name": "정원오", "party_name": "더불어민주당", "value_raw": "44%"},
+        {"option_type": "candidate_matchup", "option_name": "오세훈", "value_raw": "31%"},
+    ]
+    ingest_payload(IngestPayload.model_validate(payload_data), repo)
+
+    assert enrich_calls == []
+    inferred = repo.option_rows[1]
+    assert inferred["party_name"] == "국민의힘"
+    assert inferred["party_inference_source"] == "official_registry_v3"
+    assert json.loads(inferred["party_inference_evidence"])["rule"] == "party_evidence_index"
+    assert {
+        "candidate_token": "정원오",
+        "region_code": "11-000",
+        "party_name": "더불어민주당",
+        "source": "poll_option",
+        "evidence_count": 1,
+    } in repo.evidence
+
+    # Re-applying the same record re-derives its evidence instead of adding to it.
+    ingest_payload(IngestPayload.model_validate(payload_data), repo)
+    assert get_party_evidence_index().lookup("정원오", ["11-000"]).total == 1
+
+    # Poll-option evidence alone still asks data.go.kr; when that has no answer the index fills in,
+    # labelled as article context and held below the review threshold.
+    payload_data["records"][0]["observation"]["observation_key"] = "obs-2"
+    payload_data["records"][0]["options"] = [
+        {"option_type": "candidate_matchup", "option_name": "정원오", "value_raw": "40%"},
+        {"option_type": "candidate_matchup", "option_name": "나경원", "value_raw": "30%"},
+    ]
+    ingest_payload(IngestPayload.model_validate(payload_data), repo)
+
+    assert "정원오" in enrich_calls and "나경원" in enrich_calls
+    stated_elsewhere, incumbent = repo.option_rows[-2:]
+    assert stated_elsewhere["party_name"] == "더불어민주당"
+    assert stated_elsewhere["party_inference_source"] == "article_context"
+    assert stated_elsewhere["party_inference_confidence"] == 0.75
+    assert stated_elsewhere["needs_manual_review"] is True
+    assert incumbent["party_name"] == "국민의힘"
+    assert incumbent["party_inference_source"] == "incumbent_context_v3"
+    assert incumbent["party_inference_confidence"] == 0.85
+    reset_party_evidence_index()
+
+
 def test_candidate_data_go_verified_sets_data_go_source(monkeypatch):
     class _FakeVerifier:
         def enrich_candidate(self, candidate):  # noqa: ANN001
@@ -879,3 +1065,118 @@ def test_multi_scenario_parse_incomplete_routes_review_queue():
     assert result.status == "success"
     assert any(row[2] == "scenario_parse_incomplete" for row in repo.review)
     assert any("candidate_count=2" in row[3] for row in repo.review if row[2] == "scenario_parse_incomplete")
+
+
+def test_plan_ingest_payload_plans_writes_without_repo_or_mutating_payload():
+    payload_data = deepcopy(PAYLOAD)
+    payload_data["records"][0]["observation"]["date_inference_mode"] = "estimated_timestamp"
+    payload = IngestPayload.model_validate(payload_data)
+    before = payload.model_dump()
+
+    plan = ingest_service_module.plan_ingest_payload(payload)
+
+    assert payload.model_dump() == before
+    record_plan = plan.records[0]
+    assert record_plan.options_finalized is True
+    assert record_plan.matchup["election_id"] == "20260603"
+    assert len(record_plan.observation["poll_fingerprint"]) == 64
+    assert record_plan.options[0]["option_type"] == "election_frame"
+    assert [item.issue_type for item in record_plan.review_items] == ["extract_error"]
+    assert plan.summary()["planned_count"] == 1
+    assert plan.summary()["option_write_count"] == 1
+    assert plan.payload_hash == ingest_service_module.plan_ingest_payload(payload).payload_hash
+
+    repo = FakeRepo()
+    result = ingest_service_module.apply_ingest_plan(plan, repo)
+    assert result.processed_count == 1
+    assert repo.policy_counters == [(1, 0, 1)]
+    assert [row[2] for row in repo.review] == ["extract_error"]
+
+
+def test_plan_ingest_payload_records_planning_failure_as_ingest_error(monkeypatch):
+    def broken_normalize(option):  # noqa: ARG001
+        raise ValueError("bad option")
+
+    monkeypatch.setattr(ingest_service_module, "_normalize_option", broken_normalize)
+    plan = ingest_service_module.plan_ingest_payload(IngestPayload.model_validate(deepcopy(PAYLOAD)))
+
+    assert plan.records[0].error == "bad option"
+    repo = FakeRepo()
+    result = ingest_service_module.apply_ingest_plan(plan, repo)
+    assert result.error_count == 1
+    assert repo.observations == {}
+    assert repo.review == [("ingest_record", "obs-1", "ingestion_error", "bad option")]
+
+
+class HashingRepo(FakeRepo):
+    def __init__(self):
+        super().__init__()
+        self.content_hashes = {}
+        self.hash_lookups = []
+        self.skipped_updates = []
+
+    def fetch_observation_content_hashes(self, record_keys):
+        self.hash_lookups.append(list(record_keys))
+        return {key: self.content_hashes[key] for key in record_keys if key in self.content_hashes}
+
+    def set_observation_content_hash(self, record_key, observation_id, content_hash):  # noqa: ARG002
+        self.content_hashes[record_key] = content_hash
+
+    def update_ingestion_skipped_count(self, run_id, skipped_count):
+        self.skipped_updates.append((run_id, skipped_count))
+
+
+def test_unchanged_record_is_skipped_by_content_hash():
+    repo = HashingRepo()
+    payload = IngestPayload.model_validate(deepcopy(PAYLOAD))
+
+    first = ingest_payload(payload, repo)
+    option_writes = len(repo.option_rows)
+    second = ingest_payload(payload, repo)
+
+    assert (first.processed_count, first.skipped_count) == (1, 0)
+    assert (second.processed_count, second.skipped_count, second.status) == (0, 1, "success")
+    assert second.touched_matchup_ids == []
+    assert len(repo.option_rows) == option_writes
+    assert repo.hash_lookups == [["obs-1"], ["obs-1"]]
+    assert repo.skipped_updates == [(2, 1)]
+
+    changed = deepcopy(PAYLOAD)
+    changed["records"][0]["options"][0]["value_raw"] = "54~56%"
+    third = ingest_payload(IngestPayload.model_validate(changed), repo)
+    assert (third.processed_count, third.skipped_count) == (1, 0)
+
+
+def test_records_merged_by_fingerprint_keep_their_own_content_hash():
+    class MergingRepo(HashingRepo):
+        """Fingerprint merge keeps the first record's row, like the poll_fingerprint upsert."""
+
+        def __init__(self):
+            super().__init__()
+            self.ids_by_fingerprint = {}
+
+        def upsert_poll_observation(self, observation, article_id, ingestion_run_id):  # noqa: ARG002
+            fingerprint = observation["poll_fingerprint"]
+            if fingerprint not in self.ids_by_fingerprint:
+                self.ids_by_fingerprint[fingerprint] = len(self.ids_by_fingerprint) + 1
+                self.observations[observation["observation_key"]] = observation
+            return self.ids_by_fingerprint[fingerprint]
+
+    payload = deepcopy(PAYLOAD)
+    nesdc_record = deepcopy(payload["records"][0])
+    nesdc_record["article"]["url"] = "https://example.com/nesdc-1"
+    nesdc_record["observation"]["observation_key"] = "obs-1-nesdc"
+    nesdc_record["observation"]["source_channel"] = "nesdc"
+    nesdc_record["observation"]["source_channels"] = ["nesdc"]
+    payload["records"].append(nesdc_record)
+    repo = MergingRepo()
+
+    first = ingest_payload(IngestPayload.model_validate(payload), repo)
+    second = ingest_payload(IngestPayload.model_validate(payload), repo)
+
+    assert len(repo.ids_by_fingerprint) == 1
+    assert list(repo.observations) == ["obs-1"]
+    assert set(repo.content_hashes) == {"obs-1", "obs-1-nesdc"}
+    assert repo.content_hashes["obs-1"] != repo.content_hashes["obs-1-nesdc"]
+    assert (first.processed_count, first.skipped_count) == (2, 0)
+    assert (second.processed_count, second.skipped_count) == (0, 2)
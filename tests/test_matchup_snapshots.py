@@ -0,0 +1,124 @@
+from datetime import date
+
+from app.services.matchup_snapshots import rebuild_matchup_snapshots, run_matchup_snapshot_rebuild
+from app.services.repository import PostgresRepository, clear_api_read_cache
+
+
+class _SnapshotRepo:
+    def __init__(self):
+        self.upserts: list[tuple[str, dict, dict]] = []
+        self.deleted: list[str] = []
+        self.rollback_count = 0
+
+    def fetch_matchup_data_version(self, matchup_id):
+        return 7
+
+    def get_matchup(self, matchup_id):
+        if matchup_id == "missing":
+            return None
+        if matchup_id == "broken":
+            raise RuntimeError("boom")
+        if matchup_id == "2026_local|광역자치단체장|11-000":
+            matchup_id = "20260603|광역자치단체장|11-000"
+        return {"matchup_id": matchup_id, "survey_end_date": date(2026, 2, 18), "options": []}
+
+    def upsert_matchup_snapshot(self, matchup_id, payload, *, data_version, source_run_id=None):
+        self.upserts.append((matchup_id, payload, {"data_version": data_version, "source_run_id": source_run_id}))
+
+    def delete_matchup_snapshot(self, matchup_id):
+        self.deleted.append(matchup_id)
+
+    def rollback(self):
+        self.rollback_count += 1
+
+
+def test_rebuild_matchup_snapshots_stores_canonical_payloads_and_reports_failures():
+    repo = _SnapshotRepo()
+
+    result = rebuild_matchup_snapshots(
+        repo,
+        [
+            "20260603|광역자치단체장|26-000",
+            "20260603|광역자치단체장|26-000",
+            "2026_local|광역자치단체장|11-000",
+            "missing",
+            "broken",
+        ],
+        run_id=42,
+    )
+
+    assert result.rebuilt == ["20260603|광역자치단체장|26-000", "20260603|광역자치단체장|11-000"]
+    assert result.missing == ["missing"]
+    assert result.failed == ["broken"]
+    assert repo.deleted == ["missing"]
+    assert repo.rollback_count == 1
+    assert [row[0] for row in repo.upserts] == result.rebuilt
+    assert repo.upserts[0][2] == {"data_version": 7, "source_run_id": 42}
+    assert result.as_dict()["failed_count"] == 1
+
+
+def test_run_matchup_snapshot_rebuild_skips_empty_and_swallows_connection_errors(monkeypatch):
+    assert run_matchup_snapshot_rebuild([])["status"] == "skipped"
+
+    def _raise():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr("app.services.matchup_snapshots.get_connection", _raise)
+    summary = run_matchup_snapshot_rebuild(["20260603|광역자치단체장|11-000"], run_id=7)
+    assert summary["status"] == "failed"
+    assert "db down" in summary["error"]
+
+
+class _Cursor:
+    def __init__(self, row):
+        self.row = row
+        self.queries: list[str] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
+        return False
+
+    def execute(self, query, params=None):  # noqa: ARG002
+        self.queries.append(query)
+
+    def fetchone(self):
+        return self.row
+
+
+class _Conn:
+    def __init__(self, row):
+        self.cur = _Cursor(row)
+
+    def cursor(self):
+        return self.cur
+
+
+def test_fetch_matchup_snapshot_checks_data_version_and_restores_dates():
+    clear_api_read_cache()
+    conn = _Conn({"payload": '{"matchup_id": "m1", "survey_start_date": "2026-02-15", "survey_end_date": "2026-02-18"}'})
+    repo = PostgresRepository(conn)
+
+    payload = repo.fetch_matchup_snapshot("m1")
+
+    assert payload["survey_start_date"] == date(2026, 2, 15)
+    assert payload["survey_end_date"] == date(2026, 2, 18)
+    assert "s.data_version = m.data_version" in conn.cur.queries[0]
+    assert "COUNT(" not in conn.cur.queries[0]
+
+    assert PostgresRepository(_Conn(None)).fetch_matchup_snapshot("m2") is None
+
+
+def test_fetch_matchup_snapshot_answers_from_read_cache_before_querying(monkeypatch):
+    clear_api_read_cache()
+    monkeypatch.setattr("app.services.repository._api_read_cache_ttl_sec", lambda: 60.0)
+    conn = _Conn({"payload": '{"matchup_id": "m1", "survey_end_date": "2026-02-18"}'})
+    repo = PostgresRepository(conn)
+
+    first = repo.fetch_matchup_snapshot("m1")
+    second = repo.fetch_matchup_snapshot("m1")
+
+    assert second == first
+    assert len(conn.cur.queries) == 1
+    clear_api_read_cache()
@@ -0,0 +1,32 @@
+import random
+
+from app.services.multi_pattern_matcher import MultiPatternMatcher
+
+
+def test_best_picks_lowest_rank_across_texts():
+    matcher = MultiPatternMatcher(["경기도지사", "경기지사", "경기", "경기"])
+
+    assert len(matcher) == 3
+    assert matcher.best("경기 여론", "경기지사 후보") == "경기지사"
+    assert matcher.best("부산") is None
+    assert matcher.best("", None) is None
+    assert MultiPatternMatcher([]).best("경기") is None
+
+
+def test_best_sees_patterns_overlapping_an_earlier_hit():
+    # "중구" wins at position 0, but the higher-priority "구로구" starts inside it.
+    matcher = MultiPatternMatcher(["구로구", "중구"])
+
+    assert matcher.best("중구로구청") == "구로구"
+
+
+def test_best_matches_a_priority_loop_of_substring_checks():
+    rng = random.Random(7)
+    alphabet = "서울시장구로중경기도지사"
+    patterns = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(40)]
+    matcher = MultiPatternMatcher(patterns)
+
+    for _ in range(500):
+        texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(2)]
+        expected = next((pattern for pattern in patterns if any(pattern in text for text in texts)), None)
+        assert matcher.best(*texts) == expected
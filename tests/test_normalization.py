@@ -1,4 +1,4 @@
-from app.services.normalization import normalize_percentage
+from app.services.normalization import normalize_percentage, normalize_percentages
 
 
 def test_normalize_range_value():
@@ -15,3 +15,21 @@ def test_normalize_missing_value():
     assert normalized.value_max is None
     assert normalized.value_mid is None
     assert normalized.is_missing is True
+
+
+def test_normalize_band_and_reversed_range_value():
+    assert normalize_percentage(" 30%대 ") == (30.0, 39.0, 34.5, False)
+    assert normalize_percentage("55-53") == (53.0, 55.0, 54.0, False)
+    assert normalize_percentage("약 40%").is_missing is True
+
+
+def test_normalize_percentages_returns_columns_matching_scalar_results():
+    raws = ["53~55%", None, "40%", "30%대", "미공개", "40%"]
+
+    columns = normalize_percentages(raws)
+
+    expected = [normalize_percentage(raw) for raw in raws]
+    assert columns.value_min == [row.value_min for row in expected]
+    assert columns.value_max == [row.value_max for row in expected]
+    assert columns.value_mid == [row.value_mid for row in expected]
+    assert columns.is_missing == [True if raw in {None, "미공개"} else False for raw in raws]
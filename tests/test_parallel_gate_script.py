@@ -0,0 +1,119 @@
+import json
+from pathlib import Path
+from threading import Event
+import time
+
+from scripts.qa.run_parallel_gate import (
+    DEFAULT_CHECKS,
+    CheckOutcome,
+    GateCheck,
+    GateContext,
+    normalized_payload_path,
+    run_gate,
+    select_checks,
+)
+
+
+def _ctx(tmp_path: Path, input_path: Path | None = None) -> GateContext:
+    return GateContext(
+        root=tmp_path,
+        cache_dir=tmp_path / "cache",
+        input_path=input_path or tmp_path / "input.json",
+        timeout=30.0,
+        env={},
+    )
+
+
+def test_run_gate_runs_independent_checks_concurrently(tmp_path: Path) -> None:
+    both_started = Event()
+    arrived: list[str] = []
+
+    def waiter(name: str):
+        def run(_ctx: GateContext) -> CheckOutcome:
+            arrived.append(name)
+            if len(arrived) == 2:
+                both_started.set()
+            return CheckOutcome("pass" if both_started.wait(timeout=5) else "fail")
+
+        return run
+
+    out = run_gate(
+        [GateCheck("a", waiter("a")), GateCheck("b", waiter("b"))],
+        _ctx(tmp_path),
+        workers=2,
+        with_db=False,
+    )
+
+    assert out["summary"]["overall_status"] == "PASS"
+    assert out["summary"]["passed"] == 2
+
+
+def test_run_gate_orders_dependencies_and_skips_after_failure(tmp_path: Path) -> None:
+    order: list[str] = []
+
+    def record(name: str, status: str = "pass"):
+        def run(_ctx: GateContext) -> CheckOutcome:
+            order.append(name)
+            time.sleep(0.01)
+            return CheckOutcome(status)
+
+        return run
+
+    def boom(_ctx: GateContext) -> CheckOutcome:
+        raise RuntimeError("seed failed")
+
+    checks = [
+        GateCheck("seed", record("seed")),
+        GateCheck("after_seed", record("after_seed"), requires=("seed",)),
+        GateCheck("broken", boom),
+        GateCheck("after_broken", record("after_broken"), requires=("broken",)),
+        GateCheck("db_only", record("db_only"), needs_db=True),
+    ]
+    out = run_gate(checks, _ctx(tmp_path), workers=4, with_db=False)
+
+    assert order.index("seed") < order.index("after_seed")
+    assert "after_broken" not in order and "db_only" not in order
+    rows = out["checks"]
+    assert rows["broken"]["status"] == "fail"
+    assert "RuntimeError: seed failed" in rows["broken"]["detail"]
+    assert rows["after_broken"]["status"] == "skipped"
+    assert rows["db_only"]["detail"] == "requires --with-db"
+    assert out["summary"]["failed_checks"] == ["broken"]
+    assert out["summary"]["overall_status"] == "FAIL"
+    assert out["summary"]["serial_sec"] >= rows["seed"]["duration_sec"]
+
+
+def test_select_checks_pulls_in_requirements() -> None:
+    noop = lambda _ctx: CheckOutcome("pass")  # noqa: E731
+    checks = [
+        GateCheck("normalize", noop),
+        GateCheck("seed", noop, requires=("normalize",)),
+        GateCheck("smoke", noop, requires=("seed",)),
+        GateCheck("pytest", noop),
+    ]
+
+    assert [check.name for check in select_checks(checks, {"smoke"})] == ["normalize", "seed", "smoke"]
+    assert len(select_checks(checks, set())) == 4
+
+
+def test_normalized_payload_is_built_once_and_cached_on_disk(tmp_path: Path) -> None:
+    source = Path(__file__).resolve().parents[1] / "data" / "sample_ingest.json"
+    ctx = _ctx(tmp_path, input_path=source)
+
+    first = normalized_payload_path(ctx)
+    second = normalized_payload_path(ctx)
+
+    assert first == second and first.exists()
+    assert ctx.cache_hits == {"normalized_payload": 1}
+    assert json.loads(first.read_text(encoding="utf-8"))["records"]
+    mtime = first.stat().st_mtime_ns
+    assert normalized_payload_path(_ctx(tmp_path, input_path=source)).stat().st_mtime_ns == mtime
+
+
+def test_db_equivalence_writes_between_seed_and_app_server() -> None:
+    by_name = {check.name: check for check in DEFAULT_CHECKS}
+    names = [check.name for check in DEFAULT_CHECKS]
+
+    assert "seed_db" in by_name["db_equivalence"].requires
+    assert "db_equivalence" in by_name["app_server"].requires
+    assert names.index("seed_db") < names.index("db_equivalence") < names.index("app_server")
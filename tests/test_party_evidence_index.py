@@ -0,0 +1,92 @@
+from app.services.party_evidence_index import (
+    PartyEvidenceIndex,
+    get_party_evidence_index,
+    load_party_evidence_index,
+    party_evidence_row,
+    reset_party_evidence_index,
+)
+from app.services.repository import PostgresRepository
+
+
+def test_lookup_prefers_most_specific_region_then_region_agnostic_evidence():
+    index = PartyEvidenceIndex.from_rows(
+        [
+            party_evidence_row("정원오", "11-200", "더불어민주당", "poll_option", 3),
+            party_evidence_row("정원오", "11-200", "국민의힘", "poll_option"),
+            party_evidence_row("정원오", "", "더불어민주당", "registry"),
+            party_evidence_row("", "", "무소속", "registry"),
+            party_evidence_row("오세훈", "11-000", "국민의힘", "unknown_source"),
+        ]
+    )
+
+    local = index.lookup("정원오", ["11-200", "11-000"])
+    assert local.region_code == "11-200"
+    assert local.party_counts == {"더불어민주당": 3, "국민의힘": 1}
+    assert local.top_party() == ("더불어민주당", 3)
+    assert local.party_sources["더불어민주당"] == frozenset({"poll_option"})
+
+    fallback = index.lookup("정원오", ["26-000"])
+    assert fallback.region_code == ""
+    assert fallback.party_sources["더불어민주당"] == frozenset({"registry"})
+    assert index.lookup("오세훈", ["11-000"]) is None
+    assert len(index) == 2
+
+
+def test_load_party_evidence_index_reads_repo_once():
+    class EvidenceRepo:
+        calls = 0
+
+        def fetch_candidate_party_evidence(self):
+            self.calls += 1
+            return [party_evidence_row("오세훈", "11-000", "국민의힘", "data_go")]
+
+    reset_party_evidence_index()
+    repo = EvidenceRepo()
+
+    load_party_evidence_index(repo)
+    load_party_evidence_index(repo)
+
+    assert repo.calls == 1
+    assert get_party_evidence_index().lookup("오세훈", ["11-000"]).total == 1
+    reset_party_evidence_index()
+
+
+def test_incumbent_evidence_matches_head_of_government_titles():
+    regions = [
+        {"region_code": "11-000", "sido_name": "서울특별시", "sigungu_name": "전체"},
+        {"region_code": "11-200", "sido_name": "서울특별시", "sigungu_name": "성동구"},
+        {"region_code": "11-140", "sido_name": "서울특별시", "sigungu_name": "중구"},
+        {"region_code": "26-110", "sido_name": "부산광역시", "sigungu_name": "중구"},
+    ]
+    candidates = [
+        {"name_ko": "오세훈", "party_name": "국민의힘", "job": "서울특별시장"},
+        {"name_ko": "정원오", "party_name": "더불어민주당", "job": "성동구청장"},
+        {"name_ko": "김길성", "party_name": "국민의힘", "job": "서울특별시 중구청장"},
+        {"name_ko": "최진봉", "party_name": "국민의힘", "job": "중구청장"},
+        {"name_ko": "홍길동", "party_name": "무소속", "job": "변호사"},
+    ]
+
+    rows = PostgresRepository._incumbent_party_evidence_rows(candidates, regions)
+
+    assert {(row["candidate_token"], row["region_code"]) for row in rows} == {
+        ("오세훈", "11-000"),
+        ("정원오", "11-200"),
+        ("김길성", "11-140"),
+    }
+    assert {row["source"] for row in rows} == {"incumbent"}
+
+
+def test_replace_candidates_swaps_in_the_persisted_rows():
+    index = PartyEvidenceIndex.from_rows(
+        [
+            party_evidence_row("정원오", "11-200", "더불어민주당", "poll_option", 2),
+            party_evidence_row("오세훈", "", "국민의힘", "registry"),
+        ]
+    )
+
+    index.replace_candidates({"정원오"}, [party_evidence_row("정원오", "11-200", "더불어민주당", "poll_option", 2)])
+    index.replace_candidates({"정원오"}, [party_evidence_row("정원오", "11-200", "더불어민주당", "poll_option", 2)])
+
+    assert index.lookup("정원오", ["11-200"]).total == 2
+    assert index.lookup("오세훈", ["11-000"]).total == 1
+    assert len(index) == 2
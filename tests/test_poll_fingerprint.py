@@ -170,3 +170,4 @@ def test_merge_source_grade_does_not_downgrade_when_article_arrives_later():
     assert merged["source_channel"] == "nesdc"
     assert merged["source_channels"] == ["article", "nesdc"]
     assert merged["source_grade"] == "A"
+
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from app.services.slow_query_log import (
+    capture_query_plans,
+    capture_slow_query,
+    clear_slow_queries,
+    is_read_query,
+    recent_slow_queries,
+    slow_query_threshold_sec,
+)
+from scripts.qa.capture_query_plans import diff_plans, group_plans, plan_shape
+
+INDEX_PLAN = [
+    {
+        "Plan": {
+            "Node Type": "Nested Loop",
+            "Join Type": "Inner",
+            "Plans": [
+                {
+                    "Node Type": "Index Scan",
+                    "Index Name": "idx_poll_observations_matchup_latest",
+                    "Relation Name": "poll_observations",
+                },
+                {"Node Type": "Index Scan", "Index Name": "idx_poll_options_observation_value", "Relation Name": "poll_options"},
+            ],
+        }
+    }
+]
+SEQ_PLAN = [
+    {
+        "Plan": {
+            "Node Type": "Hash Join",
+            "Join Type": "Inner",
+            "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "poll_observations"},
+                {"Node Type": "Hash", "Plans": [{"Node Type": "Seq Scan", "Relation Name": "poll_options"}]},
+            ],
+        }
+    }
+]
+
+
+def test_plan_shape_keeps_structure_and_drops_costs():
+    assert plan_shape(INDEX_PLAN) == [
+        "Inner Nested Loop",
+        "  Index Scan using idx_poll_observations_matchup_latest on poll_observations",
+        "  Index Scan using idx_poll_options_observation_value on poll_options",
+    ]
+
+
+def test_diff_plans_flags_new_sequential_scans_on_watched_tables():
+    baseline = group_plans([{"method": "get_matchup", "plan": INDEX_PLAN}, {"method": "gone", "plan": INDEX_PLAN}])
+    current = group_plans(
+        [
+            {"method": "get_matchup", "plan": SEQ_PLAN},
+            {"method": "search_regions", "plan": INDEX_PLAN},
+            {"method": "skipped", "plan": None},
+        ]
+    )
+
+    result = diff_plans(baseline, current)
+
+    assert result["get_matchup"]["status"] == "changed"
+    assert result["get_matchup"]["new_seq_scans"] == ["poll_observations", "poll_options"]
+    assert any(line.startswith("+Inner Hash Join") for line in result["get_matchup"]["diff"])
+    assert result["search_regions"]["status"] == "new"
+    assert result["gone"]["status"] == "missing"
+    assert "skipped" not in result
+    assert diff_plans(baseline, baseline)["get_matchup"] == {"status": "ok", "diff": [], "new_seq_scans": []}
+
+
+def test_plan_capture_records_every_statement_under_repository_method_name():
+    assert slow_query_threshold_sec() is None
+    assert is_read_query("  WITH x AS (SELECT 1) SELECT * FROM x")
+    assert not is_read_query("UPDATE poll_observations SET verified = TRUE")
+
+    clear_slow_queries()
+    with capture_query_plans() as captured:
+        assert slow_query_threshold_sec() == 0.0
+        capture_slow_query(None, "UPDATE review_queue SET status = %s", ("resolved",), elapsed_sec=0.05)
+
+    assert captured[0]["method"] == "unknown"
+    assert captured[0]["plan"] is None
+    assert captured[0]["params"] == ["resolved"]
+    assert captured[0]["elapsed_ms"] == 50.0
+    assert recent_slow_queries() == []
+
+
+def test_slow_query_is_keyed_by_outermost_repository_method():
+    namespace = {"__name__": "app.services.repository", "capture_slow_query": capture_slow_query}
+    exec(
+        "def _inner(self):\n"
+        "    capture_slow_query(None, 'DELETE FROM x', None, elapsed_sec=1.0)\n"
+        "def fetch_dashboard_quality(self):\n"
+        "    _inner(self)\n",
+        namespace,
+    )
+
+    clear_slow_queries()
+    namespace["fetch_dashboard_quality"](object())
+
+    [entry] = recent_slow_queries()
+    assert entry["method"] == "fetch_dashboard_quality"
+    assert recent_slow_queries(method="get_matchup") == []
+    clear_slow_queries()
+
+
+def test_request_path_explains_without_analyze(monkeypatch):
+    import app.services.slow_query_log as slow_query_log
+
+    calls = []
+
+    def fake_explain(conn, query, params, *, analyze=False):
+        calls.append(analyze)
+        return [{"Plan": {"Node Type": "Result"}}], None
+
+    monkeypatch.setattr(slow_query_log, "explain_query", fake_explain)
+    monkeypatch.setattr(slow_query_log, "_explain_enabled", lambda: True)
+
+    clear_slow_queries()
+    capture_slow_query(None, "SELECT 1", None, elapsed_sec=1.0)
+    with capture_query_plans():
+        capture_slow_query(None, "SELECT 1", None, elapsed_sec=1.0)
+
+    assert calls == [False, True]
+    clear_slow_queries()
@@ -1,6 +1,11 @@
 import pytest
 
-from app.services.region_code_normalizer import normalize_region_code_input
+from app.services.region_code_normalizer import (
+    clear_region_code_cache,
+    normalize_region_code_input,
+    region_code_cache_info,
+    resolve_region_code,
+)
 
 
 @pytest.mark.parametrize(
@@ -22,3 +27,20 @@ def test_normalize_region_code_input(raw, canonical, is_code_like, was_aliased):
     assert normalized.canonical == canonical
     assert normalized.is_code_like is is_code_like
     assert normalized.was_aliased is was_aliased
+
+
+def test_resolve_region_code_memoizes_and_interns_canonical_codes():
+    clear_region_code_cache()
+
+    first = resolve_region_code("KR-32")
+    second = resolve_region_code("32-000")
+
+    assert first == "42-000"
+    assert first is second is resolve_region_code(" 42000 ")
+    assert resolve_region_code(" 서울특별시 ") == "서울특별시"
+    assert resolve_region_code("  ") is None
+    assert resolve_region_code(None) is None
+    info = region_code_cache_info()
+    assert (info.hits, info.misses) == (0, 5)
+    resolve_region_code("KR-32")
+    assert region_code_cache_info().hits == 1
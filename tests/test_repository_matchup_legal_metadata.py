@@ -3,10 +3,15 @@ from datetime import date
 from app.services.repository import PostgresRepository
 
 
+def _detail_rows(meta, region, observations):
+    base = {f"meta_{key}": value for key, value in meta.items()}
+    base.update({f"title_region_{key}": value for key, value in region.items()})
+    return [{**base, **observation, "has_observation": True} for observation in observations]
+
+
 class _Cursor:
     def __init__(self):
         self.execs: list[str] = []
-        self._step = 0
 
     def __enter__(self):
         return self
@@ -18,78 +23,74 @@ class _Cursor:
         self.execs.append(query)
 
     def fetchone(self):
-        if self._step == 0:
-            self._step += 1
-            return {
-                "matchup_id": "m1",
-                "region_code": "11-000",
-                "office_type": "광역자치단체장",
-                "title": "[여론조사] 서울시장 양자대결 정원오-오세훈",
-                "is_active": True,
-            }
-        if self._step == 1:
-            self._step += 1
-            return {
-                "region_code": "11-000",
-                "sido_name": "서울특별시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-        if self._step == 2:
-            self._step += 1
-            return {
-                "matchup_id": "m1",
-                "region_code": "11-000",
-                "office_type": "광역자치단체장",
-                "title": "[여론조사] 서울시장 양자대결 정원오-오세훈",
-                "pollster": "KBS",
-                "survey_start_date": date(2026, 2, 15),
-                "survey_end_date": date(2026, 2, 18),
-                "confidence_level": 95.0,
-                "sample_size": 1000,
-                "response_rate": 12.3,
-                "margin_of_error": 3.1,
-                "source_grade": "B",
-                "audience_scope": "regional",
-                "audience_region_code": "11-000",
-                "sampling_population_text": "서울시 거주 만 18세 이상",
-                "legal_completeness_score": 0.86,
-                "legal_filled_count": 6,
-                "legal_required_count": 7,
-                "date_resolution": "exact",
-                "date_inference_mode": "relative_published_at",
-                "date_inference_confidence": 0.92,
-                "observation_updated_at": "2026-02-18T03:00:00+00:00",
-                "official_release_at": None,
-                "article_published_at": "2026-02-18T01:00:00+00:00",
-                "nesdc_enriched": True,
-                "needs_manual_review": True,
-                "poll_fingerprint": "f" * 64,
-                "source_channel": "article",
-                "source_channels": ["article", "nesdc"],
-                "verified": True,
-                "observation_id": 101,
-                "options": [
-                    {
-                        "option_name": "정원오",
-                        "candidate_id": "cand-jwo",
-                        "party_name": "더불어민주당",
-                        "scenario_key": "default",
-                        "scenario_type": "head_to_head",
-                        "scenario_title": "정원오 vs 오세훈",
-                        "value_mid": 44.0,
-                        "value_raw": "44%",
-                        "party_inferred": True,
-                        "party_inference_source": "name_rule",
-                        "party_inference_confidence": 0.84,
-                        "needs_manual_review": False,
-                    }
-                ],
-            }
         return None
 
     def fetchall(self):
-        return []
+        if len(self.execs) != 1:
+            return []
+        meta = {
+            "matchup_id": "m1",
+            "region_code": "11-000",
+            "office_type": "광역자치단체장",
+            "title": "[여론조사] 서울시장 양자대결 정원오-오세훈",
+            "is_active": True,
+        }
+        region = {
+            "region_code": "11-000",
+            "sido_name": "서울특별시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
+        }
+        observation = {
+            "matchup_id": "m1",
+            "region_code": "11-000",
+            "office_type": "광역자치단체장",
+            "title": "[여론조사] 서울시장 양자대결 정원오-오세훈",
+            "pollster": "KBS",
+            "survey_start_date": date(2026, 2, 15),
+            "survey_end_date": date(2026, 2, 18),
+            "confidence_level": 95.0,
+            "sample_size": 1000,
+            "response_rate": 12.3,
+            "margin_of_error": 3.1,
+            "source_grade": "B",
+            "audience_scope": "regional",
+            "audience_region_code": "11-000",
+            "sampling_population_text": "서울시 거주 만 18세 이상",
+            "legal_completeness_score": 0.86,
+            "legal_filled_count": 6,
+            "legal_required_count": 7,
+            "date_resolution": "exact",
+            "date_inference_mode": "relative_published_at",
+            "date_inference_confidence": 0.92,
+            "observation_updated_at": "2026-02-18T03:00:00+00:00",
+            "official_release_at": None,
+            "article_published_at": "2026-02-18T01:00:00+00:00",
+            "nesdc_enriched": True,
+            "needs_manual_review": True,
+            "poll_fingerprint": "f" * 64,
+            "source_channel": "article",
+            "source_channels": ["article", "nesdc"],
+            "verified": True,
+            "observation_id": 101,
+            "options": [
+                {
+                    "option_name": "정원오",
+                    "candidate_id": "cand-jwo",
+                    "party_name": "더불어민주당",
+                    "scenario_key": "default",
+                    "scenario_type": "head_to_head",
+                    "scenario_title": "정원오 vs 오세훈",
+                    "value_mid": 44.0,
+                    "value_raw": "44%",
+                    "party_inferred": True,
+                    "party_inference_source": "name_rule",
+                    "party_inference_confidence": 0.84,
+                    "needs_manual_review": False,
+                }
+            ],
+        }
+        return _detail_rows(meta, region, [observation])
 
 
 class _Conn:
@@ -129,4 +130,4 @@ def test_get_matchup_returns_legal_metadata_fields():
     assert out["options"][0]["needs_manual_review"] is False
     assert out["scenarios"][0]["scenario_type"] == "head_to_head"
     assert out["scenarios"][0]["scenario_title"] == "정원오 vs 오세훈"
-    assert len(conn.cur.execs) == 3
+    assert len(conn.cur.execs) == 1
@@ -3,10 +3,19 @@ from datetime import date
 from app.services.repository import PostgresRepository
 
 
-class _Cursor:
+def _detail_rows(meta, region, observations):
+    base = {f"meta_{key}": value for key, value in meta.items()}
+    base.update({f"title_region_{key}": value for key, value in (region or {}).items()})
+    if not observations:
+        return [{**base, "has_observation": False}]
+    return [{**base, **observation, "has_observation": True} for observation in observations]
+
+
+class _DetailCursor:
+    """Serves the single matchup detail query from meta/region/observation fixtures."""
+
     def __init__(self):
         self.execs: list[str] = []
-        self._step = 0
 
     def __enter__(self):
         return self
@@ -18,26 +27,48 @@ class _Cursor:
         self.execs.append(query)
 
     def fetchone(self):
-        if self._step == 0:
-            self._step += 1
-            return {
-                "matchup_id": "m1",
-                "region_code": "26-000",
-                "office_type": "광역자치단체장",
-                "title": "부산시장 가상대결",
-                "is_active": True,
-            }
-        if self._step == 1:
-            self._step += 1
-            return {
-                "region_code": "26-000",
-                "sido_name": "부산광역시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-        if self._step == 2:
-            self._step += 1
-            return {
+        return None
+
+    def fetchall(self):
+        if len(self.execs) != 1 or "WITH matchup_meta AS" not in self.execs[0]:
+            return []
+        meta = self._meta()
+        if meta is None:
+            return []
+        return _detail_rows(meta, self._region(), self._observations())
+
+    def _meta(self):
+        # No matchups row: the detail query returns nothing.
+        return None
+
+    def _region(self):
+        return None
+
+    def _observations(self):
+        return []
+
+
+class _Cursor(_DetailCursor):
+    def _meta(self):
+        return {
+            "matchup_id": "m1",
+            "region_code": "26-000",
+            "office_type": "광역자치단체장",
+            "title": "부산시장 가상대결",
+            "is_active": True,
+        }
+
+    def _region(self):
+        return {
+            "region_code": "26-000",
+            "sido_name": "부산광역시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
+        }
+
+    def _observations(self):
+        return [
+            {
                 "matchup_id": "m1",
                 "region_code": "26-000",
                 "office_type": "광역자치단체장",
@@ -142,7 +173,7 @@ class _Cursor:
                     },
                 ],
             }
-        return None
+        ]
 
 
 class _Conn:
@@ -242,42 +273,25 @@ def test_normalize_options_filters_low_quality_manual_candidate_rows():
     assert names == ["정원오"]
 
 
-class _FallbackCursor:
-    def __init__(self):
-        self.execs: list[str] = []
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
-        return False
-
-    def execute(self, query, params=None):  # noqa: ARG002
-        self.execs.append(query)
-
-    def fetchone(self):
-        step = len(self.execs)
-        if step == 1:
-            return {
-                "matchup_id": "m-fallback",
-                "region_code": "11-000",
-                "office_type": "광역자치단체장",
-                "title": "서울시장 가상대결",
-                "is_active": True,
-            }
-        if step == 2:
-            return {
-                "region_code": "11-000",
-                "sido_name": "서울특별시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-        return None
-
-    def fetchall(self):
-        step = len(self.execs)
-        if step != 3:
-            return []
+class _FallbackCursor(_DetailCursor):
+    def _meta(self):
+        return {
+            "matchup_id": "m-fallback",
+            "region_code": "11-000",
+            "office_type": "광역자치단체장",
+            "title": "서울시장 가상대결",
+            "is_active": True,
+        }
+
+    def _region(self):
+        return {
+            "region_code": "11-000",
+            "sido_name": "서울특별시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
+        }
+
+    def _observations(self):
         return [
             {
                 "matchup_id": "m-fallback",
@@ -417,42 +431,25 @@ def test_get_matchup_falls_back_to_previous_observation_when_latest_is_invalid()
     assert [row["option_name"] for row in out["options"]] == ["정원오", "오세훈"]
 
 
-class _BundleCursor:
-    def __init__(self):
-        self.execs: list[str] = []
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
-        return False
-
-    def execute(self, query, params=None):  # noqa: ARG002
-        self.execs.append(query)
-
-    def fetchone(self):
-        step = len(self.execs)
-        if step == 1:
-            return {
-                "matchup_id": "m-bundle",
-                "region_code": "26-000",
-                "office_type": "광역자치단체장",
-                "title": "부산시장 가상대결",
-                "is_active": True,
-            }
-        if step == 2:
-            return {
-                "region_code": "26-000",
-                "sido_name": "부산광역시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-        return None
-
-    def fetchall(self):
-        step = len(self.execs)
-        if step != 3:
-            return []
+class _BundleCursor(_DetailCursor):
+    def _meta(self):
+        return {
+            "matchup_id": "m-bundle",
+            "region_code": "26-000",
+            "office_type": "광역자치단체장",
+            "title": "부산시장 가상대결",
+            "is_active": True,
+        }
+
+    def _region(self):
+        return {
+            "region_code": "26-000",
+            "sido_name": "부산광역시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
+        }
+
+    def _observations(self):
         return [
             {
                 "matchup_id": "m-bundle",
@@ -678,11 +675,8 @@ def test_get_matchup_merges_recent_observations_with_same_poll_fingerprint():
 
 
 class _RichScenarioCursor(_BundleCursor):
-    def fetchall(self):
-        step = len(self.execs)
-        if step != 3:
-            return []
-        rows = super().fetchall()
+    def _observations(self):
+        rows = super()._observations()
         latest_minimal = dict(rows[0])
         latest_minimal["pollster"] = "최신리서치"
         latest_minimal["survey_end_date"] = date(2026, 2, 22)
@@ -747,11 +741,8 @@ def test_get_matchup_prefers_richer_scenario_observation_over_latest_minimal_def
 
 
 class _AllInvalidCursor(_FallbackCursor):
-    def fetchall(self):
-        step = len(self.execs)
-        if step != 3:
-            return []
-        rows = super().fetchall()
+    def _observations(self):
+        rows = super()._observations()
         return rows[:1]
 
 
@@ -778,44 +769,25 @@ def test_get_matchup_sets_has_data_false_when_all_recent_observations_invalid():
     assert out["scenarios"] == []
 
 
-class _NoiseOnlyCursor:
-    def __init__(self):
-        self.execs: list[str] = []
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
-        return False
-
-    def execute(self, query, params=None):  # noqa: ARG002
-        self.execs.append(query)
-
-    def fetchone(self):
-        step = len(self.execs)
-        if step == 1:
-            return {
-                "matchup_id": "m-noise",
-                "region_code": "11-000",
-                "office_type": "광역자치단체장",
-                "title": "서울시장 가상대결",
-                "is_active": True,
-            }
-        if step == 2:
-            return {
-                "region_code": "11-000",
-                "sido_name": "서울특별시",
-                "sigungu_name": "전체",
-                "admin_level": "sido",
-            }
-        if step == 4:
-            return None
-        return None
-
-    def fetchall(self):
-        step = len(self.execs)
-        if step != 3:
-            return []
+class _NoiseOnlyCursor(_DetailCursor):
+    def _meta(self):
+        return {
+            "matchup_id": "m-noise",
+            "region_code": "11-000",
+            "office_type": "광역자치단체장",
+            "title": "서울시장 가상대결",
+            "is_active": True,
+        }
+
+    def _region(self):
+        return {
+            "region_code": "11-000",
+            "sido_name": "서울특별시",
+            "sigungu_name": "전체",
+            "admin_level": "sido",
+        }
+
+    def _observations(self):
         return [
             {
                 "matchup_id": "m-noise",
@@ -894,3 +866,68 @@ def test_get_matchup_routes_review_queue_when_noise_filter_removes_all_candidate
     assert out["needs_manual_review"] is True
     assert conn.commit_count == 1
     assert any("INSERT INTO review_queue" in query for query in conn.cur.execs)
+
+
+class _ParamCaptureCursor(_DetailCursor):
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+        self.params: list[dict] = []
+
+    def execute(self, query, params=None):
+        super().execute(query, params)
+        self.params.append(params)
+
+    def fetchall(self):
+        return self.rows
+
+
+class _ParamCaptureConn:
+    def __init__(self, rows):
+        self.cur = _ParamCaptureCursor(rows)
+
+    def cursor(self):
+        return self.cur
+
+
+def test_get_matchup_reads_meta_region_and_observations_in_one_query():
+    rows = _detail_rows(
+        {
+            "matchup_id": "20260603|기초자치단체장|26-710",
+            "region_code": "26-710",
+            "office_type": "기초자치단체장",
+            "title": "부산 중구청장 가상대결",
+            "is_active": True,
+        },
+        {
+            "region_code": "26-710",
+            "sido_name": "부산광역시",
+            "sigungu_name": "중구",
+            "admin_level": "sigungu",
+        },
+        [],
+    )
+    conn = _ParamCaptureConn(rows)
+    repo = PostgresRepository(conn)
+
+    out = repo.get_matchup("2026_local|기초자치단체장|26-710")
+
+    assert len(conn.cur.execs) == 1
+    query = conn.cur.execs[0]
+    assert "open_reviews" in query
+    assert "EXISTS" not in query
+    assert conn.cur.params[0]["office_type"] == "기초자치단체장"
+    assert conn.cur.params[0]["region_code"] == "26-710"
+    assert conn.cur.params[0]["limit"] == 5
+    assert out is not None
+    assert out["matchup_id"] == "20260603|기초자치단체장|26-710"
+    assert out["has_data"] is False
+    assert out["canonical_title"] == "중구청장"
+
+
+def test_get_matchup_returns_none_when_meta_missing():
+    conn = _ParamCaptureConn([])
+    repo = PostgresRepository(conn)
+
+    assert repo.get_matchup("missing") is None
+    assert conn.cur.params[0]["office_type"] is None
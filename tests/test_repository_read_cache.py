@@ -1,6 +1,7 @@
 from datetime import date
 
 import app.services.repository as repository_module
+from app.services.encoded_response_cache import get_encoded_response, set_encoded_response
 from app.services.repository import PostgresRepository, clear_api_read_cache
 
 
@@ -110,3 +111,74 @@ def test_write_path_invalidates_dashboard_summary_cache(monkeypatch):
 
     assert conn.review_insert_count == 1
     assert conn.summary_query_count == 2
+
+
+def test_write_path_drops_encoded_response_bodies():
+    set_encoded_response('W/"g1-abc"', b"{}", None, now=0.0, ttl=60.0)
+    assert get_encoded_response('W/"g1-abc"', now=1.0) == (b"{}", None)
+
+    PostgresRepository(_FakeConn()).insert_review_queue(
+        entity_type="ingest_record",
+        entity_id="obs-1",
+        issue_type="mapping_error",
+        review_note="need check",
+    )
+
+    assert get_encoded_response('W/"g1-abc"', now=1.0) is None
+
+
+class _GenerationCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None):  # noqa: ARG002
+        self.conn.queries.append(query)
+        if "SELECT generation FROM data_generation" in query:
+            self._row = {"generation": self.conn.generation}
+        elif "UPDATE ingestion_runs" in query:
+            self._row = None
+        elif "INSERT INTO data_generation" in query:
+            self.conn.generation += 1
+            self._row = None
+
+    def fetchone(self):
+        return self._row
+
+
+class _GenerationConn:
+    def __init__(self):
+        self.generation = 3
+        self.queries = []
+
+    def cursor(self):
+        return _GenerationCursor(self)
+
+    def commit(self):
+        return None
+
+    def rollback(self):
+        return None
+
+
+def test_data_generation_is_cached_and_bumped_by_finished_ingest(monkeypatch):
+    clear_api_read_cache()
+    monkeypatch.setattr(repository_module, "_data_generation_cache_ttl_sec", lambda: 30.0)
+
+    conn = _GenerationConn()
+    repo = PostgresRepository(conn)
+
+    assert repo.fetch_data_generation() == 3
+    assert repo.fetch_data_generation() == 3
+    assert sum("FROM data_generation" in q for q in conn.queries) == 1
+
+    repo.finish_ingestion_run(run_id=1, status="success", processed_count=1, error_count=0)
+
+    assert any("INSERT INTO data_generation" in q for q in conn.queries)
+    assert repo.fetch_data_generation() == 4
@@ -394,3 +394,103 @@ def test_region_elections_uses_master_rows_when_present():
     assert rows[0]["office_type"] == "광역자치단체장"
     assert rows[0]["is_fallback"] is False
     assert rows[0]["source"] == "master_sync"
+
+
+class _BatchCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries: list[tuple[str, dict]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):  # noqa: ANN001
+        return False
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+
+    def fetchall(self):
+        return self.rows
+
+
+class _BatchConn:
+    def __init__(self, rows):
+        self._cursor = _BatchCursor(rows)
+
+    def cursor(self):
+        return self._cursor
+
+
+def test_region_elections_batch_assembles_all_regions_from_single_query():
+    conn = _BatchConn(
+        [
+            {
+                "region_code": "26-710",
+                "sido_name": "부산광역시",
+                "sigungu_name": "중구",
+                "admin_level": "sigungu",
+                "topology_version_id": "official-v2",
+                "election_rows": [],
+                "matchup_rows": [],
+                "poll_meta_rows": [
+                    {
+                        "office_type": "기초자치단체장",
+                        "has_poll_data": True,
+                        "latest_survey_end_date": "2026-02-19",
+                        "latest_matchup_id": "20260603|기초자치단체장|26-710",
+                        "has_candidate_data": True,
+                    }
+                ],
+            },
+            {
+                "region_code": "29-000",
+                "sido_name": "광주광역시",
+                "sigungu_name": "전체",
+                "admin_level": "sido",
+                "topology_version_id": None,
+                "election_rows": (
+                    '[{"region_code": "29-000", "office_type": "광역자치단체장", '
+                    '"slot_matchup_id": "master|광역자치단체장|29-000", "title": "세종특별자치시 광역자치단체장", '
+                    '"display_title": "세종특별자치시 광역자치단체장", "source": "code_master", '
+                    '"has_poll_data": false, "latest_matchup_id": null, "is_active": true}]'
+                ),
+                "matchup_rows": [],
+                "poll_meta_rows": [],
+            },
+        ]
+    )
+
+    repo = PostgresRepository(conn)
+    result = repo.fetch_region_elections_batch(region_codes=["29-000", "26-710", "99-999"])
+
+    assert len(conn._cursor.queries) == 1
+    query, params = conn._cursor.queries[0]
+    assert "region_code = ANY(%(region_codes)s::text[])" in query
+    assert params["region_codes"] == ["29-000", "26-710", "99-999"]
+    assert params["sido_like"] is None
+
+    assert list(result.keys()) == ["29-000", "26-710", "99-999"]
+    assert result["99-999"] == []
+
+    sejong = result["29-000"]
+    assert [row["title"] for row in sejong] == ["세종특별자치시 광역자치단체장"]
+    assert sejong[0]["topology_version_id"] == "official-v1"
+
+    junggu = result["26-710"]
+    assert [row["office_type"] for row in junggu] == ["기초자치단체장", "기초의회"]
+    assert junggu[0]["latest_survey_end_date"] == date(2026, 2, 19)
+    assert junggu[0]["status"] == "데이터 준비 완료"
+    assert all(row["topology_version_id"] == "official-v2" for row in junggu)
+
+
+def test_region_elections_batch_expands_sido_prefix():
+    conn = _BatchConn([])
+
+    repo = PostgresRepository(conn)
+    result = repo.fetch_region_elections_batch(sido_code="26-000")
+
+    assert result == {}
+    _, params = conn._cursor.queries[0]
+    assert params["sido_like"] == "26-%"
+    assert params["region_codes"] == []
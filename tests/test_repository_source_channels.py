@@ -1,3 +1,7 @@
+import psycopg
+import pytest
+
+from app.services.errors import DuplicateConflictError
 from app.services.repository import PostgresRepository
 
 
@@ -26,3 +30,76 @@ def test_prepare_observation_payload_keeps_given_source_channels():
         ingestion_run_id=1,
     )
     assert payload["source_channels"] == ["article", "nesdc"]
+
+
+class _UpsertCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.queries.append(query)
+        outcome = self.conn.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        self._row = outcome
+
+    def fetchone(self):
+        return self._row
+
+
+class _UpsertConn:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return _UpsertCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def _fingerprinted_observation():
+    return {"observation_key": "obs-1", "source_channel": "nesdc", "poll_fingerprint": "fp1"}
+
+
+def test_upsert_poll_observation_merges_fingerprint_in_single_statement():
+    conn = _UpsertConn([{"id": 11}])
+    repo = PostgresRepository(conn)
+
+    assert repo.upsert_poll_observation(_fingerprinted_observation(), article_id=1, ingestion_run_id=1) == 11
+    assert len(conn.queries) == 1
+    assert "ON CONFLICT (poll_fingerprint) WHERE poll_fingerprint IS NOT NULL DO UPDATE" in conn.queries[0]
+    assert "SET data_version = data_version + 1" in conn.queries[0]
+    assert conn.commits == 1
+
+
+def test_upsert_poll_observation_raises_duplicate_conflict_on_core_mismatch():
+    conn = _UpsertConn([None])
+    repo = PostgresRepository(conn)
+
+    with pytest.raises(DuplicateConflictError, match="DUPLICATE_CONFLICT"):
+        repo.upsert_poll_observation(_fingerprinted_observation(), article_id=1, ingestion_run_id=1)
+    assert conn.commits == 0
+
+
+def test_upsert_poll_observation_falls_back_to_observation_key_on_unique_violation():
+    conn = _UpsertConn([psycopg.errors.UniqueViolation("observation_key"), None, {"id": 12}])
+    repo = PostgresRepository(conn)
+
+    assert repo.upsert_poll_observation(_fingerprinted_observation(), article_id=1, ingestion_run_id=1) == 12
+    assert conn.rollbacks == 1
+    assert "poll_fingerprint = %s" in conn.queries[1]
+    assert "ON CONFLICT (observation_key)" in conn.queries[2]
@@ -0,0 +1,54 @@
+from app.services.request_metrics import (
+    RequestQueryStats,
+    clear_request_metrics,
+    current_request_stats,
+    finish_request_stats,
+    record_cache_lookup,
+    record_request_metrics,
+    server_timing_header,
+    start_request_stats,
+    summarize_request_metrics,
+)
+
+
+def test_cache_lookups_only_count_inside_sampled_request():
+    record_cache_lookup(True)
+    assert current_request_stats() is None
+
+    stats, token = start_request_stats()
+    record_cache_lookup(True)
+    record_cache_lookup(False)
+    finish_request_stats(token)
+
+    assert (stats.cache_hits, stats.cache_misses) == (1, 1)
+    assert current_request_stats() is None
+
+
+def test_server_timing_header_reports_db_cache_and_total():
+    stats = RequestQueryStats(query_count=3, db_time_sec=0.0125, rows_fetched=40, cache_hits=2, cache_misses=1)
+
+    header = server_timing_header(stats, total_sec=0.02)
+
+    assert header == 'db;dur=12.50;desc="queries=3 rows=40", cache;desc="hits=2 misses=1", total;dur=20.00'
+
+
+def test_summarize_request_metrics_computes_route_percentiles():
+    clear_request_metrics()
+    for index in range(1, 101):
+        record_request_metrics(
+            "GET",
+            "/api/v1/matchups/{matchup_id}",
+            total_sec=index / 1000.0,
+            stats=RequestQueryStats(query_count=index % 4, db_time_sec=index / 2000.0, rows_fetched=10, cache_misses=1),
+        )
+
+    [row] = summarize_request_metrics()
+
+    assert row["sample_count"] == 100
+    assert (row["p50_ms"], row["p95_ms"], row["p99_ms"]) == (50.0, 95.0, 99.0)
+    assert row["db_p50_ms"] == 25.0
+    assert row["queries_mean"] == 1.5
+    assert row["queries_max"] == 3
+    assert row["rows_mean"] == 10.0
+    assert row["cache_hit_rate"] == 0.0
+    clear_request_metrics()
@@ -3,9 +3,12 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from app.jobs.ingest_runner import AttemptLog, IngestRunnerResult
+from app.jobs.ingest_runner import AttemptLog, IngestRunnerResult, split_ingest_payload
 from scripts.qa.run_ingest_with_retry import (
     is_effective_success,
+    load_acked_chunk_ids,
+    save_acked_chunk_ids,
+    write_chunk_dead_letters,
     write_failure_classification_artifact,
     write_failure_comment_template,
 )
@@ -85,3 +88,33 @@ def test_write_failure_comment_template(tmp_path: Path) -> None:
     assert "[DEVELOP][INGEST FAILURE TEMPLATE]" in text
     assert "classification_artifact" in text
     assert "next_status: status/in-progress" in text
+
+
+def test_chunk_dead_letters_hold_only_failed_chunks_and_ack_state_round_trips(tmp_path: Path) -> None:
+    payload = {"run_type": "collector", "records": [{"observation": {"observation_key": f"obs-{i}"}} for i in range(4)]}
+    chunks = split_ingest_payload(payload, max_chunk_records=2)
+    result = _result(success=False, failure_class="timeout")
+    result.chunks = [
+        {"chunk_id": chunks[0].chunk_id, "status": "acked"},
+        {"chunk_id": chunks[1].chunk_id, "status": "failed", "failure_class": "timeout", "failure_reason": "t"},
+    ]
+
+    paths = write_chunk_dead_letters(
+        dead_letter_dir=tmp_path / "dead",
+        source_input_path="data/in.json",
+        payload=payload,
+        result=result,
+        report_path="data/report.json",
+        max_chunk_bytes=1_000_000,
+        max_chunk_records=2,
+    )
+
+    assert len(paths) == 1
+    record = json.loads(paths[0].read_text(encoding="utf-8"))
+    assert record["chunk_id"] == chunks[1].chunk_id
+    assert [row["observation"]["observation_key"] for row in record["payload"]["records"]] == ["obs-2", "obs-3"]
+
+    state = tmp_path / "ack.json"
+    assert load_acked_chunk_ids(state) == set()
+    save_acked_chunk_ids(state, {chunks[0].chunk_id})
+    assert load_acked_chunk_ids(state) == {chunks[0].chunk_id}
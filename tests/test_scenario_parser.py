@@ -0,0 +1,37 @@
+from app.services.scenario_parser import (
+    clear_scenario_parse_cache,
+    parse_survey_scenarios,
+    scenario_name_token,
+    scenario_parse_cache_info,
+)
+
+SURVEY = "양자대결 정원오 44.1%-오세훈 31.2%, 정원오 43.6%-나경원 30.4% 다자대결 정원오 34.9% 오세훈 21.0% 나경원 9.8% 여론조사"
+
+
+def test_parse_survey_scenarios_extracts_pairs_anchor_and_multi_candidates():
+    parsed = parse_survey_scenarios(SURVEY)
+
+    assert parsed.h2h_pairs == (
+        ("정원오", 44.1, "오세훈", 31.2),
+        ("정원오", 43.6, "나경원", 30.4),
+    )
+    assert parsed.multi_anchor == ("정원오", 34.9)
+    assert parsed.multi_candidates == (("정원오", 34.9), ("오세훈", 21.0), ("나경원", 9.8))
+
+
+def test_parse_survey_scenarios_is_memoized_by_normalized_text():
+    clear_scenario_parse_cache()
+
+    first = parse_survey_scenarios(SURVEY)
+    second = parse_survey_scenarios(f"  {SURVEY} ")
+
+    assert second is first
+    info = scenario_parse_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_parse_survey_scenarios_handles_empty_and_short_multi():
+    assert parse_survey_scenarios(None).h2h_pairs == ()
+    assert parse_survey_scenarios("다자대결 정원오 34.9% 오세훈 21.0%").multi_candidates == ()
+    assert scenario_name_token(" 정원오 후보 ") == "정원오"
+    assert scenario_name_token(None) == ""
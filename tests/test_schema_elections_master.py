@@ -8,3 +8,5 @@ def test_schema_contains_elections_master_table() -> None:
     assert "has_poll_data BOOLEAN NOT NULL DEFAULT FALSE" in sql
     assert "latest_matchup_id TEXT NULL" in sql
     assert "elections_source_check" in sql
+    assert "ADD COLUMN IF NOT EXISTS display_title TEXT NULL" in sql
+    assert "idx_regions_code_prefix" in sql
@@ -13,3 +13,29 @@ def test_schema_contains_read_performance_indexes() -> None:
     assert "idx_poll_options_candidate_matchup_observation_value" in sql
     assert "idx_review_queue_entity_status" in sql
     assert "ON review_queue (entity_type, entity_id, status)" in sql
+    assert "CREATE TABLE IF NOT EXISTS matchup_snapshots" in sql
+    assert "ADD COLUMN IF NOT EXISTS data_version BIGINT NOT NULL DEFAULT 0" in sql
+    assert "CREATE TABLE IF NOT EXISTS data_generation" in sql
+    assert "INSERT INTO data_generation (id, generation)" in sql
+    assert "CREATE TABLE IF NOT EXISTS trend_daily_points" in sql
+    assert "PRIMARY KEY (metric, audience_scope, region_key, survey_end_date, option_name)" in sql
+    assert "idx_poll_observations_ingestion_run" in sql
+
+
+def test_schema_enforces_unique_poll_fingerprint_after_dedup() -> None:
+    sql = Path("db/schema.sql").read_text(encoding="utf-8")
+    assert "CREATE TEMP TABLE poll_fingerprint_dedup" in sql
+    assert "CREATE UNIQUE INDEX uq_poll_observations_fingerprint" in sql
+    assert "ON poll_observations (poll_fingerprint)\n            WHERE poll_fingerprint IS NOT NULL;" in sql
+    assert "DROP INDEX IF EXISTS idx_poll_observations_fingerprint;" in sql
+
+
+def test_query_plan_capture_targets_existing_repository_reads_and_tables() -> None:
+    from app.services.repository import PostgresRepository
+    from scripts.qa.capture_query_plans import READ_METHOD_CALLS, WATCHED_RELATIONS
+
+    sql = Path("db/schema.sql").read_text(encoding="utf-8")
+    for method, _build_kwargs in READ_METHOD_CALLS:
+        assert callable(getattr(PostgresRepository, method, None)), method
+    for relation in WATCHED_RELATIONS:
+        assert f"CREATE TABLE IF NOT EXISTS {relation} (" in sql
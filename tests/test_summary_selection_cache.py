@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.services import summary_selection_cache as cache_module
+from app.services.summary_selection_cache import (
+    clear_summary_selection_cache,
+    get_cached_summary_selection,
+    set_cached_summary_selection,
+    summary_selection_cache_key,
+)
+
+
+def test_historical_keys_ignore_generation_and_current_keys_do_not() -> None:
+    today = date(2026, 3, 10)
+    past = summary_selection_cache_key(date(2026, 3, 1), generation=1, policy_version="v1", today=today)
+    assert past == summary_selection_cache_key(date(2026, 3, 1), generation=9, policy_version="v1", today=today)
+    assert past != summary_selection_cache_key(date(2026, 3, 1), generation=1, policy_version="v2", today=today)
+    assert summary_selection_cache_key(None, generation=1, policy_version="v1", today=today) != (
+        summary_selection_cache_key(None, generation=2, policy_version="v1", today=today)
+    )
+    assert summary_selection_cache_key(today, generation=1, policy_version="v1", today=today)[0] == "current"
+
+
+def test_new_generation_replaces_older_current_entries_and_cache_is_bounded(monkeypatch) -> None:
+    clear_summary_selection_cache()
+    monkeypatch.setattr(cache_module, "SUMMARY_SELECTION_CACHE_MAX_ENTRIES", 2)
+    old = summary_selection_cache_key(None, generation=1, policy_version="v1")
+    new = summary_selection_cache_key(None, generation=2, policy_version="v1")
+
+    set_cached_summary_selection(old, {"selected": []})
+    set_cached_summary_selection(new, {"selected": [1]})
+    assert get_cached_summary_selection(old) is None
+    assert get_cached_summary_selection(new) == {"selected": [1]}
+
+    for day in (1, 2):
+        key = summary_selection_cache_key(date(2025, 12, day), generation=2, policy_version="v1")
+        set_cached_summary_selection(key, {"selected": [day]})
+    assert get_cached_summary_selection(new) is None
+    clear_summary_selection_cache()
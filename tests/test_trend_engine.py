@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import date
+import math
+import random
+import statistics
+
+import pytest
+
+from app.services.trend_engine import compute_trend_aggregates, effective_sample_size
+
+
+def _row(day: int, value: float, *, pollster: str = "A리서치", sample_size: int | None = 1000, option: str = "정당A"):
+    return {
+        "survey_end_date": date(2026, 3, day),
+        "option_name": option,
+        "value_mid": value,
+        "pollster": pollster,
+        "sample_size": sample_size,
+        "margin_of_error": None,
+    }
+
+
+def test_effective_sample_size_falls_back_to_margin_then_default() -> None:
+    assert effective_sample_size({"sample_size": 800}) == 800
+    assert round(effective_sample_size({"sample_size": None, "margin_of_error": 3.1})) == 999
+    assert effective_sample_size({}) == 500.0
+
+
+def test_rolling_mean_uses_trailing_calendar_window() -> None:
+    rows = [_row(1, 30.0), _row(2, 40.0), _row(5, 50.0), _row(9, 20.0)]
+
+    estimates = compute_trend_aggregates(rows, mode="rolling", window_days=3)
+
+    assert estimates[(date(2026, 3, 2), "정당A")].value == 35.0
+    assert estimates[(date(2026, 3, 2), "정당A")].poll_count == 2
+    assert estimates[(date(2026, 3, 5), "정당A")].value == 50.0
+    assert estimates[(date(2026, 3, 5), "정당A")].poll_count == 1
+    assert estimates[(date(2026, 3, 9), "정당A")].value == 20.0
+
+
+def test_weighted_mean_favours_larger_samples_and_reports_band() -> None:
+    rows = [_row(1, 30.0, sample_size=3000), _row(1, 40.0, pollster="B조사", sample_size=1000)]
+
+    estimate = compute_trend_aggregates(rows, mode="weighted", window_days=7)[(date(2026, 3, 1), "정당A")]
+
+    assert estimate.value == 32.5
+    assert estimate.low < estimate.value < estimate.high
+    assert estimate.high - estimate.low == pytest.approx(2 * 1.96 * 100 * (0.325 * 0.675 / 4000) ** 0.5, abs=0.02)
+
+
+def test_house_adjusted_pulls_a_consistently_high_pollster_toward_consensus() -> None:
+    rows = []
+    for day in range(1, 11):
+        rows.append(_row(day, 30.0, pollster="A리서치"))
+        rows.append(_row(day, 30.0, pollster="C여론"))
+        rows.append(_row(day, 40.0, pollster="B조사"))
+    rows.append(_row(11, 40.0, pollster="B조사"))
+
+    weighted = compute_trend_aggregates(rows, mode="weighted", window_days=1)
+    adjusted = compute_trend_aggregates(rows, mode="house_adjusted", window_days=1)
+
+    assert weighted[(date(2026, 3, 11), "정당A")].value == 40.0
+    assert adjusted[(date(2026, 3, 11), "정당A")].value < 36.0
+
+
+def test_rolling_band_matches_per_window_recomputation_with_large_offsets() -> None:
+    # Raw power sums lose every significant digit of the variance at this offset.
+    rng = random.Random(7)
+    rows = [_row(day, 1e8 + rng.uniform(0.0, 1.0)) for day in range(1, 29) for _ in range(3)]
+
+    estimates = compute_trend_aggregates(rows, mode="rolling", window_days=5)
+
+    for day in range(1, 29):
+        window = [row["value_mid"] for row in rows if day - 5 < row["survey_end_date"].day <= day]
+        stderr = math.sqrt(statistics.variance(window) / len(window))
+        estimate = estimates[(date(2026, 3, day), "정당A")]
+        assert estimate.poll_count == len(window)
+        assert estimate.high - estimate.low == pytest.approx(2 * 1.96 * stderr, abs=0.02)
+
+
+def test_compute_trend_aggregates_rejects_raw_mode() -> None:
+    with pytest.raises(ValueError):
+        compute_trend_aggregates([], mode="raw", window_days=7)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.services.trend_series import (
+    TrendSeriesRebuildResult,
+    rebuild_trend_series_days,
+    refresh_trend_series_for_observations,
+    refresh_trend_series_for_run,
+    select_trend_series_points,
+)
+from app.services.repository import PostgresRepository
+
+
+def _row(**overrides) -> dict:
+    row = {
+        "metric": "party_support",
+        "option_name": "더불어민주당",
+        "value_mid": 35.0,
+        "observation_id": 1,
+        "pollster": "기사집계센터",
+        "survey_end_date": date(2026, 2, 20),
+        "source_grade": "A",
+        "audience_scope": "national",
+        "audience_region_code": None,
+        "observation_updated_at": "2026-02-20T03:00:00+00:00",
+        "official_release_at": None,
+        "article_published_at": "2026-02-20T01:00:00+00:00",
+        "source_channel": "article",
+        "source_channels": ["article"],
+    }
+    row.update(overrides)
+    return row
+
+
+def test_select_trend_series_points_prefers_official_and_skips_cutoff_rows() -> None:
+    rows = [
+        _row(),
+        _row(value_mid=34.0, observation_id=2, pollster="NBS", source_channel="nesdc", source_channels=["nesdc"]),
+        _row(option_name="국민의힘", value_mid=30.0, observation_id=3),
+        _row(option_name="국민의힘", value_mid=29.0, observation_id=4, metric="election_frame"),
+        _row(option_name="오래된정당", survey_end_date=date(2025, 11, 1), observation_id=5),
+    ]
+
+    points = select_trend_series_points(rows)
+
+    assert [(p["metric"], p["option_name"]) for p in points] == [
+        ("election_frame", "국민의힘"),
+        ("party_support", "국민의힘"),
+        ("party_support", "더불어민주당"),
+    ]
+    dem = points[-1]
+    assert dem["value_mid"] == 34.0
+    assert dem["observation_id"] == 2
+    assert dem["selected_source_tier"] == "nesdc"
+
+
+class _SeriesRepo:
+    def __init__(self, rows_by_day: dict):
+        self.rows_by_day = rows_by_day
+        self.replaced: dict[tuple, list[dict]] = {}
+        self.day_key_calls: list = []
+
+    def fetch_trend_series_day_keys(self, *, run_id=None, observation_keys=None):
+        self.day_key_calls.append(run_id if observation_keys is None else observation_keys)
+        return [
+            {"audience_scope": scope, "region_key": region_key, "survey_end_date": day}
+            for scope, region_key, day in self.rows_by_day
+        ]
+
+    def fetch_trend_series_day_rows(self, *, scope, region_key, survey_end_date):
+        return self.rows_by_day[(scope, region_key, survey_end_date)]
+
+    def replace_trend_series_day(self, *, scope, region_key, survey_end_date, points):
+        if region_key == "broken":
+            raise RuntimeError("write failed")
+        self.replaced[(scope, region_key, survey_end_date)] = points
+
+
+def test_refresh_trend_series_for_run_replaces_each_touched_day() -> None:
+    day = date(2026, 2, 20)
+    repo = _SeriesRepo(
+        {
+            ("national", "", day): [_row(), _row(option_name="국민의힘", observation_id=3)],
+            ("regional", "11-000", day): [],
+            ("local", "broken", day): [_row(audience_scope="local")],
+        }
+    )
+
+    result = refresh_trend_series_for_run(repo, 7)
+
+    assert repo.day_key_calls == [7]
+    assert result.as_dict() == {"rebuilt_days": 2, "point_count": 2, "failed_days": 1}
+    assert len(repo.replaced[("national", "", day)]) == 2
+    assert repo.replaced[("regional", "11-000", day)] == []
+
+
+def test_refresh_trend_series_is_noop_for_repos_without_series() -> None:
+    assert refresh_trend_series_for_run(object(), 1) is None
+    assert rebuild_trend_series_days(object(), []) == TrendSeriesRebuildResult()
+
+
+def test_refresh_trend_series_for_observations_rebuilds_their_days() -> None:
+    day = date(2026, 2, 20)
+    repo = _SeriesRepo({("national", "", day): [_row()]})
+
+    result = refresh_trend_series_for_observations(repo, ["obs-1", "obs-1", None])
+
+    assert repo.day_key_calls == [["obs-1"]]
+    assert result.rebuilt_days == 1
+    assert refresh_trend_series_for_observations(repo, []) is None
+
+
+class _KeyCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+
+    def fetchall(self):
+        return []
+
+
+class _KeyConn:
+    def __init__(self):
+        self.executed: list = []
+
+    def cursor(self):
+        return _KeyCursor(self)
+
+
+def test_incremental_day_keys_include_the_days_points_were_on_before_the_write() -> None:
+    conn = _KeyConn()
+    repo = PostgresRepository(conn)
+
+    repo.fetch_trend_series_day_keys(run_id=7)
+    repo.fetch_trend_series_day_keys(observation_keys=["obs-1"])
+    repo.fetch_trend_series_day_keys()
+
+    run_query, run_params = conn.executed[0]
+    assert "JOIN poll_observations o ON o.id = tp.observation_id" in run_query
+    assert run_params == [7, 7]
+    assert conn.executed[1][1] == [["obs-1"], ["obs-1"]]
+    assert "o.observation_key = ANY(%s)" in conn.executed[1][0]
+    full_query, full_params = conn.executed[2]
+    assert "tp.observation_id" not in full_query and "FROM trend_daily_points" in full_query
+    assert full_params == []